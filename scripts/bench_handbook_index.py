@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Count task.yaml reads for a `ph status` + `ph validate` pass over a synthetic handbook.
+
+Usage: PYTHONPATH=src python scripts/bench_handbook_index.py [--sprints N] [--tasks-per-sprint M]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from ph.handbook_index import get_handbook_index, invalidate_handbook_index
+from ph.status import run_status
+from ph.validate_docs import run_validate
+
+
+def _build_handbook(root: Path, *, sprints: int, tasks_per_sprint: int) -> Path:
+    ph_data_root = root / ".project-handbook"
+    (ph_data_root / "process" / "checks").mkdir(parents=True)
+    (ph_data_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    (ph_data_root / "config.json").write_text(
+        '{"handbook_schema_version": 1, "requires_ph_version": ">=0.0.1", "repo_root": "."}\n', encoding="utf-8"
+    )
+    for s in range(sprints):
+        sprint_dir = ph_data_root / "sprints" / "2026" / f"SPRINT-2026-W{s:02d}"
+        for t in range(tasks_per_sprint):
+            task_id = f"TASK-{s * tasks_per_sprint + t:04d}"
+            task_dir = sprint_dir / "tasks" / f"{task_id}-bench"
+            task_dir.mkdir(parents=True)
+            (task_dir / "task.yaml").write_text(
+                f"id: {task_id}\ntitle: Bench\nfeature: f{t % 5}\ndecision: ADR-0001\nowner: @a\n"
+                "status: todo\nstory_points: 3\ndepends_on: [FIRST_TASK]\n",
+                encoding="utf-8",
+            )
+    return ph_data_root
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sprints", type=int, default=20)
+    parser.add_argument("--tasks-per-sprint", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        ph_data_root = _build_handbook(root, sprints=args.sprints, tasks_per_sprint=args.tasks_per_sprint)
+        invalidate_handbook_index(ph_data_root=ph_data_root)
+
+        reads = 0
+        real_read_text = Path.read_text
+
+        def counting_read_text(self: Path, *a: object, **kw: object) -> str:
+            nonlocal reads
+            if self.name == "task.yaml":
+                reads += 1
+            return real_read_text(self, *a, **kw)  # type: ignore[arg-type]
+
+        start = time.perf_counter()
+        with mock.patch.object(Path, "read_text", counting_read_text), redirect_stdout(io.StringIO()):
+            run_status(ph_root=root, ph_project_root=root, ph_data_root=ph_data_root, env={})
+            run_validate(
+                ph_root=root,
+                ph_project_root=root,
+                ph_data_root=ph_data_root,
+                scope="project",
+                quick=True,
+                silent_success=True,
+            )
+        elapsed = time.perf_counter() - start
+
+        tasks = args.sprints * args.tasks_per_sprint
+        index = get_handbook_index(ph_data_root=ph_data_root)
+        print(f"tasks:              {tasks}")
+        print(f"task.yaml reads:    {reads} ({reads / tasks:.2f} per task)")
+        print(f"task.yaml parses:   {index.parse_count} ({index.parse_count / tasks:.2f} per task)")
+        print(f"status+validate:    {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
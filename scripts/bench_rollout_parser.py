@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Compare the streaming rollout reader with the list-building loop it replaced on a synthetic Codex rollout.
+
+Usage: PYTHONPATH=src python scripts/bench_rollout_parser.py [--entries N] [--text-bytes B]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from ph.end_session import build_command_timeline
+from ph.rollout_parser import iter_json_objects
+
+
+def legacy_iter_json_objects(path: Path) -> list[dict[str, Any]]:
+    """The former reader: re-slices the buffer after every object and returns a list."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    items: list[dict[str, Any]] = []
+    with path.open("r", encoding="utf-8") as handle:
+        while True:
+            chunk = handle.read(65536)
+            if not chunk:
+                break
+            buffer += chunk
+            buffer = buffer.lstrip()
+            while buffer:
+                try:
+                    obj, index = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    break
+                if isinstance(obj, dict):
+                    items.append(obj)
+                buffer = buffer[index:].lstrip()
+        buffer = buffer.lstrip()
+        if buffer:
+            obj, _ = decoder.raw_decode(buffer)
+            if isinstance(obj, dict):
+                items.append(obj)
+    return items
+
+
+def write_rollout(path: Path, *, entries: int, text_bytes: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps({"type": "session_meta", "payload": {"id": "bench"}}, indent=2) + "\n")
+        for n in range(entries):
+            payload = {"type": "message", "role": "user" if n % 2 else "assistant"}
+            payload["content"] = [{"type": "input_text", "text": f"entry {n} " + "x" * text_bytes}]
+            item = {"type": "response_item", "timestamp": "2026-01-14T00:00:00Z", "payload": payload}
+            handle.write(json.dumps(item, indent=2) + "\n")
+
+
+def measure(label: str, read: Callable[[Path], Iterable[dict[str, Any]]], path: Path) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    timeline = build_command_timeline(read(path))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {elapsed * 1000:9.1f} ms  peak {peak / 1e6:8.1f} MB  ({len(timeline)} messages)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--text-bytes", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rollout.jsonl"
+        write_rollout(path, entries=args.entries, text_bytes=args.text_bytes)
+        print(f"rollout: {path.stat().st_size / 1e6:.1f} MB, {args.entries} entries")
+        measure("legacy", legacy_iter_json_objects, path)
+        measure("streaming", iter_json_objects, path)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
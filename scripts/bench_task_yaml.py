@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Compare the single-pass task.yaml reader with the per-module loops it replaced on synthetic task files.
+
+Usage: PYTHONPATH=src python scripts/bench_task_yaml.py [--files N] [--repeat R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ph.task_yaml import load_task_yaml
+
+
+def legacy_task_fields(text: str) -> dict[str, Any]:
+    """The loop formerly copied into handbook_index, sprint_close and task_status."""
+    data: dict[str, Any] = {}
+    for line in text.splitlines():
+        if ":" not in line or line.strip().startswith("-"):
+            continue
+        key, value = line.split(":", 1)
+        key = key.strip()
+        value = value.strip()
+        if value.startswith("[") and value.endswith("]"):
+            items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
+            data[key] = [item for item in items if item]
+        else:
+            data[key] = value
+    return data
+
+
+def legacy_release_task_yaml(content: str) -> dict[str, Any]:
+    """The former `release.parse_task_yaml_text` loop (booleans, integers, block lists)."""
+    data: dict[str, Any] = {}
+    current_key: str | None = None
+    collecting_list = False
+    for raw in content.splitlines():
+        line = raw.rstrip()
+        if not line.strip() or line.strip().startswith("#"):
+            continue
+        if collecting_list and current_key and line.strip().startswith("-"):
+            data.setdefault(current_key, []).append(line.strip()[1:].strip())
+            continue
+        collecting_list = False
+        if ":" not in line or line.strip().startswith("-"):
+            continue
+        key, value = line.split(":", 1)
+        key = key.strip()
+        value = value.strip()
+        current_key = key
+        if value == "":
+            data[key] = []
+            collecting_list = True
+            continue
+        if value.startswith("[") and value.endswith("]"):
+            inner = value[1:-1].strip()
+            if not inner:
+                data[key] = []
+            else:
+                items = [item.strip().strip("\"'") for item in inner.split(",")]
+                data[key] = [item for item in items if item]
+            continue
+        if value.lower() in {"true", "false"}:
+            data[key] = value.lower() == "true"
+            continue
+        if value.isdigit():
+            data[key] = int(value)
+            continue
+        data[key] = value
+    return data
+
+
+DAILY_KEYS = ("id", "title", "status", "story_points", "owner", "blocked_reason")
+
+
+def legacy_task_scalars(text: str) -> dict[str, Any]:
+    """The former `daily._parse_task_scalars` loop."""
+    data: dict[str, Any] = {}
+    for line in text.splitlines():
+        if ":" in line and not line.strip().startswith("-"):
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+            data[key] = int(value) if value.isdigit() else value
+    return data
+
+
+def legacy_phase_mapping(text: str) -> dict[str, Any]:
+    """The former `validate_docs.parse_simple_yaml_mapping` loop (top-level keys, block lists, quotes stripped)."""
+
+    def strip(val: str) -> str:
+        return val.strip().strip('"').strip("'")
+
+    data: dict[str, Any] = {}
+    lines = text.splitlines()
+    i = 0
+    n = len(lines)
+    while i < n:
+        line = lines[i]
+        if not line.strip() or line.startswith(" ") or ":" not in line or line.lstrip().startswith("-"):
+            i += 1
+            continue
+        key, val = line.split(":", 1)
+        if val.strip() == "" and i + 1 < n and lines[i + 1].lstrip().startswith("- "):
+            i += 1
+            items = []
+            while i < n and lines[i].startswith("  - "):
+                items.append(strip(lines[i].split("- ", 1)[1]))
+                i += 1
+            data[key.strip()] = items
+            continue
+        data[key.strip()] = strip(val)
+        i += 1
+    return data
+
+
+def _task_yaml(i: int) -> str:
+    return (
+        f"id: TASK-{i:05d}\n"
+        f"title: Synthetic task {i}\n"
+        f"feature: feature-{i % 25}\n"
+        "decision: ADR-0001\n"
+        "owner: '@owner'\n"
+        f"status: {('todo', 'doing', 'review', 'done')[i % 4]}\n"
+        f"story_points: {(1, 2, 3, 5, 8)[i % 5]}\n"
+        "prio: P2\n"
+        "due: 2026-01-09\n"
+        "release: v1.2.0\n"
+        f"release_gate: {'true' if i % 10 == 0 else 'false'}\n"
+        "lane: core\n"
+        "session: task-execution\n"
+        f"depends_on: [TASK-{max(i - 1, 0):05d}, FIRST_TASK]\n"
+        "acceptance:\n"
+        "  - Behaviour is covered by tests\n"
+        "  - Docs updated\n"
+        "# Notes: synthetic\n"
+    )
+
+
+def _phase_yaml(i: int) -> str:
+    return (
+        f"phase: {i}\n"
+        f'title: "Synthetic phase {i}"\n'
+        "features:\n"
+        f"  - feature-{i % 25}\n"
+        f"  - feature-{(i + 1) % 25}\n"
+        "decisions:\n"
+        "  - ADR-0001\n"
+    )
+
+
+def _best_of(repeat: int, texts: list[str], parse: Callable[[str], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            parse(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = Path(tmp) / f"TASK-{i:05d}" / "task.yaml"
+            path.parent.mkdir()
+            path.write_text(_task_yaml(i), encoding="utf-8")
+            paths.append(path)
+        texts = [path.read_text(encoding="utf-8") for path in paths]
+
+    phases = [_phase_yaml(i) for i in range(len(texts))]
+
+    # Each row times the view its callers actually read, one parse per file, against the loop that caller used.
+    views: list[tuple[str, list[str], Callable[[str], object], Callable[[str], object]]] = [
+        ("fields (handbook index)", texts, legacy_task_fields, lambda t: load_task_yaml(t).fields()),
+        ("typed (release, next)", texts, legacy_release_task_yaml, lambda t: load_task_yaml(t).typed()),
+        ("typed (daily)", texts, legacy_task_scalars, lambda t: load_task_yaml(t).typed()),
+        ("mapping (phase.yaml)", phases, legacy_phase_mapping, lambda t: load_task_yaml(t).mapping()),
+    ]
+    rows = []
+    for label, inputs, legacy, current in views:
+        for text in inputs[:100]:
+            expected = legacy(text)
+            actual = current(text)
+            if label == "typed (daily)":
+                # `ph daily` only reads these keys; its old loop left booleans and lists as text.
+                expected = {key: expected.get(key) for key in DAILY_KEYS}
+                actual = {key: actual.get(key) for key in DAILY_KEYS}
+            assert actual == expected, (label, actual, expected)
+        rows.append((f"{label} legacy", _best_of(args.repeat, inputs, legacy)))
+        rows.append((f"{label} load_task_yaml", _best_of(args.repeat, inputs, current)))
+
+    print(f"files: {len(texts)} (best of {args.repeat})")
+    for label, seconds in rows:
+        print(f"{label:<40} {seconds * 1000:8.1f} ms  {seconds / len(texts) * 1e6:6.2f} us/file")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
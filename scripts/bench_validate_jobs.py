@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Compare serial and threaded `ph validate` wall time on a synthetic handbook.
+
+`--latency-ms` adds a sleep to every file read to mimic a network-mounted handbook, where the validators are I/O bound.
+Every run starts cold (no parse cache, no in-process index) and must produce the same `validation.json`.
+
+Usage: PYTHONPATH=src python scripts/bench_validate_jobs.py [--sprints N] [--docs M] [--jobs J] [--latency-ms L]
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from ph import parse_cache
+from ph.handbook_index import invalidate_handbook_index
+from ph.validate_docs import run_validate
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _build_handbook(root: Path, *, sprints: int, docs: int) -> Path:
+    ph_data_root = root / ".project-handbook"
+    _write(ph_data_root / "process" / "checks" / "validation_rules.json", "{}")
+    _write(
+        ph_data_root / "config.json",
+        '{"handbook_schema_version": 1, "requires_ph_version": ">=0.0.1", "repo_root": "."}\n',
+    )
+    for n in range(docs):
+        _write(ph_data_root / "adr" / f"{n:04d}-decision.md", f"---\ntitle: ADR {n}\n---\n# ADR-{n:04d}\n")
+        _write(ph_data_root / "features" / f"f{n % 10}" / "notes" / f"note-{n}.md", f"---\ntitle: Note {n}\n---\n")
+    for s in range(sprints):
+        sprint_dir = ph_data_root / "sprints" / "2026" / f"SPRINT-2026-W{s:02d}"
+        _write(sprint_dir / "plan.md", f"---\ntitle: Sprint {s}\n---\n")
+        for t in range(20):
+            task_id = f"TASK-{s * 20 + t:04d}"
+            task_dir = sprint_dir / "tasks" / f"{task_id}-bench"
+            _write(
+                task_dir / "task.yaml",
+                f"id: {task_id}\ntitle: Bench\nfeature: f{t % 10}\ndecision: ADR-0001\nowner: @a\n"
+                "status: todo\nstory_points: 3\ndepends_on: [FIRST_TASK]\n",
+            )
+            _write(task_dir / "README.md", f"---\ntitle: {task_id}\n---\n")
+    return ph_data_root
+
+
+def _cold_run(*, root: Path, ph_data_root: Path, jobs: int, latency: float) -> tuple[float, str]:
+    shutil.rmtree(ph_data_root / ".cache", ignore_errors=True)
+    parse_cache._CACHES.clear()
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+
+    real_read_text = Path.read_text
+
+    def slow_read_text(self: Path, *a: object, **kw: object) -> str:
+        time.sleep(latency)
+        return real_read_text(self, *a, **kw)  # type: ignore[arg-type]
+
+    start = time.perf_counter()
+    with mock.patch.object(Path, "read_text", slow_read_text):
+        _code, out, _message = run_validate(
+            ph_root=root,
+            ph_project_root=ph_data_root,
+            ph_data_root=ph_data_root,
+            scope="project",
+            quick=False,
+            silent_success=True,
+            jobs=jobs,
+        )
+    elapsed = time.perf_counter() - start
+    return elapsed, out.read_text(encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sprints", type=int, default=10)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        ph_data_root = _build_handbook(root, sprints=args.sprints, docs=args.docs)
+        latency = args.latency_ms / 1000
+        serial, serial_report = _cold_run(root=root, ph_data_root=ph_data_root, jobs=1, latency=latency)
+        threaded, threaded_report = _cold_run(root=root, ph_data_root=ph_data_root, jobs=args.jobs, latency=latency)
+        assert threaded_report == serial_report, "threaded validation.json differs from the serial run"
+
+    print(f"sprints: {args.sprints}, docs: {args.docs}, read latency: {args.latency_ms} ms")
+    print(f"--jobs 1:  {serial * 1000:8.1f} ms")
+    print(f"--jobs {args.jobs}:  {threaded * 1000:8.1f} ms  ({serial / threaded:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,8 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..handbook_index import get_handbook_index, invalidate_handbook_index
+
 ADR_ID_RE = re.compile(r"^ADR-(\d{4})$")
 ADR_FILENAME_RE = re.compile(r"^(\d{4})-([a-z0-9]+(?:-[a-z0-9]+)*)\.md$")
 DR_ID_RE = re.compile(r"^DR-(\d{4})$")
@@ -88,31 +90,11 @@ def _find_existing_adr_by_id(*, adr_dir: Path, adr_id: str) -> Path | None:
 
 
 def _find_dr_markdown_matches(*, ph_data_root: Path, dr_id: str) -> list[Path]:
-    matches: list[Path] = []
-
-    project_dr_dir = ph_data_root / "decision-register"
-    if project_dr_dir.exists():
-        matches.extend(sorted(project_dr_dir.glob(f"{dr_id}-*.md")))
-
-    features_dir = ph_data_root / "features"
-    if features_dir.exists():
-        for entry in sorted(features_dir.iterdir()):
-            if not entry.is_dir():
-                continue
-            if entry.name == "implemented":
-                for implemented in sorted(entry.iterdir()):
-                    if not implemented.is_dir():
-                        continue
-                    folder = implemented / "decision-register"
-                    if folder.exists():
-                        matches.extend(sorted(folder.glob(f"{dr_id}-*.md")))
-                continue
-
-            folder = entry / "decision-register"
-            if folder.exists():
-                matches.extend(sorted(folder.glob(f"{dr_id}-*.md")))
-
-    return matches
+    return [
+        ref.path
+        for ref in get_handbook_index(ph_data_root=ph_data_root).decisions().refs(dr_id)
+        if ref.kind == "decision-register" and ref.source == "filename" and not ref.nested
+    ]
 
 
 def _render_adr_markdown(*, spec: AdrAddSpec) -> str:
@@ -325,6 +307,7 @@ def run_adr_add(
     try:
         _validate_generated_adr(path=target, content=content, expected_number=spec.number)
         target.write_text(content, encoding="utf-8")
+        invalidate_handbook_index(ph_data_root=ph_data_root)
     except OSError as exc:
         print(f"❌ Failed to write ADR.\n  path: {target}\n  error: {exc}\n")
         return 1
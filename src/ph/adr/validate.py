@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from ..handbook_tree import HandbookTree
 from .add import ADR_FILENAME_RE, ADR_ID_RE, RECOMMENDED_H1, REQUIRED_H1
 
 
@@ -53,7 +54,7 @@ def _normalize_optional_yaml_scalar(value: str | None) -> str | None:
     return candidate
 
 
-def validate_adrs(*, issues: list[dict], root: Path) -> None:
+def validate_adrs(*, issues: list[dict], root: Path, tree: HandbookTree | None = None) -> None:
     adr_dir = root / "adr"
     if not adr_dir.exists():
         return
@@ -61,7 +62,7 @@ def validate_adrs(*, issues: list[dict], root: Path) -> None:
     id_to_paths: dict[str, list[str]] = {}
     superseded_refs: list[tuple[str, str]] = []
 
-    for md in sorted(adr_dir.rglob("*.md")):
+    for md in sorted((tree or HandbookTree(root)).with_suffix(".md", "adr")):
         rel_path = md.relative_to(root).as_posix()
         text = ""
         try:
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from .context import Context, build_context
+from .handbook_index import invalidate_handbook_index
+from .parse_cache import cache_dir_for
+from .validate_profile import ValidationProfile, profile_requested
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms validate in the foreground
+    fcntl = None  # type: ignore[assignment]
+
+PENDING_FILENAME = "validation.pending"
+_LOCK_FILENAME = "post_validate.lock"
+_WORKER_LOCK_FILENAME = "post_validate.worker.lock"
+_RESULT_FILENAME = "post_validate_result.json"
+
+
+def background_supported() -> bool:
+    return fcntl is not None
+
+
+def pending_path(*, ph_data_root: Path) -> Path:
+    return ph_data_root / "status" / PENDING_FILENAME
+
+
+def worker_lock_path(*, ph_data_root: Path) -> Path:
+    """The file a running worker holds an exclusive `flock` on for its whole lifetime."""
+    return cache_dir_for(ph_data_root=ph_data_root) / _WORKER_LOCK_FILENAME
+
+
+def _result_path(*, ph_data_root: Path) -> Path:
+    return cache_dir_for(ph_data_root=ph_data_root) / _RESULT_FILENAME
+
+
+@contextmanager
+def _state_lock(*, ph_data_root: Path) -> Iterator[None]:
+    """Serialize reads/updates of the pending marker between `ph` invocations and the worker."""
+    lock_path = cache_dir_for(ph_data_root=ph_data_root) / _LOCK_FILENAME
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _read_pending(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _claim_worker_lock(*, ph_data_root: Path) -> int | None:
+    """Return a descriptor holding the worker lock, or None while a live worker holds it.
+
+    The lock belongs to the open file description rather than a PID, so a recycled PID cannot pass for a live worker;
+    it is released when the worker closes the descriptor or exits, however it exits.
+    """
+    path = worker_lock_path(ph_data_root=ph_data_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _merge_domains(current: list[str] | None, extra: Sequence[str] | None) -> list[str] | None:
+    if current is None or extra is None:
+        return None
+    return sorted(set(current) | set(extra))
+
+
+def request_background_validation(
+    *, ctx: Context, domains: Sequence[str] | None, env: Mapping[str, str] | None = None
+) -> bool:
+    """Queue a post-command validation and return True when a new detached worker was started.
+
+    While a worker is alive its pending marker is updated instead (bumped generation, merged domains); the worker
+    re-runs once more before exiting, so a burst of commands costs at most one extra validation.
+    """
+    env = env or os.environ
+    marker = pending_path(ph_data_root=ctx.ph_data_root)
+    with _state_lock(ph_data_root=ctx.ph_data_root):
+        lock_fd = _claim_worker_lock(ph_data_root=ctx.ph_data_root)
+        if lock_fd is None:
+            pending = _read_pending(marker) or {}
+            pending["generation"] = int(pending.get("generation") or 0) + 1
+            pending["domains"] = _merge_domains(pending.get("domains", []), domains)
+            _write_json(marker, pending)
+            return False
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            # The worker inherits the locked descriptor and holds it until it exits.
+            process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "ph.background_validate",
+                    "--root",
+                    str(ctx.ph_root),
+                    "--scope",
+                    ctx.scope,
+                    "--lock-fd",
+                    str(lock_fd),
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=dict(env),
+                start_new_session=True,
+                close_fds=True,
+                pass_fds=(lock_fd,),
+            )
+        finally:
+            os.close(lock_fd)
+        _write_json(
+            marker,
+            {"pid": process.pid, "generation": 1, "domains": None if domains is None else sorted(set(domains))},
+        )
+    return True
+
+
+def take_background_failure(*, ph_data_root: Path) -> str | None:
+    """Return (and clear) the failure message left by the last finished background validation, if any."""
+    path = _result_path(ph_data_root=ph_data_root)
+    if not path.exists():
+        return None
+    with _state_lock(ph_data_root=ph_data_root):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            payload = {}
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    if not isinstance(payload, dict) or payload.get("exit_code") in (0, None):
+        return None
+    return str(payload.get("message") or "").strip() or None
+
+
+def _run_worker(*, ctx: Context, env: Mapping[str, str], lock_fd: int) -> int:
+    from .validate_docs import run_validate
+
+    marker = pending_path(ph_data_root=ctx.ph_data_root)
+    while True:
+        with _state_lock(ph_data_root=ctx.ph_data_root):
+            pending = _read_pending(marker) or {}
+            generation = pending.get("generation")
+            domains = pending.get("domains")
+            if pending:
+                # Requests arriving from here on are collected into a fresh domain set for the next round.
+                pending["domains"] = []
+                _write_json(marker, pending)
+
+        profile = ValidationProfile() if profile_requested(env) else None
+        try:
+            invalidate_handbook_index(ph_data_root=ctx.ph_data_root)
+            exit_code, _out_path, message = run_validate(
+                ph_root=ctx.ph_root,
+                ph_project_root=ctx.ph_project_root,
+                ph_data_root=ctx.ph_data_root,
+                scope=ctx.scope,
+                quick=True,
+                silent_success=True,
+                incremental=True,
+                domains=domains,
+                profile=profile,
+            )
+        except Exception as exc:
+            # Nobody watches the worker's output; leave the crash for the next command to report.
+            exit_code, message = 1, f"background validation crashed: {type(exc).__name__}: {exc}"
+            profile = None
+        if profile is not None:
+            profile.write_json(ph_data_root=ctx.ph_data_root, source="background", quick=True)
+        result = {"exit_code": exit_code, "message": " ".join(str(message).split())}
+
+        with _state_lock(ph_data_root=ctx.ph_data_root):
+            pending = _read_pending(marker) or {}
+            if pending.get("generation") != generation:
+                continue
+            _write_json(_result_path(ph_data_root=ctx.ph_data_root), result)
+            try:
+                marker.unlink()
+            except OSError:
+                pass
+            # Released under the state lock, so a request arriving now starts a new worker rather than being missed.
+            os.close(lock_fd)
+            return exit_code
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ph.background_validate")
+    parser.add_argument("--root", required=True)
+    parser.add_argument("--scope", required=True)
+    parser.add_argument("--lock-fd", type=int, default=None)
+    args = parser.parse_args(argv)
+    ctx = build_context(ph_root=Path(args.root), scope=args.scope)
+    lock_fd = args.lock_fd
+    if lock_fd is None:
+        # Started by hand: take the worker lock like `request_background_validation` does.
+        lock_fd = _claim_worker_lock(ph_data_root=ctx.ph_data_root)
+        if lock_fd is None:
+            return 0
+    return _run_worker(ctx=ctx, env=os.environ, lock_fd=lock_fd)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from . import __version__
+from .context import Context
+from .parse_cache import PARSE_CACHE_FILENAME, PARSE_CACHE_SCHEMA, cache_dir_for
+
+
+def _cache_files(cache_dir: Path) -> list[Path]:
+    if not cache_dir.exists():
+        return []
+    return sorted(p for p in cache_dir.rglob("*") if p.is_file())
+
+
+def run_cache_stats(*, ctx: Context) -> int:
+    cache_dir = cache_dir_for(ph_data_root=ctx.ph_data_root)
+    files = _cache_files(cache_dir)
+    total_bytes = sum(p.stat().st_size for p in files)
+
+    print(f"Cache directory: {cache_dir}")
+    parse_cache_path = cache_dir / PARSE_CACHE_FILENAME
+    if parse_cache_path.exists():
+        try:
+            payload = json.loads(parse_cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            payload = {}
+        if not isinstance(payload, dict):
+            payload = {}
+        entries = payload.get("entries")
+        entries = entries if isinstance(entries, dict) else {}
+        kinds: dict[str, int] = {}
+        for entry in entries.values():
+            values = entry.get("values") if isinstance(entry, dict) else None
+            for kind in values or {}:
+                kinds[kind] = kinds.get(kind, 0) + 1
+        current = payload.get("ph_version") == __version__ and payload.get("schema") == PARSE_CACHE_SCHEMA
+        print(
+            f"Parse cache: {len(entries)} file(s), {parse_cache_path.stat().st_size} bytes "
+            f"(ph {payload.get('ph_version', '?')}, schema {payload.get('schema', '?')}"
+            f"{'' if current else ', stale'})"
+        )
+        for kind, count in sorted(kinds.items()):
+            print(f"  {kind}: {count}")
+    else:
+        print("Parse cache: empty")
+    print(f"Total: {len(files)} file(s), {total_bytes} bytes")
+    return 0
+
+
+def run_cache_clear(*, ctx: Context) -> int:
+    cache_dir = cache_dir_for(ph_data_root=ctx.ph_data_root)
+    files = _cache_files(cache_dir)
+    if cache_dir.exists():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    print(f"Removed {len(files)} cache file(s) from {cache_dir}")
+    return 0
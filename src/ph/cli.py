@@ -5,90 +5,24 @@ import json
 import os
 import shlex
 import sys
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from typing import Any
 
 from . import __version__
-from .adr import run_adr_add, run_adr_list
 from .adr.add import add_adr_add_arguments
-from .backlog import (
-    run_backlog_add,
-    run_backlog_assign,
-    run_backlog_list,
-    run_backlog_rubric,
-    run_backlog_stats,
-    run_backlog_triage,
-)
-from .clean import clean_python_caches
 from .cli_group_help import list_subcommands, print_group_overview
 from .config import ConfigError, load_handbook_config, validate_handbook_config
 from .context import ScopeError, build_context, resolve_scope
-from .daily import check_status as check_daily_status
-from .daily import create_daily_status
-from .dashboard import run_dashboard
-from .doctor import run_doctor
 from .dr.add import add_dr_add_arguments, run_dr_add
-from .end_session import EndSessionError, run_end_session_codex, run_end_session_skip_codex
-from .evidence import EvidenceError, run_evidence_new, run_evidence_run
-from .fdr import run_fdr_add
 from .fdr.add import add_fdr_add_arguments
-from .feature import run_feature_create, run_feature_list, run_feature_status
-from .feature_archive import run_feature_archive
-from .feature_status_updater import run_feature_summary, run_feature_update_status
-from .git_hooks import install_git_hooks
-from .help_text import get_help_text
 from .hooks import plan_post_command_hook, run_post_command_hook
-from .init_repo import InitError, run_init
-from .next import run_next
-from .onboarding import (
-    OnboardingError,
-    SessionList,
-    list_session_topics,
-    read_latest_session_summary,
-    render_onboarding,
-    render_session_template,
-)
-from .orchestration import run_check_all, run_test_system
-from .parking import run_parking_add, run_parking_list, run_parking_promote, run_parking_review
-from .pre_exec import PreExecError, run_pre_exec_audit, run_pre_exec_lint
-from .process_refresh import run_process_refresh
-from .question import run_question_add, run_question_answer, run_question_close, run_question_list, run_question_show
-from .release import (
-    run_release_activate,
-    run_release_add_feature,
-    run_release_clear,
-    run_release_close,
-    run_release_draft,
-    run_release_list,
-    run_release_migrate_slot_format,
-    run_release_plan,
-    run_release_show,
-    run_release_status,
-    run_release_suggest,
-)
-from .reset import ResetError, run_reset
-from .reset_smoke import run_reset_smoke
-from .roadmap import run_roadmap_create, run_roadmap_show, run_roadmap_validate
 from .root import RootResolutionError, resolve_ph_root
-from .sprint_archive import run_sprint_archive
-from .sprint_burndown import run_sprint_burndown
-from .sprint_capacity import run_sprint_capacity
-from .sprint_close import run_sprint_close
-from .sprint_commands import sprint_open, sprint_plan
-from .sprint_status import run_sprint_status
-from .sprint_tasks import run_sprint_tasks
-from .status import run_status
-from .task_create import run_task_create
-from .task_status import run_task_status
-from .task_view import run_task_list, run_task_show
-from .validate_docs import run_validate
-
-
-def _format_cli_preamble(*, ph_root: Path, cmd_args: list[str]) -> str:
-    reporter = (
-        os.environ.get("npm_config_reporter")
-        or os.environ.get("NPM_CONFIG_REPORTER")
-        or os.environ.get("PNPM_REPORTER")
-    )
+from .serve_client import forward_to_server
+
+
+def _format_cli_preamble(*, ph_root: Path, cmd_args: list[str], env: Mapping[str, str]) -> str:
+    reporter = env.get("npm_config_reporter") or env.get("NPM_CONFIG_REPORTER") or env.get("PNPM_REPORTER")
     if isinstance(reporter, str) and reporter.strip().lower() == "silent":
         return ""
 
@@ -189,6 +123,65 @@ def _apply_usage_placeholders(root_parser: argparse.ArgumentParser) -> None:
             stack.append(child)
 
 
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """Top-level subcommands whose arguments are only added once the command is selected.
+
+    `ph --help` only needs each command's name and help line; a command's `builder` fills in its parser (arguments,
+    nested subcommands) right before argparse hands the remaining arguments to it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._builders: dict[str, Callable[[argparse.ArgumentParser], None]] = {}
+
+    def add_parser(
+        self, name: str, *, builder: Callable[[argparse.ArgumentParser], None] | None = None, **kwargs: Any
+    ) -> argparse.ArgumentParser:
+        parser = super().add_parser(name, **kwargs)
+        if builder is not None:
+            self._builders[name] = builder
+        return parser
+
+    def materialize(self, name: str) -> None:
+        builder = self._builders.pop(name, None)
+        if builder is None:
+            return
+        parser = self._name_parser_map[name]
+        # Nested subcommand progs are derived from the parent's usage, which must not be the placeholder yet.
+        parser.usage = None
+        builder(parser)
+        _apply_usage_placeholders(parser)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        if values:
+            self.materialize(values[0])
+        super().__call__(parser, namespace, values, option_string)
+
+
+# Command modules are imported only when their subcommand runs; their user-facing errors are caught only if loaded.
+_COMMAND_ERRORS = (
+    ("onboarding", "OnboardingError"),
+    ("end_session", "EndSessionError"),
+    ("reset", "ResetError"),
+    ("evidence", "EvidenceError"),
+)
+
+
+def _loaded_command_errors() -> tuple[type[Exception], ...]:
+    errors: list[type[Exception]] = []
+    for module_name, error_name in _COMMAND_ERRORS:
+        module = sys.modules.get(f"{__package__}.{module_name}")
+        if module is not None:
+            errors.append(getattr(module, error_name))
+    return tuple(errors)
+
+
 def build_parser() -> argparse.ArgumentParser:
     def _add_common_args(p: argparse.ArgumentParser, *, suppress_defaults: bool) -> None:
         default = argparse.SUPPRESS if suppress_defaults else None
@@ -225,30 +218,36 @@ def build_parser() -> argparse.ArgumentParser:
 
     parser = argparse.ArgumentParser(prog="ph", description="Project Handbook CLI", parents=[main_common])
     parser.set_defaults(_post_validate="never")
-    subparsers = parser.add_subparsers(dest="command", title="Commands", metavar="<command>")
+    subparsers = parser.add_subparsers(
+        dest="command", title="Commands", metavar="<command>", action=_LazySubParsersAction
+    )
 
     version_parser = subparsers.add_parser("version", help="Print installed ph version", parents=[sub_common])
     version_parser.set_defaults(_post_validate="never")
     version_parser.set_defaults(_handler=_handle_version)
 
-    init_parser = subparsers.add_parser("init", help="Initialize a new handbook instance repo", parents=[sub_common])
-    init_parser.set_defaults(_post_validate="never")
-    init_gitignore_group = init_parser.add_mutually_exclusive_group()
-    init_gitignore_group.add_argument(
-        "--gitignore",
-        dest="gitignore",
-        action="store_true",
-        default=argparse.SUPPRESS,
-        help="Update/create .gitignore with recommended handbook ignores (default)",
-    )
-    init_gitignore_group.add_argument(
-        "--no-gitignore",
-        dest="gitignore",
-        action="store_false",
-        default=argparse.SUPPRESS,
-        help="Do not read or write .gitignore",
+    def _build_init(init_parser: argparse.ArgumentParser) -> None:
+        init_parser.set_defaults(_post_validate="never")
+        init_gitignore_group = init_parser.add_mutually_exclusive_group()
+        init_gitignore_group.add_argument(
+            "--gitignore",
+            dest="gitignore",
+            action="store_true",
+            default=argparse.SUPPRESS,
+            help="Update/create .gitignore with recommended handbook ignores (default)",
+        )
+        init_gitignore_group.add_argument(
+            "--no-gitignore",
+            dest="gitignore",
+            action="store_false",
+            default=argparse.SUPPRESS,
+            help="Do not read or write .gitignore",
+        )
+        init_parser.set_defaults(gitignore=True)
+
+    subparsers.add_parser(
+        "init", help="Initialize a new handbook instance repo", parents=[sub_common], builder=_build_init
     )
-    init_parser.set_defaults(gitignore=True)
 
     doctor_parser = subparsers.add_parser(
         "doctor",
@@ -258,112 +257,208 @@ def build_parser() -> argparse.ArgumentParser:
     doctor_parser.set_defaults(_post_validate="quick")
     doctor_parser.set_defaults(_handler=_handle_doctor)
 
-    help_parser = subparsers.add_parser("help", help="Show help topics", parents=[sub_common])
-    help_parser.set_defaults(_post_validate="never")
-    help_parser.add_argument("topic", nargs="?", help="Help topic")
+    def _build_help(help_parser: argparse.ArgumentParser) -> None:
+        help_parser.set_defaults(_post_validate="never")
+        help_parser.add_argument("topic", nargs="?", help="Help topic")
+
+    subparsers.add_parser("help", help="Show help topics", parents=[sub_common], builder=_build_help)
+
+    def _build_onboarding(onboarding_parser: argparse.ArgumentParser) -> None:
+        onboarding_parser.set_defaults(_post_validate="never")
+        onboarding_subparsers = onboarding_parser.add_subparsers(
+            dest="onboarding_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        onboarding_session = onboarding_subparsers.add_parser(
+            "session",
+            help="Show onboarding session templates",
+            parents=[sub_common],
+        )
+        onboarding_session.set_defaults(_post_validate="never")
+        onboarding_session.add_argument(
+            "session_topic", nargs="?", help="Session topic (or 'list' / 'continue-session')"
+        )
 
-    onboarding_parser = subparsers.add_parser(
+    subparsers.add_parser(
         "onboarding",
         help="Show onboarding docs and sessions",
         parents=[sub_common],
+        builder=_build_onboarding,
     )
-    onboarding_parser.set_defaults(_post_validate="never")
-    onboarding_subparsers = onboarding_parser.add_subparsers(
-        dest="onboarding_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    onboarding_session = onboarding_subparsers.add_parser(
-        "session",
-        help="Show onboarding session templates",
-        parents=[sub_common],
-    )
-    onboarding_session.set_defaults(_post_validate="never")
-    onboarding_session.add_argument("session_topic", nargs="?", help="Session topic (or 'list' / 'continue-session')")
-
-    hooks_parser = subparsers.add_parser("hooks", help="Install repo git hooks", parents=[sub_common])
-    hooks_parser.set_defaults(_post_validate="never")
-    hooks_subparsers = hooks_parser.add_subparsers(
-        dest="hooks_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    hooks_install = hooks_subparsers.add_parser("install", help="Install repo git hooks", parents=[sub_common])
-    hooks_install.set_defaults(_post_validate="never")
 
-    end_session_parser = subparsers.add_parser(
+    def _build_hooks(hooks_parser: argparse.ArgumentParser) -> None:
+        hooks_parser.set_defaults(_post_validate="never")
+        hooks_subparsers = hooks_parser.add_subparsers(
+            dest="hooks_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        hooks_install = hooks_subparsers.add_parser("install", help="Install repo git hooks", parents=[sub_common])
+        hooks_install.set_defaults(_post_validate="never")
+
+    subparsers.add_parser("hooks", help="Install repo git hooks", parents=[sub_common], builder=_build_hooks)
+
+    def _build_end_session(end_session_parser: argparse.ArgumentParser) -> None:
+        end_session_parser.set_defaults(_post_validate="never")
+        end_session_parser.add_argument("--log", required=True, help="Path to rollout log file")
+        end_session_parser.add_argument(
+            "--force", action="store_true", help="Process the provided --log even if cwd mismatches"
+        )
+        end_session_parser.add_argument("--session-id", help="Explicit session id to match")
+        end_session_parser.add_argument(
+            "--session-end-mode",
+            choices=["none", "continue-task", "sprint-hand-off"],
+            default="none",
+            help="Emit a lightweight session-end recap",
+        )
+        end_session_parser.add_argument(
+            "--session-end-codex", action="store_true", help="Use Codex enrichment for session-end"
+        )
+        end_session_parser.add_argument(
+            "--session-end-codex-model", help="Model to use for session-end Codex enrichment"
+        )
+        end_session_parser.add_argument("--skip-codex", action="store_true", help="Skip Codex calls (offline mode)")
+        end_session_parser.add_argument("--workstream", help="Workstream identifier for session_end artifacts")
+        end_session_parser.add_argument("--task-ref", help="Optional task identifier for session_end artifacts")
+        end_session_parser.add_argument("--codex-model", help="Model used for headless summarization")
+        end_session_parser.add_argument(
+            "--codex-jobs",
+            type=int,
+            metavar="N",
+            help="Summarize transcript chunks with up to N concurrent codex processes (default: 4; 1 runs serially)",
+        )
+        end_session_parser.add_argument(
+            "--no-codex-cache",
+            action="store_true",
+            help="Re-summarize every chunk instead of reusing outputs cached under process/sessions/logs/",
+        )
+        end_session_parser.add_argument(
+            "--since", help="Only summarize entries from this point on (e.g. 90m, 2h, 1d, or an ISO-8601 timestamp)"
+        )
+        end_session_parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Continue this rollout's previous summary from its checkpoint, parsing only entries added since",
+        )
+        end_session_parser.add_argument(
+            "--no-rollout-index",
+            action="store_true",
+            help="Stream the whole log instead of using the sidecar rollout index under process/sessions/logs/",
+        )
+        end_session_parser.add_argument(
+            "--reasoning-effort",
+            choices=["minimal", "low", "medium", "high"],
+            help="Override Codex reasoning effort for compression prompts.",
+        )
+        end_session_parser.add_argument(
+            "--reasoning-summary",
+            choices=["auto", "concise", "detailed", "none"],
+            help="Override Codex reasoning summary style.",
+        )
+        end_session_parser.add_argument(
+            "--model-verbosity",
+            choices=["low", "medium", "high"],
+            help="Override Codex model verbosity (experimental).",
+        )
+
+    subparsers.add_parser(
         "end-session",
         help="Summarize a Codex session rollout log",
         parents=[sub_common],
-    )
-    end_session_parser.set_defaults(_post_validate="never")
-    end_session_parser.add_argument("--log", required=True, help="Path to rollout log file")
-    end_session_parser.add_argument(
-        "--force", action="store_true", help="Process the provided --log even if cwd mismatches"
-    )
-    end_session_parser.add_argument("--session-id", help="Explicit session id to match")
-    end_session_parser.add_argument(
-        "--session-end-mode",
-        choices=["none", "continue-task", "sprint-hand-off"],
-        default="none",
-        help="Emit a lightweight session-end recap",
-    )
-    end_session_parser.add_argument(
-        "--session-end-codex", action="store_true", help="Use Codex enrichment for session-end"
-    )
-    end_session_parser.add_argument("--session-end-codex-model", help="Model to use for session-end Codex enrichment")
-    end_session_parser.add_argument("--skip-codex", action="store_true", help="Skip Codex calls (offline mode)")
-    end_session_parser.add_argument("--workstream", help="Workstream identifier for session_end artifacts")
-    end_session_parser.add_argument("--task-ref", help="Optional task identifier for session_end artifacts")
-    end_session_parser.add_argument("--codex-model", help="Model used for headless summarization")
-    end_session_parser.add_argument(
-        "--reasoning-effort",
-        choices=["minimal", "low", "medium", "high"],
-        help="Override Codex reasoning effort for compression prompts.",
-    )
-    end_session_parser.add_argument(
-        "--reasoning-summary",
-        choices=["auto", "concise", "detailed", "none"],
-        help="Override Codex reasoning summary style.",
-    )
-    end_session_parser.add_argument(
-        "--model-verbosity",
-        choices=["low", "medium", "high"],
-        help="Override Codex model verbosity (experimental).",
+        builder=_build_end_session,
     )
 
     clean_parser = subparsers.add_parser("clean", help="Remove Python cache files under PH_ROOT", parents=[sub_common])
     clean_parser.set_defaults(_post_validate="never")
 
-    reset_parser = subparsers.add_parser(
-        "reset",
-        help="Reset project scope (dry-run by default)",
+    def _build_cache(cache_parser: argparse.ArgumentParser) -> None:
+        cache_parser.set_defaults(_post_validate="never")
+        cache_subparsers = cache_parser.add_subparsers(
+            dest="cache_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        cache_stats = cache_subparsers.add_parser("stats", help="Show parse cache statistics", parents=[sub_common])
+        cache_stats.set_defaults(_post_validate="never")
+        cache_clear = cache_subparsers.add_parser("clear", help="Remove cached parse results", parents=[sub_common])
+        cache_clear.set_defaults(_post_validate="never")
+
+    subparsers.add_parser("cache", help="Inspect or clear the parse cache", parents=[sub_common], builder=_build_cache)
+
+    def _build_serve(serve_parser: argparse.ArgumentParser) -> None:
+        serve_parser.set_defaults(_post_validate="never")
+        serve_parser.add_argument(
+            "--idle-timeout",
+            type=float,
+            default=None,
+            help="Exit after this many seconds without requests (default: run until stopped)",
+        )
+
+    subparsers.add_parser(
+        "serve",
+        help="Keep a warm ph process for this root and run commands sent over a Unix socket",
         parents=[sub_common],
+        builder=_build_serve,
     )
-    reset_parser.set_defaults(_post_validate="never")
-    reset_parser.add_argument(
-        "--spec",
-        default=".project-handbook/process/automation/reset_spec.json",
-        help="Repo-relative path to reset spec JSON",
+
+    def _build_watch(watch_parser: argparse.ArgumentParser) -> None:
+        watch_parser.set_defaults(_post_validate="never")
+        watch_parser.add_argument(
+            "--debounce",
+            type=float,
+            default=0.5,
+            help="Seconds the tree must stay quiet before regenerating (default: 0.5)",
+        )
+        watch_parser.add_argument(
+            "--poll", action="store_true", help="Use the stat-based poller even when inotify is available"
+        )
+        watch_parser.add_argument(
+            "--poll-interval", type=float, default=1.0, help="Seconds between polls (default: 1.0)"
+        )
+
+    subparsers.add_parser(
+        "watch",
+        help="Regenerate status/current.json and other derived artifacts when handbook files change",
+        parents=[sub_common],
+        builder=_build_watch,
     )
-    reset_parser.add_argument(
-        "--include-system",
-        action="store_true",
-        help="Also wipe .project-handbook/system/** (destructive; default: preserve system scope)",
+
+    def _build_reset(reset_parser: argparse.ArgumentParser) -> None:
+        reset_parser.set_defaults(_post_validate="never")
+        reset_parser.add_argument(
+            "--spec",
+            default=".project-handbook/process/automation/reset_spec.json",
+            help="Repo-relative path to reset spec JSON",
+        )
+        reset_parser.add_argument(
+            "--include-system",
+            action="store_true",
+            help="Also wipe .project-handbook/system/** (destructive; default: preserve system scope)",
+        )
+        reset_parser.add_argument("--confirm", default="", help="Must be exactly RESET to execute")
+        reset_parser.add_argument("--force", default="", help="Must be exactly true to execute")
+
+    subparsers.add_parser(
+        "reset",
+        help="Reset project scope (dry-run by default)",
+        parents=[sub_common],
+        builder=_build_reset,
     )
-    reset_parser.add_argument("--confirm", default="", help="Must be exactly RESET to execute")
-    reset_parser.add_argument("--force", default="", help="Must be exactly true to execute")
 
-    reset_smoke_parser = subparsers.add_parser(
+    def _build_reset_smoke(reset_smoke_parser: argparse.ArgumentParser) -> None:
+        reset_smoke_parser.set_defaults(_post_validate="never")
+        reset_smoke_parser.add_argument(
+            "--include-system",
+            action="store_true",
+            help="Also wipe system scope (default: verify system scope is preserved)",
+        )
+
+    subparsers.add_parser(
         "reset-smoke",
         help="Run reset smoke verification (destructive to project scope)",
         parents=[sub_common],
-    )
-    reset_smoke_parser.set_defaults(_post_validate="never")
-    reset_smoke_parser.add_argument(
-        "--include-system",
-        action="store_true",
-        help="Also wipe system scope (default: verify system scope is preserved)",
+        builder=_build_reset_smoke,
     )
 
     dashboard_parser = subparsers.add_parser(
@@ -372,555 +467,646 @@ def build_parser() -> argparse.ArgumentParser:
         parents=[sub_common],
     )
     dashboard_parser.set_defaults(_post_validate="never")
-    next_parser = subparsers.add_parser(
+
+    def _build_next(next_parser: argparse.ArgumentParser) -> None:
+        next_parser.set_defaults(_post_validate="never")
+        next_parser.add_argument(
+            "--format", choices=["text", "json"], default="text", help="Output format (default: text)"
+        )
+        next_parser.add_argument("--release", help="Release version (vX.Y.Z or 'current'; default: current)")
+        next_parser.add_argument("--sprint", help="Sprint id (SPRINT-... or 'current'; default: current)")
+
+    subparsers.add_parser(
         "next",
         help="One-screen current context + next actions",
         parents=[sub_common],
+        builder=_build_next,
     )
-    next_parser.set_defaults(_post_validate="never")
-    next_parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format (default: text)")
-    next_parser.add_argument("--release", help="Release version (vX.Y.Z or 'current'; default: current)")
-    next_parser.add_argument("--sprint", help="Sprint id (SPRINT-... or 'current'; default: current)")
+
     status_parser = subparsers.add_parser("status", help="Generate status rollup", parents=[sub_common])
     status_parser.set_defaults(_post_validate="never")
     check_all_parser = subparsers.add_parser("check-all", help="Run validate + status", parents=[sub_common])
     check_all_parser.set_defaults(_post_validate="never")
 
-    test_parser = subparsers.add_parser("test", help="Run automation smoke suites", parents=[sub_common])
-    test_parser.set_defaults(_post_validate="never")
-    test_subparsers = test_parser.add_subparsers(
-        dest="test_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    test_system_parser = test_subparsers.add_parser(
-        "system",
-        help="Run handbook system smoke suite",
-        parents=[sub_common],
-    )
-    test_system_parser.set_defaults(_post_validate="never")
-
-    sprint_parser = subparsers.add_parser("sprint", help="Manage sprint lifecycle", parents=[sub_common])
-    sprint_parser.set_defaults(_post_validate="never")
-    sprint_subparsers = sprint_parser.add_subparsers(
-        dest="sprint_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    sprint_plan_parser = sprint_subparsers.add_parser("plan", help="Create sprint plan", parents=[sub_common])
-    sprint_plan_parser.set_defaults(_post_validate="quick")
-    sprint_plan_parser.add_argument("--sprint", help="Sprint ID (default: computed)")
-    sprint_plan_parser.add_argument("--force", action="store_true", help="Overwrite existing plan.md")
-    sprint_open_parser = sprint_subparsers.add_parser(
-        "open", help="Set current sprint to existing", parents=[sub_common]
-    )
-    sprint_open_parser.set_defaults(_post_validate="quick")
-    sprint_open_parser.add_argument("--sprint", required=True, help="Sprint ID to open")
-    sprint_status_parser = sprint_subparsers.add_parser("status", help="Show sprint status", parents=[sub_common])
-    sprint_status_parser.set_defaults(_post_validate="never")
-    sprint_status_parser.add_argument("--sprint", help="Sprint ID (default: current)")
-    sprint_tasks_parser = sprint_subparsers.add_parser("tasks", help="List sprint tasks", parents=[sub_common])
-    sprint_tasks_parser.set_defaults(_post_validate="never")
-    sprint_tasks_parser.add_argument("--sprint", help="Sprint ID (default: current)")
-    sprint_burndown_parser = sprint_subparsers.add_parser(
-        "burndown", help="Generate sprint burndown", parents=[sub_common]
-    )
-    sprint_burndown_parser.set_defaults(_post_validate="never")
-    sprint_burndown_parser.add_argument("--sprint", help="Sprint ID (default: current)")
-    sprint_capacity_parser = sprint_subparsers.add_parser(
-        "capacity", help="Show sprint capacity allocation", parents=[sub_common]
-    )
-    sprint_capacity_parser.set_defaults(_post_validate="never")
-    sprint_capacity_parser.add_argument("--sprint", help="Sprint ID (default: current)")
-    sprint_archive_parser = sprint_subparsers.add_parser(
-        "archive", help="Archive sprint into sprints/archive", parents=[sub_common]
-    )
-    sprint_archive_parser.set_defaults(_post_validate="quick")
-    sprint_archive_parser.add_argument("--sprint", help="Sprint ID (default: current)")
-    sprint_close_parser = sprint_subparsers.add_parser(
-        "close", help="Close sprint and archive it", parents=[sub_common]
-    )
-    sprint_close_parser.set_defaults(_post_validate="quick")
-    sprint_close_parser.add_argument("--sprint", help="Sprint ID (default: current)")
-
-    task_parser = subparsers.add_parser("task", help="Manage sprint tasks", parents=[sub_common])
-    task_parser.set_defaults(_post_validate="never")
-    task_subparsers = task_parser.add_subparsers(
-        dest="task_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    task_create_parser = task_subparsers.add_parser(
-        "create", help="Create a new task in current sprint", parents=[sub_common]
-    )
-    task_create_parser.set_defaults(_post_validate="quick")
-    task_create_parser.add_argument("--title", required=True, help="Task title")
-    task_create_parser.add_argument("--feature", required=True, help="Feature name")
-    task_create_parser.add_argument("--decision", required=True, help="Decision id (ADR-XXX, FDR-XXX, DR-XXX)")
-    task_create_parser.add_argument("--points", type=int, help="Story points (default: 5)")
-    task_create_parser.add_argument("--owner", default="@owner", help="Task owner (default: @owner)")
-    task_create_parser.add_argument("--prio", default="P2", help="Priority (default: P2)")
-    task_create_parser.add_argument("--lane", help="Optional lane/workstream label")
-    task_create_parser.add_argument(
-        "--type",
-        "--task-type",
-        dest="task_type",
-        default=None,
-        help="Task taxonomy (e.g. implementation, research-discovery, sprint-gate)",
-    )
-    task_create_parser.add_argument(
-        "--release",
-        help='Optional release tag (vX.Y.Z or "current") to attribute work to a release',
-    )
-    task_create_parser.add_argument(
-        "--gate",
-        action="store_true",
-        help="Mark this task as a release gate (counts toward release burn-up)",
-    )
-    task_list_parser = task_subparsers.add_parser("list", help="List tasks in current sprint", parents=[sub_common])
-    task_list_parser.set_defaults(_post_validate="never")
-    task_show_parser = task_subparsers.add_parser("show", help="Show a task", parents=[sub_common])
-    task_show_parser.set_defaults(_post_validate="never")
-    task_show_parser.add_argument("--id", required=True, help="Task id (e.g. TASK-001)")
-    task_status_parser = task_subparsers.add_parser("status", help="Update task status", parents=[sub_common])
-    task_status_parser.set_defaults(_post_validate="quick")
-    task_status_parser.add_argument("--id", required=True, help="Task id (e.g. TASK-001)")
-    task_status_parser.add_argument("--status", required=True, help="New status (e.g. doing)")
-    task_status_parser.add_argument(
-        "--force",
-        action="store_true",
-        help="Force update despite unresolved dependencies (requires explicit user approval)",
-    )
+    def _build_test(test_parser: argparse.ArgumentParser) -> None:
+        test_parser.set_defaults(_post_validate="never")
+        test_subparsers = test_parser.add_subparsers(
+            dest="test_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        test_system_parser = test_subparsers.add_parser(
+            "system",
+            help="Run handbook system smoke suite",
+            parents=[sub_common],
+        )
+        test_system_parser.set_defaults(_post_validate="never")
 
-    feature_parser = subparsers.add_parser("feature", help="Manage features", parents=[sub_common])
-    feature_parser.set_defaults(_post_validate="never")
-    feature_subparsers = feature_parser.add_subparsers(
-        dest="feature_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    feature_list_parser = feature_subparsers.add_parser("list", help="List features", parents=[sub_common])
-    feature_list_parser.set_defaults(_post_validate="never")
-    feature_create_parser = feature_subparsers.add_parser("create", help="Create a new feature", parents=[sub_common])
-    feature_create_parser.set_defaults(_post_validate="quick")
-    feature_create_parser.add_argument("--name", required=True, help="Feature name (kebab-case)")
-    feature_create_parser.add_argument("--epic", action="store_true", help="Mark feature as an epic")
-    feature_create_parser.add_argument("--owner", default="@owner", help="Owner (default: @owner)")
-    feature_create_parser.add_argument("--stage", default="proposed", help="Initial stage (default: proposed)")
-    feature_status_parser = feature_subparsers.add_parser("status", help="Update feature stage", parents=[sub_common])
-    feature_status_parser.set_defaults(_post_validate="quick")
-    feature_status_parser.add_argument("--name", required=True, help="Feature name (kebab-case)")
-    feature_status_parser.add_argument("--stage", required=True, help="New stage")
-    feature_update_status_parser = feature_subparsers.add_parser(
-        "update-status", help="Update status.md files from sprint tasks", parents=[sub_common]
-    )
-    feature_update_status_parser.set_defaults(_post_validate="quick")
-    feature_summary_parser = feature_subparsers.add_parser(
-        "summary",
-        help="Show feature summary with sprint data",
-        parents=[sub_common],
-    )
-    feature_summary_parser.set_defaults(_post_validate="never")
-    feature_archive_parser = feature_subparsers.add_parser(
-        "archive", help="Archive a feature into features/implemented", parents=[sub_common]
-    )
-    feature_archive_parser.set_defaults(_post_validate="quick")
-    feature_archive_parser.add_argument("--name", required=True, help="Feature name (kebab-case)")
-    feature_archive_parser.add_argument(
-        "--force", action="store_true", help="Force archive despite warnings (requires explicit approval)"
-    )
+    subparsers.add_parser("test", help="Run automation smoke suites", parents=[sub_common], builder=_build_test)
 
-    adr_parser = subparsers.add_parser("adr", help="Manage ADRs", parents=[sub_common])
-    adr_parser.set_defaults(_post_validate="never")
-    adr_subparsers = adr_parser.add_subparsers(
-        dest="adr_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    adr_add_parser = adr_subparsers.add_parser("add", help="Create an ADR file", parents=[sub_common])
-    adr_add_parser.set_defaults(_post_validate="quick")
-    add_adr_add_arguments(adr_add_parser)
-    adr_list_parser = adr_subparsers.add_parser("list", help="List ADRs", parents=[sub_common])
-    adr_list_parser.set_defaults(_post_validate="never")
-
-    dr_parser = subparsers.add_parser("dr", help="Manage Decision Register entries", parents=[sub_common])
-    dr_parser.set_defaults(_post_validate="never")
-    dr_subparsers = dr_parser.add_subparsers(
-        dest="dr_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    dr_add_parser = dr_subparsers.add_parser("add", help="Create a DR file", parents=[sub_common])
-    dr_add_parser.set_defaults(_post_validate="quick")
-    add_dr_add_arguments(dr_add_parser)
-
-    fdr_parser = subparsers.add_parser("fdr", help="Manage Feature Decision Records", parents=[sub_common])
-    fdr_parser.set_defaults(_post_validate="never")
-    fdr_subparsers = fdr_parser.add_subparsers(
-        dest="fdr_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    fdr_add_parser = fdr_subparsers.add_parser("add", help="Create an FDR file", parents=[sub_common])
-    fdr_add_parser.set_defaults(_post_validate="quick")
-    add_fdr_add_arguments(fdr_add_parser)
-
-    backlog_parser = subparsers.add_parser("backlog", help="Manage issue backlog", parents=[sub_common])
-    backlog_parser.set_defaults(_post_validate="never")
-    backlog_subparsers = backlog_parser.add_subparsers(
-        dest="backlog_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    backlog_add_parser = backlog_subparsers.add_parser("add", help="Create a backlog entry", parents=[sub_common])
-    backlog_add_parser.set_defaults(_post_validate="quick")
-    backlog_add_parser.add_argument(
-        "--type",
-        dest="issue_type",
-        required=True,
-        help="bug|wildcards|work-items (accepts v0 synonyms)",
-    )
-    backlog_add_parser.add_argument("--title", required=True, help="Issue title")
-    backlog_add_parser.add_argument("--severity", required=True, help="P0|P1|P2|P3|P4")
-    backlog_add_parser.add_argument("--desc", default="", help="Description")
-    backlog_add_parser.add_argument("--owner", default="", help="Owner handle (e.g. @alice)")
-    backlog_add_parser.add_argument("--impact", default="", help="Impact summary")
-    backlog_add_parser.add_argument("--workaround", default="", help="Workaround summary")
-    backlog_list_parser = backlog_subparsers.add_parser("list", help="List backlog entries", parents=[sub_common])
-    backlog_list_parser.set_defaults(_post_validate="never")
-    backlog_list_parser.add_argument("--severity", help="Filter by severity (P0..P4)")
-    backlog_list_parser.add_argument("--category", help="Filter by category (bugs|wildcards|work-items)")
-    backlog_list_parser.add_argument(
-        "--format", choices=["table", "json"], default="table", help="Output format (default: table)"
-    )
-    backlog_triage_parser = backlog_subparsers.add_parser(
-        "triage", help="Show or create triage analysis", parents=[sub_common]
-    )
-    backlog_triage_parser.set_defaults(_post_validate="quick")
-    backlog_triage_parser.add_argument("--issue", dest="issue_id", required=True, help="Issue id (e.g. BUG-P1-...)")
-    backlog_assign_parser = backlog_subparsers.add_parser(
-        "assign", help="Assign a backlog issue to a sprint", parents=[sub_common]
-    )
-    backlog_assign_parser.set_defaults(_post_validate="quick")
-    backlog_assign_parser.add_argument("--issue", dest="issue_id", required=True, help="Issue id (e.g. BUG-P1-...)")
-    backlog_assign_parser.add_argument("--sprint", default="current", help="current|next|SPRINT-... (default: current)")
-    backlog_rubric_parser = backlog_subparsers.add_parser("rubric", help="Show severity rubric", parents=[sub_common])
-    backlog_rubric_parser.set_defaults(_post_validate="never")
-    backlog_stats_parser = backlog_subparsers.add_parser("stats", help="Show backlog statistics", parents=[sub_common])
-    backlog_stats_parser.set_defaults(_post_validate="never")
-
-    parking_parser = subparsers.add_parser("parking", help="Manage parking lot items", parents=[sub_common])
-    parking_parser.set_defaults(_post_validate="never")
-    parking_subparsers = parking_parser.add_subparsers(
-        dest="parking_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    parking_add_parser = parking_subparsers.add_parser("add", help="Create a parking lot item", parents=[sub_common])
-    parking_add_parser.set_defaults(_post_validate="quick")
-    parking_add_parser.add_argument(
-        "--type",
-        dest="parking_type",
-        required=True,
-        choices=["features", "technical-debt", "research", "external-requests"],
-        help="features|technical-debt|research|external-requests",
-    )
-    parking_add_parser.add_argument("--title", required=True, help="Item title")
-    parking_add_parser.add_argument("--desc", default="", help="Description")
-    parking_add_parser.add_argument("--owner", default="", help="Owner handle (e.g. @alice)")
-    parking_add_parser.add_argument("--tags", default="", help="Comma-separated tags")
-
-    parking_list_parser = parking_subparsers.add_parser("list", help="List parking lot items", parents=[sub_common])
-    parking_list_parser.set_defaults(_post_validate="never")
-    parking_list_parser.add_argument(
-        "--category",
-        choices=["features", "technical-debt", "research", "external-requests"],
-        help="Filter by category",
-    )
-    parking_list_parser.add_argument(
-        "--format", choices=["table", "json"], default="table", help="Output format (default: table)"
-    )
+    def _build_sprint(sprint_parser: argparse.ArgumentParser) -> None:
+        sprint_parser.set_defaults(_post_validate="never")
+        sprint_subparsers = sprint_parser.add_subparsers(
+            dest="sprint_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        sprint_plan_parser = sprint_subparsers.add_parser("plan", help="Create sprint plan", parents=[sub_common])
+        sprint_plan_parser.set_defaults(_post_validate="quick", _post_validate_domains=("sprint",))
+        sprint_plan_parser.add_argument("--sprint", help="Sprint ID (default: computed)")
+        sprint_plan_parser.add_argument("--force", action="store_true", help="Overwrite existing plan.md")
+        sprint_open_parser = sprint_subparsers.add_parser(
+            "open", help="Set current sprint to existing", parents=[sub_common]
+        )
+        sprint_open_parser.set_defaults(_post_validate="quick", _post_validate_domains=("sprint",))
+        sprint_open_parser.add_argument("--sprint", required=True, help="Sprint ID to open")
+        sprint_status_parser = sprint_subparsers.add_parser("status", help="Show sprint status", parents=[sub_common])
+        sprint_status_parser.set_defaults(_post_validate="never")
+        sprint_status_parser.add_argument("--sprint", help="Sprint ID (default: current)")
+        sprint_tasks_parser = sprint_subparsers.add_parser("tasks", help="List sprint tasks", parents=[sub_common])
+        sprint_tasks_parser.set_defaults(_post_validate="never")
+        sprint_tasks_parser.add_argument("--sprint", help="Sprint ID (default: current)")
+        sprint_burndown_parser = sprint_subparsers.add_parser(
+            "burndown", help="Generate sprint burndown", parents=[sub_common]
+        )
+        sprint_burndown_parser.set_defaults(_post_validate="never")
+        sprint_burndown_parser.add_argument("--sprint", help="Sprint ID (default: current)")
+        sprint_capacity_parser = sprint_subparsers.add_parser(
+            "capacity", help="Show sprint capacity allocation", parents=[sub_common]
+        )
+        sprint_capacity_parser.set_defaults(_post_validate="never")
+        sprint_capacity_parser.add_argument("--sprint", help="Sprint ID (default: current)")
+        sprint_archive_parser = sprint_subparsers.add_parser(
+            "archive", help="Archive sprint into sprints/archive", parents=[sub_common]
+        )
+        sprint_archive_parser.set_defaults(_post_validate="quick", _post_validate_domains=("sprint",))
+        sprint_archive_parser.add_argument("--sprint", help="Sprint ID (default: current)")
+        sprint_close_parser = sprint_subparsers.add_parser(
+            "close", help="Close sprint and archive it", parents=[sub_common]
+        )
+        sprint_close_parser.set_defaults(_post_validate="quick")
+        sprint_close_parser.add_argument("--sprint", help="Sprint ID (default: current)")
 
-    parking_review_parser = parking_subparsers.add_parser(
-        "review",
-        help="Review parking lot items",
-        parents=[sub_common],
-    )
-    parking_review_parser.set_defaults(_post_validate="never")
-    parking_review_parser.add_argument(
-        "--format",
-        choices=["text", "json"],
-        default="text",
-        help="Output format (default: text)",
-    )
+    subparsers.add_parser("sprint", help="Manage sprint lifecycle", parents=[sub_common], builder=_build_sprint)
 
-    parking_promote_parser = parking_subparsers.add_parser(
-        "promote", help="Promote item to roadmap", parents=[sub_common]
-    )
-    parking_promote_parser.set_defaults(_post_validate="quick")
-    parking_promote_parser.add_argument("--item", required=True, help="Item id (e.g. FEAT-...)")
-    parking_promote_parser.add_argument(
-        "--target",
-        choices=["now", "next", "later"],
-        default="later",
-        help="now|next|later (default: later)",
-    )
+    def _build_task(task_parser: argparse.ArgumentParser) -> None:
+        task_parser.set_defaults(_post_validate="never")
+        task_subparsers = task_parser.add_subparsers(
+            dest="task_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        task_create_parser = task_subparsers.add_parser(
+            "create", help="Create a new task in current sprint", parents=[sub_common]
+        )
+        task_create_parser.set_defaults(_post_validate="quick", _post_validate_domains=("sprint:current",))
+        task_create_parser.add_argument("--title", required=True, help="Task title")
+        task_create_parser.add_argument("--feature", required=True, help="Feature name")
+        task_create_parser.add_argument("--decision", required=True, help="Decision id (ADR-XXX, FDR-XXX, DR-XXX)")
+        task_create_parser.add_argument("--points", type=int, help="Story points (default: 5)")
+        task_create_parser.add_argument("--owner", default="@owner", help="Task owner (default: @owner)")
+        task_create_parser.add_argument("--prio", default="P2", help="Priority (default: P2)")
+        task_create_parser.add_argument("--lane", help="Optional lane/workstream label")
+        task_create_parser.add_argument(
+            "--type",
+            "--task-type",
+            dest="task_type",
+            default=None,
+            help="Task taxonomy (e.g. implementation, research-discovery, sprint-gate)",
+        )
+        task_create_parser.add_argument(
+            "--release",
+            help='Optional release tag (vX.Y.Z or "current") to attribute work to a release',
+        )
+        task_create_parser.add_argument(
+            "--gate",
+            action="store_true",
+            help="Mark this task as a release gate (counts toward release burn-up)",
+        )
+        task_list_parser = task_subparsers.add_parser("list", help="List tasks in current sprint", parents=[sub_common])
+        task_list_parser.set_defaults(_post_validate="never")
+        task_show_parser = task_subparsers.add_parser("show", help="Show a task", parents=[sub_common])
+        task_show_parser.set_defaults(_post_validate="never")
+        task_show_parser.add_argument("--id", required=True, help="Task id (e.g. TASK-001)")
+        task_status_parser = task_subparsers.add_parser("status", help="Update task status", parents=[sub_common])
+        task_status_parser.set_defaults(
+            _post_validate="quick", _post_validate_domains=("sprint:current", "backlog", "parking")
+        )
+        task_status_parser.add_argument("--id", required=True, help="Task id (e.g. TASK-001)")
+        task_status_parser.add_argument("--status", required=True, help="New status (e.g. doing)")
+        task_status_parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Force update despite unresolved dependencies (requires explicit user approval)",
+        )
 
-    process_parser = subparsers.add_parser("process", help="Manage process templates/playbooks", parents=[sub_common])
-    process_parser.set_defaults(_post_validate="never")
-    process_subparsers = process_parser.add_subparsers(
-        dest="process_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    process_refresh = process_subparsers.add_parser(
-        "refresh",
-        help="Refresh seeded session templates and playbooks",
-        parents=[sub_common],
-    )
-    process_refresh.set_defaults(_post_validate="quick")
-    process_refresh.add_argument("--templates", action="store_true", help="Refresh session templates only")
-    process_refresh.add_argument("--playbooks", action="store_true", help="Refresh playbooks only")
-    process_refresh.add_argument("--force", action="store_true", help="Overwrite modified seed-owned files")
-    process_refresh.add_argument(
-        "--disable-system-scope-enforcement",
-        action="store_true",
-        help="Disable system-scope routing/enforcement (updates validation rules; deletes system scope config)",
-    )
-    process_refresh.add_argument(
-        "--migrate-tasks-drop-session",
-        action="store_true",
-        help="Migrate current sprint tasks by removing deprecated `session:` (infers task_type when possible)",
-    )
+    subparsers.add_parser("task", help="Manage sprint tasks", parents=[sub_common], builder=_build_task)
 
-    question_parser = subparsers.add_parser("question", help="Manage operator questions", parents=[sub_common])
-    question_parser.set_defaults(_post_validate="never")
-    question_subparsers = question_parser.add_subparsers(
-        dest="question_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    question_add = question_subparsers.add_parser("add", help="Add a question for the operator", parents=[sub_common])
-    question_add.set_defaults(_post_validate="quick")
-    question_add.add_argument("--title", required=True, help="Question title")
-    question_add.add_argument("--severity", required=True, help="blocking|non-blocking")
-    question_add.add_argument(
-        "--q-scope",
-        dest="question_scope",
-        required=True,
-        help="Question scope: sprint|task|release|project (NOT the system/project CLI scope)",
-    )
-    question_add.add_argument("--sprint", help="Sprint id (required for scope sprint|task)")
-    question_add.add_argument("--task-id", help="Task id (required for scope task)")
-    question_add.add_argument("--release", help="Optional release id (vX.Y.Z or current)")
-    question_add.add_argument("--asked-by", help="Who asked (agent/human)")
-    question_add.add_argument("--owner", help="Owner handle (e.g. @spenser)")
-    question_add.add_argument("--body", default="", help="Question body/details")
-
-    question_list = question_subparsers.add_parser("list", help="List questions", parents=[sub_common])
-    question_list.set_defaults(_post_validate="never")
-    question_list.add_argument("--status", default="open", help="open|answered|closed|all (default: open)")
-    question_list.add_argument("--format", choices=["table", "json"], default="table", help="Output format")
-
-    question_show = question_subparsers.add_parser("show", help="Show a question", parents=[sub_common])
-    question_show.set_defaults(_post_validate="never")
-    question_show.add_argument("--id", required=True, help="Question id (e.g. Q-0001)")
-
-    question_answer = question_subparsers.add_parser("answer", help="Record an answer", parents=[sub_common])
-    question_answer.set_defaults(_post_validate="quick")
-    question_answer.add_argument("--id", required=True, help="Question id (e.g. Q-0001)")
-    question_answer.add_argument("--answer", required=True, help="Answer text")
-    question_answer.add_argument("--by", help="Answerer handle (e.g. @user)")
-
-    question_close = question_subparsers.add_parser("close", help="Close a question", parents=[sub_common])
-    question_close.set_defaults(_post_validate="quick")
-    question_close.add_argument("--id", required=True, help="Question id (e.g. Q-0001)")
-    question_close.add_argument("--resolution", required=True, help="answered|not-needed|superseded")
-
-    roadmap_parser = subparsers.add_parser("roadmap", help="Manage the project roadmap", parents=[sub_common])
-    roadmap_parser.set_defaults(_post_validate="never")
-    roadmap_subparsers = roadmap_parser.add_subparsers(
-        dest="roadmap_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    roadmap_show_parser = roadmap_subparsers.add_parser(
-        "show",
-        help="Show roadmap now/next/later",
-        parents=[sub_common],
-    )
-    roadmap_show_parser.set_defaults(_post_validate="never")
-    roadmap_create_parser = roadmap_subparsers.add_parser(
-        "create",
-        help="Create roadmap template",
-        parents=[sub_common],
-    )
-    roadmap_create_parser.set_defaults(_post_validate="quick")
-    roadmap_validate_parser = roadmap_subparsers.add_parser(
-        "validate",
-        help="Validate roadmap links",
-        parents=[sub_common],
-    )
-    roadmap_validate_parser.set_defaults(_post_validate="never")
-
-    release_parser = subparsers.add_parser("release", help="Manage project releases", parents=[sub_common])
-    release_parser.set_defaults(_post_validate="never")
-    release_subparsers = release_parser.add_subparsers(
-        dest="release_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    release_plan_parser = release_subparsers.add_parser("plan", help="Create a release plan", parents=[sub_common])
-    release_plan_parser.set_defaults(_post_validate="quick")
-    release_plan_parser.add_argument("--version", help="Release version (vX.Y.Z or 'next')")
-    release_plan_parser.add_argument("--activate", action="store_true", help="Activate this release as current")
-    release_plan_parser.add_argument("--bump", choices=["patch", "minor", "major"], default="patch")
-    release_plan_parser.add_argument("--sprints", type=int, default=3, help="Number of sprints (default: 3)")
-    release_plan_parser.add_argument("--start-sprint", help="Starting sprint id (SPRINT-...)")
-    release_plan_parser.add_argument("--sprint-ids", help="Comma-separated sprint ids (overrides --sprints)")
-    release_activate = release_subparsers.add_parser("activate", help="Set the current release", parents=[sub_common])
-    release_activate.set_defaults(_post_validate="quick")
-    release_activate.add_argument("--release", required=True, help="Release version (vX.Y.Z)")
-    release_clear_parser = release_subparsers.add_parser(
-        "clear",
-        help="Clear the current release pointer",
-        parents=[sub_common],
-    )
-    release_clear_parser.set_defaults(_post_validate="quick")
-    release_list_parser = release_subparsers.add_parser("list", help="List release folders", parents=[sub_common])
-    release_list_parser.set_defaults(_post_validate="never")
-    release_status = release_subparsers.add_parser("status", help="Show release status", parents=[sub_common])
-    release_status.set_defaults(_post_validate="never")
-    release_status.add_argument("--release", help="Release version (vX.Y.Z or 'current'; default: current)")
-    release_show = release_subparsers.add_parser(
-        "show",
-        help="Print release plan + computed status",
-        parents=[sub_common],
-    )
-    release_show.set_defaults(_post_validate="never")
-    release_show.add_argument("--release", help="Release version (vX.Y.Z or 'current'; default: current)")
-    release_draft = release_subparsers.add_parser(
-        "draft",
-        help="Draft a release composition (local-only; creates no files)",
-        parents=[sub_common],
-    )
-    release_draft.set_defaults(_post_validate="never")
-    release_draft.add_argument("--version", default="next", help="Release version (vX.Y.Z or 'next')")
-    release_draft.add_argument("--sprints", type=int, default=3, help="Number of planned sprints (default: 3)")
-    release_draft.add_argument(
-        "--base",
-        default="latest-delivered",
-        help="Draft base (latest-delivered|current|vX.Y.Z)",
-    )
-    release_draft.add_argument("--format", default="text", help="Output format (text|json)")
-    release_draft.add_argument("--schema", action="store_true", help="Print JSON schema for --format json and exit")
-    release_add_feature = release_subparsers.add_parser(
-        "add-feature", help="Assign a feature to a release", parents=[sub_common]
-    )
-    release_add_feature.set_defaults(_post_validate="quick")
-    release_add_feature.add_argument("--release", required=True, help="Release version (vX.Y.Z)")
-    release_add_feature.add_argument("--feature", required=True, help="Feature name")
-    release_add_feature.add_argument("--slot", required=True, type=int, help="Sprint slot number (1..planned_sprints)")
-    release_add_feature.add_argument(
-        "--commitment",
-        required=True,
-        choices=["committed", "stretch"],
-        help="Scope commitment for this release",
-    )
-    release_add_feature.add_argument(
-        "--intent",
-        required=True,
-        choices=["deliver", "decide", "enable"],
-        help="Slot intent for this feature",
-    )
-    release_add_feature.add_argument("--priority", default="P1", help="Priority (default: P1)")
-    release_add_feature.add_argument("--epic", action="store_true", help="Mark feature as epic")
-    release_add_feature.add_argument("--critical", action="store_true", help="Mark as critical path")
-    release_suggest = release_subparsers.add_parser(
-        "suggest", help="Suggest features for a release", parents=[sub_common]
-    )
-    release_suggest.set_defaults(_post_validate="never")
-    release_suggest.add_argument("--version", required=True, help="Release version (vX.Y.Z)")
-    release_close = release_subparsers.add_parser("close", help="Close a release", parents=[sub_common])
-    release_close.set_defaults(_post_validate="quick")
-    release_close.add_argument("--version", required=True, help="Release version (vX.Y.Z)")
-    release_migrate = release_subparsers.add_parser(
-        "migrate-slot-format",
-        help="Migrate legacy release slot plans to strict slot sections",
-        parents=[sub_common],
-    )
-    release_migrate.set_defaults(_post_validate="quick")
-    release_migrate.add_argument("--release", required=True, help="Release version (vX.Y.Z)")
-    release_migrate.add_argument("--diff", action="store_true", help="Print unified diff only")
-    release_migrate.add_argument("--write-back", action="store_true", help="Write changes to plan.md and validate")
-
-    daily_parser = subparsers.add_parser("daily", help="Manage daily status cadence", parents=[sub_common])
-    daily_parser.set_defaults(_post_validate="never")
-    daily_subparsers = daily_parser.add_subparsers(
-        dest="daily_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    daily_generate = daily_subparsers.add_parser("generate", help="Generate daily status", parents=[sub_common])
-    daily_generate.set_defaults(_post_validate="quick")
-    daily_generate.add_argument("--force", action="store_true", help="Generate even on weekends or overwrite")
-    daily_check = daily_subparsers.add_parser("check", help="Check daily status freshness", parents=[sub_common])
-    daily_check.set_defaults(_post_validate="never")
-    daily_check.add_argument("--verbose", action="store_true", help="Verbose output")
-
-    validate_parser = subparsers.add_parser("validate", help="Validate handbook content", parents=[sub_common])
-    validate_parser.set_defaults(_post_validate="never")
-    validate_parser.add_argument("--quick", action="store_true", help="Skip heavyweight checks")
-    validate_parser.add_argument(
-        "--silent-success", action="store_true", help="Suppress output when there are no issues"
-    )
+    def _build_feature(feature_parser: argparse.ArgumentParser) -> None:
+        feature_parser.set_defaults(_post_validate="never")
+        feature_subparsers = feature_parser.add_subparsers(
+            dest="feature_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        feature_list_parser = feature_subparsers.add_parser("list", help="List features", parents=[sub_common])
+        feature_list_parser.set_defaults(_post_validate="never")
+        feature_create_parser = feature_subparsers.add_parser(
+            "create", help="Create a new feature", parents=[sub_common]
+        )
+        feature_create_parser.set_defaults(_post_validate="quick", _post_validate_domains=("feature",))
+        feature_create_parser.add_argument("--name", required=True, help="Feature name (kebab-case)")
+        feature_create_parser.add_argument("--epic", action="store_true", help="Mark feature as an epic")
+        feature_create_parser.add_argument("--owner", default="@owner", help="Owner (default: @owner)")
+        feature_create_parser.add_argument("--stage", default="proposed", help="Initial stage (default: proposed)")
+        feature_status_parser = feature_subparsers.add_parser(
+            "status", help="Update feature stage", parents=[sub_common]
+        )
+        feature_status_parser.set_defaults(_post_validate="quick", _post_validate_domains=("feature",))
+        feature_status_parser.add_argument("--name", required=True, help="Feature name (kebab-case)")
+        feature_status_parser.add_argument("--stage", required=True, help="New stage")
+        feature_update_status_parser = feature_subparsers.add_parser(
+            "update-status", help="Update status.md files from sprint tasks", parents=[sub_common]
+        )
+        feature_update_status_parser.set_defaults(_post_validate="quick", _post_validate_domains=("feature",))
+        feature_summary_parser = feature_subparsers.add_parser(
+            "summary",
+            help="Show feature summary with sprint data",
+            parents=[sub_common],
+        )
+        feature_summary_parser.set_defaults(_post_validate="never")
+        feature_archive_parser = feature_subparsers.add_parser(
+            "archive", help="Archive a feature into features/implemented", parents=[sub_common]
+        )
+        feature_archive_parser.set_defaults(_post_validate="quick", _post_validate_domains=("feature", "decision"))
+        feature_archive_parser.add_argument("--name", required=True, help="Feature name (kebab-case)")
+        feature_archive_parser.add_argument(
+            "--force", action="store_true", help="Force archive despite warnings (requires explicit approval)"
+        )
 
-    pre_exec_parser = subparsers.add_parser("pre-exec", help="Pre-execution lint/audit gate", parents=[sub_common])
-    pre_exec_parser.set_defaults(_post_validate="never")
-    pre_exec_subparsers = pre_exec_parser.add_subparsers(
-        dest="pre_exec_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
-    pre_exec_lint = pre_exec_subparsers.add_parser("lint", help="Strict task-doc lint gate", parents=[sub_common])
-    pre_exec_lint.set_defaults(_post_validate="never")
-    pre_exec_audit = pre_exec_subparsers.add_parser(
-        "audit",
-        help="Capture evidence bundle + lint",
-        parents=[sub_common],
-    )
-    pre_exec_audit.set_defaults(_post_validate="never")
-    pre_exec_audit.add_argument("--sprint", help="Override sprint id (default: from sprints/current/plan.md)")
-    pre_exec_audit.add_argument("--date", help="Override evidence date (default: today YYYY-MM-DD)")
-    pre_exec_audit.add_argument("--evidence-dir", help="Override evidence directory path")
-
-    evidence_parser = subparsers.add_parser("evidence", help="Evidence capture utilities", parents=[sub_common])
-    evidence_parser.set_defaults(_post_validate="never")
-    evidence_subparsers = evidence_parser.add_subparsers(
-        dest="evidence_command",
-        title="Subcommands",
-        metavar="<subcommand>",
-    )
+    subparsers.add_parser("feature", help="Manage features", parents=[sub_common], builder=_build_feature)
+
+    def _build_adr(adr_parser: argparse.ArgumentParser) -> None:
+        adr_parser.set_defaults(_post_validate="never")
+        adr_subparsers = adr_parser.add_subparsers(
+            dest="adr_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        adr_add_parser = adr_subparsers.add_parser("add", help="Create an ADR file", parents=[sub_common])
+        adr_add_parser.set_defaults(_post_validate="quick", _post_validate_domains=("decision",))
+        add_adr_add_arguments(adr_add_parser)
+        adr_list_parser = adr_subparsers.add_parser("list", help="List ADRs", parents=[sub_common])
+        adr_list_parser.set_defaults(_post_validate="never")
+
+    subparsers.add_parser("adr", help="Manage ADRs", parents=[sub_common], builder=_build_adr)
+
+    def _build_dr(dr_parser: argparse.ArgumentParser) -> None:
+        dr_parser.set_defaults(_post_validate="never")
+        dr_subparsers = dr_parser.add_subparsers(
+            dest="dr_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        dr_add_parser = dr_subparsers.add_parser("add", help="Create a DR file", parents=[sub_common])
+        dr_add_parser.set_defaults(_post_validate="quick", _post_validate_domains=("decision", "feature"))
+        add_dr_add_arguments(dr_add_parser)
+
+    subparsers.add_parser("dr", help="Manage Decision Register entries", parents=[sub_common], builder=_build_dr)
+
+    def _build_fdr(fdr_parser: argparse.ArgumentParser) -> None:
+        fdr_parser.set_defaults(_post_validate="never")
+        fdr_subparsers = fdr_parser.add_subparsers(
+            dest="fdr_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        fdr_add_parser = fdr_subparsers.add_parser("add", help="Create an FDR file", parents=[sub_common])
+        fdr_add_parser.set_defaults(_post_validate="quick", _post_validate_domains=("feature",))
+        add_fdr_add_arguments(fdr_add_parser)
+
+    subparsers.add_parser("fdr", help="Manage Feature Decision Records", parents=[sub_common], builder=_build_fdr)
+
+    def _build_backlog(backlog_parser: argparse.ArgumentParser) -> None:
+        backlog_parser.set_defaults(_post_validate="never")
+        backlog_subparsers = backlog_parser.add_subparsers(
+            dest="backlog_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        backlog_add_parser = backlog_subparsers.add_parser("add", help="Create a backlog entry", parents=[sub_common])
+        backlog_add_parser.set_defaults(_post_validate="quick", _post_validate_domains=("backlog",))
+        backlog_add_parser.add_argument(
+            "--type",
+            dest="issue_type",
+            required=True,
+            help="bug|wildcards|work-items (accepts v0 synonyms)",
+        )
+        backlog_add_parser.add_argument("--title", required=True, help="Issue title")
+        backlog_add_parser.add_argument("--severity", required=True, help="P0|P1|P2|P3|P4")
+        backlog_add_parser.add_argument("--desc", default="", help="Description")
+        backlog_add_parser.add_argument("--owner", default="", help="Owner handle (e.g. @alice)")
+        backlog_add_parser.add_argument("--impact", default="", help="Impact summary")
+        backlog_add_parser.add_argument("--workaround", default="", help="Workaround summary")
+        backlog_list_parser = backlog_subparsers.add_parser("list", help="List backlog entries", parents=[sub_common])
+        backlog_list_parser.set_defaults(_post_validate="never")
+        backlog_list_parser.add_argument("--severity", help="Filter by severity (P0..P4)")
+        backlog_list_parser.add_argument("--category", help="Filter by category (bugs|wildcards|work-items)")
+        backlog_list_parser.add_argument(
+            "--format", choices=["table", "json"], default="table", help="Output format (default: table)"
+        )
+        backlog_triage_parser = backlog_subparsers.add_parser(
+            "triage", help="Show or create triage analysis", parents=[sub_common]
+        )
+        backlog_triage_parser.set_defaults(_post_validate="quick", _post_validate_domains=("backlog",))
+        backlog_triage_parser.add_argument("--issue", dest="issue_id", required=True, help="Issue id (e.g. BUG-P1-...)")
+        backlog_assign_parser = backlog_subparsers.add_parser(
+            "assign", help="Assign a backlog issue to a sprint", parents=[sub_common]
+        )
+        backlog_assign_parser.set_defaults(_post_validate="quick", _post_validate_domains=("backlog",))
+        backlog_assign_parser.add_argument("--issue", dest="issue_id", required=True, help="Issue id (e.g. BUG-P1-...)")
+        backlog_assign_parser.add_argument(
+            "--sprint", default="current", help="current|next|SPRINT-... (default: current)"
+        )
+        backlog_rubric_parser = backlog_subparsers.add_parser(
+            "rubric", help="Show severity rubric", parents=[sub_common]
+        )
+        backlog_rubric_parser.set_defaults(_post_validate="never")
+        backlog_stats_parser = backlog_subparsers.add_parser(
+            "stats", help="Show backlog statistics", parents=[sub_common]
+        )
+        backlog_stats_parser.set_defaults(_post_validate="never")
 
-    evidence_new = evidence_subparsers.add_parser("new", help="Create evidence folder(s)", parents=[sub_common])
-    evidence_new.set_defaults(_post_validate="never")
-    evidence_new.add_argument("--task", required=True, help="Task id (e.g. TASK-001)")
-    evidence_new.add_argument("--name", default="manual", help="Label for this evidence run (default: manual)")
-    evidence_new.add_argument("--run-id", dest="run_id", help="Override run id (default: UTC timestamp + slug)")
+    subparsers.add_parser("backlog", help="Manage issue backlog", parents=[sub_common], builder=_build_backlog)
 
-    evidence_run = evidence_subparsers.add_parser(
-        "run", help="Run a command and capture evidence", parents=[sub_common]
+    def _build_parking(parking_parser: argparse.ArgumentParser) -> None:
+        parking_parser.set_defaults(_post_validate="never")
+        parking_subparsers = parking_parser.add_subparsers(
+            dest="parking_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        parking_add_parser = parking_subparsers.add_parser(
+            "add", help="Create a parking lot item", parents=[sub_common]
+        )
+        parking_add_parser.set_defaults(_post_validate="quick", _post_validate_domains=("parking",))
+        parking_add_parser.add_argument(
+            "--type",
+            dest="parking_type",
+            required=True,
+            choices=["features", "technical-debt", "research", "external-requests"],
+            help="features|technical-debt|research|external-requests",
+        )
+        parking_add_parser.add_argument("--title", required=True, help="Item title")
+        parking_add_parser.add_argument("--desc", default="", help="Description")
+        parking_add_parser.add_argument("--owner", default="", help="Owner handle (e.g. @alice)")
+        parking_add_parser.add_argument("--tags", default="", help="Comma-separated tags")
+
+        parking_list_parser = parking_subparsers.add_parser("list", help="List parking lot items", parents=[sub_common])
+        parking_list_parser.set_defaults(_post_validate="never")
+        parking_list_parser.add_argument(
+            "--category",
+            choices=["features", "technical-debt", "research", "external-requests"],
+            help="Filter by category",
+        )
+        parking_list_parser.add_argument(
+            "--format", choices=["table", "json"], default="table", help="Output format (default: table)"
+        )
+
+        parking_review_parser = parking_subparsers.add_parser(
+            "review",
+            help="Review parking lot items",
+            parents=[sub_common],
+        )
+        parking_review_parser.set_defaults(_post_validate="never")
+        parking_review_parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            help="Output format (default: text)",
+        )
+
+        parking_promote_parser = parking_subparsers.add_parser(
+            "promote", help="Promote item to roadmap", parents=[sub_common]
+        )
+        parking_promote_parser.set_defaults(_post_validate="quick", _post_validate_domains=("parking", "backlog"))
+        parking_promote_parser.add_argument("--item", required=True, help="Item id (e.g. FEAT-...)")
+        parking_promote_parser.add_argument(
+            "--target",
+            choices=["now", "next", "later"],
+            default="later",
+            help="now|next|later (default: later)",
+        )
+
+    subparsers.add_parser("parking", help="Manage parking lot items", parents=[sub_common], builder=_build_parking)
+
+    def _build_process(process_parser: argparse.ArgumentParser) -> None:
+        process_parser.set_defaults(_post_validate="never")
+        process_subparsers = process_parser.add_subparsers(
+            dest="process_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        process_refresh = process_subparsers.add_parser(
+            "refresh",
+            help="Refresh seeded session templates and playbooks",
+            parents=[sub_common],
+        )
+        process_refresh.set_defaults(_post_validate="quick")
+        process_refresh.add_argument("--templates", action="store_true", help="Refresh session templates only")
+        process_refresh.add_argument("--playbooks", action="store_true", help="Refresh playbooks only")
+        process_refresh.add_argument("--force", action="store_true", help="Overwrite modified seed-owned files")
+        process_refresh.add_argument(
+            "--disable-system-scope-enforcement",
+            action="store_true",
+            help="Disable system-scope routing/enforcement (updates validation rules; deletes system scope config)",
+        )
+        process_refresh.add_argument(
+            "--migrate-tasks-drop-session",
+            action="store_true",
+            help="Migrate current sprint tasks by removing deprecated `session:` (infers task_type when possible)",
+        )
+
+    subparsers.add_parser(
+        "process", help="Manage process templates/playbooks", parents=[sub_common], builder=_build_process
     )
-    evidence_run.set_defaults(_post_validate="never")
-    evidence_run.add_argument("--task", required=True, help="Task id (e.g. TASK-001)")
-    evidence_run.add_argument("--name", required=True, help="Short label for this evidence run (e.g. v2-smoke)")
-    evidence_run.add_argument("--run-id", dest="run_id", help="Override run id (default: UTC timestamp + slug)")
-    evidence_run.add_argument(
-        "cmd",
-        nargs=argparse.REMAINDER,
-        help="Command to run (use `-- <cmd> ...` to pass flags through)",
+
+    def _build_question(question_parser: argparse.ArgumentParser) -> None:
+        question_parser.set_defaults(_post_validate="never")
+        question_subparsers = question_parser.add_subparsers(
+            dest="question_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        question_add = question_subparsers.add_parser(
+            "add", help="Add a question for the operator", parents=[sub_common]
+        )
+        question_add.set_defaults(_post_validate="quick", _post_validate_domains=("status",))
+        question_add.add_argument("--title", required=True, help="Question title")
+        question_add.add_argument("--severity", required=True, help="blocking|non-blocking")
+        question_add.add_argument(
+            "--q-scope",
+            dest="question_scope",
+            required=True,
+            help="Question scope: sprint|task|release|project (NOT the system/project CLI scope)",
+        )
+        question_add.add_argument("--sprint", help="Sprint id (required for scope sprint|task)")
+        question_add.add_argument("--task-id", help="Task id (required for scope task)")
+        question_add.add_argument("--release", help="Optional release id (vX.Y.Z or current)")
+        question_add.add_argument("--asked-by", help="Who asked (agent/human)")
+        question_add.add_argument("--owner", help="Owner handle (e.g. @spenser)")
+        question_add.add_argument("--body", default="", help="Question body/details")
+
+        question_list = question_subparsers.add_parser("list", help="List questions", parents=[sub_common])
+        question_list.set_defaults(_post_validate="never")
+        question_list.add_argument("--status", default="open", help="open|answered|closed|all (default: open)")
+        question_list.add_argument("--format", choices=["table", "json"], default="table", help="Output format")
+
+        question_show = question_subparsers.add_parser("show", help="Show a question", parents=[sub_common])
+        question_show.set_defaults(_post_validate="never")
+        question_show.add_argument("--id", required=True, help="Question id (e.g. Q-0001)")
+
+        question_answer = question_subparsers.add_parser("answer", help="Record an answer", parents=[sub_common])
+        question_answer.set_defaults(_post_validate="quick", _post_validate_domains=("status",))
+        question_answer.add_argument("--id", required=True, help="Question id (e.g. Q-0001)")
+        question_answer.add_argument("--answer", required=True, help="Answer text")
+        question_answer.add_argument("--by", help="Answerer handle (e.g. @user)")
+
+        question_close = question_subparsers.add_parser("close", help="Close a question", parents=[sub_common])
+        question_close.set_defaults(_post_validate="quick", _post_validate_domains=("status",))
+        question_close.add_argument("--id", required=True, help="Question id (e.g. Q-0001)")
+        question_close.add_argument("--resolution", required=True, help="answered|not-needed|superseded")
+
+    subparsers.add_parser("question", help="Manage operator questions", parents=[sub_common], builder=_build_question)
+
+    def _build_roadmap(roadmap_parser: argparse.ArgumentParser) -> None:
+        roadmap_parser.set_defaults(_post_validate="never")
+        roadmap_subparsers = roadmap_parser.add_subparsers(
+            dest="roadmap_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        roadmap_show_parser = roadmap_subparsers.add_parser(
+            "show",
+            help="Show roadmap now/next/later",
+            parents=[sub_common],
+        )
+        roadmap_show_parser.set_defaults(_post_validate="never")
+        roadmap_create_parser = roadmap_subparsers.add_parser(
+            "create",
+            help="Create roadmap template",
+            parents=[sub_common],
+        )
+        roadmap_create_parser.set_defaults(_post_validate="quick", _post_validate_domains=("roadmap",))
+        roadmap_validate_parser = roadmap_subparsers.add_parser(
+            "validate",
+            help="Validate roadmap links",
+            parents=[sub_common],
+        )
+        roadmap_validate_parser.set_defaults(_post_validate="never")
+
+    subparsers.add_parser("roadmap", help="Manage the project roadmap", parents=[sub_common], builder=_build_roadmap)
+
+    def _build_release(release_parser: argparse.ArgumentParser) -> None:
+        release_parser.set_defaults(_post_validate="never")
+        release_subparsers = release_parser.add_subparsers(
+            dest="release_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        release_plan_parser = release_subparsers.add_parser("plan", help="Create a release plan", parents=[sub_common])
+        release_plan_parser.set_defaults(_post_validate="quick", _post_validate_domains=("release",))
+        release_plan_parser.add_argument("--version", help="Release version (vX.Y.Z or 'next')")
+        release_plan_parser.add_argument("--activate", action="store_true", help="Activate this release as current")
+        release_plan_parser.add_argument("--bump", choices=["patch", "minor", "major"], default="patch")
+        release_plan_parser.add_argument("--sprints", type=int, default=3, help="Number of sprints (default: 3)")
+        release_plan_parser.add_argument("--start-sprint", help="Starting sprint id (SPRINT-...)")
+        release_plan_parser.add_argument("--sprint-ids", help="Comma-separated sprint ids (overrides --sprints)")
+        release_activate = release_subparsers.add_parser(
+            "activate", help="Set the current release", parents=[sub_common]
+        )
+        release_activate.set_defaults(_post_validate="quick", _post_validate_domains=("release",))
+        release_activate.add_argument("--release", required=True, help="Release version (vX.Y.Z)")
+        release_clear_parser = release_subparsers.add_parser(
+            "clear",
+            help="Clear the current release pointer",
+            parents=[sub_common],
+        )
+        release_clear_parser.set_defaults(_post_validate="quick", _post_validate_domains=("release",))
+        release_list_parser = release_subparsers.add_parser("list", help="List release folders", parents=[sub_common])
+        release_list_parser.set_defaults(_post_validate="never")
+        release_list_parser.add_argument(
+            "--progress",
+            action="store_true",
+            help="Show tagged-task progress for every release (one scan of all sprints)",
+        )
+        release_status = release_subparsers.add_parser("status", help="Show release status", parents=[sub_common])
+        release_status.set_defaults(_post_validate="never")
+        release_status.add_argument("--release", help="Release version (vX.Y.Z or 'current'; default: current)")
+        release_show = release_subparsers.add_parser(
+            "show",
+            help="Print release plan + computed status",
+            parents=[sub_common],
+        )
+        release_show.set_defaults(_post_validate="never")
+        release_show.add_argument("--release", help="Release version (vX.Y.Z or 'current'; default: current)")
+        release_draft = release_subparsers.add_parser(
+            "draft",
+            help="Draft a release composition (local-only; creates no files)",
+            parents=[sub_common],
+        )
+        release_draft.set_defaults(_post_validate="never")
+        release_draft.add_argument("--version", default="next", help="Release version (vX.Y.Z or 'next')")
+        release_draft.add_argument("--sprints", type=int, default=3, help="Number of planned sprints (default: 3)")
+        release_draft.add_argument(
+            "--base",
+            default="latest-delivered",
+            help="Draft base (latest-delivered|current|vX.Y.Z)",
+        )
+        release_draft.add_argument("--format", default="text", help="Output format (text|json)")
+        release_draft.add_argument("--schema", action="store_true", help="Print JSON schema for --format json and exit")
+        release_add_feature = release_subparsers.add_parser(
+            "add-feature", help="Assign a feature to a release", parents=[sub_common]
+        )
+        release_add_feature.set_defaults(_post_validate="quick", _post_validate_domains=("release",))
+        release_add_feature.add_argument("--release", required=True, help="Release version (vX.Y.Z)")
+        release_add_feature.add_argument("--feature", required=True, help="Feature name")
+        release_add_feature.add_argument(
+            "--slot", required=True, type=int, help="Sprint slot number (1..planned_sprints)"
+        )
+        release_add_feature.add_argument(
+            "--commitment",
+            required=True,
+            choices=["committed", "stretch"],
+            help="Scope commitment for this release",
+        )
+        release_add_feature.add_argument(
+            "--intent",
+            required=True,
+            choices=["deliver", "decide", "enable"],
+            help="Slot intent for this feature",
+        )
+        release_add_feature.add_argument("--priority", default="P1", help="Priority (default: P1)")
+        release_add_feature.add_argument("--epic", action="store_true", help="Mark feature as epic")
+        release_add_feature.add_argument("--critical", action="store_true", help="Mark as critical path")
+        release_suggest = release_subparsers.add_parser(
+            "suggest", help="Suggest features for a release", parents=[sub_common]
+        )
+        release_suggest.set_defaults(_post_validate="never")
+        release_suggest.add_argument("--version", required=True, help="Release version (vX.Y.Z)")
+        release_close = release_subparsers.add_parser("close", help="Close a release", parents=[sub_common])
+        release_close.set_defaults(_post_validate="quick", _post_validate_domains=("release",))
+        release_close.add_argument("--version", required=True, help="Release version (vX.Y.Z)")
+        release_migrate = release_subparsers.add_parser(
+            "migrate-slot-format",
+            help="Migrate legacy release slot plans to strict slot sections",
+            parents=[sub_common],
+        )
+        release_migrate.set_defaults(_post_validate="quick", _post_validate_domains=("release",))
+        release_migrate.add_argument("--release", required=True, help="Release version (vX.Y.Z)")
+        release_migrate.add_argument("--diff", action="store_true", help="Print unified diff only")
+        release_migrate.add_argument("--write-back", action="store_true", help="Write changes to plan.md and validate")
+
+    subparsers.add_parser("release", help="Manage project releases", parents=[sub_common], builder=_build_release)
+
+    def _build_daily(daily_parser: argparse.ArgumentParser) -> None:
+        daily_parser.set_defaults(_post_validate="never")
+        daily_subparsers = daily_parser.add_subparsers(
+            dest="daily_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        daily_generate = daily_subparsers.add_parser("generate", help="Generate daily status", parents=[sub_common])
+        daily_generate.set_defaults(_post_validate="quick", _post_validate_domains=("status",))
+        daily_generate.add_argument("--force", action="store_true", help="Generate even on weekends or overwrite")
+        daily_check = daily_subparsers.add_parser("check", help="Check daily status freshness", parents=[sub_common])
+        daily_check.set_defaults(_post_validate="never")
+        daily_check.add_argument("--verbose", action="store_true", help="Verbose output")
+
+    subparsers.add_parser("daily", help="Manage daily status cadence", parents=[sub_common], builder=_build_daily)
+
+    def _build_validate(validate_parser: argparse.ArgumentParser) -> None:
+        validate_parser.set_defaults(_post_validate="never")
+        validate_parser.add_argument("--quick", action="store_true", help="Skip heavyweight checks")
+        validate_parser.add_argument(
+            "--silent-success", action="store_true", help="Suppress output when there are no issues"
+        )
+        validate_parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Re-check only files changed since the last incremental run (same report as a full run)",
+        )
+        validate_parser.add_argument(
+            "--jobs",
+            type=int,
+            metavar="N",
+            help="Run independent validators on N threads (default: 1, serially)",
+        )
+        validate_parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Print per-validator wall time, files/bytes read, stat calls and issue counts",
+        )
+        validate_parser.add_argument(
+            "--profile-json",
+            action="store_true",
+            help="With --profile, also write status/validation_profile.json",
+        )
+
+    subparsers.add_parser("validate", help="Validate handbook content", parents=[sub_common], builder=_build_validate)
+
+    def _build_pre_exec(pre_exec_parser: argparse.ArgumentParser) -> None:
+        pre_exec_parser.set_defaults(_post_validate="never")
+        pre_exec_subparsers = pre_exec_parser.add_subparsers(
+            dest="pre_exec_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+        pre_exec_lint = pre_exec_subparsers.add_parser("lint", help="Strict task-doc lint gate", parents=[sub_common])
+        pre_exec_lint.set_defaults(_post_validate="never")
+        pre_exec_audit = pre_exec_subparsers.add_parser(
+            "audit",
+            help="Capture evidence bundle + lint",
+            parents=[sub_common],
+        )
+        pre_exec_audit.set_defaults(_post_validate="never")
+        pre_exec_audit.add_argument("--sprint", help="Override sprint id (default: from sprints/current/plan.md)")
+        pre_exec_audit.add_argument("--date", help="Override evidence date (default: today YYYY-MM-DD)")
+        pre_exec_audit.add_argument("--evidence-dir", help="Override evidence directory path")
+
+    subparsers.add_parser(
+        "pre-exec", help="Pre-execution lint/audit gate", parents=[sub_common], builder=_build_pre_exec
     )
 
+    def _build_evidence(evidence_parser: argparse.ArgumentParser) -> None:
+        evidence_parser.set_defaults(_post_validate="never")
+        evidence_subparsers = evidence_parser.add_subparsers(
+            dest="evidence_command",
+            title="Subcommands",
+            metavar="<subcommand>",
+        )
+
+        evidence_new = evidence_subparsers.add_parser("new", help="Create evidence folder(s)", parents=[sub_common])
+        evidence_new.set_defaults(_post_validate="never")
+        evidence_new.add_argument("--task", required=True, help="Task id (e.g. TASK-001)")
+        evidence_new.add_argument("--name", default="manual", help="Label for this evidence run (default: manual)")
+        evidence_new.add_argument("--run-id", dest="run_id", help="Override run id (default: UTC timestamp + slug)")
+
+        evidence_run = evidence_subparsers.add_parser(
+            "run", help="Run a command and capture evidence", parents=[sub_common]
+        )
+        evidence_run.set_defaults(_post_validate="never")
+        evidence_run.add_argument("--task", required=True, help="Task id (e.g. TASK-001)")
+        evidence_run.add_argument("--name", required=True, help="Short label for this evidence run (e.g. v2-smoke)")
+        evidence_run.add_argument("--run-id", dest="run_id", help="Override run id (default: UTC timestamp + slug)")
+        evidence_run.add_argument(
+            "cmd",
+            nargs=argparse.REMAINDER,
+            help="Command to run (use `-- <cmd> ...` to pass flags through)",
+        )
+
+    subparsers.add_parser("evidence", help="Evidence capture utilities", parents=[sub_common], builder=_build_evidence)
+
     _apply_usage_placeholders(parser)
     return parser
 
@@ -934,12 +1120,18 @@ def _handle_doctor(args: argparse.Namespace) -> int:
     raise RuntimeError("doctor is dispatched by main()")
 
 
-def main(argv: list[str] | None = None) -> int:
+def main(argv: list[str] | None = None, *, env: Mapping[str, str] | None = None) -> int:
     invocation_args = list(argv) if argv is not None else sys.argv[1:]
+    # `ph serve` passes each client's environment here instead of swapping the daemon's `os.environ`.
+    env = os.environ if env is None else env
     if invocation_args in (["--version"], ["-V"]):
         print(__version__)
         return 0
 
+    forwarded_exit_code = forward_to_server(argv=invocation_args, env=env)
+    if forwarded_exit_code is not None:
+        return forwarded_exit_code
+
     parser = build_parser()
     args = parser.parse_args(argv)
 
@@ -947,6 +1139,8 @@ def main(argv: list[str] | None = None) -> int:
         return _handle_version(args)
 
     if args.command == "init":
+        from .init_repo import InitError, run_init
+
         target_root = Path(getattr(args, "root", None) or Path.cwd()).resolve()
         try:
             exit_code = run_init(target_root=target_root, update_gitignore=bool(getattr(args, "gitignore", True)))
@@ -964,12 +1158,13 @@ def main(argv: list[str] | None = None) -> int:
             no_history=bool(getattr(args, "no_history", False)),
             no_validate=bool(getattr(args, "no_validate", False)),
             post_validate_mode=str(getattr(args, "_post_validate", "quick")),
-            env=os.environ,
+            env=env,
         )
 
     group_next_commands: dict[str, list[str]] = {
         "process": ["ph process refresh --templates", "ph process refresh --playbooks", "ph --help"],
         "hooks": ["ph hooks install"],
+        "cache": ["ph cache stats", "ph cache clear"],
         "question": [
             "ph question list",
             "ph question add --title '...' --severity blocking --q-scope sprint --body '...'",
@@ -1037,10 +1232,12 @@ def main(argv: list[str] | None = None) -> int:
         nonlocal ctx
         config = load_handbook_config(ph_root)
         validate_handbook_config(config)
-        scope = resolve_scope(cli_scope=getattr(args, "scope", None))
+        scope = resolve_scope(cli_scope=getattr(args, "scope", None), env=env)
         ctx = build_context(ph_root=ph_root, scope=scope)
 
     if args.command == "doctor":
+        from .doctor import run_doctor
+
         result = run_doctor(ph_root)
         stream = sys.stdout if result.exit_code == 0 else sys.stderr
         print(result.output, file=stream, end="")
@@ -1054,6 +1251,8 @@ def main(argv: list[str] | None = None) -> int:
                 parser.print_help()
                 exit_code = 0
             elif args.command == "help":
+                from .help_text import get_help_text
+
                 topic = str(args.topic).strip().lower() if args.topic is not None else None
                 text = get_help_text(topic)
                 if text is None:
@@ -1063,13 +1262,22 @@ def main(argv: list[str] | None = None) -> int:
                     cmd_args = ["help"]
                     if topic:
                         cmd_args.append(topic)
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     sys.stdout.write(text)
             elif args.command == "onboarding":
+                from .onboarding import render_onboarding
+
                 if args.onboarding_command is None:
                     sys.stdout.write(render_onboarding(ph_data_root=ctx.ph_data_root))
                     exit_code = 0
                 elif args.onboarding_command == "session":
+                    from .onboarding import (
+                        SessionList,
+                        list_session_topics,
+                        read_latest_session_summary,
+                        render_session_template,
+                    )
+
                     session_topic = str(args.session_topic).strip() if args.session_topic is not None else ""
                     if session_topic == "list":
                         topics = list_session_topics(ph_data_root=ctx.ph_data_root)
@@ -1091,8 +1299,10 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="hooks")
                     exit_code = 2
                 elif args.hooks_command == "install":
+                    from .git_hooks import install_git_hooks
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["hooks", "install"]))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["hooks", "install"]))
                     install_git_hooks(ph_root=ph_root)
                     sys.stdout.write("Git hooks installed!\n")
                     exit_code = 0
@@ -1100,6 +1310,8 @@ def main(argv: list[str] | None = None) -> int:
                     print("Unknown hooks command.\nUse: ph hooks install\n", file=sys.stderr, end="")
                     exit_code = 2
             elif args.command == "reset":
+                from .reset import run_reset
+
                 exit_code = run_reset(
                     ctx=ctx,
                     spec=str(getattr(args, "spec")),
@@ -1108,12 +1320,16 @@ def main(argv: list[str] | None = None) -> int:
                     force=str(getattr(args, "force")),
                 )
             elif args.command == "reset-smoke":
+                from .reset_smoke import run_reset_smoke
+
                 exit_code = run_reset_smoke(
                     ph_root=ph_root,
                     ctx=ctx,
                     include_system=bool(getattr(args, "include_system", False)),
                 )
             elif args.command == "end-session":
+                from .end_session import parse_since, run_end_session_codex, run_end_session_skip_codex
+
                 _ = args.session_id  # parsed for parity; log selection is explicit in v1
                 _ = args.session_end_codex  # parsed for parity; not exercised in tests
                 _ = args.session_end_codex_model  # parsed for parity; not exercised in tests
@@ -1126,6 +1342,9 @@ def main(argv: list[str] | None = None) -> int:
                 if getattr(args, "model_verbosity", None):
                     overrides["model_verbosity"] = args.model_verbosity
 
+                since = parse_since(args.since) if getattr(args, "since", None) else None
+                use_index = not bool(getattr(args, "no_rollout_index", False))
+
                 if args.skip_codex:
                     run_end_session_skip_codex(
                         ph_root=ph_root,
@@ -1134,6 +1353,9 @@ def main(argv: list[str] | None = None) -> int:
                         session_end_mode=str(args.session_end_mode),
                         workstream=getattr(args, "workstream", None),
                         task_ref=getattr(args, "task_ref", None),
+                        since=since,
+                        use_index=use_index,
+                        incremental=bool(getattr(args, "incremental", False)),
                     )
                     exit_code = 0
                 else:
@@ -1142,29 +1364,64 @@ def main(argv: list[str] | None = None) -> int:
                         log_path=Path(args.log),
                         model=getattr(args, "codex_model", None),
                         overrides=overrides,
+                        codex_jobs=getattr(args, "codex_jobs", None),
+                        codex_cache=not bool(getattr(args, "no_codex_cache", False)),
                         force=bool(args.force),
                         session_end_mode=str(args.session_end_mode),
                         workstream=getattr(args, "workstream", None),
                         task_ref=getattr(args, "task_ref", None),
+                        since=since,
+                        use_index=use_index,
+                        incremental=bool(getattr(args, "incremental", False)),
                     )
                     exit_code = 0
             elif args.command == "clean":
+                from .clean import clean_python_caches
+
                 if ctx.scope == "project":
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["clean"]))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["clean"]))
                     sys.stdout.flush()
                 clean_python_caches(ph_root=ph_root)
                 print("Cleaned Python cache files\n", end="")
                 exit_code = 0
+            elif args.command == "watch":
+                from .watch import run_watch
+
+                exit_code = run_watch(
+                    ctx=ctx,
+                    env=env,
+                    debounce=float(args.debounce),
+                    poll=bool(args.poll),
+                    poll_interval=float(args.poll_interval),
+                )
+            elif args.command == "serve":
+                from .serve import run_serve
+
+                exit_code = run_serve(ph_root=ph_root, idle_timeout=getattr(args, "idle_timeout", None))
+            elif args.command == "cache":
+                if args.cache_command == "stats":
+                    from .cache_commands import run_cache_stats
+
+                    exit_code = run_cache_stats(ctx=ctx)
+                elif args.cache_command == "clear":
+                    from .cache_commands import run_cache_clear
+
+                    exit_code = run_cache_clear(ctx=ctx)
+                else:
+                    print("Unknown cache command.\nUse: ph cache stats|clear\n", file=sys.stderr, end="")
+                    exit_code = 2
             elif args.command == "status":
+                from .status import run_status
+
                 if ctx.scope == "project":
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["status"]))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["status"]))
                     sys.stdout.flush()
 
                 status_result = run_status(
                     ph_root=ph_root,
                     ph_project_root=ctx.ph_project_root,
                     ph_data_root=ctx.ph_data_root,
-                    env=os.environ,
+                    env=env,
                 )
                 print(f"Generated: {status_result.json_path.resolve()}")
                 print(f"Updated: {status_result.summary_path.resolve()}")
@@ -1181,11 +1438,15 @@ def main(argv: list[str] | None = None) -> int:
                 if status_result.feature_update_message:
                     print(status_result.feature_update_message)
             elif args.command == "dashboard":
+                from .dashboard import run_dashboard
+
                 if ctx.scope == "project":
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["dashboard"]))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["dashboard"]))
                     sys.stdout.flush()
-                exit_code = run_dashboard(ph_root=ph_root, ctx=ctx)
+                exit_code = run_dashboard(ph_root=ph_root, ctx=ctx, env=env)
             elif args.command == "next":
+                from .next import run_next
+
                 output_format = str(getattr(args, "format", "text"))
                 if ctx.scope == "project" and output_format != "json":
                     cmd_args = ["next"]
@@ -1195,7 +1456,7 @@ def main(argv: list[str] | None = None) -> int:
                         cmd_args.extend(["--release", str(args.release)])
                     if "--sprint" in invocation_args and getattr(args, "sprint", None) is not None:
                         cmd_args.extend(["--sprint", str(args.sprint)])
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     sys.stdout.flush()
                 exit_code = run_next(
                     ph_root=ph_root,
@@ -1203,13 +1464,15 @@ def main(argv: list[str] | None = None) -> int:
                     release=getattr(args, "release", None),
                     sprint=getattr(args, "sprint", None),
                     format=output_format,
-                    env=os.environ,
+                    env=env,
                 )
             elif args.command == "process":
                 if getattr(args, "process_command", None) is None:
                     _print_group_missing_subcommand(group="process")
                     exit_code = 2
                 elif args.process_command == "refresh":
+                    from .process_refresh import run_process_refresh
+
                     if ctx.scope == "project":
                         cmd_args = ["process", "refresh"]
                         if bool(getattr(args, "templates", False)):
@@ -1222,7 +1485,7 @@ def main(argv: list[str] | None = None) -> int:
                             cmd_args.append("--disable-system-scope-enforcement")
                         if bool(getattr(args, "migrate_tasks_drop_session", False)):
                             cmd_args.append("--migrate-tasks-drop-session")
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                         sys.stdout.flush()
                     exit_code = run_process_refresh(
                         ctx=ctx,
@@ -1231,7 +1494,7 @@ def main(argv: list[str] | None = None) -> int:
                         force=bool(getattr(args, "force", False)),
                         disable_system_scope_enforcement=bool(getattr(args, "disable_system_scope_enforcement", False)),
                         migrate_tasks_drop_session=bool(getattr(args, "migrate_tasks_drop_session", False)),
-                        env=os.environ,
+                        env=env,
                     )
                 else:
                     _print_group_missing_subcommand(group="process")
@@ -1241,6 +1504,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="question")
                     exit_code = 2
                 elif args.question_command == "add":
+                    from .question import run_question_add
+
                     exit_code = run_question_add(
                         ctx=ctx,
                         title=str(getattr(args, "title")),
@@ -1252,49 +1517,61 @@ def main(argv: list[str] | None = None) -> int:
                         asked_by=getattr(args, "asked_by", None),
                         owner=getattr(args, "owner", None),
                         body=str(getattr(args, "body", "")),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.question_command == "list":
+                    from .question import run_question_list
+
                     exit_code = run_question_list(
                         ctx=ctx,
                         status=str(getattr(args, "status", "open")),
                         format=str(getattr(args, "format", "table")),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.question_command == "show":
-                    exit_code = run_question_show(ctx=ctx, qid=str(getattr(args, "id")), env=os.environ)
+                    from .question import run_question_show
+
+                    exit_code = run_question_show(ctx=ctx, qid=str(getattr(args, "id")), env=env)
                 elif args.question_command == "answer":
+                    from .question import run_question_answer
+
                     exit_code = run_question_answer(
                         ctx=ctx,
                         qid=str(getattr(args, "id")),
                         answer=str(getattr(args, "answer")),
                         by=getattr(args, "by", None),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.question_command == "close":
+                    from .question import run_question_close
+
                     exit_code = run_question_close(
                         ctx=ctx,
                         qid=str(getattr(args, "id")),
                         resolution=str(getattr(args, "resolution")),
-                        env=os.environ,
+                        env=env,
                     )
                 else:
                     _print_group_missing_subcommand(group="question")
                     exit_code = 2
             elif args.command == "check-all":
+                from .orchestration import run_check_all
+
                 if ctx.scope == "project":
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["check-all"]))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["check-all"]))
                     sys.stdout.flush()
-                exit_code = run_check_all(ph_root=ph_root, ctx=ctx, env=os.environ)
+                exit_code = run_check_all(ph_root=ph_root, ctx=ctx, env=env)
             elif args.command == "test":
                 if getattr(args, "test_command", None) is None:
                     _print_group_missing_subcommand(group="test")
                     exit_code = 2
                 elif args.test_command == "system":
+                    from .orchestration import run_test_system
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["test", "system"]))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["test", "system"]))
                         sys.stdout.flush()
-                    exit_code = run_test_system(ph_root=ph_root, ctx=ctx, env=os.environ)
+                    exit_code = run_test_system(ph_root=ph_root, ctx=ctx, env=env)
                 else:
                     _print_group_missing_subcommand(group="test")
                     exit_code = 2
@@ -1303,6 +1580,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="sprint")
                     exit_code = 2
                 elif args.sprint_command == "plan":
+                    from .sprint_commands import sprint_plan
+
                     if ctx.scope == "project":
                         cmd_args = ["sprint", "plan"]
                         sprint_id = getattr(args, "sprint", None)
@@ -1310,93 +1589,108 @@ def main(argv: list[str] | None = None) -> int:
                             cmd_args.extend(["--sprint", str(sprint_id)])
                         if bool(getattr(args, "force", False)):
                             cmd_args.append("--force")
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = sprint_plan(
                         ph_root=ph_root,
                         ctx=ctx,
                         sprint_id=getattr(args, "sprint", None),
                         force=bool(getattr(args, "force", False)),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.sprint_command == "open":
+                    from .sprint_commands import sprint_open
+
                     sprint_id = str(args.sprint)
                     if ctx.scope == "project":
                         sys.stdout.write(
                             _format_cli_preamble(
                                 ph_root=ph_root,
+                                env=env,
                                 cmd_args=["sprint", "open", "--sprint", sprint_id],
                             )
                         )
                     exit_code = sprint_open(ph_root=ph_root, ctx=ctx, sprint_id=sprint_id)
                 elif args.sprint_command == "status":
+                    from .sprint_status import run_sprint_status
+
                     if ctx.scope == "project":
                         cmd_args = ["sprint", "status"]
                         sprint_id = getattr(args, "sprint", None)
                         if sprint_id:
                             cmd_args.extend(["--sprint", str(sprint_id)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_sprint_status(
                         ph_project_root=ctx.ph_project_root, ctx=ctx, sprint=getattr(args, "sprint", None)
                     )
                 elif args.sprint_command == "tasks":
+                    from .sprint_tasks import run_sprint_tasks
+
                     if ctx.scope == "project":
                         cmd_args = ["sprint", "tasks"]
                         sprint_id = getattr(args, "sprint", None)
                         if sprint_id:
                             cmd_args.extend(["--sprint", str(sprint_id)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_sprint_tasks(ctx=ctx, sprint=getattr(args, "sprint", None))
                 elif args.sprint_command == "burndown":
+                    from .sprint_burndown import run_sprint_burndown
+
                     if ctx.scope == "project":
                         cmd_args = ["sprint", "burndown"]
                         sprint_id = getattr(args, "sprint", None)
                         if sprint_id:
                             cmd_args.extend(["--sprint", str(sprint_id)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_sprint_burndown(
                         ph_project_root=ctx.ph_project_root,
                         ctx=ctx,
                         sprint=getattr(args, "sprint", None),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.sprint_command == "capacity":
+                    from .sprint_capacity import run_sprint_capacity
+
                     if ctx.scope == "project":
                         cmd_args = ["sprint", "capacity"]
                         sprint_id = getattr(args, "sprint", None)
                         if sprint_id:
                             cmd_args.extend(["--sprint", str(sprint_id)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_sprint_capacity(
                         ph_root=ph_root,
                         ctx=ctx,
                         sprint=getattr(args, "sprint", None),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.sprint_command == "archive":
+                    from .sprint_archive import run_sprint_archive
+
                     if ctx.scope == "project":
                         cmd_args = ["sprint", "archive"]
                         sprint_id = getattr(args, "sprint", None)
                         if sprint_id:
                             cmd_args.extend(["--sprint", str(sprint_id)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_sprint_archive(
                         ph_root=ph_root,
                         ctx=ctx,
                         sprint=getattr(args, "sprint", None),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.sprint_command == "close":
+                    from .sprint_close import run_sprint_close
+
                     if ctx.scope == "project":
                         cmd_args = ["sprint", "close"]
                         sprint_id = getattr(args, "sprint", None)
                         if sprint_id:
                             cmd_args.extend(["--sprint", str(sprint_id)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_sprint_close(
                         ph_project_root=ctx.ph_project_root,
                         ctx=ctx,
                         sprint=getattr(args, "sprint", None),
-                        env=os.environ,
+                        env=env,
                     )
                 else:
                     _print_group_missing_subcommand(group="sprint")
@@ -1406,6 +1700,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="task")
                     exit_code = 2
                 elif args.task_command == "create":
+                    from .task_create import run_task_create
+
                     if ctx.scope == "project":
                         cmd_args = [
                             "task",
@@ -1432,7 +1728,7 @@ def main(argv: list[str] | None = None) -> int:
                         if "--gate" in invocation_args and bool(getattr(args, "gate", False)):
                             cmd_args.append("--gate")
 
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
 
                     exit_code = run_task_create(
                         ph_root=ph_root,
@@ -1447,22 +1743,29 @@ def main(argv: list[str] | None = None) -> int:
                         task_type=getattr(args, "task_type", None),
                         release=getattr(args, "release", None),
                         gate=bool(getattr(args, "gate", False)),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.task_command == "list":
+                    from .task_view import run_task_list
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["task", "list"]))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["task", "list"]))
                     exit_code = run_task_list(ctx=ctx)
                 elif args.task_command == "show":
+                    from .task_view import run_task_show
+
                     if ctx.scope == "project":
                         sys.stdout.write(
                             _format_cli_preamble(
                                 ph_root=ph_root,
+                                env=env,
                                 cmd_args=["task", "show", "--id", str(args.id)],
                             )
                         )
                     exit_code = run_task_show(ctx=ctx, task_id=str(args.id))
                 elif args.task_command == "status":
+                    from .task_status import run_task_status
+
                     if ctx.scope == "project":
                         cmd_args = [
                             "task",
@@ -1475,7 +1778,7 @@ def main(argv: list[str] | None = None) -> int:
                         if "--force" in invocation_args and bool(getattr(args, "force", False)):
                             cmd_args.append("--force")
 
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
 
                     exit_code = run_task_status(
                         ctx=ctx,
@@ -1491,6 +1794,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="feature")
                     exit_code = 2
                 elif args.feature_command == "create":
+                    from .feature import run_feature_create
+
                     if ctx.scope == "project":
                         cmd_args = ["feature", "create", "--name", str(args.name)]
                         if "--epic" in invocation_args and bool(getattr(args, "epic", False)):
@@ -1499,7 +1804,7 @@ def main(argv: list[str] | None = None) -> int:
                             cmd_args.extend(["--owner", str(args.owner)])
                         if "--stage" in invocation_args:
                             cmd_args.extend(["--stage", str(args.stage)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_feature_create(
                         ph_root=ph_root,
                         ctx=ctx,
@@ -1507,17 +1812,22 @@ def main(argv: list[str] | None = None) -> int:
                         epic=bool(getattr(args, "epic", False)),
                         owner=str(args.owner),
                         stage=str(args.stage),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.feature_command == "list":
+                    from .feature import run_feature_list
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["feature", "list"]))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["feature", "list"]))
                     exit_code = run_feature_list(ctx=ctx)
                 elif args.feature_command == "status":
+                    from .feature import run_feature_status
+
                     if ctx.scope == "project":
                         sys.stdout.write(
                             _format_cli_preamble(
                                 ph_root=ph_root,
+                                env=env,
                                 cmd_args=["feature", "status", "--name", str(args.name), "--stage", str(args.stage)],
                             )
                         )
@@ -1525,22 +1835,32 @@ def main(argv: list[str] | None = None) -> int:
                         ctx=ctx,
                         name=str(args.name),
                         stage=str(args.stage),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.feature_command == "update-status":
+                    from .feature_status_updater import run_feature_update_status
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["feature", "update-status"]))
-                    exit_code = run_feature_update_status(ctx=ctx, env=os.environ)
+                        sys.stdout.write(
+                            _format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["feature", "update-status"])
+                        )
+                    exit_code = run_feature_update_status(ctx=ctx, env=env)
                 elif args.feature_command == "summary":
+                    from .feature_status_updater import run_feature_summary
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["feature", "summary"]))
-                    exit_code = run_feature_summary(ctx=ctx, env=os.environ)
+                        sys.stdout.write(
+                            _format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["feature", "summary"])
+                        )
+                    exit_code = run_feature_summary(ctx=ctx, env=env)
                 elif args.feature_command == "archive":
+                    from .feature_archive import run_feature_archive
+
                     if ctx.scope == "project":
                         cmd_args = ["feature", "archive", "--name", str(args.name)]
                         if bool(getattr(args, "force", False)):
                             cmd_args.append("--force")
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_feature_archive(
                         ctx=ctx,
                         name=str(args.name),
@@ -1554,6 +1874,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="adr")
                     exit_code = 2
                 elif args.adr_command == "add":
+                    from .adr import run_adr_add
+
                     if ctx.scope == "project":
                         cmd_args = [
                             "adr",
@@ -1573,7 +1895,7 @@ def main(argv: list[str] | None = None) -> int:
                             cmd_args.extend(["--date", str(getattr(args, "date"))])
                         if "--force" in invocation_args and bool(getattr(args, "force", False)):
                             cmd_args.append("--force")
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
 
                     exit_code = run_adr_add(
                         ph_root=ph_root,
@@ -1587,8 +1909,10 @@ def main(argv: list[str] | None = None) -> int:
                         force=bool(getattr(args, "force", False)),
                     )
                 elif args.adr_command == "list":
+                    from .adr import run_adr_list
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["adr", "list"]))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["adr", "list"]))
                     exit_code = run_adr_list(ph_data_root=ctx.ph_data_root)
                 else:
                     _print_group_missing_subcommand(group="adr")
@@ -1613,7 +1937,7 @@ def main(argv: list[str] | None = None) -> int:
                             cmd_args.extend(["--date", str(getattr(args, "date"))])
                         if "--force" in invocation_args and bool(getattr(args, "force", False)):
                             cmd_args.append("--force")
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
 
                     exit_code = run_dr_add(
                         ph_root=ph_root,
@@ -1632,6 +1956,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="fdr")
                     exit_code = 2
                 elif args.fdr_command == "add":
+                    from .fdr import run_fdr_add
+
                     if ctx.scope == "project":
                         cmd_args = [
                             "fdr",
@@ -1647,7 +1973,7 @@ def main(argv: list[str] | None = None) -> int:
                             cmd_args.extend(["--dr", str(dr_id)])
                         if "--date" in invocation_args and getattr(args, "date", None) is not None:
                             cmd_args.extend(["--date", str(getattr(args, "date"))])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
 
                     exit_code = run_fdr_add(
                         ph_root=ph_root,
@@ -1666,6 +1992,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="backlog")
                     exit_code = 2
                 elif args.backlog_command == "add":
+                    from .backlog import run_backlog_add
+
                     if ctx.scope == "project":
                         cmd_args = [
                             "backlog",
@@ -1685,7 +2013,7 @@ def main(argv: list[str] | None = None) -> int:
                             cmd_args.extend(["--impact", str(args.impact)])
                         if "--workaround" in invocation_args and str(getattr(args, "workaround", "") or "") != "":
                             cmd_args.extend(["--workaround", str(args.workaround)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_backlog_add(
                         ctx=ctx,
                         issue_type=str(args.issue_type),
@@ -1695,45 +2023,53 @@ def main(argv: list[str] | None = None) -> int:
                         owner=str(args.owner),
                         impact=str(args.impact),
                         workaround=str(args.workaround),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.backlog_command == "list":
+                    from .backlog import run_backlog_list
+
                     if ctx.scope == "project" and str(args.format) != "json":
                         cmd_args = ["backlog", "list"]
                         if "--severity" in invocation_args and getattr(args, "severity", None) is not None:
                             cmd_args.extend(["--severity", str(args.severity)])
                         if "--category" in invocation_args and getattr(args, "category", None) is not None:
                             cmd_args.extend(["--category", str(args.category)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_backlog_list(
                         ctx=ctx,
                         severity=getattr(args, "severity", None),
                         category=getattr(args, "category", None),
                         format=str(args.format),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.backlog_command == "triage":
+                    from .backlog import run_backlog_triage
+
                     issue_id = str(args.issue_id)
                     if ctx.scope == "project":
                         sys.stdout.write(
                             _format_cli_preamble(
                                 ph_root=ph_root,
+                                env=env,
                                 cmd_args=["backlog", "triage", "--issue", issue_id],
                             )
                         )
                     exit_code = run_backlog_triage(
                         ctx=ctx,
                         issue_id=issue_id,
-                        env=os.environ,
+                        env=env,
                         print_index_summary=ctx.scope == "project",
                     )
                 elif args.backlog_command == "assign":
+                    from .backlog import run_backlog_assign
+
                     issue_id = str(args.issue_id)
                     sprint = str(getattr(args, "sprint", "current") or "current")
                     if ctx.scope == "project":
                         sys.stdout.write(
                             _format_cli_preamble(
                                 ph_root=ph_root,
+                                env=env,
                                 cmd_args=["backlog", "assign", "--issue", issue_id, "--sprint", sprint],
                             )
                         )
@@ -1741,16 +2077,20 @@ def main(argv: list[str] | None = None) -> int:
                         ctx=ctx,
                         issue_id=issue_id,
                         sprint=sprint,
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.backlog_command == "rubric":
+                    from .backlog import run_backlog_rubric
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["backlog", "rubric"]))
-                    exit_code = run_backlog_rubric(ctx=ctx, env=os.environ)
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["backlog", "rubric"]))
+                    exit_code = run_backlog_rubric(ctx=ctx, env=env)
                 elif args.backlog_command == "stats":
+                    from .backlog import run_backlog_stats
+
                     if ctx.scope == "project":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["backlog", "stats"]))
-                    exit_code = run_backlog_stats(ctx=ctx, env=os.environ)
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["backlog", "stats"]))
+                    exit_code = run_backlog_stats(ctx=ctx, env=env)
                 else:
                     _print_group_missing_subcommand(group="backlog")
                     exit_code = 2
@@ -1759,6 +2099,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="parking")
                     exit_code = 2
                 elif args.parking_command == "add":
+                    from .parking import run_parking_add
+
                     if ctx.scope == "project":
                         cmd_args = [
                             "parking",
@@ -1775,7 +2117,7 @@ def main(argv: list[str] | None = None) -> int:
                         if "--tags" in invocation_args and str(getattr(args, "tags", "") or "") != "":
                             cmd_args.extend(["--tags", str(args.tags)])
 
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
 
                     exit_code = run_parking_add(
                         ctx=ctx,
@@ -1784,33 +2126,40 @@ def main(argv: list[str] | None = None) -> int:
                         desc=str(args.desc),
                         owner=str(args.owner),
                         tags=str(getattr(args, "tags", "")),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.parking_command == "list":
+                    from .parking import run_parking_list
+
                     if ctx.scope == "project" and str(args.format) != "json":
                         cmd_args = ["parking", "list"]
                         if "--category" in invocation_args and getattr(args, "category", None) is not None:
                             cmd_args.extend(["--category", str(args.category)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_parking_list(
                         ctx=ctx,
                         category=getattr(args, "category", None),
                         format=str(args.format),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.parking_command == "review":
+                    from .parking import run_parking_review
+
                     output_format = str(getattr(args, "format", "text"))
                     if ctx.scope == "project" and output_format != "json":
                         cmd_args = ["parking", "review"]
                         if "--format" in invocation_args and getattr(args, "format", None) is not None:
                             cmd_args.extend(["--format", str(args.format)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
-                    exit_code = run_parking_review(ctx=ctx, format=output_format, env=os.environ)
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
+                    exit_code = run_parking_review(ctx=ctx, format=output_format, env=env)
                 elif args.parking_command == "promote":
+                    from .parking import run_parking_promote
+
                     if ctx.scope == "project":
                         sys.stdout.write(
                             _format_cli_preamble(
                                 ph_root=ph_root,
+                                env=env,
                                 cmd_args=[
                                     "parking",
                                     "promote",
@@ -1825,31 +2174,41 @@ def main(argv: list[str] | None = None) -> int:
                         ctx=ctx,
                         item_id=str(args.item),
                         target=str(args.target),
-                        env=os.environ,
+                        env=env,
                     )
                 else:
                     _print_group_missing_subcommand(group="parking")
                     exit_code = 2
             elif args.command == "roadmap":
+                from .roadmap import run_roadmap_show
+
                 if ctx.scope == "project":
                     if getattr(args, "roadmap_command", None) in (None, "show"):
                         if getattr(args, "roadmap_command", None) is None:
                             cmd_args = ["roadmap"]
                         else:
                             cmd_args = ["roadmap", "show"]
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     elif args.roadmap_command == "create":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["roadmap", "create"]))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["roadmap", "create"]))
                     elif args.roadmap_command == "validate":
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["roadmap", "validate"]))
+                        sys.stdout.write(
+                            _format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["roadmap", "validate"])
+                        )
 
                 if args.roadmap_command is None:
                     exit_code = run_roadmap_show(ctx=ctx)
                 elif args.roadmap_command == "show":
+                    from .roadmap import run_roadmap_show
+
                     exit_code = run_roadmap_show(ctx=ctx)
                 elif args.roadmap_command == "create":
-                    exit_code = run_roadmap_create(ctx=ctx)
+                    from .roadmap import run_roadmap_create
+
+                    exit_code = run_roadmap_create(ctx=ctx, env=env)
                 elif args.roadmap_command == "validate":
+                    from .roadmap import run_roadmap_validate
+
                     exit_code = run_roadmap_validate(ctx=ctx)
                 else:
                     print("Usage: ph roadmap <show|create|validate>\n", file=sys.stderr, end="")
@@ -1859,6 +2218,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="release")
                     exit_code = 2
                 elif args.release_command == "plan":
+                    from .release import run_release_plan
+
                     exit_code = run_release_plan(
                         ctx=ctx,
                         version=getattr(args, "version", None),
@@ -1867,19 +2228,31 @@ def main(argv: list[str] | None = None) -> int:
                         start_sprint=getattr(args, "start_sprint", None),
                         sprint_ids=getattr(args, "sprint_ids", None),
                         activate=bool(getattr(args, "activate", False)),
-                        env=os.environ,
+                        env=env,
                     )
                 elif args.release_command == "activate":
-                    exit_code = run_release_activate(ctx=ctx, release=str(getattr(args, "release")), env=os.environ)
+                    from .release import run_release_activate
+
+                    exit_code = run_release_activate(ctx=ctx, release=str(getattr(args, "release")), env=env)
                 elif args.release_command == "clear":
+                    from .release import run_release_clear
+
                     exit_code = run_release_clear(ctx=ctx)
                 elif args.release_command == "list":
-                    exit_code = run_release_list(ctx=ctx)
+                    from .release import run_release_list
+
+                    exit_code = run_release_list(ctx=ctx, progress=bool(args.progress))
                 elif args.release_command == "status":
-                    exit_code = run_release_status(ctx=ctx, release=getattr(args, "release", None), env=os.environ)
+                    from .release import run_release_status
+
+                    exit_code = run_release_status(ctx=ctx, release=getattr(args, "release", None), env=env)
                 elif args.release_command == "show":
-                    exit_code = run_release_show(ctx=ctx, release=getattr(args, "release", None), env=os.environ)
+                    from .release import run_release_show
+
+                    exit_code = run_release_show(ctx=ctx, release=getattr(args, "release", None), env=env)
                 elif args.release_command == "draft":
+                    from .release import run_release_draft
+
                     exit_code = run_release_draft(
                         ctx=ctx,
                         version=str(getattr(args, "version", "next")),
@@ -1889,6 +2262,8 @@ def main(argv: list[str] | None = None) -> int:
                         schema=bool(getattr(args, "schema", False)),
                     )
                 elif args.release_command == "add-feature":
+                    from .release import run_release_add_feature
+
                     exit_code = run_release_add_feature(
                         ctx=ctx,
                         release=str(getattr(args, "release")),
@@ -1901,26 +2276,44 @@ def main(argv: list[str] | None = None) -> int:
                         critical=bool(getattr(args, "critical", False)),
                     )
                 elif args.release_command == "suggest":
+                    from .release import run_release_suggest
+
                     exit_code = run_release_suggest(ctx=ctx, version=str(getattr(args, "version")))
                 elif args.release_command == "close":
-                    exit_code = run_release_close(ctx=ctx, version=str(getattr(args, "version")), env=os.environ)
+                    from .release import run_release_close
+
+                    exit_code = run_release_close(ctx=ctx, version=str(getattr(args, "version")), env=env)
                 elif args.release_command == "migrate-slot-format":
+                    from .release import run_release_migrate_slot_format
+
                     exit_code = run_release_migrate_slot_format(
                         ctx=ctx,
                         release=str(getattr(args, "release")),
                         diff=bool(getattr(args, "diff", False)),
                         write_back=bool(getattr(args, "write_back", False)),
-                        env=os.environ,
+                        env=env,
                     )
                 else:
                     _print_group_missing_subcommand(group="release")
                     exit_code = 2
             elif args.command == "validate":
+                from .validate_docs import run_validate
+
                 cmd_args = ["validate"]
                 if bool(args.quick):
                     cmd_args.append("--quick")
                 if "--silent-success" in invocation_args and bool(args.silent_success):
                     cmd_args.append("--silent-success")
+                if bool(args.incremental):
+                    cmd_args.append("--incremental")
+                if args.jobs is not None:
+                    cmd_args.extend(["--jobs", str(args.jobs)])
+                profile = None
+                if bool(args.profile) or bool(args.profile_json):
+                    from .validate_profile import ValidationProfile
+
+                    profile = ValidationProfile()
+                    cmd_args.append("--profile-json" if bool(args.profile_json) else "--profile")
                 exit_code, _out_path, message = run_validate(
                     ph_root=ph_root,
                     ph_project_root=ctx.ph_project_root,
@@ -1928,18 +2321,36 @@ def main(argv: list[str] | None = None) -> int:
                     scope=ctx.scope,
                     quick=bool(args.quick),
                     silent_success=bool(args.silent_success),
+                    incremental=bool(args.incremental),
+                    jobs=args.jobs,
+                    profile=profile,
                 )
-                if message:
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                if message or profile is not None:
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     print(message, end="")
+                if profile is not None:
+                    print(profile.format_table(), end="")
+                    if bool(args.profile_json):
+                        profile_path = profile.write_json(
+                            ph_data_root=ctx.ph_data_root,
+                            source="validate",
+                            quick=bool(args.quick),
+                            incremental=bool(args.incremental),
+                            jobs=args.jobs,
+                        )
+                        print(f"profile: {profile_path}")
             elif args.command == "pre-exec":
                 if getattr(args, "pre_exec_command", None) is None:
                     _print_group_missing_subcommand(group="pre-exec")
                     exit_code = 2
                 elif args.pre_exec_command == "lint":
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=["pre-exec", "lint"]))
-                    exit_code = run_pre_exec_lint(ctx=ctx)
+                    from .pre_exec import run_pre_exec_lint
+
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["pre-exec", "lint"]))
+                    exit_code = run_pre_exec_lint(ctx=ctx, env=env)
                 elif args.pre_exec_command == "audit":
+                    from .pre_exec import PreExecError, run_pre_exec_audit
+
                     cmd_args = ["pre-exec", "audit"]
                     sprint = getattr(args, "sprint", None)
                     date = getattr(args, "date", None)
@@ -1950,7 +2361,7 @@ def main(argv: list[str] | None = None) -> int:
                         cmd_args.extend(["--date", str(date)])
                     if evidence_dir:
                         cmd_args.extend(["--evidence-dir", str(evidence_dir)])
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     try:
                         exit_code = run_pre_exec_audit(
                             ph_root=ph_root,
@@ -1958,6 +2369,7 @@ def main(argv: list[str] | None = None) -> int:
                             sprint=sprint,
                             date=date,
                             evidence_dir=evidence_dir,
+                            env=env,
                         )
                     except PreExecError as exc:
                         print(f"\n❌ PRE-EXEC AUDIT FAILED: {exc}")
@@ -1970,6 +2382,8 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="evidence")
                     exit_code = 2
                 elif args.evidence_command == "new":
+                    from .evidence import run_evidence_new
+
                     task_id = str(getattr(args, "task"))
                     name = str(getattr(args, "name", "manual"))
                     run_id = getattr(args, "run_id", None)
@@ -1977,9 +2391,11 @@ def main(argv: list[str] | None = None) -> int:
                     cmd_args = ["evidence", "new", "--task", task_id, "--name", name]
                     if run_id:
                         cmd_args.extend(["--run-id", str(run_id)])
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     exit_code = run_evidence_new(ctx=ctx, task_id=task_id, name=name, run_id=run_id)
                 elif args.evidence_command == "run":
+                    from .evidence import run_evidence_run
+
                     task_id = str(getattr(args, "task"))
                     name = str(getattr(args, "name"))
                     run_id = getattr(args, "run_id", None)
@@ -1997,7 +2413,7 @@ def main(argv: list[str] | None = None) -> int:
                         cmd_args = ["evidence", "run", "--task", task_id, "--name", name]
                         if run_id:
                             cmd_args.extend(["--run-id", str(run_id)])
-                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                        sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                         exit_code = run_evidence_run(ctx=ctx, task_id=task_id, name=name, run_id=run_id, cmd=cmd)
                 else:
                     _print_group_missing_subcommand(group="evidence")
@@ -2007,28 +2423,32 @@ def main(argv: list[str] | None = None) -> int:
                     _print_group_missing_subcommand(group="daily")
                     exit_code = 2
                 elif args.daily_command == "generate":
+                    from .daily import create_daily_status
+
                     cmd_args = ["daily", "generate"]
                     if bool(getattr(args, "force", False)):
                         cmd_args.append("--force")
-                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, cmd_args=cmd_args))
+                    sys.stdout.write(_format_cli_preamble(ph_root=ph_root, env=env, cmd_args=cmd_args))
                     created = create_daily_status(
                         ph_root=ph_root,
                         ph_data_root=ctx.ph_data_root,
                         force=bool(args.force),
-                        env=os.environ,
+                        env=env,
                     )
                     exit_code = 0 if created else 1
                 elif args.daily_command == "check":
+                    from .daily import check_status as check_daily_status
+
                     if bool(getattr(args, "verbose", False)):
                         sys.stdout.write(
-                            _format_cli_preamble(ph_root=ph_root, cmd_args=["daily", "check", "--verbose"])
+                            _format_cli_preamble(ph_root=ph_root, env=env, cmd_args=["daily", "check", "--verbose"])
                         )
 
                     exit_code = check_daily_status(
                         ph_root=ph_root,
                         ph_data_root=ctx.ph_data_root,
                         verbose=bool(args.verbose),
-                        env=os.environ,
+                        env=env,
                     )
                     if bool(getattr(args, "verbose", False)) and exit_code != 0:
                         sys.stdout.write("\u2009ELIFECYCLE\u2009 Command failed with exit code 2.\n")
@@ -2039,7 +2459,7 @@ def main(argv: list[str] | None = None) -> int:
             else:
                 print(f"Unknown command: {args.command}\n", file=sys.stderr, end="")
                 exit_code = 2
-        except (ConfigError, ScopeError, OnboardingError, EndSessionError, ResetError, EvidenceError) as exc:
+        except (ConfigError, ScopeError, *_loaded_command_errors()) as exc:
             print(str(exc), file=sys.stderr, end="")
             exit_code = 2
 
@@ -2051,7 +2471,7 @@ def main(argv: list[str] | None = None) -> int:
             no_history=bool(getattr(args, "no_history", False)),
             no_validate=bool(getattr(args, "no_validate", False)),
             post_validate_mode=str(getattr(args, "_post_validate", "quick")),
-            env=os.environ,
+            env=env,
         )
         if plan.run_validation and ctx is None:
             _build_ctx()
@@ -2070,5 +2490,6 @@ def main(argv: list[str] | None = None) -> int:
         no_history=bool(getattr(args, "no_history", False)),
         no_validate=bool(getattr(args, "no_validate", False)),
         post_validate_mode=str(getattr(args, "_post_validate", "quick")),
-        env=os.environ,
+        post_validate_domains=getattr(args, "_post_validate_domains", None),
+        env=env,
     )
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+CODEX_CACHE_DIRNAME = ".codex_cache"
+CODEX_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def chunk_cache_key(*, template: str, model: str | None, overrides: dict[str, str] | None, chunk: str) -> str:
+    """Return the sha256 of everything that determines a chunk's Codex output."""
+    material = json.dumps(
+        {"template": template, "model": model or "", "overrides": dict(sorted((overrides or {}).items()))},
+        sort_keys=True,
+    )
+    return hashlib.sha256((material + "\0" + chunk).encode("utf-8")).hexdigest()
+
+
+class CodexChunkCache:
+    """Codex outputs for transcript chunks, one `<sha256>.md` file per chunk under the session logs directory.
+
+    A hit refreshes the file's mtime, and `evict()` removes the least recently used files until the directory fits in
+    `max_bytes`, so retried or re-rendered end-session runs only call Codex for chunks they have not seen.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int = CODEX_CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.md"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits in `max_bytes`; return how many were removed."""
+        entries: list[tuple[int, int, Path]] = []
+        try:
+            scan = os.scandir(self.directory)
+        except OSError:
+            return 0
+        with scan:
+            for entry in scan:
+                if not entry.name.endswith(".md") or entry.name.startswith("."):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, Path(entry.path)))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
+import operator
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
-from packaging.specifiers import InvalidSpecifier, SpecifierSet
-
 from . import __version__
 from .root import PH_CONFIG_RELATIVE_PATH
 
@@ -70,14 +71,20 @@ def validate_handbook_config(config: HandbookConfig) -> None:
             _config_error_message(f"Unsupported handbook_schema_version: {config.handbook_schema_version} (expected 1)")
         )
 
-    try:
-        spec = SpecifierSet(config.requires_ph_version)
-    except InvalidSpecifier as exc:
-        raise ConfigError(
-            _config_error_message(f"Invalid requires_ph_version specifier: {config.requires_ph_version}")
-        ) from exc
+    satisfied = _simple_specifier_contains(config.requires_ph_version, __version__)
+    if satisfied is None:
+        # Full PEP 440 handling; `packaging` is only imported for specifiers the fast path cannot decide.
+        from packaging.specifiers import InvalidSpecifier, SpecifierSet
 
-    if not spec.contains(__version__, prereleases=True):
+        try:
+            spec = SpecifierSet(config.requires_ph_version)
+        except InvalidSpecifier as exc:
+            raise ConfigError(
+                _config_error_message(f"Invalid requires_ph_version specifier: {config.requires_ph_version}")
+            ) from exc
+        satisfied = spec.contains(__version__, prereleases=True)
+
+    if not satisfied:
         raise ConfigError(
             _config_error_message(
                 "Installed ph version does not satisfy requires_ph_version.\n"
@@ -87,6 +94,39 @@ def validate_handbook_config(config: HandbookConfig) -> None:
         )
 
 
+_SIMPLE_CLAUSE = re.compile(r"(>=|<=|==|!=|>|<)\s*(\d+(?:\.\d+)*)")
+_SIMPLE_OPERATORS: dict[str, Callable[[object, object], bool]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
+def _release_tuple(version: str, width: int) -> tuple[int, ...]:
+    parts = [int(p) for p in version.split(".")]
+    return tuple(parts + [0] * (width - len(parts)))
+
+
+def _simple_specifier_contains(specifier: str, version: str) -> bool | None:
+    """Evaluate comparisons of plain release numbers (e.g. `>=0.0.1,<0.1.0`); None when PEP 440 rules are needed."""
+    if not re.fullmatch(r"\d+(?:\.\d+)*", version):
+        return None
+    clauses = []
+    for raw in specifier.split(","):
+        match = _SIMPLE_CLAUSE.fullmatch(raw.strip())
+        if match is None:
+            return None
+        clauses.append((match.group(1), match.group(2)))
+    for op, bound in clauses:
+        width = max(len(version.split(".")), len(bound.split(".")))
+        if not _SIMPLE_OPERATORS[op](_release_tuple(version, width), _release_tuple(bound, width)):
+            return False
+    return True
+
+
 def check_handbook_config(ph_root: Path) -> ConfigCheckResult:
     try:
         config = load_handbook_config(ph_root)
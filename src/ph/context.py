@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,11 +18,11 @@ class Context:
     ph_data_root: Path
 
 
-def resolve_scope(*, cli_scope: str | None) -> str:
+def resolve_scope(*, cli_scope: str | None, env: Mapping[str, str] | None = None) -> str:
     if cli_scope is not None:
         scope = cli_scope
     else:
-        scope = os.environ.get("PH_SCOPE") or "project"
+        scope = (env if env is not None else os.environ).get("PH_SCOPE") or "project"
 
     if scope not in {"project", "system"}:
         raise ScopeError(f"Invalid scope: {scope!r} (expected 'project' or 'system')\n")
@@ -9,6 +9,7 @@ from typing import Any
 
 from .clock import now as clock_now
 from .clock import today as clock_today
+from .handbook_index import sprint_task_entries
 
 
 @dataclass(frozen=True)
@@ -117,29 +118,11 @@ def collect_sprint_tasks(*, ph_data_root: Path, env: dict[str, str]) -> dict[str
     if not tasks_dir.exists():
         return tasks_by_status
 
-    for task_dir in tasks_dir.iterdir():
-        if not task_dir.is_dir():
+    for entry in sprint_task_entries(sprint_dir=sprint_dir, sort=False):
+        document = entry.document()
+        if document is None:
             continue
-
-        task_yaml = task_dir / "task.yaml"
-        if not task_yaml.exists():
-            continue
-
-        try:
-            content = task_yaml.read_text(encoding="utf-8")
-        except Exception:
-            continue
-
-        task_data: dict[str, Any] = {}
-        for line in content.splitlines():
-            if ":" in line and not line.strip().startswith("-"):
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-                if value.isdigit():
-                    task_data[key] = int(value)
-                else:
-                    task_data[key] = value
+        task_data = document.typed()
 
         status = str(task_data.get("status", "todo") or "todo")
         if status in tasks_by_status:
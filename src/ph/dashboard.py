@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 from pathlib import Path
 from typing import Any
 
@@ -46,7 +45,7 @@ def _iter_recent_daily(*, ph_root: Path, ctx: Context) -> list[str]:
     return out
 
 
-def run_dashboard(*, ph_root: Path, ctx: Context) -> int:
+def run_dashboard(*, ph_root: Path, ctx: Context, env: dict[str, str]) -> int:
     print(BANNER_LINE)
     print(BANNER_SYSTEM if ctx.scope == "system" else BANNER_PROJECT)
     print(BANNER_LINE)
@@ -57,7 +56,7 @@ def run_dashboard(*, ph_root: Path, ctx: Context) -> int:
 
     print("Open Questions:")
     try:
-        qm = QuestionManager(ph_data_root=ctx.ph_data_root, env=os.environ)
+        qm = QuestionManager(ph_data_root=ctx.ph_data_root, env=env)
         questions = [q for q in qm.get_questions() if q.status.strip().lower() == "open"]
     except Exception:
         questions = []
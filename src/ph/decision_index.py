@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .parse_cache import ParseCache
+
+_DECISION_MARKERS_KIND = "decision_markers"
+_HEADING_RE = re.compile(r"^(#{1,6})\s+((?:ADR|FDR|DR)-\d+)\b")
+# Front matter is only looked for near the top of a document.
+_FRONT_MATTER_MAX_LINES = 120
+
+
+def parse_decision_markers(text: str) -> dict[str, Any]:
+    """Return the front matter `id`/`status` and the decision-ID headings of a markdown document."""
+    front_id: list[Any] | None = None
+    status = ""
+    headings: list[list[Any]] = []
+    lines = text.splitlines()
+    if lines and lines[0].strip() == "---":
+        for lineno, line in enumerate(lines[1:_FRONT_MATTER_MAX_LINES], start=2):
+            if line.strip() == "---":
+                break
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            key = key.strip()
+            if key == "id" and front_id is None:
+                front_id = [value.strip().strip("\"'"), lineno]
+            elif key == "status" and not status:
+                status = value.strip().strip("\"'")
+    for lineno, line in enumerate(lines, start=1):
+        if line[:1] != "#":
+            continue
+        match = _HEADING_RE.match(line)
+        if match:
+            headings.append([match.group(2), len(match.group(1)), lineno])
+    return {"id": front_id, "status": status, "headings": headings}
+
+
+@dataclass(frozen=True)
+class DecisionRef:
+    """One place a decision ID is declared.
+
+    - `kind`: folder the document lives in (`adr`, `fdr` or `decision-register`)
+    - `feature`: owning feature directory name, None for the project-level `adr/` and `decision-register/`
+    - `implemented`: the feature lives under `features/implemented/`
+    - `nested`: the document sits in a subdirectory of its decision folder
+    - `source`: `front_matter` (`id:`), `heading` (`### DR-0001`) or `filename` (`DR-0001-*.md`)
+    - `level`: heading level for `heading` refs, else 0
+    """
+
+    decision_id: str
+    path: Path
+    line: int
+    kind: str
+    feature: str | None
+    implemented: bool
+    nested: bool
+    source: str
+    level: int
+    status: str
+
+
+class DecisionIndex:
+    """ADR/FDR/DR identifiers -> declaring documents, built in one pass over the decision folders.
+
+    Document markers go through the parse cache, so only new or changed documents are read again.
+    """
+
+    def __init__(self, *, ph_data_root: Path, cache: ParseCache, feature_dirs: list[Path]) -> None:
+        self.ph_data_root = ph_data_root
+        self._refs: dict[str, list[DecisionRef]] = {}
+
+        folders: list[tuple[Path, str, str | None, bool]] = [
+            (ph_data_root / "adr", "adr", None, False),
+            (ph_data_root / "decision-register", "decision-register", None, False),
+        ]
+        for feature_dir in feature_dirs:
+            if feature_dir.name == "implemented":
+                for implemented_dir in sorted(p for p in feature_dir.iterdir() if p.is_dir()):
+                    for sub in ("fdr", "decision-register"):
+                        folders.append((implemented_dir / sub, sub, implemented_dir.name, True))
+                continue
+            for sub in ("fdr", "decision-register"):
+                folders.append((feature_dir / sub, sub, feature_dir.name, False))
+
+        for folder, kind, feature, implemented in folders:
+            if not folder.is_dir():
+                continue
+            for path in sorted(folder.rglob("*.md")):
+                nested = path.parent != folder
+                place = {"kind": kind, "feature": feature, "implemented": implemented, "nested": nested}
+                markers = cache.parse(path, _DECISION_MARKERS_KIND, parse_decision_markers, default=None)
+                status = str(markers.get("status", "")) if markers else ""
+                name_parts = path.name.split("-", 2)
+                if len(name_parts) == 3 and name_parts[0] in {"ADR", "FDR", "DR"}:
+                    self._add(f"{name_parts[0]}-{name_parts[1]}", path, 0, place, "filename", 0, status)
+                if not markers:
+                    continue
+                if markers["id"]:
+                    value, line = markers["id"]
+                    self._add(str(value), path, int(line), place, "front_matter", 0, status)
+                for decision_id, level, line in markers["headings"]:
+                    self._add(decision_id, path, line, place, "heading", level, status)
+
+    def _add(
+        self, decision_id: str, path: Path, line: int, place: dict[str, Any], source: str, level: int, status: str
+    ) -> None:
+        ref = DecisionRef(
+            decision_id=decision_id, path=path, line=line, source=source, level=level, status=status, **place
+        )
+        self._refs.setdefault(decision_id, []).append(ref)
+
+    def refs(self, decision_id: str) -> list[DecisionRef]:
+        """Return every declaration of `decision_id` (project folders first, then features in name order)."""
+        return self._refs.get(decision_id, [])
@@ -6,6 +6,8 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..handbook_index import invalidate_handbook_index
+
 DR_ID_RE = re.compile(r"^DR-(\d{4})$")
 DR_FILENAME_RE = re.compile(r"^(DR-\d{4})-([a-z0-9]+(?:-[a-z0-9]+)*)\.md$")
 
@@ -227,6 +229,7 @@ def run_dr_add(
     try:
         _validate_generated_dr(path=target, content=content, expected_id=spec.dr_id)
         target.write_text(content, encoding="utf-8")
+        invalidate_handbook_index(ph_data_root=ph_data_root)
     except OSError as exc:
         print(f"❌ Failed to write DR.\n  path: {target}\n  error: {exc}\n")
         return 1
@@ -6,16 +6,26 @@ import shutil
 import subprocess
 import sys
 import tempfile
-from collections.abc import Iterable, Sequence
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from .codex_cache import CODEX_CACHE_DIRNAME, CodexChunkCache, chunk_cache_key
 from .config import load_handbook_config
 from .rollout_parser import CodexRolloutParser, RolloutParserError, SessionMetadata
 
 MANIFEST_LIMIT = 5
+SESSION_CHECKPOINT_SCHEMA = 2
+# The most recent items of each kind that the summary sections show (see render_summary).
+SUMMARY_CONTEXT_LIMITS = {"turn_context": 1, "function_call": 10, "user": 3, "assistant": 3}
+SUMMARY_TIMELINE_LIMIT = 10
+SUMMARY_PRUNED_LIMIT = 8
+ROLLOUT_INDEX_DIRNAME = ".rollout_index"
 SESSION_END_RECORD_LIMIT = 200
 MAX_RECORD_CHARS = 400
 SESSION_END_COMMAND_LIMIT = 30
@@ -50,6 +60,11 @@ CHAPTER_VERB_MAP = {
     "search": "Investigate",
 }
 
+# Chunk prompts run concurrently by default; each is a `codex exec` subprocess that mostly waits on the model.
+DEFAULT_CODEX_JOBS = 4
+# How often a running `codex exec` checks whether a sibling chunk failed.
+_CODEX_CANCEL_POLL_SECONDS = 0.2
+
 CODEX_OVERRIDE_FLAG_MAP = {
     "model_reasoning_effort": "--reasoning-effort",
     "model_reasoning_summary": "--reasoning-summary",
@@ -143,6 +158,20 @@ def parse_iso8601(value: str | None) -> datetime | None:
         return None
 
 
+def parse_since(value: str, *, now: datetime | None = None) -> datetime:
+    """Parse `--since`: a duration back from now (`90m`, `2h`, `1d`) or an ISO-8601 timestamp (local time if naive)."""
+    match = re.fullmatch(r"(\d+)\s*([mhd])", value.strip())
+    if match:
+        seconds = int(match.group(1)) * {"m": 60, "h": 3600, "d": 86400}[match.group(2)]
+        return (now or datetime.now(timezone.utc)) - timedelta(seconds=seconds)
+    parsed = parse_iso8601(value.strip())
+    if parsed is None:
+        raise EndSessionError(
+            f"[session-summary] Invalid --since value: {value!r} (use e.g. 90m, 2h, 1d or ISO-8601)\n"
+        )
+    return parsed if parsed.tzinfo else parsed.astimezone()
+
+
 def format_local_timestamp(value: str | None) -> str:
     ts = parse_iso8601(value)
     if not ts:
@@ -226,30 +255,34 @@ def format_function_call(entry: dict[str, Any]) -> str:
 
 
 def extract_context(
-    entries: list[dict[str, Any]],
+    entries: Iterable[dict[str, Any]],
 ) -> tuple[dict[str, Any] | None, list[dict[str, Any]], list[dict[str, Any]], list[str], list[str]]:
-    session_meta = next((e for e in entries if e.get("type") == "session_meta"), None)
-    turn_contexts = [e for e in entries if e.get("type") == "turn_context"]
-    function_calls = [
-        e
-        for e in entries
-        if e.get("type") == "response_item"
-        and (e.get("payload") or {}).get("type") in {"function_call", "custom_tool_call", "custom_tool_call_output"}
-    ]
-    messages_user = [
-        collapse_content((e.get("payload") or {}).get("content", []))
-        for e in entries
-        if e.get("type") == "response_item"
-        and (e.get("payload") or {}).get("type") == "message"
-        and (e.get("payload") or {}).get("role") == "user"
-    ]
-    messages_assistant = [
-        collapse_content((e.get("payload") or {}).get("content", []))
-        for e in entries
-        if e.get("type") == "response_item"
-        and (e.get("payload") or {}).get("type") == "message"
-        and (e.get("payload") or {}).get("role") == "assistant"
-    ]
+    session_meta: dict[str, Any] | None = None
+    turn_contexts: list[dict[str, Any]] = []
+    function_calls: list[dict[str, Any]] = []
+    messages_user: list[str] = []
+    messages_assistant: list[str] = []
+    for entry in entries:
+        entry_type = entry.get("type")
+        if entry_type == "session_meta":
+            if session_meta is None:
+                session_meta = entry
+            continue
+        if entry_type == "turn_context":
+            turn_contexts.append(entry)
+            continue
+        if entry_type != "response_item":
+            continue
+        payload = entry.get("payload") or {}
+        payload_type = payload.get("type")
+        if payload_type in {"function_call", "custom_tool_call", "custom_tool_call_output"}:
+            function_calls.append(entry)
+        elif payload_type == "message":
+            role = payload.get("role")
+            if role == "user":
+                messages_user.append(collapse_content(payload.get("content", [])))
+            elif role == "assistant":
+                messages_assistant.append(collapse_content(payload.get("content", [])))
     return session_meta, turn_contexts, function_calls, messages_user, messages_assistant
 
 
@@ -263,34 +296,39 @@ def summarize_output(text: str | None) -> str:
     return ""
 
 
-def build_command_timeline(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def command_timeline_row(entry: dict[str, Any]) -> dict[str, Any] | None:
+    if entry.get("type") != "response_item":
+        return None
+    payload = entry.get("payload") or {}
+    if payload.get("type") != "message":
+        return None
+    role = payload.get("role", "assistant")
+    full_text = collapse_content(payload.get("content", []))
+    snippet = summarize_output(full_text)
+    timestamp = entry.get("timestamp")
+    return {
+        "timestamp": timestamp,
+        "local_time": format_local_timestamp(timestamp),
+        "event": "message",
+        "role": role,
+        "text": snippet or "",
+    }
+
+
+def build_command_timeline(entries: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
     timeline: list[dict[str, Any]] = []
     for entry in entries:
-        if entry.get("type") != "response_item":
-            continue
-        payload = entry.get("payload") or {}
-        if payload.get("type") != "message":
-            continue
-        role = payload.get("role", "assistant")
-        full_text = collapse_content(payload.get("content", []))
-        snippet = summarize_output(full_text)
-        timestamp = entry.get("timestamp")
-        timeline.append(
-            {
-                "timestamp": timestamp,
-                "local_time": format_local_timestamp(timestamp),
-                "event": "message",
-                "role": role,
-                "text": snippet or "",
-            }
-        )
+        row = command_timeline_row(entry)
+        if row is not None:
+            timeline.append(row)
     return timeline
 
 
-def build_summary_events_from_timeline(timeline: list[dict[str, Any]]) -> list[SummaryEvent]:
+def build_summary_events_from_timeline(timeline: Iterable[dict[str, Any]], *, first_seq: int = 0) -> list[SummaryEvent]:
+    """Build summary events; `first_seq` continues the numbering of events built from an earlier part of the log."""
     summary_events: list[SummaryEvent] = []
-    seq = 0
-    anchor_index = 0
+    seq = first_seq
+    anchor_index = first_seq
     for raw in timeline:
         seq += 1
         event_type = raw.get("event")
@@ -475,7 +513,7 @@ def build_pruned_transcript(events: list[SummaryEvent]) -> list[str]:
     return pruned
 
 
-def build_chapters_from_events(events: list[SummaryEvent]) -> list[Chapter]:
+def build_chapters_from_events(events: list[SummaryEvent], *, first_id: int = 1) -> list[Chapter]:
     chapters: list[Chapter] = []
     if not events:
         return chapters
@@ -519,7 +557,7 @@ def build_chapters_from_events(events: list[SummaryEvent]) -> list[Chapter]:
 
     chapter_events: list[SummaryEvent] = []
     chapter_triggers: list[str] = []
-    chapter_counter = 1
+    chapter_counter = first_id
     last_ts: datetime | None = None
     last_scope: str | None = None
     last_phase: str | None = None
@@ -712,7 +750,7 @@ def normalize_entry(entry: dict[str, Any]) -> str | None:
     return None
 
 
-def build_normalized_blocks(entries: list[dict[str, Any]]) -> list[str]:
+def build_normalized_blocks(entries: Iterable[dict[str, Any]]) -> list[str]:
     blocks: list[str] = []
     for entry in entries:
         normalized = normalize_entry(entry)
@@ -721,11 +759,115 @@ def build_normalized_blocks(entries: list[dict[str, Any]]) -> list[str]:
     return blocks
 
 
-def compute_log_bounds(entries: list[dict[str, Any]]) -> tuple[datetime | None, datetime | None]:
-    timestamps = [parse_iso8601(entry.get("timestamp")) for entry in entries if entry.get("timestamp")]
-    start = next((ts for ts in timestamps if ts), None)
-    end = next((ts for ts in reversed(timestamps) if ts), start)
-    return start, end
+def compute_log_bounds(entries: Iterable[dict[str, Any]]) -> tuple[datetime | None, datetime | None]:
+    start: datetime | None = None
+    end: datetime | None = None
+    for entry in entries:
+        if not entry.get("timestamp"):
+            continue
+        timestamp = parse_iso8601(entry.get("timestamp"))
+        if timestamp:
+            start = start or timestamp
+            end = timestamp
+    return start, end or start
+
+
+def transcript_line(entry: dict[str, Any]) -> str | None:
+    """Return the `role: text` line a message contributes to the Codex compression transcript."""
+    if entry.get("type") != "response_item":
+        return None
+    payload = entry.get("payload") or {}
+    if payload.get("type") != "message":
+        return None
+    role = payload.get("role") or "unknown"
+    content = payload.get("content") or []
+    if not isinstance(content, list):
+        return None
+    text = _collapse_content(content)
+    if not text:
+        return None
+    return f"{role}: {text}"
+
+
+class _ContextTail:
+    """Keeps the entries `render_summary` shows: the first session_meta plus the most recent of each kind."""
+
+    def __init__(self) -> None:
+        self._position = 0
+        self._session_meta: tuple[int, dict[str, Any]] | None = None
+        self._recent: dict[str, deque[tuple[int, dict[str, Any]]]] = {
+            kind: deque(maxlen=limit) for kind, limit in SUMMARY_CONTEXT_LIMITS.items()
+        }
+
+    def add(self, entry: dict[str, Any]) -> None:
+        self._position += 1
+        entry_type = entry.get("type")
+        if entry_type == "session_meta":
+            if self._session_meta is None:
+                self._session_meta = (self._position, entry)
+            return
+        kind = None
+        if entry_type == "turn_context":
+            kind = "turn_context"
+        elif entry_type == "response_item":
+            payload = entry.get("payload") or {}
+            if payload.get("type") in {"function_call", "custom_tool_call", "custom_tool_call_output"}:
+                kind = "function_call"
+            elif payload.get("type") == "message" and payload.get("role") in {"user", "assistant"}:
+                kind = payload["role"]
+        if kind is not None:
+            self._recent[kind].append((self._position, entry))
+
+    def entries(self) -> list[dict[str, Any]]:
+        kept = [item for items in self._recent.values() for item in items]
+        if self._session_meta is not None:
+            kept.append(self._session_meta)
+        return [entry for _, entry in sorted(kept, key=lambda item: item[0])]
+
+
+def recent_context_entries(entries: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the subset of `entries` that renders the same summary context sections as all of them."""
+    tail = _ContextTail()
+    for entry in entries:
+        tail.add(entry)
+    return tail.entries()
+
+
+@dataclass
+class RolloutScan:
+    start: datetime | None = None
+    end: datetime | None = None
+    transcript_lines: list[str] = field(default_factory=list)
+    timeline: list[dict[str, Any]] = field(default_factory=list)
+    normalized_tail: list[str] = field(default_factory=list)
+    context_entries: list[dict[str, Any]] = field(default_factory=list)
+
+
+def scan_rollout(entries: Iterable[dict[str, Any]]) -> RolloutScan:
+    """Collect everything a session summary is built from in one pass over the rollout entries."""
+    scan = RolloutScan()
+    normalized: deque[str] = deque(maxlen=SUMMARY_PRUNED_LIMIT)
+    context = _ContextTail()
+    for entry in entries:
+        if entry.get("timestamp"):
+            timestamp = parse_iso8601(entry.get("timestamp"))
+            if timestamp:
+                scan.start = scan.start or timestamp
+                scan.end = timestamp
+        line = transcript_line(entry)
+        if line is not None:
+            scan.transcript_lines.append(line)
+        row = command_timeline_row(entry)
+        if row is not None:
+            scan.timeline.append(row)
+        block = normalize_entry(entry)
+        if block:
+            normalized.append(block)
+        context.add(entry)
+    scan.end = scan.end or scan.start
+    scan.normalized_tail = list(normalized)
+    scan.context_entries = context.entries()
+    return scan
 
 
 def format_summary_path(logs_dir: Path, start: datetime | None, session_id: str | None) -> Path:
@@ -796,7 +938,7 @@ def read_status_snapshot(status_path: Path, max_lines: int = 25) -> tuple[list[s
 
 
 def render_summary(
-    entries: list[dict[str, Any]],
+    entries: Iterable[dict[str, Any]],
     codex_highlights: str,
     chunk_outputs: list[str],
     history_entries: list[tuple[datetime, str]],
@@ -838,7 +980,7 @@ def render_summary(
 
     lines.append("## Commands & Tool Calls")
     if function_calls:
-        for call in function_calls[-10:]:
+        for call in function_calls[-SUMMARY_CONTEXT_LIMITS["function_call"] :]:
             lines.append(format_function_call(call))
     else:
         lines.append("- (No tool invocations recorded)")
@@ -861,7 +1003,7 @@ def render_summary(
     append_messages("Recent Assistant Responses", messages_assistant)
 
     lines.append("## Pruned Transcript Sample")
-    sample = pruned_blocks[-8:]
+    sample = pruned_blocks[-SUMMARY_PRUNED_LIMIT:]
     if sample:
         lines.extend(f"- {line}" for line in sample)
     else:
@@ -883,7 +1025,7 @@ def render_summary(
 
     lines.append("## Command Timeline (recent)")
     if command_timeline:
-        for event in command_timeline[-10:]:
+        for event in command_timeline[-SUMMARY_TIMELINE_LIMIT:]:
             if event.get("event") == "command":
                 status = event.get("status", "pending")
                 summary_line = event.get("summary") or "(no output)"
@@ -1276,7 +1418,7 @@ def _collapse_content(chunks: list[dict[str, Any]]) -> str:
     return collapse_content(chunks)
 
 
-def _extract_user_messages(entries: list[dict[str, Any]]) -> list[str]:
+def _extract_user_messages(entries: Iterable[dict[str, Any]]) -> list[str]:
     messages: list[str] = []
     for entry in entries:
         if entry.get("type") != "response_item":
@@ -1296,7 +1438,7 @@ def _extract_user_messages(entries: list[dict[str, Any]]) -> list[str]:
 
 
 def render_skip_codex_summary(
-    *, metadata: SessionMetadata, entries: list[dict[str, Any]], generated_at: datetime
+    *, metadata: SessionMetadata, entries: Iterable[dict[str, Any]], generated_at: datetime
 ) -> str:
     date = generated_at.astimezone(timezone.utc).date().isoformat()
     user_messages = _extract_user_messages(entries)
@@ -1537,8 +1679,18 @@ def build_codex_cli_args(model: str | None, overrides: dict[str, str] | None = N
 
 
 def run_codex_prompt(
-    *, prompt: str, ph_root: Path, model: str | None = None, overrides: dict[str, str] | None = None
-) -> str:
+    *,
+    prompt: str,
+    ph_root: Path,
+    model: str | None = None,
+    overrides: dict[str, str] | None = None,
+    cancel: threading.Event | None = None,
+) -> tuple[str, bool]:
+    """Run one headless `codex exec` prompt and return `(text, complete)`; setting `cancel` kills it.
+
+    `complete` is False when the text stands in for a real answer (a failed run's partial last message, or the
+    placeholder for an empty response), so it is shown but never cached.
+    """
     codex_path = shutil.which("codex")
     if not codex_path:
         raise EndSessionError("codex CLI not found on PATH.\nRemediation: install @openai/codex or use --skip-codex.\n")
@@ -1559,9 +1711,23 @@ def run_codex_prompt(
     cmd.extend(build_codex_cli_args(model, overrides))
     cmd.append("-")
 
-    result = subprocess.run(cmd, input=prompt, text=True, capture_output=True, cwd=ph_root)
-    if result.returncode != 0:
-        stderr = result.stderr.strip() or "Unknown codex error"
+    proc = subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=ph_root
+    )
+    pending_input: str | None = prompt
+    while True:
+        try:
+            _, stderr_text = proc.communicate(input=pending_input, timeout=_CODEX_CANCEL_POLL_SECONDS)
+            break
+        except subprocess.TimeoutExpired:
+            pending_input = None
+            if cancel is not None and cancel.is_set():
+                proc.kill()
+                proc.communicate()
+                output_path.unlink(missing_ok=True)
+                raise EndSessionError("codex exec cancelled after another chunk failed.\n") from None
+    if proc.returncode != 0:
+        stderr = stderr_text.strip() or "Unknown codex error"
         fallback_text = None
         if output_path.exists():
             try:
@@ -1570,14 +1736,69 @@ def run_codex_prompt(
                 fallback_text = None
         output_path.unlink(missing_ok=True)
         if fallback_text:
-            return fallback_text
+            return fallback_text, False
         raise EndSessionError(stderr + "\n")
 
     try:
         content = output_path.read_text(encoding="utf-8").strip()
     finally:
         output_path.unlink(missing_ok=True)
-    return content or "(Codex returned an empty response.)"
+    if not content:
+        return "(Codex returned an empty response.)", False
+    return content, True
+
+
+def run_codex_prompts(
+    *,
+    prompts: list[str],
+    ph_root: Path,
+    model: str | None,
+    overrides: dict[str, str] | None,
+    jobs: int,
+    on_output: Callable[[int, str, bool], None] | None = None,
+) -> list[str]:
+    """Run chunk prompts (serially or on `jobs` threads) and return their outputs in prompt order.
+
+    `on_output(position, output, complete)` is called as each prompt succeeds, so finished chunks survive a later
+    failure. The first failure cancels prompts not yet started, kills the ones still running and is re-raised.
+    """
+    if jobs <= 1 or len(prompts) <= 1:
+        outputs: list[str] = []
+        for position, prompt in enumerate(prompts):
+            output, complete = run_codex_prompt(prompt=prompt, ph_root=ph_root, model=model, overrides=overrides)
+            outputs.append(output)
+            if on_output is not None:
+                on_output(position, output, complete)
+        return outputs
+
+    cancel = threading.Event()
+    outputs = [""] * len(prompts)
+
+    def run(position: int, prompt: str) -> str:
+        if cancel.is_set():
+            raise EndSessionError("codex exec skipped after another chunk failed.\n")
+        try:
+            output, complete = run_codex_prompt(
+                prompt=prompt, ph_root=ph_root, model=model, overrides=overrides, cancel=cancel
+            )
+        except BaseException:
+            cancel.set()
+            raise
+        if on_output is not None:
+            on_output(position, output, complete)
+        return output
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(prompts))) as pool:
+        futures = {pool.submit(run, position, prompt): position for position, prompt in enumerate(prompts)}
+        try:
+            for future in as_completed(futures):
+                outputs[futures[future]] = future.result()
+        except BaseException:
+            cancel.set()
+            for future in futures:
+                future.cancel()
+            raise
+    return outputs
 
 
 def summarize_with_codex(
@@ -1588,18 +1809,57 @@ def summarize_with_codex(
     overrides: dict[str, str] | None,
     chunk_size: int = 4000,
     chunk_overlap: int = 200,
+    jobs: int | None = None,
+    cache: CodexChunkCache | None = None,
 ) -> tuple[str, list[str]]:
-    if not codex_available():
-        raise EndSessionError("codex CLI not found; use --skip-codex.\n")
     chunks = chunk_text_blocks(transcript, chunk_size, chunk_overlap)
     if not chunks:
         return ("(No transcript data available for Codex compression.)", [])
 
-    chunk_outputs: list[str] = []
-    for index, chunk in enumerate(chunks, start=1):
-        prompt = HEADLESS_PROMPT_TEMPLATE.format(index=index, total=len(chunks), chunk=chunk)
-        chunk_outputs.append(run_codex_prompt(prompt=prompt, ph_root=ph_root, model=model, overrides=overrides))
+    keys = [
+        chunk_cache_key(template=HEADLESS_PROMPT_TEMPLATE, model=model, overrides=overrides, chunk=chunk)
+        for chunk in chunks
+    ]
+    chunk_outputs = [""] * len(chunks)
+    missing: list[int] = []
+    for position, key in enumerate(keys):
+        cached = cache.get(key) if cache is not None else None
+        if cached is None:
+            missing.append(position)
+        else:
+            chunk_outputs[position] = cached
+
+    if missing:
+        if not codex_available():
+            raise EndSessionError("codex CLI not found; use --skip-codex.\n")
+
+        def remember(position: int, output: str, complete: bool) -> None:
+            # Only a real answer from a successful run is reusable; fallbacks and placeholders are asked again.
+            if cache is not None and complete:
+                cache.put(keys[missing[position]], output)
+
+        try:
+            fresh = run_codex_prompts(
+                prompts=[
+                    HEADLESS_PROMPT_TEMPLATE.format(index=position + 1, total=len(chunks), chunk=chunks[position])
+                    for position in missing
+                ],
+                ph_root=ph_root,
+                model=model,
+                overrides=overrides,
+                jobs=DEFAULT_CODEX_JOBS if jobs is None else jobs,
+                on_output=remember,
+            )
+        finally:
+            if cache is not None:
+                cache.evict()
+        for position, output in zip(missing, fresh):
+            chunk_outputs[position] = output
+
+    return merge_chunk_outputs(chunk_outputs), chunk_outputs
+
 
+def merge_chunk_outputs(chunk_outputs: list[str]) -> str:
     merged_lines: list[str] = []
     seen: set[str] = set()
     for output in chunk_outputs:
@@ -1613,8 +1873,44 @@ def summarize_with_codex(
             seen.add(key)
             merged_lines.append(cleaned)
 
-    merged = "\n".join(merged_lines).strip() or "(Codex did not return any usable summary text.)"
-    return merged, chunk_outputs
+    return "\n".join(merged_lines).strip() or "(Codex did not return any usable summary text.)"
+
+
+def load_session_checkpoint(
+    *, manifest_path: Path, session_id: str, log_path: Path, indexed_bytes: int, codex: dict[str, Any] | None
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """Return `(manifest entry, checkpoint)` for the last summary of this rollout, if it can be continued.
+
+    `codex` describes how this run summarizes (None without Codex); a checkpoint made with other settings (model,
+    overrides, or Codex on/off) cannot be continued, since its chunk outputs would not match a full run's.
+    """
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    for entry in data.get("sessions", []) if isinstance(data, dict) else []:
+        if not isinstance(entry, dict) or entry.get("session_id") != session_id:
+            continue
+        checkpoint = entry.get("checkpoint")
+        if not isinstance(checkpoint, dict) or checkpoint.get("schema") != SESSION_CHECKPOINT_SCHEMA:
+            return None
+        if checkpoint.get("log_path") != str(log_path.resolve()):
+            return None
+        offset = checkpoint.get("offset")
+        if not isinstance(offset, int) or offset > indexed_bytes:
+            return None
+        if checkpoint.get("codex") != codex:
+            return None
+        return entry, checkpoint
+    return None
+
+
+def chapters_from_checkpoint(checkpoint: dict[str, Any]) -> list[Chapter]:
+    chapters: list[Chapter] = []
+    for raw in checkpoint.get("chapters") or []:
+        events = [SummaryEvent(**event) for event in raw.get("events") or []]
+        chapters.append(Chapter(**{**raw, "events": events}))
+    return chapters
 
 
 @dataclass(frozen=True)
@@ -1626,20 +1922,32 @@ class EndSessionResult:
     session_end_prompt_path: Path | None = None
 
 
-def run_end_session_skip_codex(
+def _run_end_session(
     *,
     ph_root: Path,
     log_path: Path,
-    force: bool = False,
-    session_end_mode: str = "none",
-    workstream: str | None = None,
-    task_ref: str | None = None,
+    summarize: Callable[[str], list[str]] | None,
+    codex: dict[str, Any] | None,
+    force: bool,
+    session_end_mode: str,
+    workstream: str | None,
+    task_ref: str | None,
+    since: datetime | None,
+    use_index: bool,
+    incremental: bool,
 ) -> EndSessionResult:
+    if incremental and not use_index:
+        raise EndSessionError("[session-summary] --incremental reads the rollout index; drop --no-rollout-index.\n")
+    if incremental and since is not None:
+        raise EndSessionError("[session-summary] --incremental and --since cannot be combined.\n")
+
     repo_root = resolve_repo_root(ph_root=ph_root)
     logs_dir = repo_root / "process" / "sessions" / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
+    latest_path = logs_dir / "latest_summary.md"
+    manifest_path = logs_dir / "manifest.json"
 
-    parser = CodexRolloutParser(repo_root)
+    parser = CodexRolloutParser(repo_root, index_dir=logs_dir / ROLLOUT_INDEX_DIRNAME if use_index else None)
     metadata = parser.read_session_meta(log_path)
     if metadata is None:
         raise EndSessionError(f"[session-summary] Unable to parse provided log {log_path}\n")
@@ -1652,17 +1960,44 @@ def run_end_session_skip_codex(
             file=sys.stderr,
         )
 
+    index = parser.index(log_path)
+    previous: dict[str, Any] | None = None
+    checkpoint: dict[str, Any] | None = None
+    if incremental and index is not None:
+        # The stored index (already checked against the log's first bytes) vouches for the offset; a log without one
+        # is summarized in full, indexing it in the same pass.
+        found = load_session_checkpoint(
+            manifest_path=manifest_path,
+            session_id=metadata.session_id,
+            log_path=log_path,
+            indexed_bytes=index.indexed_bytes,
+            codex=codex,
+        )
+        if found is None:
+            print(
+                "[session-summary] No checkpoint to continue for this rollout (none yet, or made with other Codex "
+                "settings); summarizing the whole log."
+            )
+        else:
+            previous, checkpoint = found
+
     try:
-        metadata, entries = parser.parse(log_path)
+        metadata, entries = parser.parse(log_path, since=since, offset=checkpoint["offset"] if checkpoint else 0)
     except RolloutParserError as exc:
         raise EndSessionError(str(exc) + "\n") from exc
     if not entries:
+        if previous is not None and checkpoint is not None:
+            summary_path = repo_root / str(previous.get("summary_path"))
+            print(f"[session-summary] No new rollout entries since the last summary; {summary_path} is up to date.")
+            return EndSessionResult(summary_path=summary_path, latest_path=latest_path, manifest_path=manifest_path)
         raise EndSessionError(f"[session-summary] Log {log_path} contained no entries.\n")
 
     history_log = repo_root / ".project-handbook" / "history.log"
     history_entries = read_history_entries(history_log)
 
-    start_utc, end_utc = compute_log_bounds(entries)
+    scan = scan_rollout(entries)
+    start_utc = parse_iso8601(checkpoint.get("start")) if checkpoint else scan.start
+    end_utc = scan.end or (parse_iso8601(checkpoint.get("last_timestamp")) if checkpoint else None)
     if start_utc is None:
         start_utc = timestamp_from_filename(log_path) or datetime.now(timezone.utc)
     if start_utc.tzinfo is None:
@@ -1672,12 +2007,28 @@ def run_end_session_skip_codex(
     if end_utc.tzinfo is None:
         end_utc = end_utc.replace(tzinfo=timezone.utc)
 
-    command_timeline = build_command_timeline(entries)
-    summary_events = build_summary_events_from_timeline(command_timeline)
-    pruned_transcript = build_pruned_transcript(summary_events)
-    if not pruned_transcript:
-        pruned_transcript = build_normalized_blocks(entries)
-    chapters = build_chapters_from_events(summary_events)
+    checkpoint = checkpoint or {}
+    chunk_outputs: list[str] = list(checkpoint.get("chunk_outputs") or [])
+    if summarize is not None and (scan.transcript_lines or not checkpoint):
+        chunk_outputs.extend(summarize("\n\n".join(scan.transcript_lines)))
+    if summarize is not None:
+        codex_highlights = merge_chunk_outputs(chunk_outputs)
+    else:
+        codex_highlights = "(Codex compression skipped by --skip-codex.)"
+
+    # A checkpoint's last chapter is reopened so events appended to it split exactly as in a full run.
+    chapters = chapters_from_checkpoint(checkpoint)
+    reopened = chapters.pop().events if chapters else []
+    event_count = int(checkpoint.get("events") or 0)
+    new_events = build_summary_events_from_timeline(scan.timeline, first_seq=event_count)
+    chapters.extend(build_chapters_from_events(reopened + new_events, first_id=len(chapters) + 1))
+    summary_events = [event for chapter in chapters for event in chapter.events]
+    event_count += len(scan.timeline)
+
+    command_timeline = [*(checkpoint.get("timeline_tail") or []), *scan.timeline][-SUMMARY_TIMELINE_LIMIT:]
+    normalized_tail = [*(checkpoint.get("normalized_tail") or []), *scan.normalized_tail][-SUMMARY_PRUNED_LIMIT:]
+    context_entries = recent_context_entries([*(checkpoint.get("context_entries") or []), *scan.context_entries])
+    pruned_transcript = build_pruned_transcript(summary_events) or normalized_tail
 
     scoped_history = filter_history_window(
         history_entries,
@@ -1686,11 +2037,10 @@ def run_end_session_skip_codex(
     )
     status_lines, status_truncated = read_status_snapshot(repo_root / "status" / "current_summary.md")
 
-    codex_highlights = "(Codex compression skipped by --skip-codex.)"
     summary = render_summary(
-        entries,
+        context_entries,
         codex_highlights,
-        [],
+        chunk_outputs,
         scoped_history,
         status_lines,
         status_truncated,
@@ -1700,8 +2050,6 @@ def run_end_session_skip_codex(
     )
 
     summary_path = format_summary_path(logs_dir, start_utc, metadata.session_id)
-    latest_path = logs_dir / "latest_summary.md"
-    manifest_path = logs_dir / "manifest.json"
     summary_path.write_text(summary + "\n", encoding="utf-8")
     latest_path.write_text(summary + "\n", encoding="utf-8")
 
@@ -1712,6 +2060,22 @@ def run_end_session_skip_codex(
         log_path,
         generated_at,
     )
+    # A `--since` window leaves out earlier events, so continuing from it would drop them for good.
+    if index is not None and since is None:
+        entry["checkpoint"] = {
+            "schema": SESSION_CHECKPOINT_SCHEMA,
+            "log_path": str(log_path.resolve()),
+            "codex": codex,
+            "offset": index.indexed_bytes,
+            "start": start_utc.isoformat(),
+            "last_timestamp": end_utc.isoformat(),
+            "events": event_count,
+            "chapters": [asdict(chapter) for chapter in chapters],
+            "timeline_tail": command_timeline,
+            "normalized_tail": normalized_tail,
+            "context_entries": context_entries,
+            "chunk_outputs": chunk_outputs,
+        }
     update_manifest(manifest_path=manifest_path, entry=entry)
 
     print(f"[session-summary] Wrote {summary_path}")
@@ -1768,168 +2132,77 @@ def run_end_session_skip_codex(
     )
 
 
-def run_end_session_codex(
+def run_end_session_skip_codex(
     *,
     ph_root: Path,
     log_path: Path,
-    model: str | None,
-    overrides: dict[str, str] | None,
     force: bool = False,
     session_end_mode: str = "none",
     workstream: str | None = None,
     task_ref: str | None = None,
+    since: datetime | None = None,
+    use_index: bool = True,
+    incremental: bool = False,
 ) -> EndSessionResult:
-    repo_root = resolve_repo_root(ph_root=ph_root)
-    logs_dir = repo_root / "process" / "sessions" / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-
-    parser = CodexRolloutParser(repo_root)
-    metadata = parser.read_session_meta(log_path)
-    if metadata is None:
-        raise EndSessionError(f"[session-summary] Unable to parse provided log {log_path}\n")
-    if metadata.cwd and not is_within_repo(repo_root, metadata.cwd):
-        if not force:
-            raise EndSessionError("[session-summary] Provided log was not recorded inside this repository.\n")
-        print(
-            "[session-summary] Warning: forcing summary generation for log outside repo root.\n"
-            f"  log cwd: {metadata.cwd}\n  repo root: {repo_root}",
-            file=sys.stderr,
-        )
-
-    try:
-        metadata, entries = parser.parse(log_path)
-    except RolloutParserError as exc:
-        raise EndSessionError(str(exc) + "\n") from exc
-    if not entries:
-        raise EndSessionError(f"[session-summary] Log {log_path} contained no entries.\n")
-
-    history_log = repo_root / ".project-handbook" / "history.log"
-    history_entries = read_history_entries(history_log)
-
-    start_utc, end_utc = compute_log_bounds(entries)
-    if start_utc is None:
-        start_utc = timestamp_from_filename(log_path) or datetime.now(timezone.utc)
-    if start_utc.tzinfo is None:
-        start_utc = start_utc.replace(tzinfo=timezone.utc)
-    if end_utc is None:
-        end_utc = start_utc
-    if end_utc.tzinfo is None:
-        end_utc = end_utc.replace(tzinfo=timezone.utc)
-
-    transcript_lines: list[str] = []
-    for entry in entries:
-        if entry.get("type") != "response_item":
-            continue
-        payload = entry.get("payload") or {}
-        if payload.get("type") != "message":
-            continue
-        role = payload.get("role") or "unknown"
-        content = payload.get("content") or []
-        if not isinstance(content, list):
-            continue
-        text = _collapse_content(content)
-        if not text:
-            continue
-        transcript_lines.append(f"{role}: {text}")
-    transcript = "\n\n".join(transcript_lines)
-
-    codex_highlights, chunk_outputs = summarize_with_codex(
+    return _run_end_session(
         ph_root=ph_root,
-        transcript=transcript,
-        model=model,
-        overrides=overrides,
+        log_path=log_path,
+        summarize=None,
+        codex=None,
+        force=force,
+        session_end_mode=session_end_mode,
+        workstream=workstream,
+        task_ref=task_ref,
+        since=since,
+        use_index=use_index,
+        incremental=incremental,
     )
 
-    command_timeline = build_command_timeline(entries)
-    summary_events = build_summary_events_from_timeline(command_timeline)
-    pruned_transcript = build_pruned_transcript(summary_events)
-    if not pruned_transcript:
-        pruned_transcript = build_normalized_blocks(entries)
-    chapters = build_chapters_from_events(summary_events)
 
-    scoped_history = filter_history_window(
-        history_entries,
-        to_local_naive(start_utc),
-        to_local_naive(end_utc),
-    )
-    status_lines, status_truncated = read_status_snapshot(repo_root / "status" / "current_summary.md")
-
-    summary = render_summary(
-        entries,
-        codex_highlights,
-        chunk_outputs,
-        scoped_history,
-        status_lines,
-        status_truncated,
-        pruned_transcript,
-        command_timeline,
-        chapters,
-    )
-
-    summary_path = format_summary_path(logs_dir, start_utc, metadata.session_id)
-    latest_path = logs_dir / "latest_summary.md"
-    manifest_path = logs_dir / "manifest.json"
-    summary_path.write_text(summary + "\n", encoding="utf-8")
-    latest_path.write_text(summary + "\n", encoding="utf-8")
-
-    generated_at = datetime.now(timezone.utc).isoformat()
-    entry = metadata.to_manifest_entry(
-        repo_root,
-        summary_path.relative_to(repo_root),
-        log_path,
-        generated_at,
+def run_end_session_codex(
+    *,
+    ph_root: Path,
+    log_path: Path,
+    model: str | None,
+    overrides: dict[str, str] | None,
+    force: bool = False,
+    session_end_mode: str = "none",
+    workstream: str | None = None,
+    task_ref: str | None = None,
+    since: datetime | None = None,
+    use_index: bool = True,
+    codex_jobs: int | None = None,
+    codex_cache: bool = True,
+    incremental: bool = False,
+) -> EndSessionResult:
+    repo_root = resolve_repo_root(ph_root=ph_root)
+    chunk_cache = (
+        CodexChunkCache(repo_root / "process" / "sessions" / "logs" / CODEX_CACHE_DIRNAME) if codex_cache else None
     )
-    update_manifest(manifest_path=manifest_path, entry=entry)
-
-    print(f"[session-summary] Wrote {summary_path}")
-    if history_log.exists() and history_log.stat().st_mtime > summary_path.stat().st_mtime:
-        print("[session-summary] Warning: history log updated after summary generation; consider re-running soon.")
 
-    session_end_summary_path = None
-    session_end_prompt_path = None
-    if session_end_mode != "none":
-        resolved_workstream = resolve_workstream_identifier(workstream, metadata)
-        summary_id = build_session_end_identifier(start_utc, metadata.session_id, session_end_mode)
-        session_end_summary_path, session_end_prompt_path = format_session_end_paths(
-            repo_root=repo_root,
-            workstream=resolved_workstream,
-            summary_id=summary_id,
-            mode=session_end_mode,
-        )
-        summary_rel = str(session_end_summary_path.relative_to(repo_root))
-        session_end_text, prompt_text, extra_meta = build_session_end_documents(
-            mode=session_end_mode,
-            metadata=metadata,
-            summary_events=summary_events,
-            workstream=resolved_workstream,
-            task_ref=task_ref,
-            start_utc=start_utc,
-            end_utc=end_utc,
-            summary_relpath=summary_rel,
-            summary_id=summary_id,
-            repo_root=repo_root,
+    def summarize(transcript: str) -> list[str]:
+        _, chunk_outputs = summarize_with_codex(
+            ph_root=ph_root,
+            transcript=transcript,
+            model=model,
+            overrides=overrides,
+            jobs=codex_jobs,
+            cache=chunk_cache,
         )
-        session_end_summary_path.write_text(session_end_text + "\n", encoding="utf-8")
-        session_end_prompt_path.write_text(prompt_text + "\n", encoding="utf-8")
-        created_at = datetime.now(timezone.utc).isoformat()
-        branch = metadata.git.get("branch") if metadata.git else None
-        index_entry = {
-            **extra_meta,
-            "codex_enriched": False,
-            "session_id": metadata.session_id,
-            "branch": branch,
-            "summary_path": summary_rel,
-            "prompt_path": str(session_end_prompt_path.relative_to(repo_root)),
-            "created_at": created_at,
-        }
-        record_session_end_index(repo_root=repo_root, entry={k: v for k, v in index_entry.items() if v is not None})
-        print(f"[session-end] Wrote {session_end_summary_path}")
-        print("[session-end] Prompt snippet:\n" + prompt_text)
+        if chunk_cache is not None:
+            print(f"[session-summary] Codex chunk cache: {chunk_cache.hits} reused, {chunk_cache.misses} summarized")
+        return chunk_outputs
 
-    return EndSessionResult(
-        summary_path=summary_path,
-        latest_path=latest_path,
-        manifest_path=manifest_path,
-        session_end_summary_path=session_end_summary_path,
-        session_end_prompt_path=session_end_prompt_path,
+    return _run_end_session(
+        ph_root=ph_root,
+        log_path=log_path,
+        summarize=summarize,
+        codex={"model": model or "", "overrides": dict(sorted((overrides or {}).items()))},
+        force=force,
+        session_end_mode=session_end_mode,
+        workstream=workstream,
+        task_ref=task_ref,
+        since=since,
+        use_index=use_index,
+        incremental=incremental,
     )
@@ -6,6 +6,8 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..handbook_index import get_handbook_index, invalidate_handbook_index
+
 FDR_ID_RE = re.compile(r"^FDR-(?:(?:[a-z0-9]+(?:-[a-z0-9]+)*)-)?(\d{4})$")
 FDR_FILENAME_RE = re.compile(r"^(\d{4})-([a-z0-9]+(?:-[a-z0-9]+)*)\.md$")
 DR_ID_RE = re.compile(r"^DR-(\d{4})$")
@@ -101,17 +103,17 @@ def _find_existing_fdr_by_id(*, fdr_dir: Path, fdr_id: str) -> Path | None:
 
 
 def _resolve_dr_markdown_match(*, feature_root: Path, ph_data_root: Path, dr_id: str) -> tuple[Path | None, list[Path]]:
-    feature_dir = feature_root / "decision-register"
-    if feature_dir.exists():
-        matches = sorted(feature_dir.glob(f"{dr_id}-*.md"))
+    refs = [
+        ref
+        for ref in get_handbook_index(ph_data_root=ph_data_root).decisions().refs(dr_id)
+        if ref.kind == "decision-register" and ref.source == "filename" and not ref.nested and not ref.implemented
+    ]
+    # The feature's own register wins over the project register.
+    for feature in (feature_root.name, None):
+        matches = [ref.path for ref in refs if ref.feature == feature]
         if matches:
             return (matches[0] if len(matches) == 1 else None), matches
 
-    project_dir = ph_data_root / "decision-register"
-    matches = sorted(project_dir.glob(f"{dr_id}-*.md")) if project_dir.exists() else []
-    if matches:
-        return (matches[0] if len(matches) == 1 else None), matches
-
     return None, []
 
 
@@ -301,6 +303,7 @@ def run_fdr_add(
     try:
         _validate_generated_fdr(path=target, content=content, expected_number=spec.number)
         target.write_text(content, encoding="utf-8")
+        invalidate_handbook_index(ph_data_root=ph_data_root)
     except OSError as exc:
         print(f"❌ Failed to write FDR.\n  path: {target}\n  error: {exc}\n")
         return 1
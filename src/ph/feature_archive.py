@@ -6,6 +6,7 @@ import shutil
 from pathlib import Path
 
 from .context import Context
+from .handbook_index import invalidate_handbook_index
 
 PLACEHOLDER_STRINGS = [
     "brief description",
@@ -162,6 +163,7 @@ def run_feature_archive(*, ctx: Context, name: str, force: bool) -> int:
 
     owner = extract_feature_owner(source_dir)
     shutil.move(str(source_dir), str(target_dir))
+    invalidate_handbook_index()
 
     timestamp = dt.datetime.now(dt.timezone.utc).isoformat()
     entry: dict[str, object] = {
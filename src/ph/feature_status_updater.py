@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import re
 from collections.abc import Iterable
 from pathlib import Path
 
 from .clock import today as clock_today
 from .context import Context
+from .generated_files import write_if_changed
+from .handbook_index import get_handbook_index, with_int_values
+
+# Bump when `format_active_work_section` output changes so stored digests stop matching.
+_ACTIVE_WORK_FORMAT = 1
+_DIGEST_RE = re.compile(r"^<!-- ph:active-work digest=([0-9a-f]+) -->$", re.MULTILINE)
 
 
 def iter_sprint_dirs(*, sprints_dir: Path) -> Iterable[Path]:
@@ -35,43 +44,19 @@ def collect_all_sprint_tasks(*, sprints_dir: Path) -> dict[str, list[dict[str, o
     if not sprints_dir.exists():
         return tasks_by_feature
 
-    for sprint_dir in iter_sprint_dirs(sprints_dir=sprints_dir):
-        tasks_dir = sprint_dir / "tasks"
-        if not tasks_dir.exists():
-            continue
-
-        sprint_id = sprint_dir.name
-
-        for task_dir in tasks_dir.iterdir():
-            if not task_dir.is_dir():
+    index = get_handbook_index(ph_data_root=sprints_dir.parent)
+    for sprint in index.sprints():
+        for entry in index.tasks(sprint.path):
+            if not entry.has_yaml:
                 continue
-
-            task_yaml = task_dir / "task.yaml"
-            if not task_yaml.exists():
+            if entry.error is not None:
+                print(f"Error parsing {entry.task_yaml}: {entry.error}")
                 continue
 
-            try:
-                content = task_yaml.read_text(encoding="utf-8")
-                task_data: dict[str, object] = {"sprint": sprint_id}
-
-                for line in content.splitlines():
-                    if ":" in line and not line.strip().startswith("-"):
-                        key, value = line.split(":", 1)
-                        key = key.strip()
-                        value = value.strip()
-
-                        if value.isdigit():
-                            task_data[key] = int(value)
-                        elif value.startswith("[") and value.endswith("]"):
-                            items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
-                            task_data[key] = [item for item in items if item]
-                        else:
-                            task_data[key] = value
-
-                feature = task_data.get("feature", "unknown")
-                tasks_by_feature.setdefault(str(feature), []).append(task_data)
-            except Exception as exc:
-                print(f"Error parsing {task_yaml}: {exc}")
+            task_data: dict[str, object] = {"sprint": sprint.sprint_id}
+            task_data.update(with_int_values(entry.fields() or {}))
+            feature = task_data.get("feature", "unknown")
+            tasks_by_feature.setdefault(str(feature), []).append(task_data)
 
     return tasks_by_feature
 
@@ -157,6 +142,12 @@ def get_current_sprint(*, ph_data_root: Path) -> str:
     return best_sprint or "UNKNOWN"
 
 
+def active_work_digest(*, tasks: list[dict[str, object]], current_sprint: str) -> str:
+    """Digest of everything the auto-generated section depends on apart from the date."""
+    payload = json.dumps([_ACTIVE_WORK_FORMAT, current_sprint, tasks], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
 def format_active_work_section(
     *,
     ph_data_root: Path,
@@ -164,15 +155,18 @@ def format_active_work_section(
     tasks: list[dict[str, object]],
     metrics: dict[str, object],
     env: dict[str, str],
+    current_sprint: str | None = None,
 ) -> str:
-    current_sprint = get_current_sprint(ph_data_root=ph_data_root)
+    if current_sprint is None:
+        current_sprint = get_current_sprint(ph_data_root=ph_data_root)
 
     current_tasks = [t for t in tasks if t.get("sprint") == current_sprint]
     recent_completed = [t for t in tasks if t.get("status") == "done"][-5:]
     blocked_tasks = [t for t in tasks if t.get("status") == "blocked"]
 
     section = "## Active Work (auto-generated)\n"
-    section += f"*Last updated: {clock_today(env=env).strftime('%Y-%m-%d')}*\n\n"
+    section += f"*Last updated: {clock_today(env=env).strftime('%Y-%m-%d')}*\n"
+    section += f"<!-- ph:active-work digest={active_work_digest(tasks=tasks, current_sprint=current_sprint)} -->\n\n"
 
     if current_tasks:
         section += f"### Current Sprint ({current_sprint})\n"
@@ -231,7 +225,9 @@ def update_feature_status_file(
     feature: str,
     tasks: list[dict[str, object]],
     env: dict[str, str],
+    current_sprint: str | None = None,
 ) -> bool:
+    """Regenerate the feature's auto-generated section, leaving it alone when its stored digest still matches."""
     features_dir = ph_data_root / "features"
     feature_dir = features_dir / feature
     status_file = feature_dir / "status.md"
@@ -243,6 +239,13 @@ def update_feature_status_file(
     try:
         content = status_file.read_text(encoding="utf-8")
         metrics = calculate_feature_metrics(tasks=tasks)
+        if current_sprint is None:
+            current_sprint = get_current_sprint(ph_data_root=ph_data_root)
+
+        stored = _DIGEST_RE.search(content)
+        if stored and stored.group(1) == active_work_digest(tasks=tasks, current_sprint=current_sprint):
+            print(f"✅ {feature} status up to date ({len(tasks)} tasks, {metrics['completion_percentage']}% complete)")
+            return True
 
         manual_lines: list[str] = []
         for line in content.splitlines():
@@ -259,10 +262,11 @@ def update_feature_status_file(
             tasks=tasks,
             metrics=metrics,
             env=env,
+            current_sprint=current_sprint,
         )
         updated_content = manual_content + "\n\n" + auto_section
 
-        status_file.write_text(updated_content, encoding="utf-8")
+        write_if_changed(status_file, updated_content)
         print(f"✅ Updated {feature} status with {len(tasks)} tasks, {metrics['completion_percentage']}% complete")
         return True
     except Exception as exc:
@@ -276,11 +280,15 @@ def update_all_feature_status(*, ph_data_root: Path, env: dict[str, str]) -> int
         print("📋 No sprint tasks found")
         return 0
 
+    # Resolved once: without a `sprints/current` link this scans every sprint's plan.md.
+    current_sprint = get_current_sprint(ph_data_root=ph_data_root)
     updated_count = 0
     for feature, tasks in tasks_by_feature.items():
         if feature == "unknown":
             continue
-        if update_feature_status_file(ph_data_root=ph_data_root, feature=feature, tasks=tasks, env=env):
+        if update_feature_status_file(
+            ph_data_root=ph_data_root, feature=feature, tasks=tasks, env=env, current_sprint=current_sprint
+        ):
             updated_count += 1
 
     print(f"\n🎯 Updated {updated_count} feature status files")
@@ -294,13 +302,12 @@ def show_feature_summary(*, ph_data_root: Path, env: dict[str, str]) -> int:
     print("🎯 FEATURE SUMMARY WITH SPRINT DATA")
     print("=" * 60)
 
+    current_sprint = get_current_sprint(ph_data_root=ph_data_root)
     for feature, tasks in sorted(tasks_by_feature.items()):
         if feature == "unknown":
             continue
 
         metrics = calculate_feature_metrics(tasks=tasks)
-
-        current_sprint = get_current_sprint(ph_data_root=ph_data_root)
         current_tasks = len([t for t in tasks if t.get("sprint") == current_sprint])
 
         if metrics["completion_percentage"] >= 90:
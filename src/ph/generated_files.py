@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+_lock = threading.Lock()
+_counts = {"written": 0, "unchanged": 0}
+
+
+def write_counts() -> tuple[int, int]:
+    """Return `(written, unchanged)`: generated-file writes performed and skipped so far in this process."""
+    with _lock:
+        return _counts["written"], _counts["unchanged"]
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _counts[key] += 1
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write a generated file only when its text differs, via a temp file and rename; return whether it was written.
+
+    Leaving unchanged files alone keeps their mtimes stable for the parse cache, incremental validation, `ph watch`
+    and git. A file symlink is followed so the link itself survives the rename.
+    """
+    target = path.resolve() if path.is_symlink() else path
+    try:
+        existing = target.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        existing = None
+    if existing == content:
+        _count("unchanged")
+        return False
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        if existing is not None:
+            os.chmod(tmp, target.stat().st_mode & 0o7777)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _count("written")
+    return True
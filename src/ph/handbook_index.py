@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .decision_index import DecisionIndex
+from .parse_cache import get_parse_cache
+from .task_yaml import TaskYaml, load_task_yaml
+from .validate_profile import count_stats
+
+# Per-process cache of handbook indexes keyed by resolved data root. Commands and validators that
+# run inside a single `ph` invocation share one index so each task.yaml is read and parsed once.
+_INDEXES: dict[str, HandbookIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+_TASK_YAML_KIND = "task_yaml"
+
+
+def parse_task_fields(text: str) -> dict[str, Any]:
+    return load_task_yaml(text).fields()
+
+
+def with_int_values(data: dict[str, Any]) -> dict[str, Any]:
+    return {key: int(value) if isinstance(value, str) and value.isdigit() else value for key, value in data.items()}
+
+
+@dataclass(frozen=True)
+class SprintRef:
+    sprint_id: str
+    path: Path
+    archived: bool
+
+
+@dataclass
+class TaskEntry:
+    sprint_id: str
+    task_dir: Path
+    task_yaml: Path
+    has_yaml: bool
+    text: str | None = None
+    error: Exception | None = None
+    _document: TaskYaml | None = field(default=None, repr=False)
+
+    def document(self) -> TaskYaml | None:
+        """Return the parsed task.yaml (None when missing or unreadable)."""
+        return self._document
+
+    def fields(self) -> dict[str, Any] | None:
+        """Return the parsed task.yaml mapping (None when missing or unreadable)."""
+        if self._document is None:
+            return None
+        return self._document.fields()
+
+    def read_text(self) -> str | None:
+        """Return the raw task.yaml text, reading it lazily when the parse came from the on-disk cache."""
+        if self.text is None and self.has_yaml and self.error is None:
+            try:
+                self.text = self.task_yaml.read_text(encoding="utf-8")
+            except Exception as exc:
+                self.error = exc
+        return self.text
+
+
+class HandbookIndex:
+    def __init__(self, *, ph_data_root: Path) -> None:
+        self.ph_data_root = ph_data_root
+        self.sprints_dir = ph_data_root / "sprints"
+        self.parse_count = 0
+        self.cache = get_parse_cache(ph_data_root=ph_data_root)
+        self._sprints: list[SprintRef] | None = None
+        self._archived: dict[str, Path] | None = None
+        self._tasks_by_sprint: dict[str, list[TaskEntry]] = {}
+        self._feature_dirs: list[Path] | None = None
+        self._release_dirs: list[Path] | None = None
+        self._decisions: DecisionIndex | None = None
+        # `ph validate --jobs N` reads the index from worker threads; each lazy part is built once, under this lock.
+        self._lock = threading.RLock()
+
+    def sprints(self) -> list[SprintRef]:
+        """Return sprint directories in filesystem order (active year dirs plus `archive/<year>/`)."""
+        if self._sprints is not None:
+            return self._sprints
+        with self._lock:
+            if self._sprints is not None:
+                return self._sprints
+            sprints: list[SprintRef] = []
+            stat_calls = 1
+            if self.sprints_dir.exists():
+                for year_dir in self.sprints_dir.iterdir():
+                    stat_calls += 1
+                    if not year_dir.is_dir() or year_dir.name == "current":
+                        continue
+                    if year_dir.name == "archive":
+                        for archived_year_dir in year_dir.iterdir():
+                            stat_calls += 1
+                            if not archived_year_dir.is_dir():
+                                continue
+                            for sprint_dir in archived_year_dir.iterdir():
+                                stat_calls += 1
+                                if sprint_dir.is_dir() and sprint_dir.name.startswith("SPRINT-"):
+                                    sprints.append(SprintRef(sprint_id=sprint_dir.name, path=sprint_dir, archived=True))
+                        continue
+                    for sprint_dir in year_dir.iterdir():
+                        stat_calls += 1
+                        if sprint_dir.is_dir() and sprint_dir.name.startswith("SPRINT-"):
+                            sprints.append(SprintRef(sprint_id=sprint_dir.name, path=sprint_dir, archived=False))
+            count_stats(stat_calls)
+            self._sprints = sprints
+            return sprints
+
+    def archived_sprint_dirs(self) -> dict[str, Path]:
+        """Return archived sprint directories keyed by sprint ID (first match wins, as with `sprints()` order)."""
+        with self._lock:
+            if self._archived is None:
+                archived: dict[str, Path] = {}
+                for sprint in self.sprints():
+                    if sprint.archived:
+                        archived.setdefault(sprint.sprint_id, sprint.path)
+                self._archived = archived
+            return self._archived
+
+    def tasks(self, sprint_dir: Path) -> list[TaskEntry]:
+        """Return task directories of a sprint in filesystem order, reading each task.yaml once."""
+        # Keyed by the path as given so issue/report paths keep the caller's spelling (e.g. `sprints/current`).
+        key = str(sprint_dir)
+        cached = self._tasks_by_sprint.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            cached = self._tasks_by_sprint.get(key)
+            if cached is not None:
+                return cached
+            entries: list[TaskEntry] = []
+            try:
+                sprint_id = sprint_dir.resolve().name
+            except OSError:
+                sprint_id = sprint_dir.name
+            tasks_dir = sprint_dir / "tasks"
+            stat_calls = 1
+            if tasks_dir.exists():
+                for task_dir in tasks_dir.iterdir():
+                    stat_calls += 1
+                    if not task_dir.is_dir():
+                        continue
+                    stat_calls += 1
+                    task_yaml = task_dir / "task.yaml"
+                    try:
+                        st = task_yaml.stat()
+                    except OSError:
+                        st = None
+                    entry = TaskEntry(
+                        sprint_id=sprint_id, task_dir=task_dir, task_yaml=task_yaml, has_yaml=st is not None
+                    )
+                    if st is not None:
+                        hit, cached = self.cache.lookup(task_yaml, _TASK_YAML_KIND, st=st)
+                        if hit:
+                            entry._document = TaskYaml.from_record(cached)
+                        elif entry.read_text() is not None:
+                            entry._document = load_task_yaml(entry.text)
+                            self.cache.store(task_yaml, _TASK_YAML_KIND, entry._document.to_record(), st=st)
+                            self.parse_count += 1
+                    entries.append(entry)
+            count_stats(stat_calls)
+
+            self._tasks_by_sprint[key] = entries
+            return entries
+
+    def all_tasks(self, *, include_archived: bool = True) -> list[TaskEntry]:
+        entries: list[TaskEntry] = []
+        for sprint in self.sprints():
+            if sprint.archived and not include_archived:
+                continue
+            entries.extend(self.tasks(sprint.path))
+        return entries
+
+    def feature_dirs(self) -> list[Path]:
+        """Return sorted feature directories (including the `implemented` container itself)."""
+        with self._lock:
+            if self._feature_dirs is None:
+                features_dir = self.ph_data_root / "features"
+                children = list(features_dir.iterdir()) if features_dir.exists() else []
+                count_stats(1 + len(children))
+                self._feature_dirs = sorted([p for p in children if p.is_dir()])
+            return self._feature_dirs
+
+    def release_dirs(self) -> list[Path]:
+        with self._lock:
+            if self._release_dirs is None:
+                releases_dir = self.ph_data_root / "releases"
+                children = list(releases_dir.iterdir()) if releases_dir.exists() else []
+                count_stats(1 + len(children))
+                self._release_dirs = sorted([p for p in children if p.is_dir() and p.name.startswith("v")])
+            return self._release_dirs
+
+    def forget(self, parts: tuple[str, ...]) -> None:
+        """Drop what the index holds about a changed path, given as (non-empty) parts relative to the data root."""
+        with self._lock:
+            top = parts[0]
+            if top == "sprints":
+                depth = 4 if parts[1:2] == ("archive",) else 3
+                if len(parts) <= depth or parts[1] == "current":
+                    # A sprint (or year, or the `current` link) appeared or went away.
+                    self._sprints = None
+                    self._archived = None
+                    self._tasks_by_sprint.clear()
+                    return
+                sprint_dir = self.sprints_dir.joinpath(*parts[1:depth]).resolve()
+                for key in list(self._tasks_by_sprint):
+                    if Path(key).resolve() == sprint_dir:
+                        del self._tasks_by_sprint[key]
+            elif top == "features":
+                self._feature_dirs = None
+                self._decisions = None
+            elif top in {"adr", "decision-register"}:
+                self._decisions = None
+            elif top == "releases":
+                self._release_dirs = None
+
+    def decisions(self) -> DecisionIndex:
+        """Return the ADR/FDR/Decision Register ID index of the data root."""
+        with self._lock:
+            if self._decisions is None:
+                self._decisions = DecisionIndex(
+                    ph_data_root=self.ph_data_root, cache=self.cache, feature_dirs=self.feature_dirs()
+                )
+            return self._decisions
+
+
+def get_handbook_index(*, ph_data_root: Path) -> HandbookIndex:
+    key = str(ph_data_root.resolve())
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = HandbookIndex(ph_data_root=ph_data_root)
+            _INDEXES[key] = index
+    return index
+
+
+def sprint_task_entries(*, sprint_dir: Path, sort: bool = True) -> list[TaskEntry]:
+    """Return a sprint's task entries from the index of the data root that owns `sprint_dir`."""
+    try:
+        resolved = sprint_dir.resolve()
+    except OSError:
+        resolved = sprint_dir
+    ph_data_root = next((p.parent for p in resolved.parents if p.name == "sprints"), resolved.parent)
+    entries = get_handbook_index(ph_data_root=ph_data_root).tasks(sprint_dir)
+    return sorted(entries, key=lambda e: e.task_dir) if sort else list(entries)
+
+
+def invalidate_handbook_index(*, ph_data_root: Path | None = None) -> None:
+    """Drop cached indexes after a command mutates the handbook tree."""
+    if ph_data_root is None:
+        _INDEXES.clear()
+        return
+    _INDEXES.pop(str(ph_data_root.resolve()), None)
+
+
+def forget_handbook_paths(changed: set[Path]) -> None:
+    """Drop only the parts of the cached indexes that read `changed` paths (as reported by a file watcher)."""
+    for key, index in list(_INDEXES.items()):
+        root = Path(key)
+        for path in changed:
+            try:
+                parts = path.relative_to(root).parts
+            except ValueError:
+                continue
+            if not parts:
+                _INDEXES.pop(key, None)
+                break
+            index.forget(parts)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+from .validate_profile import count_stats
+
+
+class HandbookTree:
+    """Directory listing of a data root gathered with one `os.scandir` per directory.
+
+    Validators used to `rglob` overlapping subtrees (`**/*.md`, `adr/`, `features/**/fdr`, `sprints/**`) separately;
+    they now share this listing. Subtrees are scanned on first use and never again, so a full walk up front serves
+    every later query from memory. Like `Path.rglob`, symlinked directories are listed but not descended into, and
+    files come out in the order `rglob` yields them (pre-order, directory entry order).
+    """
+
+    def __init__(self, root: Path, *, skip: Iterable[str] = ()) -> None:
+        self.root = root
+        self._skip = frozenset(skip)
+        self._entries: dict[str, list[str]] = {}
+        self._subdirs: dict[str, list[str]] = {}
+        self._dir_names: dict[str, set[str]] = {}
+        # Subtrees are scanned under this lock; a directory appears in `_entries` only once its whole subtree has.
+        self._lock = threading.Lock()
+
+    def _scan(self, rel_dir: str) -> None:
+        try:
+            with os.scandir(self.root / rel_dir if rel_dir else self.root) as it:
+                entries = list(it)
+        except OSError:
+            entries = []
+        names: list[str] = []
+        subdirs: list[str] = []
+        dir_names: set[str] = set()
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if rel in self._skip:
+                continue
+            names.append(entry.name)
+            if entry.is_dir():
+                dir_names.add(entry.name)
+                if not entry.is_symlink():
+                    subdirs.append(rel)
+        for subdir in subdirs:
+            if subdir not in self._entries:
+                self._scan(subdir)
+        self._subdirs[rel_dir] = subdirs
+        self._dir_names[rel_dir] = dir_names
+        self._entries[rel_dir] = names
+
+    def _ensure(self, rel_dir: str) -> bool:
+        if rel_dir in self._entries:
+            return True
+        with self._lock:
+            if rel_dir in self._entries:
+                return True
+            if rel_dir:
+                count_stats()
+                if not (self.root / rel_dir).is_dir():
+                    return False
+            self._scan(rel_dir)
+        return True
+
+    def _walk(self, rel_dir: str) -> Iterator[str]:
+        yield rel_dir
+        for subdir in self._subdirs.get(rel_dir, ()):
+            yield from self._walk(subdir)
+
+    def entries(self, rel_dir: str) -> list[Path]:
+        """Direct children of `rel_dir` (like `Path.iterdir`)."""
+        if not self._ensure(rel_dir):
+            return []
+        base = self.root / rel_dir if rel_dir else self.root
+        return [base / name for name in self._entries[rel_dir]]
+
+    def subdirs(self, rel_dir: str) -> list[Path]:
+        """Direct children of `rel_dir` that are directories (symlinks to directories included)."""
+        if not self._ensure(rel_dir):
+            return []
+        base = self.root / rel_dir if rel_dir else self.root
+        return [base / name for name in self._entries[rel_dir] if name in self._dir_names[rel_dir]]
+
+    def files(self, under: str = "", *, match: Callable[[str, str], bool]) -> list[Path]:
+        """Entries below `under` whose (directory, name) satisfy `match`, in `rglob` order."""
+        if not self._ensure(under):
+            return []
+        found: list[Path] = []
+        for rel_dir in self._walk(under):
+            base = self.root / rel_dir if rel_dir else self.root
+            found.extend(base / name for name in self._entries[rel_dir] if match(rel_dir, name))
+        return found
+
+    def named(self, name: str, under: str = "") -> list[Path]:
+        return self.files(under, match=lambda _dir, entry: entry == name)
+
+    def with_suffix(self, suffix: str, under: str = "") -> list[Path]:
+        return self.files(under, match=lambda _dir, entry: entry.endswith(suffix))
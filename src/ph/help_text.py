@@ -144,6 +144,7 @@ Notes:
   ph process refresh             - Refresh seed templates/playbooks after upgrades
   ph question add|list|show|answer|close - Escape hatch for required operator answers
   ph clean                       - Remove Python caches
+  ph cache stats|clear           - Inspect or clear the parse cache (.project-handbook/.cache)
   ph hooks install               - Install repo git hooks
   ph test system                 - Automation smoke test suite
 """,
@@ -2,20 +2,23 @@ from __future__ import annotations
 
 import os
 import sys
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from .background_validate import background_supported, request_background_validation, take_background_failure
 from .context import Context
+from .handbook_index import invalidate_handbook_index
 from .history import append_history, format_history_entry
-from .validate_docs import run_validate
+from .validate_profile import ValidationProfile, profile_requested
 
 
 @dataclass(frozen=True)
 class PostCommandHookPlan:
     append_history: bool
     run_validation: bool
+    background_validation: bool = False
 
 
 def plan_post_command_hook(
@@ -28,7 +31,7 @@ def plan_post_command_hook(
     post_validate_mode: str = "quick",
     env: Mapping[str, str] | None = None,
 ) -> PostCommandHookPlan:
-    env = env or os.environ
+    env = os.environ if env is None else env
 
     if no_post_hook or env.get("PH_SKIP_POST_HOOK") == "1":
         return PostCommandHookPlan(append_history=False, run_validation=False)
@@ -50,10 +53,30 @@ def plan_post_command_hook(
     if no_validate or command in {"validate", "reset", "reset-smoke"}:
         return PostCommandHookPlan(append_history=append, run_validation=False)
 
-    if str(post_validate_mode).strip().lower() == "never":
+    mode = str(post_validate_mode).strip().lower()
+    if mode == "never":
         return PostCommandHookPlan(append_history=append, run_validation=False)
 
-    return PostCommandHookPlan(append_history=append, run_validation=True)
+    # PH_POST_VALIDATE_MODE=quick|background overrides the command's own mode for every validating command.
+    override = env.get("PH_POST_VALIDATE_MODE", "").strip().lower()
+    if override in {"quick", "background"}:
+        mode = override
+    background = mode == "background" and background_supported()
+    return PostCommandHookPlan(append_history=append, run_validation=True, background_validation=background)
+
+
+def _resolve_domains(*, ph_data_root: Path, domains: Sequence[str] | None) -> list[str] | None:
+    """Expand `sprint:current` to the sprint the `sprints/current` link points at (any sprint when unset)."""
+    if domains is None:
+        return None
+    resolved: list[str] = []
+    for domain in domains:
+        if domain == "sprint:current":
+            current = ph_data_root / "sprints" / "current"
+            name = current.resolve().name if current.exists() else ""
+            domain = f"sprint:{name}" if name.startswith("SPRINT-") else "sprint"
+        resolved.append(domain)
+    return resolved
 
 
 def run_post_command_hook(
@@ -67,6 +90,7 @@ def run_post_command_hook(
     no_history: bool,
     no_validate: bool,
     post_validate_mode: str = "quick",
+    post_validate_domains: Sequence[str] | None = None,
     env: Mapping[str, str] | None = None,
     now: datetime | None = None,
 ) -> int:
@@ -85,12 +109,30 @@ def run_post_command_hook(
     if plan.append_history:
         append_history(ph_root=ph_root, entry=history_entry, now=now)
 
+    if ctx is not None:
+        # `ph validate` supersedes a background result, so it only clears it.
+        failure = take_background_failure(ph_data_root=ctx.ph_data_root)
+        if failure and command != "validate":
+            sys.stderr.write(f"Background validate --quick failed (non-blocking): {failure}\n")
+
     if not plan.run_validation:
         return exit_code
 
     if ctx is None:
         raise ValueError("ctx is required to run post-command validate-quick")
 
+    domains = _resolve_domains(ph_data_root=ctx.ph_data_root, domains=post_validate_domains)
+    if plan.background_validation:
+        request_background_validation(ctx=ctx, domains=domains, env=env)
+        return exit_code
+
+    from .validate_docs import run_validate
+
+    # PH_VALIDATE_PROFILE=1 reports what the hidden validate-quick costs after each command.
+    profile = ValidationProfile() if profile_requested(env or os.environ) else None
+
+    # The command may have rewritten task.yaml files; validate against a fresh view of the tree.
+    invalidate_handbook_index(ph_data_root=ctx.ph_data_root)
     validate_exit, _out_path, message = run_validate(
         ph_root=ctx.ph_root,
         ph_project_root=ctx.ph_project_root,
@@ -98,7 +140,15 @@ def run_post_command_hook(
         scope=ctx.scope,
         quick=True,
         silent_success=True,
+        incremental=True,
+        domains=domains,
+        profile=profile,
     )
+    if profile is not None:
+        profile_path = profile.write_json(
+            ph_data_root=ctx.ph_data_root, source="post-hook", command=command, quick=True
+        )
+        sys.stderr.write(f"Post-hook validate --quick profile ({profile_path}):\n{profile.format_table()}")
     if validate_exit != 0 and message and command != "migrate":
         msg = " ".join(str(message).split())
         if msg:
@@ -14,9 +14,12 @@ DEFAULT_REQUIRES_PH_VERSION = ">=0.0.1,<0.1.0"
 
 _DEFAULT_GITIGNORE_LINES = (
     ".project-handbook/history.log",
+    ".project-handbook/.cache",
     ".project-handbook/process/sessions/logs/*",
     "!.project-handbook/process/sessions/logs/.gitkeep",
     ".project-handbook/status/exports",
+    ".project-handbook/status/validation.pending",
+    ".project-handbook/serve.sock",
     ".DS_Store",
 )
 
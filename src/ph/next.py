@@ -5,14 +5,15 @@ from pathlib import Path
 from typing import Any
 
 from .context import Context
+from .handbook_index import sprint_task_entries
 from .release import (
+    archived_sprint_dir,
     collect_release_tagged_tasks,
     get_current_release,
     get_release_timeline_info,
     is_sprint_archived,
     list_release_versions,
     normalize_version,
-    parse_task_yaml,
     summarize_tagged_tasks,
 )
 from .sprint import sprint_dir_from_id
@@ -48,8 +49,7 @@ def _sprint_paths(*, ctx: Context, sprint_id: str, state: str, is_current: bool)
 
     sprint_dir = sprint_dir_from_id(ph_data_root=ctx.ph_data_root, sprint_id=sprint_id)
     if state == "closed":
-        year = sprint_id.split("-")[1] if "-" in sprint_id else sprint_id
-        sprint_dir = ctx.ph_data_root / "sprints" / "archive" / year / sprint_id
+        sprint_dir = archived_sprint_dir(ph_root=ctx.ph_data_root, sprint_id=sprint_id) or sprint_dir
 
     return {"plan": _repo_rel(ctx=ctx, path=sprint_dir / "plan.md")}
 
@@ -88,13 +88,12 @@ def _collect_sprint_tasks(*, sprint_dir: Path) -> list[dict[str, Any]]:
         return []
 
     tasks: list[dict[str, Any]] = []
-    for task_dir in sorted(tasks_dir.iterdir()):
-        if not task_dir.is_dir():
+    for entry in sprint_task_entries(sprint_dir=sprint_dir):
+        if not entry.has_yaml:
             continue
-        task_yaml = task_dir / "task.yaml"
-        if not task_yaml.exists():
-            continue
-        task = parse_task_yaml(task_yaml=task_yaml)
+        task_dir = entry.task_dir
+        document = entry.document()
+        task = document.typed() if document is not None else {}
         task.setdefault("id", task_dir.name.split("-", 1)[0])
         task.setdefault("title", task_dir.name)
         task["directory"] = task_dir.name
@@ -117,8 +116,7 @@ def _task_path(
 
     sprint_dir = sprint_dir_from_id(ph_data_root=ctx.ph_data_root, sprint_id=sprint_id)
     if sprint_state == "closed":
-        year = sprint_id.split("-")[1] if "-" in sprint_id else sprint_id
-        sprint_dir = ctx.ph_data_root / "sprints" / "archive" / year / sprint_id
+        sprint_dir = archived_sprint_dir(ph_root=ctx.ph_data_root, sprint_id=sprint_id) or sprint_dir
     return _repo_rel(ctx=ctx, path=sprint_dir / "tasks" / task_dir_name / filename)
 
 
@@ -379,9 +377,8 @@ def run_next(
         if candidate.exists():
             sprint_dir = candidate
         else:
-            year = sprint_id.split("-")[1] if "-" in sprint_id else sprint_id
-            archived = ctx.ph_data_root / "sprints" / "archive" / year / sprint_id
-            if archived.exists():
+            archived = archived_sprint_dir(ph_root=ctx.ph_data_root, sprint_id=sprint_id)
+            if archived is not None:
                 sprint_dir = archived
 
     sprint_state: str | None = None
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .validate_profile import count_stats
+
+# Bump when the shape of cached records (or any parser feeding them) changes incompatibly.
+PARSE_CACHE_SCHEMA = 3
+PARSE_CACHE_FILENAME = "parse_cache.json"
+
+# Files modified this recently are parsed but not persisted: a same-size rewrite within the filesystem's
+# timestamp granularity would otherwise be indistinguishable from the cached version.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_CACHES: dict[str, ParseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def cache_dir_for(*, ph_data_root: Path) -> Path:
+    """Return the cache directory for a data root (`.project-handbook/.cache[/system]`)."""
+    if ph_data_root.name == "system" and ph_data_root.parent.name == ".project-handbook":
+        return ph_data_root.parent / ".cache" / "system"
+    return ph_data_root / ".cache"
+
+
+class ParseCache:
+    """On-disk cache of parsed file records keyed by (relative path, st_mtime_ns, st_size)."""
+
+    def __init__(self, *, ph_data_root: Path) -> None:
+        self.ph_data_root = ph_data_root
+        self.path = cache_dir_for(ph_data_root=ph_data_root) / PARSE_CACHE_FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        # Validators running on worker threads (`ph validate --jobs N`) share entries and counters.
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(payload, dict):
+            return
+        if payload.get("ph_version") != __version__ or payload.get("schema") != PARSE_CACHE_SCHEMA:
+            # Stale cache from another `ph` release; drop it on the next save.
+            self._dirty = True
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.ph_data_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def lookup(self, path: Path, kind: str, *, st: os.stat_result | None = None) -> tuple[bool, Any]:
+        """Return (hit, value) for a cached record of `kind` when `path` is unchanged on disk."""
+        if st is None:
+            count_stats()
+            try:
+                st = path.stat()
+            except OSError:
+                return False, None
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+            if entry is None or entry.get("mtime_ns") != st.st_mtime_ns or entry.get("size") != st.st_size:
+                self.misses += 1
+                return False, None
+            values = entry.get("values") or {}
+            if kind not in values:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, values[kind]
+
+    def store(self, path: Path, kind: str, value: Any, *, st: os.stat_result | None = None) -> None:
+        if st is None:
+            count_stats()
+            try:
+                st = path.stat()
+            except OSError:
+                return
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.get("mtime_ns") != st.st_mtime_ns or entry.get("size") != st.st_size:
+                entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "values": {}}
+                self._entries[key] = entry
+            entry["values"][kind] = value
+            self._dirty = True
+
+    def parse(self, path: Path, kind: str, parser: Callable[[str], Any], *, default: Any = None) -> Any:
+        """Return `parser(text)` for `path`, reading the file only when the cached record is stale."""
+        count_stats()
+        try:
+            st = path.stat()
+        except OSError:
+            return default
+        hit, value = self.lookup(path, kind, st=st)
+        if hit:
+            return value
+        try:
+            text = path.read_text(encoding="utf-8")
+        except Exception:
+            return default
+        value = parser(text)
+        self.store(path, kind, value, st=st)
+        return value
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        with self._lock:
+            text = json.dumps({"ph_version": __version__, "schema": PARSE_CACHE_SCHEMA, "entries": self._entries})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(text + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+        self._dirty = False
+
+
+def get_parse_cache(*, ph_data_root: Path) -> ParseCache:
+    key = str(ph_data_root.resolve())
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = ParseCache(ph_data_root=ph_data_root)
+            _CACHES[key] = cache
+    return cache
+
+
+def save_parse_caches() -> None:
+    for cache in list(_CACHES.values()):
+        cache.save()
+
+
+atexit.register(save_parse_caches)
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as dt
-import os
 import re
 import sys
 from contextlib import redirect_stderr, redirect_stdout
@@ -705,7 +704,7 @@ def _print_findings(*, ph_data_root: Path, findings: list[Finding]) -> None:
             print(f"  ↳ {f.excerpt}")
 
 
-def run_pre_exec_lint(*, ctx: Context) -> int:
+def run_pre_exec_lint(*, ctx: Context, env: dict[str, str]) -> int:
     tasks_dir = ctx.ph_data_root / "sprints" / "current" / "tasks"
     if not tasks_dir.exists():
         print(f"FAIL: No sprint tasks directory found at {tasks_dir}")
@@ -713,7 +712,7 @@ def run_pre_exec_lint(*, ctx: Context) -> int:
 
     all_findings: list[Finding] = []
     try:
-        qm = QuestionManager(ph_data_root=ctx.ph_data_root, env=os.environ)
+        qm = QuestionManager(ph_data_root=ctx.ph_data_root, env=env)
         blocking = qm.blocking_open_for_current_sprint()
     except Exception:
         blocking = []
@@ -791,6 +790,7 @@ def run_pre_exec_audit(
     sprint: str | None,
     date: str | None,
     evidence_dir: str | None,
+    env: dict[str, str],
 ) -> int:
     sprint_plan = ctx.ph_data_root / "sprints" / "current" / "plan.md"
     sprint_id = (sprint or "").strip() or _extract_sprint_id_from_plan(plan_path=sprint_plan)
@@ -823,9 +823,9 @@ def run_pre_exec_audit(
             "sprint-status.txt",
             lambda: run_sprint_status(ph_project_root=ctx.ph_project_root, ctx=ctx, sprint=None),
         ),
-        ("release-status", "release-status.txt", lambda: run_release_status(ctx=ctx, release=None, env=os.environ)),
+        ("release-status", "release-status.txt", lambda: run_release_status(ctx=ctx, release=None, env=env)),
         ("task-list", "task-list.txt", lambda: run_task_list(ctx=ctx)),
-        ("feature-summary", "feature-summary.txt", lambda: run_feature_summary(ctx=ctx, env=os.environ)),
+        ("feature-summary", "feature-summary.txt", lambda: run_feature_summary(ctx=ctx, env=env)),
         ("validate", "handbook-validate.txt", _validate_code),
     ]
 
@@ -849,7 +849,7 @@ def run_pre_exec_audit(
     print("\n════════════════════════════════════════════════")
     print("PRE-EXEC: lint")
     print("════════════════════════════════════════════════")
-    lint_code, lint_out = _capture_call("lint", lambda: run_pre_exec_lint(ctx=ctx))
+    lint_code, lint_out = _capture_call("lint", lambda: run_pre_exec_lint(ctx=ctx, env=env))
     sys.stdout.write(lint_out)
     _write_evidence_text(evidence_dir=evid, name="pre-exec-lint.txt", text=lint_out)
     if lint_code != 0:
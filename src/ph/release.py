@@ -10,6 +10,9 @@ from typing import Any, TextIO
 from .clock import today as clock_today
 from .context import Context
 from .feature_status_updater import calculate_feature_metrics, collect_all_sprint_tasks
+from .generated_files import write_if_changed
+from .handbook_index import get_handbook_index
+from .release_index import CURRENT_RELEASE_KEY, ReleaseTaskIndex, normalize_version, task_release_keys
 from .remediation_hints import ph_prefix, print_next_commands
 from .shell_quote import shell_quote
 from .validate_docs import run_validate
@@ -1117,7 +1120,7 @@ links: [{", ".join(links)}]
     )
     content += f"- Readiness (gate-first): {readiness}\n"
 
-    progress_file.write_text(content.rstrip() + "\n", encoding="utf-8")
+    write_if_changed(progress_file, content.rstrip() + "\n")
     return progress_file
 
 
@@ -1518,12 +1521,6 @@ def sprint_plan_release_slot(*, sprint_dir: Path) -> int | None:
     return parse_int(meta.get("release_sprint_slot"))
 
 
-def normalize_version(version: str) -> str:
-    if not version:
-        return version
-    return version if version.startswith("v") else f"v{version}"
-
-
 def sprint_plan_release_version(*, sprint_dir: Path) -> str | None:
     meta = parse_sprint_plan_front_matter(plan_path=sprint_dir / "plan.md")
     raw = meta.get("release")
@@ -1536,142 +1533,30 @@ def sprint_plan_release_version(*, sprint_dir: Path) -> str | None:
 
 
 def iter_sprint_dirs(*, sprints_dir: Path) -> list[Path]:
-    dirs: list[Path] = []
     if not sprints_dir.exists():
-        return dirs
-
-    for year_dir in sprints_dir.iterdir():
-        if not year_dir.is_dir() or year_dir.name == "current":
-            continue
+        return []
 
-        if year_dir.name == "archive":
-            for archived_year_dir in year_dir.iterdir():
-                if not archived_year_dir.is_dir():
-                    continue
-                for sprint_dir in archived_year_dir.iterdir():
-                    if sprint_dir.is_dir() and sprint_dir.name.startswith("SPRINT-"):
-                        dirs.append(sprint_dir)
-            continue
+    index = get_handbook_index(ph_data_root=sprints_dir.parent)
+    return sorted((sprint.path for sprint in index.sprints()), key=lambda p: p.name)
 
-        for sprint_dir in year_dir.iterdir():
-            if sprint_dir.is_dir() and sprint_dir.name.startswith("SPRINT-"):
-                dirs.append(sprint_dir)
 
-    dirs.sort(key=lambda p: p.name)
-    return dirs
+def archived_sprint_dir(*, ph_root: Path, sprint_id: str) -> Path | None:
+    """Return `sprints/archive/<year>/<sprint_id>` if the sprint is archived (via the shared handbook index)."""
+    return get_handbook_index(ph_data_root=ph_root).archived_sprint_dirs().get(sprint_id)
 
 
 def is_sprint_archived(*, ph_root: Path, sprint_id: str) -> bool:
-    archive_dir = ph_root / "sprints" / "archive"
-    if not archive_dir.exists():
-        return False
-    for path in archive_dir.rglob(sprint_id):
-        if path.is_dir() and path.name == sprint_id:
-            return True
-    return False
-
-
-def parse_task_yaml(*, task_yaml: Path) -> dict[str, Any]:
-    try:
-        content = task_yaml.read_text(encoding="utf-8")
-    except Exception:
-        return {}
-
-    data: dict[str, Any] = {}
-    current_key: str | None = None
-    collecting_list = False
-    for raw in content.splitlines():
-        line = raw.rstrip()
-        if not line.strip() or line.strip().startswith("#"):
-            continue
-        if collecting_list and current_key and line.strip().startswith("-"):
-            data.setdefault(current_key, []).append(line.strip()[1:].strip())
-            continue
-        collecting_list = False
-        if ":" not in line or line.strip().startswith("-"):
-            continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip()
-        current_key = key
-        if value == "":
-            data[key] = []
-            collecting_list = True
-            continue
-        if value.startswith("[") and value.endswith("]"):
-            inner = value[1:-1].strip()
-            if not inner:
-                data[key] = []
-            else:
-                items = [item.strip().strip("\"'") for item in inner.split(",")]
-                data[key] = [item for item in items if item]
-            continue
-        if value.lower() in {"true", "false"}:
-            data[key] = value.lower() == "true"
-            continue
-        if value.isdigit():
-            data[key] = int(value)
-            continue
-        data[key] = value
-    return data
+    return archived_sprint_dir(ph_root=ph_root, sprint_id=sprint_id) is not None
 
 
 def task_matches_release(*, task: dict[str, Any], version: str) -> bool:
-    version = normalize_version(version)
-
-    val = task.get("release")
-    if isinstance(val, str):
-        raw = val.strip()
-        if raw.lower() in {"", "null", "none"}:
-            return False
-        if raw.lower() == "current":
-            return True
-        return normalize_version(raw) == version
-    if isinstance(val, list):
-        for item in val:
-            if not isinstance(item, str):
-                continue
-            raw = item.strip()
-            if not raw or raw.lower() in {"null", "none"}:
-                continue
-            if raw.lower() == "current":
-                return True
-            if normalize_version(raw) == version:
-                return True
-    return False
+    keys = task_release_keys(task)
+    return CURRENT_RELEASE_KEY in keys or normalize_version(version) in keys
 
 
 def collect_release_tagged_tasks(*, ph_root: Path, version: str) -> list[dict[str, Any]]:
-    version = normalize_version(version)
-    tagged: list[dict[str, Any]] = []
-
-    for sprint_dir in iter_sprint_dirs(sprints_dir=ph_root / "sprints"):
-        tasks_dir = sprint_dir / "tasks"
-        if not tasks_dir.exists():
-            continue
-
-        for task_dir in tasks_dir.iterdir():
-            if not task_dir.is_dir():
-                continue
-            task_yaml = task_dir / "task.yaml"
-            if not task_yaml.exists():
-                continue
-
-            task = parse_task_yaml(task_yaml=task_yaml)
-            task.setdefault("id", task_dir.name.split("-", 1)[0])
-            task.setdefault("title", task_dir.name)
-            task.setdefault("feature", "unknown")
-            task["sprint"] = sprint_dir.name
-            task["directory"] = task_dir.name
-
-            if task_matches_release(task=task, version=version):
-                tagged.append(task)
-
-    def sort_key(t: dict[str, Any]) -> tuple[str, str]:
-        return (str(t.get("sprint", "")), str(t.get("id", "")))
-
-    tagged.sort(key=sort_key)
-    return tagged
+    """Return tasks tagged for `version` or `current`, sorted by sprint and ID (from the release -> tasks view)."""
+    return ReleaseTaskIndex(ph_data_root=ph_root).tasks_for(version)
 
 
 def summarize_tagged_tasks(*, tasks: list[dict[str, Any]], sprint_timeline: list[str] | None = None) -> dict[str, Any]:
@@ -2065,7 +1950,7 @@ def calculate_release_progress(
     }
 
 
-def run_release_list(*, ctx: Context) -> int:
+def run_release_list(*, ctx: Context, progress: bool = False) -> int:
     if ctx.scope == "system":
         print(_SYSTEM_SCOPE_REMEDIATION)
         return 1
@@ -2081,11 +1966,27 @@ def run_release_list(*, ctx: Context) -> int:
         return 0
 
     current = _read_current_release_target(ph_root=ctx.ph_data_root)
+    # One scan of every sprint answers all releases; `release: current` tasks count toward the current one only.
+    tagged_index = ReleaseTaskIndex(ph_data_root=ctx.ph_data_root) if progress else None
 
     print("📦 RELEASES")
     for release in releases:
         indicator = " (current)" if current and release == current else ""
-        print(f"  {release}{indicator}")
+        if tagged_index is None:
+            print(f"  {release}{indicator}")
+            continue
+        timeline = get_release_timeline_info(ph_root=ctx.ph_data_root, version=release)
+        sprint_ids = [str(item) for item in timeline.get("sprint_ids") or [] if str(item)]  # type: ignore[union-attr]
+        summary = summarize_tagged_tasks(
+            tasks=tagged_index.tasks_for(release, include_current=release == current), sprint_timeline=sprint_ids
+        )
+        line = (
+            f"  {release}{indicator}: {summary['by_status']['done']}/{summary['tasks_total']} tasks done, "
+            f"{summary['points_done']}/{summary['points_total']} pts ({summary['completion']}%)"
+        )
+        if summary["gates_total"]:
+            line += f", gates {summary['gates_done']}/{summary['gates_total']}"
+        print(line)
     return 0
 
 
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .handbook_index import get_handbook_index
+from .parse_cache import cache_dir_for
+from .status_cache import sprint_fingerprint
+
+RELEASE_INDEX_SCHEMA = 1
+RELEASE_INDEX_FILENAME = "release_tasks.json"
+# Tasks tagged `release: current` belong to whichever release is current.
+CURRENT_RELEASE_KEY = "current"
+
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def normalize_version(version: str) -> str:
+    if not version:
+        return version
+    return version if version.startswith("v") else f"v{version}"
+
+
+def task_release_keys(task: dict[str, Any]) -> list[str]:
+    """Return the normalized versions a task is tagged for (`current` kept as is), in tag order."""
+    val = task.get("release")
+    values = [val] if isinstance(val, str) else val if isinstance(val, list) else []
+    keys: list[str] = []
+    for item in values:
+        if not isinstance(item, str):
+            continue
+        raw = item.strip()
+        if not raw or raw.lower() in {"null", "none"}:
+            continue
+        key = CURRENT_RELEASE_KEY if raw.lower() == CURRENT_RELEASE_KEY else normalize_version(raw)
+        if key not in keys:
+            keys.append(key)
+    return keys
+
+
+class ReleaseTaskIndex:
+    """Release-tagged tasks of every sprint (active and archived), grouped by normalized version.
+
+    Stored as `.cache/release_tasks.json` with one entry per sprint keyed by its task-file fingerprint, so building the
+    view re-reads only sprints whose task files changed; every release is answered from the same scan.
+    """
+
+    def __init__(self, *, ph_data_root: Path) -> None:
+        self.ph_data_root = ph_data_root
+        self.path = cache_dir_for(ph_data_root=ph_data_root) / RELEASE_INDEX_FILENAME
+        self.rescanned: list[str] = []
+        self._tasks: list[dict[str, Any]] = []
+        self._groups: dict[str, list[int]] = {}
+        stored = self._load()
+        sprints: dict[str, dict[str, Any]] = {}
+        now_ns = time.time_ns()
+
+        index = get_handbook_index(ph_data_root=ph_data_root)
+        for sprint in sorted(index.sprints(), key=lambda s: s.path.name):
+            key = sprint.path.relative_to(ph_data_root).as_posix()
+            fingerprint, newest_ns = sprint_fingerprint(sprint.path)
+            record = stored.get(key)
+            if record is None or record.get("fingerprint") != fingerprint:
+                record = {"fingerprint": fingerprint, "tasks": self._scan_sprint(sprint.path)}
+                self.rescanned.append(sprint.sprint_id)
+                if now_ns - newest_ns < _RACY_WINDOW_NS:
+                    record["fingerprint"] = None
+            sprints[key] = record
+            for task in record["tasks"]:
+                position = len(self._tasks)
+                self._tasks.append(task)
+                for release_key in task_release_keys(task):
+                    self._groups.setdefault(release_key, []).append(position)
+
+        if sprints != stored:
+            self._save(sprints)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        if payload.get("ph_version") != __version__ or payload.get("schema") != RELEASE_INDEX_SCHEMA:
+            return {}
+        sprints = payload.get("sprints")
+        return sprints if isinstance(sprints, dict) else {}
+
+    def _scan_sprint(self, sprint_dir: Path) -> list[dict[str, Any]]:
+        tagged: list[dict[str, Any]] = []
+        for entry in get_handbook_index(ph_data_root=self.ph_data_root).tasks(sprint_dir):
+            if not entry.has_yaml:
+                continue
+            document = entry.document()
+            task = document.typed() if document is not None else {}
+            if not task_release_keys(task):
+                continue
+            task.setdefault("id", entry.task_dir.name.split("-", 1)[0])
+            task.setdefault("title", entry.task_dir.name)
+            task.setdefault("feature", "unknown")
+            task["sprint"] = sprint_dir.name
+            task["directory"] = entry.task_dir.name
+            tagged.append(task)
+        return tagged
+
+    def _save(self, sprints: dict[str, dict[str, Any]]) -> None:
+        payload = {"ph_version": __version__, "schema": RELEASE_INDEX_SCHEMA, "sprints": sprints}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+
+    def releases(self) -> list[str]:
+        """Return the versions tasks are explicitly tagged for."""
+        return sorted(key for key in self._groups if key != CURRENT_RELEASE_KEY)
+
+    def tasks_for(self, version: str, *, include_current: bool = True) -> list[dict[str, Any]]:
+        """Return copies of the tasks tagged for `version` (plus `release: current` tasks), sorted by sprint and ID."""
+        positions = set(self._groups.get(normalize_version(version), ()))
+        if include_current:
+            positions.update(self._groups.get(CURRENT_RELEASE_KEY, ()))
+        tasks = [dict(self._tasks[position]) for position in sorted(positions)]
+        tasks.sort(key=lambda t: (str(t.get("sprint", "")), str(t.get("id", ""))))
+        return tasks
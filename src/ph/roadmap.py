@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import re
 from pathlib import Path
 
@@ -47,14 +46,14 @@ def _roadmap_path(*, ph_data_root: Path) -> Path:
     return ph_data_root / "roadmap" / "now-next-later.md"
 
 
-def run_roadmap_create(*, ctx: Context) -> int:
+def run_roadmap_create(*, ctx: Context, env: dict[str, str]) -> int:
     if ctx.scope == "system":
         print(_SYSTEM_SCOPE_REMEDIATION)
         return 1
 
     roadmap_path = _roadmap_path(ph_data_root=ctx.ph_data_root)
     roadmap_path.parent.mkdir(parents=True, exist_ok=True)
-    roadmap_path.write_text(_roadmap_template(env=os.environ), encoding="utf-8")
+    roadmap_path.write_text(_roadmap_template(env=env), encoding="utf-8")
     print(f"📋 Created roadmap template: {roadmap_path.resolve()}")
     return 0
 
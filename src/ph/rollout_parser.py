@@ -1,54 +1,272 @@
 from __future__ import annotations
 
+import codecs
+import hashlib
 import json
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import closing
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from . import __version__
 
 
 class RolloutParserError(Exception):
     """Raised when a rollout file cannot be parsed."""
 
 
-def iter_json_objects(path: Path, limit: int | None = None) -> list[dict[str, Any]]:
-    """
-    Stream JSON objects from a Codex rollout file.
+ROLLOUT_INDEX_SCHEMA = 1
 
-    Rollouts are formatted as pretty-printed JSON objects concatenated together
-    (not strict JSONL). This reader incrementally feeds chunks into a JSON decoder
-    and yields each object as soon as it can be decoded.
+_READ_SIZE = 65536
+_HEAD_BYTES = 4096
+_WHITESPACE = re.compile(r"\s*")
+
+
+def _byte_len(text: str, start: int, end: int) -> int:
+    segment = text[start:end]
+    return len(segment) if segment.isascii() else len(segment.encode("utf-8"))
+
+
+def _iter_spans(handle: BinaryIO, offset: int = 0) -> Iterator[tuple[int, int, Any]]:
+    """Yield `(start, end, obj)` for each top-level JSON value from byte `offset`, with byte offsets into the file.
+
+    Decoding advances an offset into the buffer; the buffer is only compacted when
+    the next chunk is read, and reads grow with a pending object that spans many
+    chunks, so the work stays linear in the size of the file.
     """
     decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
     buffer = ""
-    items: list[dict[str, Any]] = []
+    pos = 0
+    byte_pos = offset
+    read_size = _READ_SIZE
+    eof = False
 
-    with path.open("r", encoding="utf-8") as handle:
+    handle.seek(offset)
+    while not eof:
+        chunk = handle.read(read_size)
+        text = text_decoder.decode(chunk, final=not chunk)
+        if chunk:
+            buffer = buffer[pos:] + text
+            pos = 0
+        else:
+            eof = True
         while True:
-            chunk = handle.read(65536)
-            if not chunk:
+            start = _WHITESPACE.match(buffer, pos).end()
+            if start >= len(buffer):
+                break
+            try:
+                obj, end = decoder.raw_decode(buffer, start)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_size = max(_READ_SIZE, len(buffer) - pos)
                 break
-            buffer += chunk
-            buffer = buffer.lstrip()
-            while buffer:
-                try:
-                    obj, index = decoder.raw_decode(buffer)
-                except json.JSONDecodeError:
-                    break
-                if isinstance(obj, dict):
-                    items.append(obj)
-                if limit is not None:
-                    limit -= 1
-                    if limit == 0:
-                        return items
-                buffer = buffer[index:].lstrip()
-
-        buffer = buffer.lstrip()
-        if buffer:
-            obj, _ = decoder.raw_decode(buffer)
+            obj_start = byte_pos + _byte_len(buffer, pos, start)
+            byte_pos = obj_start + _byte_len(buffer, start, end)
+            pos = end
+            read_size = _READ_SIZE
+            yield obj_start, byte_pos, obj
+
+
+def iter_json_objects(path: Path, limit: int | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Stream JSON objects from a Codex rollout file.
+
+    Rollouts are formatted as pretty-printed JSON objects concatenated together
+    (not strict JSONL). This reader incrementally feeds chunks into a JSON decoder
+    and yields each object as soon as it can be decoded.
+    """
+    with path.open("rb") as handle:
+        for _, _, obj in _iter_spans(handle):
             if isinstance(obj, dict):
-                items.append(obj)
+                yield obj
+            if limit is not None:
+                limit -= 1
+                if limit == 0:
+                    return
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
 
-    return items
+def _since(items: Iterable[Any], since: datetime | None, key: Callable[[Any], tuple[Any, Any]]) -> Iterator[Any]:
+    """Yield session metadata plus everything from the first item stamped at or after `since` onward."""
+    started = since is None
+    for item in items:
+        entry_type, timestamp = key(item)
+        if not started:
+            moment = _parse_timestamp(timestamp)
+            started = moment is not None and moment >= since
+        if started or entry_type == "session_meta":
+            yield item
+
+
+class RolloutIndex:
+    """Byte offset, length, type and timestamp of every top-level object in a rollout file.
+
+    Stored as a JSON sidecar in `index_dir` and keyed by the log's size, mtime and first bytes. A log that only grew
+    (Codex appends while a session runs) is indexed from the previous end, so only the new tail is decoded; reads then
+    `mmap` the log and decode just the objects they need. The tail is indexed lazily: `refresh()` decodes it up front
+    (for windowed reads), while `scan()` indexes it in the same pass that yields the objects.
+    """
+
+    def __init__(self, log_path: Path, *, index_dir: Path) -> None:
+        self.log_path = log_path
+        digest = hashlib.sha256(str(log_path.resolve()).encode("utf-8")).hexdigest()[:12]
+        self.path = index_dir / f"{log_path.name}.{digest}.json"
+        self.rows: list[list[Any]] = []
+        self.indexed_bytes = 0
+        self.decoded_bytes = 0
+        self.fresh = False
+        self._load_stored()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        if payload.get("ph_version") != __version__ or payload.get("schema") != ROLLOUT_INDEX_SCHEMA:
+            return {}
+        return payload
+
+    @staticmethod
+    def _head(handle: BinaryIO, indexed: int) -> str:
+        handle.seek(0)
+        return hashlib.sha256(handle.read(min(indexed, _HEAD_BYTES))).hexdigest()
+
+    def _load_stored(self) -> None:
+        st = self.log_path.stat()
+        stored = self._load()
+        indexed = stored.get("indexed_bytes")
+        rows = stored.get("rows")
+        if not isinstance(indexed, int) or not isinstance(rows, list) or not 0 <= indexed <= st.st_size:
+            return
+        with self.log_path.open("rb") as handle:
+            if self._head(handle, indexed) != stored.get("head"):
+                return
+        self.rows = rows
+        self.indexed_bytes = indexed
+        self.fresh = (stored.get("size"), stored.get("mtime_ns")) == (st.st_size, st.st_mtime_ns)
+
+    def _extend(self) -> Iterator[dict[str, Any]]:
+        """Decode the log from the indexed end, recording a row for and yielding each object; save once exhausted."""
+        st = self.log_path.stat()
+        start = self.indexed_bytes
+        with self.log_path.open("rb") as handle:
+            try:
+                for obj_start, obj_end, obj in _iter_spans(handle, self.indexed_bytes):
+                    if obj_start < self.indexed_bytes:
+                        continue  # already indexed by an interleaved pass
+                    self.indexed_bytes = obj_end
+                    self.decoded_bytes = obj_end - start
+                    if isinstance(obj, dict):
+                        self.rows.append([obj_start, obj_end - obj_start, obj.get("type"), obj.get("timestamp")])
+                        yield obj
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                pass  # an object still being written; it is indexed on a later refresh
+            head = self._head(handle, self.indexed_bytes)
+        self.fresh = True
+        self._save(head=head, size=st.st_size, mtime_ns=st.st_mtime_ns, indexed=self.indexed_bytes)
+
+    def refresh(self) -> None:
+        """Index whatever the log gained since the stored index (nothing when it is unchanged)."""
+        if not self.fresh:
+            for _ in self._extend():
+                pass
+
+    def scan(self) -> Iterator[dict[str, Any]]:
+        """Yield every object in the log: indexed rows from the memory map, then the tail as it is indexed."""
+        yield from self.read(self.rows)
+        if not self.fresh:
+            yield from self._extend()
+
+    def _save(self, *, head: str, size: int, mtime_ns: int, indexed: int) -> None:
+        payload = {
+            "ph_version": __version__,
+            "schema": ROLLOUT_INDEX_SCHEMA,
+            "log_path": str(self.log_path),
+            "head": head,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "indexed_bytes": indexed,
+            "rows": self.rows,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+
+    def select(self, *, since: datetime | None = None, tail: int | None = None, offset: int = 0) -> list[list[Any]]:
+        """Return the rows in a time window (`since` onward) and/or the last `tail` rows; session metadata is kept.
+
+        `offset` skips every object starting before that byte, session metadata included.
+        """
+        self.refresh()
+        rows = self.rows if offset <= 0 else [row for row in self.rows if row[0] >= offset]
+        rows = list(_since(rows, since, lambda row: (row[2], row[3])))
+        if tail is not None:
+            cut = max(len(rows) - max(tail, 0), 0)
+            rows = [row for row in rows[:cut] if row[2] == "session_meta"] + rows[cut:]
+        return rows
+
+    def read(self, rows: Iterable[list[Any]]) -> Iterator[dict[str, Any]]:
+        """Decode the objects at the given rows from a memory map of the log."""
+        rows = list(rows)
+        if not rows:
+            return
+        with self.log_path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for offset, length, _, _ in rows:
+                yield json.loads(view[offset : offset + length])
+
+
+class RolloutEntries:
+    """Re-iterable view of the objects in a rollout file; every iteration streams the file again.
+
+    With an index, iteration decodes only the selected rows (or, with no rows selected, scans the whole log and indexes
+    it as it goes); without one, `since` filters the stream.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        index: RolloutIndex | None = None,
+        rows: list[list[Any]] | None = None,
+        since: datetime | None = None,
+    ):
+        self.path = path
+        self.index = index
+        self.rows = rows
+        self.since = since
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if self.index is not None:
+            return self.index.read(self.rows) if self.rows is not None else self.index.scan()
+        return _since(iter_json_objects(self.path), self.since, lambda e: (e.get("type"), e.get("timestamp")))
+
+    def __bool__(self) -> bool:
+        if self.rows is not None:
+            return bool(self.rows)
+        with closing(iter(self)) as objects:
+            return next(objects, None) is not None
 
 
 @dataclass(frozen=True)
@@ -94,19 +312,51 @@ class CodexRolloutParser:
 
     provider = "codex"
 
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, *, index_dir: Path | None = None):
         self.repo_root = repo_root
+        self.index_dir = index_dir
+        self._indexes: dict[Path, RolloutIndex] = {}
+
+    def index(self, path: Path) -> RolloutIndex | None:
+        """Return the (refreshed once per parser) sidecar index for `path`, or None when indexing is off."""
+        if self.index_dir is None:
+            return None
+        if path not in self._indexes:
+            self._indexes[path] = RolloutIndex(path, index_dir=self.index_dir)
+        return self._indexes[path]
 
     def read_session_meta(self, path: Path) -> SessionMetadata | None:
-        entries = iter_json_objects(path, limit=1)
-        for obj in entries:
+        index = self.index(path)
+        objects = index.read(index.rows[:1]) if index is not None and index.rows else iter_json_objects(path, limit=1)
+        for obj in objects:
             if obj.get("type") == "session_meta":
                 return self._session_meta_from_obj(obj)
         return None
 
-    def parse(self, path: Path) -> tuple[SessionMetadata, list[dict[str, Any]]]:
-        entries = iter_json_objects(path)
-        session_meta_obj = next((e for e in entries if e.get("type") == "session_meta"), None)
+    def parse(
+        self, path: Path, *, since: datetime | None = None, offset: int = 0
+    ) -> tuple[SessionMetadata, RolloutEntries]:
+        """Return the session metadata and a streaming view of the entries (nothing is held in memory).
+
+        `since` limits the entries to the tail starting at the first object stamped at or after it; `offset` (indexed
+        parsers only) to the objects starting at or after that byte.
+        """
+        index = self.index(path)
+        if index is not None and (since is not None or offset):
+            rows = index.select(since=since, offset=offset)
+            entries = RolloutEntries(path, index=index, rows=rows)
+        elif offset:
+            raise RolloutParserError("Reading a rollout from a byte offset requires the rollout index")
+        else:
+            # A whole-log read leaves an unindexed tail to the entries' own pass, which indexes it as it streams.
+            entries = RolloutEntries(path, index=index) if index is not None else RolloutEntries(path, since=since)
+        if index is not None and index.rows:
+            meta_rows = next(([row] for row in index.rows if row[2] == "session_meta"), [])
+            with closing(index.read(meta_rows)) as objects:
+                session_meta_obj = next(objects, None)
+        else:
+            with closing(iter_json_objects(path)) as objects:
+                session_meta_obj = next((e for e in objects if e.get("type") == "session_meta"), None)
         if session_meta_obj is None:
             raise RolloutParserError(f"No session_meta found in {path}")
         metadata = self._session_meta_from_obj(session_meta_obj)
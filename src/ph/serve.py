@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .cli import main
+from .handbook_index import forget_handbook_paths
+from .parse_cache import save_parse_caches
+from .serve_client import serve_socket_path
+from .watch import open_watcher
+
+# Used only where inotify is unavailable; each request then rescans the tree once.
+_POLL_INTERVAL = 1.0
+
+
+class _ServeState:
+    """The warm model lives in the process-wide handbook index and parse caches.
+
+    A recursive watch on `.project-handbook/` (the same inotify/polling machinery as `ph watch`) reports what changed
+    since the last request, and only the index entries for those subtrees are dropped. Generated outputs such as
+    `status/` and session logs are not read by the index, so rewriting them costs nothing.
+    """
+
+    def __init__(self, *, ph_root: Path) -> None:
+        self.handbook_root = (ph_root / ".project-handbook").resolve()
+        self._watcher = open_watcher(self.handbook_root, poll=False, poll_interval=_POLL_INTERVAL)
+
+    def refresh(self) -> bool:
+        changed = self._watcher.wait(0)
+        if changed:
+            forget_handbook_paths(changed)
+        return bool(changed)
+
+    def close(self) -> None:
+        self._watcher.close()
+
+
+class _StreamWriter(io.TextIOBase):
+    """Send what a command prints to the client as it goes, one `{"<stream>": text}` JSON line per output line."""
+
+    def __init__(self, conn: socket.socket, stream: str) -> None:
+        self._conn = conn
+        self._stream = stream
+        self._pending: list[str] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._pending.append(text)
+        if "\n" in text:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        _send(self._conn, {self._stream: text})
+
+
+def _send(conn: socket.socket, message: dict[str, Any]) -> None:
+    try:
+        conn.sendall((json.dumps(message) + "\n").encode("utf-8"))
+    except OSError:
+        # The client went away; let the command finish so the tree is left consistent, and drop its output.
+        pass
+
+
+def _run_request(request: dict[str, Any], conn: socket.socket) -> int:
+    argv = [str(a) for a in request.get("argv") or []]
+    env = {str(k): str(v) for k, v in (request.get("env") or {}).items()}
+    # Commands running inside the daemon must never forward back to it.
+    env["PH_NO_SERVE"] = "1"
+
+    saved_cwd = os.getcwd()
+    stdout, stderr = _StreamWriter(conn, "stdout"), _StreamWriter(conn, "stderr")
+    try:
+        os.chdir(str(request.get("cwd") or saved_cwd))
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                exit_code = main(argv, env=env)
+            except SystemExit as exc:
+                exit_code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        stdout.flush()
+        stderr.flush()
+        os.chdir(saved_cwd)
+        save_parse_caches()
+    _send(conn, {"exit_code": exit_code})
+    return exit_code
+
+
+def _handle_connection(conn: socket.socket, state: _ServeState) -> None:
+    chunks: list[bytes] = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    try:
+        request = json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        request = None
+    if not isinstance(request, dict):
+        _send(conn, {"error": "invalid request"})
+    elif request.get("ph_version") != __version__:
+        _send(conn, {"error": f"ph serve is running ph {__version__}"})
+    elif request.get("ping"):
+        _send(conn, {"ok": True})
+    else:
+        started = time.perf_counter()
+        state.refresh()
+        exit_code = _run_request(request, conn)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"ph {' '.join(request.get('argv') or [])} -> {exit_code} ({elapsed_ms:.1f} ms)", flush=True)
+
+
+def _ping(path: Path) -> bool:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(2)
+        sock.connect(str(path))
+        sock.sendall(json.dumps({"ph_version": __version__, "ping": True}).encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        return bool(sock.recv(65536))
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def run_serve(*, ph_root: Path, idle_timeout: float | None) -> int:
+    if not hasattr(socket, "AF_UNIX"):
+        print("❌ ph serve needs Unix domain sockets, which this platform does not provide.")
+        return 1
+
+    path = serve_socket_path(ph_root=ph_root)
+    if path.exists():
+        if _ping(path):
+            print(f"❌ ph serve is already running for {ph_root} ({path})")
+            return 1
+        path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Only the owner may connect: requests carry the caller's environment and run with the daemon's permissions.
+    previous_umask = os.umask(0o177)
+    try:
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+    except OSError as exc:
+        server.close()
+        print(f"❌ Could not listen on {path}: {exc}")
+        return 1
+    finally:
+        os.umask(previous_umask)
+    server.listen(64)
+    if idle_timeout:
+        server.settimeout(idle_timeout)
+
+    def _stop(_signum: int, _frame: object) -> None:
+        raise KeyboardInterrupt
+
+    previous_handler = signal.signal(signal.SIGTERM, _stop)
+    state = _ServeState(ph_root=ph_root)
+    print(f"ph serve: listening on {path} (Ctrl-C to stop)", flush=True)
+    try:
+        while True:
+            try:
+                conn, _addr = server.accept()
+            except TimeoutError:
+                print(f"ph serve: idle for {idle_timeout:g}s, exiting", flush=True)
+                break
+            # One request at a time: commands mutate files and swap the process-wide cwd and stdout/stderr.
+            with conn:
+                conn.settimeout(None)
+                try:
+                    _handle_connection(conn, state)
+                except OSError as exc:
+                    print(f"ph serve: client connection failed: {exc}", file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        state.close()
+        server.close()
+        with contextlib.suppress(OSError):
+            path.unlink()
+    print("ph serve: stopped", flush=True)
+    return 0
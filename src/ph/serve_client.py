@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+from . import __version__
+from .root import RootResolutionError, resolve_ph_root
+
+SERVE_SOCKET_RELATIVE_PATH = Path(".project-handbook") / "serve.sock"
+
+# Commands that spawn subprocesses, run until stopped or manage the daemon itself always run in-process.
+IN_PROCESS_COMMANDS = frozenset({"serve", "watch", "init", "end-session", "evidence"})
+
+_OPTIONS_WITH_VALUES = frozenset({"--root", "--scope"})
+
+
+def serve_socket_path(*, ph_root: Path) -> Path:
+    return ph_root / SERVE_SOCKET_RELATIVE_PATH
+
+
+def _scan_argv(argv: list[str]) -> tuple[str | None, str | None]:
+    """Return (--root value, command) without building the argparse tree."""
+    root: str | None = None
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token == "--":
+            return root, None
+        if token.startswith("--") and "=" in token:
+            name, _, value = token.partition("=")
+            if name == "--root":
+                root = value
+        elif token in _OPTIONS_WITH_VALUES:
+            if token == "--root" and i + 1 < len(argv):
+                root = argv[i + 1]
+            i += 1
+        elif not token.startswith("-"):
+            return root, token
+        i += 1
+    return root, None
+
+
+def forward_to_server(*, argv: list[str], env: Mapping[str, str]) -> int | None:
+    """Run `argv` on a running `ph serve` daemon for this root; None means "run in-process instead"."""
+    if env.get("PH_NO_SERVE") == "1":
+        return None
+    root_override, command = _scan_argv(argv)
+    if command is None or command in IN_PROCESS_COMMANDS:
+        return None
+    try:
+        ph_root = resolve_ph_root(override=root_override)
+    except RootResolutionError:
+        return None
+    path = serve_socket_path(ph_root=ph_root)
+    if not path.exists():
+        return None
+
+    # Imported here so plain invocations without a daemon do not pay for it.
+    import socket
+
+    request = {"ph_version": __version__, "argv": argv, "env": dict(env), "cwd": os.getcwd()}
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+    except OSError:
+        sock.close()
+        # Stale socket or daemon gone before the request was delivered: nothing ran, so run it here.
+        return None
+
+    # The daemon streams one JSON message per line: {"stdout": ...} / {"stderr": ...} while the command runs, then
+    # {"exit_code": ...}. An {"error": ...} before any output means it refused the request without running it; any
+    # other ending may come after the command ran (or half ran), so it is never run again here.
+    streamed = False
+    try:
+        with sock, sock.makefile("rb") as reader:
+            for line in reader:
+                message = json.loads(line.decode("utf-8"))
+                if not isinstance(message, dict):
+                    continue
+                if "stdout" in message:
+                    sys.stdout.write(str(message["stdout"]))
+                    sys.stdout.flush()
+                    streamed = True
+                elif "stderr" in message:
+                    sys.stderr.write(str(message["stderr"]))
+                    sys.stderr.flush()
+                    streamed = True
+                elif "exit_code" in message:
+                    return int(message["exit_code"])
+                elif "error" in message and not streamed:
+                    return None
+    except (OSError, ValueError) as exc:
+        sys.stderr.write(f"ph serve: lost connection while running the command: {exc}\n")
+        return 1
+    sys.stderr.write("ph serve: the daemon closed the connection before the command finished\n")
+    return 1
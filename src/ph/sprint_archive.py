@@ -9,8 +9,10 @@ from typing import Any
 from .clock import local_today_from_now as clock_local_today_from_now
 from .clock import now as clock_now
 from .context import Context
+from .handbook_index import invalidate_handbook_index
 from .remediation_hints import next_commands_no_active_sprint, ph_prefix, print_next_commands
 from .sprint import get_sprint_dates, sprint_dir_from_id
+from .task_index import TaskIndex
 
 
 def _get_current_sprint_path(*, ph_data_root: Path) -> Path | None:
@@ -106,7 +108,9 @@ def archive_sprint_directory(*, ctx: Context, sprint_dir: Path, env: dict[str, s
     if target.exists():
         raise FileExistsError(f"Archive target already exists: {target}")
 
+    task_index = TaskIndex(ph_data_root=ctx.ph_data_root)
     shutil.move(str(sprint_dir), str(target))
+    invalidate_handbook_index(ph_data_root=ctx.ph_data_root)
 
     current_link = ctx.ph_data_root / "sprints" / "current"
     if current_link.exists() or current_link.is_symlink():
@@ -116,6 +120,7 @@ def archive_sprint_directory(*, ctx: Context, sprint_dir: Path, env: dict[str, s
             pass
 
     _record_sprint_archive_entry(ph_data_root=ctx.ph_data_root, sprint_id=sprint_id, target=target, env=env)
+    task_index.record_sprint_move(old_dir=sprint_dir, new_dir=target)
     return target
 
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from . import sprint_status
 from .clock import today as clock_today
 from .context import Context
+from .generated_files import write_if_changed
 from .remediation_hints import next_commands_no_active_sprint, print_next_commands
 from .sprint import sprint_dir_from_id
 
@@ -98,7 +99,8 @@ def run_sprint_burndown(*, ph_project_root: Path, ctx: Context, sprint: str | No
 
     burndown_file = sprint_dir / "burndown.md"
     today = clock_today(env=env).isoformat()
-    burndown_file.write_text(
+    write_if_changed(
+        burndown_file,
         "\n".join(
             [
                 "---",
@@ -117,7 +119,6 @@ def run_sprint_burndown(*, ph_project_root: Path, ctx: Context, sprint: str | No
                 "",
             ]
         ),
-        encoding="utf-8",
     )
     print(f"\nSaved to: {burndown_file}")
     return 0
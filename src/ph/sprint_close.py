@@ -6,6 +6,7 @@ from pathlib import Path
 from . import sprint_status
 from .clock import local_today_from_now as clock_local_today_from_now
 from .context import Context
+from .handbook_index import parse_task_fields
 from .release import (
     get_current_release,
     get_release_timeline_info,
@@ -58,22 +59,6 @@ def _read_sprint_plan_metadata(*, sprint_dir: Path) -> dict[str, str]:
     return meta
 
 
-def _parse_task_yaml(text: str) -> dict[str, object]:
-    task_data: dict[str, object] = {}
-    for line in text.splitlines():
-        if ":" not in line or line.strip().startswith("-"):
-            continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip()
-        if value.startswith("[") and value.endswith("]"):
-            items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
-            task_data[key] = [item for item in items if item]
-        else:
-            task_data[key] = value
-    return task_data
-
-
 def _collect_tasks_legacy_order(*, sprint_dir: Path) -> list[dict[str, object]]:
     tasks_dir = sprint_dir / "tasks"
     if not tasks_dir.exists():
@@ -90,7 +75,7 @@ def _collect_tasks_legacy_order(*, sprint_dir: Path) -> list[dict[str, object]]:
             content = task_yaml.read_text(encoding="utf-8")
         except Exception:
             continue
-        tasks.append(_parse_task_yaml(content))
+        tasks.append(parse_task_fields(content))
     return tasks
 
 
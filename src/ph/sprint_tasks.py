@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from .context import Context
+from .handbook_index import sprint_task_entries
 from .sprint import sprint_dir_from_id
 from .task_taxonomy import effective_task_type_and_session
 
@@ -25,40 +26,17 @@ def _resolve_sprint_dir(*, ctx: Context, sprint: str | None) -> Path | None:
     return sprint_dir_from_id(ph_data_root=ctx.ph_data_root, sprint_id=sprint.strip())
 
 
-def _parse_task_yaml(text: str) -> dict[str, Any]:
-    task_data: dict[str, Any] = {}
-    for line in text.splitlines():
-        if ":" not in line or line.strip().startswith("-"):
-            continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip()
-        if value.startswith("[") and value.endswith("]"):
-            items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
-            task_data[key] = [item for item in items if item]
-        else:
-            task_data[key] = value
-    return task_data
-
-
 def list_sprint_tasks(*, sprint_dir: Path) -> list[dict[str, Any]]:
     tasks: list[dict[str, Any]] = []
     tasks_dir = sprint_dir / "tasks"
     if not tasks_dir.exists():
         return tasks
 
-    for task_dir in sorted(tasks_dir.iterdir()):
-        if not task_dir.is_dir():
-            continue
-        task_yaml = task_dir / "task.yaml"
-        if not task_yaml.exists():
-            continue
-        try:
-            content = task_yaml.read_text(encoding="utf-8")
-        except Exception:
+    for entry in sprint_task_entries(sprint_dir=sprint_dir):
+        task_data = entry.fields()
+        if task_data is None:
             continue
-        task_data = _parse_task_yaml(content)
-        task_data["directory"] = task_dir.name
+        task_data["directory"] = entry.task_dir.name
         tasks.append(task_data)
 
     return tasks
@@ -11,8 +11,11 @@ from typing import Any
 
 from .clock import local_today_from_now as clock_local_today_from_now
 from .feature_status_updater import update_all_feature_status
+from .generated_files import write_if_changed
+from .handbook_index import HandbookIndex, SprintRef, get_handbook_index, with_int_values
 from .question_manager import QuestionManager
 from .sprint import get_sprint_dates
+from .status_cache import SprintAggregateCache, sprint_fingerprint
 from .task_taxonomy import effective_task_type_and_session
 
 STAGE_PRIORITY: dict[str, int] = {
@@ -423,36 +426,17 @@ def _load_current_sprint_context(*, sprints_dir: Path) -> dict[str, Any] | None:
         return None
 
     tasks: list[dict[str, Any]] = []
-    tasks_dir = sprint_dir / "tasks"
-    if tasks_dir.exists():
-        for task_dir in sorted(tasks_dir.iterdir()):
-            if not task_dir.is_dir():
-                continue
-            task_yaml = task_dir / "task.yaml"
-            if not task_yaml.exists():
-                continue
-            data: dict[str, Any] = {}
-            try:
-                content = task_yaml.read_text(encoding="utf-8")
-            except Exception:
-                continue
-            for line in content.splitlines():
-                if ":" not in line or line.strip().startswith("-"):
-                    continue
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-                if value.startswith("[") and value.endswith("]"):
-                    items = [item.strip().strip("\"'") for item in value[1:-1].split(",") if item.strip()]
-                    data[key] = items
-                else:
-                    data[key] = value
-            data.setdefault("id", task_dir.name.split("-")[0])
-            try:
-                data["story_points"] = int(data.get("story_points", 0))
-            except Exception:
-                data["story_points"] = 0
-            tasks.append(data)
+    index = get_handbook_index(ph_data_root=sprints_dir.parent)
+    for entry in sorted(index.tasks(sprint_dir), key=lambda e: e.task_dir):
+        data = entry.fields()
+        if data is None:
+            continue
+        data.setdefault("id", entry.task_dir.name.split("-")[0])
+        try:
+            data["story_points"] = int(data.get("story_points", 0))
+        except Exception:
+            data["story_points"] = 0
+        tasks.append(data)
 
     return {"sprint_id": sprint_dir.name, "tasks": tasks}
 
@@ -474,7 +458,7 @@ def _write_status_summary(
     summary_path.parent.mkdir(parents=True, exist_ok=True)
     context = _load_current_sprint_context(sprints_dir=sprints_dir)
     if not context:
-        summary_path.write_text("# Current Sprint\n\n_No active sprint_\n", encoding="utf-8")
+        write_if_changed(summary_path, "# Current Sprint\n\n_No active sprint_\n")
         return
 
     sprint_id = str(context["sprint_id"])
@@ -638,11 +622,58 @@ def _write_status_summary(
     lines.append("")
     lines.append("> Generated with `ph status`.")
 
-    summary_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_if_changed(summary_path, "\n".join(lines) + "\n")
+
+
+def _aggregate_sprint(*, index: HandbookIndex, sprint: SprintRef) -> tuple[dict[str, Any], bool]:
+    """Return a sprint's phase entry, bucket totals and per-feature open/done tasks, and whether every task parsed."""
+    complete = True
+    sprint_tasks: list[dict[str, Any]] = []
+    for entry in index.tasks(sprint.path):
+        if not entry.has_yaml:
+            continue
+        if entry.error is not None:
+            print(f"Error parsing {entry.task_yaml}: {entry.error}")
+            complete = False
+            continue
+        sprint_tasks.append(with_int_values(entry.fields() or {}))
+
+    phase: dict[str, Any] | None = None
+    totals: dict[str, int] = {}
+    features_data: dict[str, dict[str, list[dict[str, Any]]]] = {}
+    if sprint_tasks:
+        phase = {
+            "name": sprint.sprint_id,
+            "phase": sprint.sprint_id,
+            "title": f"Sprint {sprint.sprint_id}",
+            "features": list({t.get("feature", "unknown") for t in sprint_tasks}),
+            "decisions": list({t.get("decision", "") for t in sprint_tasks if t.get("decision")}),
+            "tasks": [t.get("id") for t in sprint_tasks],
+        }
+
+        for t in sprint_tasks:
+            b = _bucket(str(t.get("status", "")))
+            totals[b] = totals.get(b, 0) + 1
+            feat = str(t.get("feature", "unknown"))
+            features_data.setdefault(feat, {"open": [], "done": []})
+            entry_payload = {
+                "id": t.get("id"),
+                "title": t.get("title"),
+                "sprint": sprint.sprint_id,
+                "status": t.get("status"),
+                "story_points": t.get("story_points"),
+                "prio": t.get("prio"),
+                "decision": t.get("decision"),
+            }
+            if b == "done":
+                features_data[feat]["done"].append(entry_payload)
+            else:
+                features_data[feat]["open"].append(entry_payload)
+
+    return {"phase": phase, "totals": totals, "features": features_data}, complete
 
 
 def _generate_status_payload(*, ph_data_root: Path, env: dict[str, str]) -> dict[str, Any]:
-    sprints = ph_data_root / "sprints"
     features = ph_data_root / "features"
     roadmap = ph_data_root / "roadmap"
 
@@ -658,7 +689,7 @@ def _generate_status_payload(*, ph_data_root: Path, env: dict[str, str]) -> dict
     feature_index_map: dict[str, int] = {}
 
     if features.exists():
-        feature_dirs = sorted([p for p in features.iterdir() if p.is_dir()])
+        feature_dirs = get_handbook_index(ph_data_root=ph_data_root).feature_dirs()
         for idx, feat_dir in enumerate(feature_dirs):
             feature_key = feat_dir.name
 
@@ -692,75 +723,29 @@ def _generate_status_payload(*, ph_data_root: Path, env: dict[str, str]) -> dict
                 except Exception:
                     pass
 
-    if sprints.exists():
-        for year_dir in sprints.iterdir():
-            if not year_dir.is_dir() or year_dir.name == "current":
-                continue
-
-            for sprint_dir in year_dir.iterdir():
-                if not sprint_dir.is_dir() or not sprint_dir.name.startswith("SPRINT-"):
-                    continue
-
-                tasks_dir = sprint_dir / "tasks"
-                if not tasks_dir.exists():
-                    continue
-
-                sprint_tasks: list[dict[str, Any]] = []
-                for task_dir in tasks_dir.iterdir():
-                    if not task_dir.is_dir():
-                        continue
-                    task_yaml = task_dir / "task.yaml"
-                    if not task_yaml.exists():
-                        continue
-                    try:
-                        content = task_yaml.read_text(encoding="utf-8")
-                        task_data: dict[str, Any] = {}
-                        for line in content.splitlines():
-                            if ":" in line and not line.strip().startswith("-"):
-                                key, value = line.split(":", 1)
-                                key = key.strip()
-                                value = value.strip()
-                                if value.isdigit():
-                                    task_data[key] = int(value)
-                                elif value.startswith("[") and value.endswith("]"):
-                                    items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
-                                    task_data[key] = [item for item in items if item]
-                                else:
-                                    task_data[key] = value
-                        sprint_tasks.append(task_data)
-                    except Exception as exc:
-                        print(f"Error parsing {task_yaml}: {exc}")
-
-                if sprint_tasks:
-                    phases.append(
-                        {
-                            "name": sprint_dir.name,
-                            "phase": sprint_dir.name,
-                            "title": f"Sprint {sprint_dir.name}",
-                            "features": list({t.get("feature", "unknown") for t in sprint_tasks}),
-                            "decisions": list({t.get("decision", "") for t in sprint_tasks if t.get("decision")}),
-                            "tasks": [t.get("id") for t in sprint_tasks],
-                        }
-                    )
+    # Archived sprints are skipped; every other sprint's slice is reused while its task files are unchanged.
+    index = get_handbook_index(ph_data_root=ph_data_root)
+    sprint_cache = SprintAggregateCache(ph_data_root=ph_data_root)
+    for sprint in index.sprints():
+        if sprint.archived:
+            continue
 
-                    for t in sprint_tasks:
-                        b = _bucket(str(t.get("status", "")))
-                        totals[b] = totals.get(b, 0) + 1
-                        feat = str(t.get("feature", "unknown"))
-                        features_data.setdefault(feat, {"open": [], "done": []})
-                        entry = {
-                            "id": t.get("id"),
-                            "title": t.get("title"),
-                            "sprint": sprint_dir.name,
-                            "status": t.get("status"),
-                            "story_points": t.get("story_points"),
-                            "prio": t.get("prio"),
-                            "decision": t.get("decision"),
-                        }
-                        if b == "done":
-                            features_data[feat]["done"].append(entry)
-                        else:
-                            features_data[feat]["open"].append(entry)
+        fingerprint, newest_ns = sprint_fingerprint(sprint.path)
+        aggregate = sprint_cache.lookup(sprint.path, fingerprint)
+        if aggregate is None:
+            aggregate, complete = _aggregate_sprint(index=index, sprint=sprint)
+            if complete:
+                sprint_cache.store(sprint.path, fingerprint, newest_ns, aggregate)
+
+        if aggregate["phase"] is not None:
+            phases.append(aggregate["phase"])
+        for bucket, count in aggregate["totals"].items():
+            totals[bucket] = totals.get(bucket, 0) + count
+        for feat, lists in aggregate["features"].items():
+            merged = features_data.setdefault(feat, {"open": [], "done": []})
+            merged["open"].extend(lists["open"])
+            merged["done"].extend(lists["done"])
+    sprint_cache.save()
 
     feature_keys = [s["key"] for s in features_summary]
     dependent_counts = {feature: 0 for feature in feature_keys}
@@ -824,10 +809,19 @@ class StatusResult(tuple[Path, Path, str | None]):
         return self[2]
 
 
-def run_status(
-    *, ph_root: Path, ph_project_root: Path, ph_data_root: Path, env: dict[str, str] | None = None
-) -> StatusResult:
-    env = env or os.environ
+def _keep_generated_at(current_json: Path, payload: dict[str, Any]) -> None:
+    """Reuse the existing file's `generated_at` when nothing else changed, so an unchanged status is not rewritten."""
+    try:
+        text = current_json.read_text(encoding="utf-8")
+        stamp = json.loads(text).get("generated_at")
+    except Exception:
+        return
+    if isinstance(stamp, str) and json.dumps({**payload, "generated_at": stamp}, indent=2) + "\n" == text:
+        payload["generated_at"] = stamp
+
+
+def write_status_files(*, ph_project_root: Path, ph_data_root: Path, env: dict[str, str]) -> tuple[Path, Path]:
+    """Write `status/current.json` and `status/current_summary.md` (without touching feature status files)."""
     status_dir = ph_data_root / "status"
     status_dir.mkdir(parents=True, exist_ok=True)
 
@@ -835,7 +829,8 @@ def run_status(
     summary_md = status_dir / "current_summary.md"
 
     payload = _generate_status_payload(ph_data_root=ph_data_root, env=env)
-    current_json.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    _keep_generated_at(current_json, payload)
+    write_if_changed(current_json, json.dumps(payload, indent=2) + "\n")
     _write_status_summary(
         ph_project_root=ph_project_root,
         ph_data_root=ph_data_root,
@@ -844,6 +839,14 @@ def run_status(
         status_payload=payload,
         env=env,
     )
+    return current_json, summary_md
+
+
+def run_status(
+    *, ph_root: Path, ph_project_root: Path, ph_data_root: Path, env: dict[str, str] | None = None
+) -> StatusResult:
+    env = env or os.environ
+    current_json, summary_md = write_status_files(ph_project_root=ph_project_root, ph_data_root=ph_data_root, env=env)
 
     feature_update_message: str | None = None
     try:
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .parse_cache import cache_dir_for
+
+STATUS_CACHE_SCHEMA = 1
+STATUS_CACHE_FILENAME = "status_sprints.json"
+
+# Sprints with a task.yaml modified this recently are aggregated but not persisted (same rule as the parse cache).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def sprint_fingerprint(sprint_dir: Path) -> tuple[list[list[Any]], int]:
+    """Return `[task dir, task.yaml mtime_ns, size]` rows in directory order, plus the newest mtime seen."""
+    rows: list[list[Any]] = []
+    newest = 0
+    try:
+        scan = os.scandir(sprint_dir / "tasks")
+    except OSError:
+        return rows, newest
+    with scan:
+        for entry in scan:
+            if not entry.is_dir():
+                continue
+            try:
+                st = os.stat(os.path.join(entry.path, "task.yaml"))
+            except OSError:
+                rows.append([entry.name, None, None])
+                continue
+            rows.append([entry.name, st.st_mtime_ns, st.st_size])
+            newest = max(newest, st.st_mtime_ns)
+    return rows, newest
+
+
+class SprintAggregateCache:
+    """Per-sprint slices of the `ph status` payload (phase entry, bucket totals, per-feature open/done tasks).
+
+    Stored as `.cache/status_sprints.json` and keyed by each sprint's task-file fingerprint, so a status run only
+    reads and aggregates the task files of sprints that changed since the previous run.
+    """
+
+    def __init__(self, *, ph_data_root: Path) -> None:
+        self.ph_data_root = ph_data_root
+        self.path = cache_dir_for(ph_data_root=ph_data_root) / STATUS_CACHE_FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._sprints: dict[str, dict[str, Any]] = {}
+        self._seen: dict[str, dict[str, Any]] = {}
+        self._now_ns = time.time_ns()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(payload, dict):
+            return
+        if payload.get("ph_version") != __version__ or payload.get("schema") != STATUS_CACHE_SCHEMA:
+            return
+        sprints = payload.get("sprints")
+        if isinstance(sprints, dict):
+            self._sprints = sprints
+
+    def _key(self, sprint_dir: Path) -> str:
+        try:
+            return sprint_dir.relative_to(self.ph_data_root).as_posix()
+        except ValueError:
+            return sprint_dir.as_posix()
+
+    def lookup(self, sprint_dir: Path, fingerprint: list[list[Any]]) -> dict[str, Any] | None:
+        key = self._key(sprint_dir)
+        record = self._sprints.get(key)
+        if record is None or record.get("fingerprint") != fingerprint:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._seen[key] = record
+        return record["aggregate"]
+
+    def store(self, sprint_dir: Path, fingerprint: list[list[Any]], newest_ns: int, aggregate: dict[str, Any]) -> None:
+        if self._now_ns - newest_ns < _RACY_WINDOW_NS:
+            return
+        self._seen[self._key(sprint_dir)] = {"fingerprint": fingerprint, "aggregate": aggregate}
+
+    def save(self) -> None:
+        """Persist the sprints seen in this run (sprints that disappeared are dropped)."""
+        if self._seen == self._sprints:
+            return
+        payload = {"ph_version": __version__, "schema": STATUS_CACHE_SCHEMA, "sprints": self._seen}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return
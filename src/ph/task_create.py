@@ -8,9 +8,12 @@ from typing import Any
 
 from .clock import today as clock_today
 from .context import Context
+from .handbook_index import get_handbook_index, invalidate_handbook_index
 from .release import get_current_release
 from .shell_quote import shell_quote
+from .task_index import TaskIndex
 from .task_taxonomy import TASK_TYPE_TO_SESSION, normalize_task_type
+from .task_yaml import load_task_yaml
 
 
 def slugify(value: str, *, max_len: int = 80) -> str:
@@ -24,44 +27,6 @@ def slugify(value: str, *, max_len: int = 80) -> str:
     return raw[:max_len].rstrip("-") or "task"
 
 
-def _read_head(path: Path, *, max_lines: int = 80) -> str:
-    try:
-        with path.open("r", encoding="utf-8") as handle:
-            lines: list[str] = []
-            for _ in range(max_lines):
-                line = handle.readline()
-                if not line:
-                    break
-                lines.append(line)
-            return "".join(lines)
-    except Exception:
-        return ""
-
-
-def _find_markdown_with_frontmatter_id(folder: Path, decision_id: str) -> Path | None:
-    if not folder.exists():
-        return None
-    needle = f"id: {decision_id}"
-    for candidate in sorted(folder.glob("*.md")):
-        head = _read_head(candidate, max_lines=120)
-        if needle in head:
-            return candidate
-    return None
-
-
-def _find_markdown_with_heading_id(folder: Path, decision_id: str) -> Path | None:
-    import re
-
-    if not folder.exists():
-        return None
-    pattern = re.compile(rf"^###\\s+{re.escape(decision_id)}\\b", re.MULTILINE)
-    for candidate in sorted(folder.glob("*.md")):
-        text = candidate.read_text(encoding="utf-8", errors="ignore")
-        if pattern.search(text):
-            return candidate
-    return None
-
-
 def resolve_decision_doc(*, ph_data_root: Path, decision_id: str, feature: str) -> Path | None:
     decision_id = (decision_id or "").strip()
     feature = (feature or "").strip()
@@ -69,40 +34,31 @@ def resolve_decision_doc(*, ph_data_root: Path, decision_id: str, feature: str)
         return None
 
     if decision_id.startswith("ADR-"):
-        return _find_markdown_with_frontmatter_id(ph_data_root / "adr", decision_id)
-
-    if decision_id.startswith("FDR-"):
-        if feature:
-            found = _find_markdown_with_frontmatter_id(ph_data_root / "features" / feature / "fdr", decision_id)
-            if found:
-                return found
-        for feature_dir in sorted((ph_data_root / "features").glob("*")):
-            if not feature_dir.is_dir() or feature_dir.name == "implemented":
-                continue
-            found = _find_markdown_with_frontmatter_id(feature_dir / "fdr", decision_id)
-            if found:
-                return found
+        kind, source = "adr", "front_matter"
+    elif decision_id.startswith("FDR-"):
+        kind, source = "fdr", "front_matter"
+    elif decision_id.startswith("DR-"):
+        kind, source = "decision-register", "heading"
+    else:
         return None
 
-    if decision_id.startswith("DR-"):
-        if feature:
-            found = _find_markdown_with_heading_id(
-                ph_data_root / "features" / feature / "decision-register", decision_id
-            )
-            if found:
-                return found
-        found = _find_markdown_with_heading_id(ph_data_root / "decision-register", decision_id)
-        if found:
-            return found
-        for feature_dir in sorted((ph_data_root / "features").glob("*")):
-            if not feature_dir.is_dir() or feature_dir.name == "implemented":
-                continue
-            found = _find_markdown_with_heading_id(feature_dir / "decision-register", decision_id)
-            if found:
-                return found
+    candidates = [
+        ref.path
+        for ref in get_handbook_index(ph_data_root=ph_data_root).decisions().refs(decision_id)
+        if ref.kind == kind
+        and ref.source == source
+        and not ref.nested
+        and not ref.implemented
+        and (source != "heading" or ref.level == 3)
+    ]
+    if not candidates:
         return None
-
-    return None
+    # The task's own feature wins; otherwise project-level folders come first, then features by name.
+    own = ph_data_root / "features" / feature if feature else None
+    for path in candidates:
+        if own is not None and own in path.parents:
+            return path
+    return candidates[0]
 
 
 def relative_markdown_link(*, from_dir: Path, target: Path) -> str:
@@ -336,6 +292,8 @@ due: {due_date.strftime("%Y-%m-%d")}
 links: []
 """
     (task_dir / "task.yaml").write_text(task_yaml, encoding="utf-8")
+    invalidate_handbook_index(ph_data_root=ctx.ph_data_root)
+    TaskIndex(ph_data_root=ctx.ph_data_root).record_task(task_dir=task_dir, fields=load_task_yaml(task_yaml).fields())
 
     decision_doc = resolve_decision_doc(ph_data_root=ctx.ph_data_root, decision_id=decision, feature=feature)
     if decision_doc:
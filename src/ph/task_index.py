@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .handbook_index import get_handbook_index
+from .parse_cache import cache_dir_for
+from .task_yaml import load_task_yaml
+
+TASK_INDEX_SCHEMA = 1
+TASK_INDEX_FILENAME = "task_index.json"
+
+
+@dataclass(frozen=True)
+class TaskLocation:
+    sprint_dir: Path
+    task_dir: Path
+    status: str
+
+
+def task_id_for_dir(task_dir_name: str, declared_id: str = "") -> str:
+    """Return the task ID a task directory is looked up by (`TASK-001-slug` -> `TASK-001`)."""
+    if declared_id and task_dir_name.startswith(f"{declared_id}-"):
+        return declared_id
+    return "-".join(task_dir_name.split("-")[:2])
+
+
+class TaskIndex:
+    """Persisted map of task ID -> task directories (with their status) across active and archived sprints.
+
+    Stored as `.cache/task_index.json`. The index is trusted while the sprint container directories it recorded
+    (`sprints/`, `sprints/<year>/`, `sprints/archive/<year>/`) keep their mtimes, so a lookup costs a handful of
+    stats instead of a walk of the archive; any other change to the sprint layout triggers a rebuild. `ph task create`
+    and `ph sprint archive` update it in place.
+    """
+
+    def __init__(self, *, ph_data_root: Path) -> None:
+        self.ph_data_root = ph_data_root
+        self.path = cache_dir_for(ph_data_root=ph_data_root) / TASK_INDEX_FILENAME
+        self.rebuilt = False
+        self._tasks: dict[str, list[dict[str, Any]]] = {}
+        self._dirs: dict[str, int] = {}
+        if not self._load() or not self._is_fresh():
+            self.rebuild()
+
+    def _load(self) -> bool:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return False
+        if not isinstance(payload, dict):
+            return False
+        if payload.get("ph_version") != __version__ or payload.get("schema") != TASK_INDEX_SCHEMA:
+            return False
+        tasks, dirs = payload.get("tasks"), payload.get("dirs")
+        if not isinstance(tasks, dict) or not isinstance(dirs, dict) or not dirs:
+            return False
+        self._tasks, self._dirs = tasks, dirs
+        return True
+
+    def _container_dirs(self) -> list[Path]:
+        sprints_dir = self.ph_data_root / "sprints"
+        dirs = [sprints_dir]
+        for parent in (sprints_dir, sprints_dir / "archive"):
+            try:
+                children = sorted(parent.iterdir())
+            except OSError:
+                continue
+            dirs.extend(child for child in children if child.is_dir() and not child.is_symlink())
+        return dirs
+
+    def _mtime(self, rel: str) -> int:
+        try:
+            return (self.ph_data_root / rel).stat().st_mtime_ns
+        except OSError:
+            return -1
+
+    def _is_fresh(self) -> bool:
+        return all(self._mtime(rel) == mtime for rel, mtime in self._dirs.items())
+
+    def _stamp_dirs(self) -> None:
+        self._dirs = {}
+        for path in self._container_dirs():
+            rel = path.relative_to(self.ph_data_root).as_posix()
+            self._dirs[rel] = self._mtime(rel)
+
+    def _record(self, *, task_dir: Path, fields: dict[str, Any] | None) -> tuple[str, dict[str, Any]]:
+        fields = fields or {}
+        try:
+            st = (task_dir / "task.yaml").stat()
+            stamp = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamp = None
+        record = {
+            "dir": task_dir.relative_to(self.ph_data_root).as_posix(),
+            "status": str(fields.get("status", "")).strip().lower(),
+            "stamp": stamp,
+        }
+        return task_id_for_dir(task_dir.name, str(fields.get("id", "")).strip()), record
+
+    def _add_sprint(self, sprint_dir: Path) -> None:
+        for entry in get_handbook_index(ph_data_root=self.ph_data_root).tasks(sprint_dir):
+            if not entry.has_yaml:
+                continue
+            task_id, record = self._record(task_dir=entry.task_dir, fields=entry.fields())
+            self._tasks.setdefault(task_id, []).append(record)
+
+    def _drop_prefix(self, rel_prefix: str) -> None:
+        for task_id in list(self._tasks):
+            kept = [r for r in self._tasks[task_id] if not r["dir"].startswith(rel_prefix)]
+            if kept:
+                self._tasks[task_id] = kept
+            else:
+                del self._tasks[task_id]
+
+    def rebuild(self) -> None:
+        self._tasks = {}
+        for sprint in get_handbook_index(ph_data_root=self.ph_data_root).sprints():
+            self._add_sprint(sprint.path)
+        self._stamp_dirs()
+        self.rebuilt = True
+        self.save()
+
+    def record_task(self, *, task_dir: Path, fields: dict[str, Any]) -> None:
+        task_id, record = self._record(task_dir=task_dir, fields=fields)
+        records = [r for r in self._tasks.get(task_id, []) if r["dir"] != record["dir"]]
+        self._tasks[task_id] = [*records, record]
+        self._stamp_dirs()
+        self.save()
+
+    def record_sprint_move(self, *, old_dir: Path, new_dir: Path) -> None:
+        self._drop_prefix(old_dir.relative_to(self.ph_data_root).as_posix() + "/")
+        self._drop_prefix(new_dir.relative_to(self.ph_data_root).as_posix() + "/")
+        self._add_sprint(new_dir)
+        self._stamp_dirs()
+        self.save()
+
+    def locate(self, task_id: str, *, archived_only: bool = False) -> list[TaskLocation]:
+        """Return the indexed directories of `task_id` (status re-read only when task.yaml changed since indexing)."""
+        locations: list[TaskLocation] = []
+        for record in self._tasks.get(task_id, []):
+            rel = record["dir"]
+            if archived_only and not rel.startswith("sprints/archive/"):
+                continue
+            task_dir = self.ph_data_root / rel
+            if not task_dir.name.startswith(f"{task_id}-"):
+                continue
+            status = record["status"]
+            try:
+                st = (task_dir / "task.yaml").stat()
+            except OSError:
+                continue
+            if record["stamp"] != [st.st_mtime_ns, st.st_size]:
+                try:
+                    text = (task_dir / "task.yaml").read_text(encoding="utf-8")
+                except OSError:
+                    text = ""
+                status = str(load_task_yaml(text).fields().get("status", "")).strip().lower()
+            locations.append(TaskLocation(sprint_dir=task_dir.parent.parent, task_dir=task_dir, status=status))
+        return locations
+
+    def save(self) -> None:
+        payload = {"ph_version": __version__, "schema": TASK_INDEX_SCHEMA, "dirs": self._dirs, "tasks": self._tasks}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return
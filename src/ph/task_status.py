@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 from .context import Context
+from .handbook_index import invalidate_handbook_index, parse_task_fields
 from .task_view import list_sprint_tasks
 from .work_item_archiver import archive_work_items_for_task, refresh_indexes
 
@@ -20,22 +21,6 @@ def _get_current_sprint_path(*, ph_data_root: Path) -> Path | None:
     return resolved if resolved.exists() else None
 
 
-def _parse_task_yaml(text: str) -> dict[str, Any]:
-    task_data: dict[str, Any] = {}
-    for line in text.splitlines():
-        if ":" not in line or line.strip().startswith("-"):
-            continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip()
-        if value.startswith("[") and value.endswith("]"):
-            items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
-            task_data[key] = [item for item in items if item]
-        else:
-            task_data[key] = value
-    return task_data
-
-
 def _normalize_list(value: Any) -> list[str]:
     if isinstance(value, list):
         return [str(v).strip() for v in value if str(v).strip()]
@@ -76,6 +61,7 @@ def _update_task_yaml_status(*, task_yaml: Path, new_status: str) -> None:
     if not replaced:
         lines.append(f"status: {new_status}")
     task_yaml.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    invalidate_handbook_index()
 
 
 def run_task_status(*, ctx: Context, task_id: str, new_status: str, force: bool) -> int:
@@ -112,7 +98,7 @@ def run_task_status(*, ctx: Context, task_id: str, new_status: str, force: bool)
         print(f"❌ Task metadata not found: {task_yaml}")
         return 1
 
-    meta = _parse_task_yaml(task_yaml.read_text(encoding="utf-8"))
+    meta = parse_task_fields(task_yaml.read_text(encoding="utf-8"))
     dependencies = _normalize_list(meta.get("depends_on", []))
 
     if new_status in {"doing", "review", "done"} and dependencies:
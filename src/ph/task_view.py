@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Any
 
 from .context import Context
+from .handbook_index import parse_task_fields, sprint_task_entries
+from .task_index import TaskIndex
 from .task_taxonomy import effective_task_type_and_session
 
 
@@ -29,22 +31,6 @@ def _get_current_sprint_path(*, ph_data_root: Path) -> Path | None:
     return resolved if resolved.exists() else None
 
 
-def _parse_task_yaml(text: str) -> dict[str, Any]:
-    task_data: dict[str, Any] = {}
-    for line in text.splitlines():
-        if ":" not in line or line.strip().startswith("-"):
-            continue
-        key, value = line.split(":", 1)
-        key = key.strip()
-        value = value.strip()
-        if value.startswith("[") and value.endswith("]"):
-            items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
-            task_data[key] = [item for item in items if item]
-        else:
-            task_data[key] = value
-    return task_data
-
-
 def _normalize_list(value: Any) -> list[str]:
     if isinstance(value, list):
         return [str(v).strip() for v in value if str(v).strip()]
@@ -64,18 +50,11 @@ def list_sprint_tasks(*, sprint_dir: Path) -> list[dict[str, Any]]:
     if not tasks_dir.exists():
         return tasks
 
-    for task_dir in sorted(tasks_dir.iterdir()):
-        if not task_dir.is_dir():
-            continue
-        task_yaml = task_dir / "task.yaml"
-        if not task_yaml.exists():
-            continue
-        try:
-            content = task_yaml.read_text(encoding="utf-8")
-        except Exception:
+    for entry in sprint_task_entries(sprint_dir=sprint_dir):
+        task_data = entry.fields()
+        if task_data is None:
             continue
-        task_data = _parse_task_yaml(content)
-        task_data["directory"] = task_dir.name
+        task_data["directory"] = entry.task_dir.name
         tasks.append(task_data)
     return tasks
 
@@ -97,50 +76,35 @@ def _resolve_task_dir(*, ctx: Context, task_id: str, sprint_dir: Path | None = N
                 if task_dir.is_dir() and task_dir.name.startswith(f"{task_id}-"):
                     return sprint_dir, task_dir
 
-    archive_root = ctx.ph_data_root / "sprints" / "archive"
-    matches: list[tuple[Path, Path]] = []
-    if archive_root.exists():
-        for task_yaml in archive_root.glob(f"**/tasks/{task_id}-*/task.yaml"):
-            task_dir = task_yaml.parent
-            sprint_dir = task_dir.parent.parent
-            if task_dir.is_dir() and sprint_dir.is_dir():
-                matches.append((sprint_dir, task_dir))
+    index = TaskIndex(ph_data_root=ctx.ph_data_root)
+    matches = index.locate(task_id, archived_only=True)
+    if not matches and not index.rebuilt:
+        # The index only notices sprints being added, moved or removed; rebuild once before giving up.
+        index.rebuild()
+        matches = index.locate(task_id, archived_only=True)
 
     if not matches:
         return None
 
     if len(matches) > 1:
-        enriched: list[tuple[str, Path, Path]] = []
-        for sprint_dir, task_dir in matches:
-            task_yaml = task_dir / "task.yaml"
-            try:
-                status = str(_parse_task_yaml(task_yaml.read_text(encoding="utf-8")).get("status", "")).strip().lower()
-            except OSError:
-                status = ""
-            enriched.append((status, sprint_dir, task_dir))
-
-        in_progress = [
-            (sprint_dir, task_dir)
-            for status, sprint_dir, task_dir in enriched
-            if status in {"doing", "review", "blocked"}
-        ]
+        in_progress = [match for match in matches if match.status in {"doing", "review", "blocked"}]
         if len(in_progress) == 1:
-            return in_progress[0]
+            return in_progress[0].sprint_dir, in_progress[0].task_dir
 
-        not_done = [(sprint_dir, task_dir) for status, sprint_dir, task_dir in enriched if status and status != "done"]
+        not_done = [match for match in matches if match.status and match.status != "done"]
         if len(not_done) == 1:
-            return not_done[0]
+            return not_done[0].sprint_dir, not_done[0].task_dir
 
         print(f"❌ Task {task_id} is ambiguous (found in multiple archived sprints).")
-        for status, sprint_dir, task_dir in enriched[:12]:
-            status_info = status or "unknown"
-            print(f"  - {sprint_dir.name} [{status_info}]: {task_dir}")
-        if len(enriched) > 12:
-            print(f"  - (+{len(enriched) - 12} more)")
+        for match in matches[:12]:
+            status_info = match.status or "unknown"
+            print(f"  - {match.sprint_dir.name} [{status_info}]: {match.task_dir}")
+        if len(matches) > 12:
+            print(f"  - (+{len(matches) - 12} more)")
         print("Set an active sprint via `ph sprint open --sprint SPRINT-...`, then retry.")
         return None
 
-    return matches[0]
+    return matches[0].sprint_dir, matches[0].task_dir
 
 
 def run_task_list(*, ctx: Context) -> int:
@@ -217,7 +181,7 @@ def run_task_show(*, ctx: Context, task_id: str) -> int:
     if not task_yaml.exists():
         print(f"❌ Task metadata not found: {task_yaml}")
         return 1
-    task = _parse_task_yaml(task_yaml.read_text(encoding="utf-8"))
+    task = parse_task_fields(task_yaml.read_text(encoding="utf-8"))
     task["directory"] = task_dir.name
 
     print(f"📋 TASK DETAILS: {task_id}")
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Any
+
+_BOOLEANS = {"true": True, "false": False, "True": True, "False": False, "TRUE": True, "FALSE": False}
+
+
+def _flow_list(value: str) -> list[str]:
+    items = [part.strip().strip("\"'") for part in value[1:-1].split(",")]
+    return [item for item in items if item] if "" in items else items
+
+
+class TaskYaml:
+    """The flat YAML subset of task.yaml (and phase.yaml), tokenized once into typed values.
+
+    - `strings`: the text after the first colon of every `key: value` line, `[a, b]` split into lists (nested keys
+      are flattened, later keys win)
+    - `resolved`: the keys whose typed value differs from `strings`: integers, booleans, and the `- item` block list
+      collected under a `key:` with an empty value
+    - `comments`: `# key: value` comment lines, kept for the string views only
+    """
+
+    __slots__ = ("strings", "resolved", "comments")
+
+    def __init__(self, strings: dict[str, Any], resolved: dict[str, Any], comments: dict[str, Any]) -> None:
+        self.strings = strings
+        self.resolved = resolved
+        self.comments = comments
+
+    def fields(self) -> dict[str, Any]:
+        """Strings, with `[a, b]` values split into lists."""
+        return {**self.strings, **self.comments} if self.comments else dict(self.strings)
+
+    def typed(self) -> dict[str, Any]:
+        """Inline and block lists, booleans and integers resolved; comment lines dropped."""
+        return {**self.strings, **self.resolved}
+
+    def mapping(self) -> dict[str, Any]:
+        """Strings with surrounding quotes removed and block lists collected (the phase.yaml view)."""
+        data: dict[str, Any] = {}
+        for key, value in self.strings.items():
+            if not isinstance(value, str):
+                data[key] = value
+            elif value:
+                data[key] = value.strip("\"'")
+            else:
+                data[key] = [item.strip("\"'") for item in self.resolved.get(key, ())] or ""
+        return data
+
+    def to_record(self) -> dict[str, Any]:
+        return {"strings": self.strings, "resolved": self.resolved, "comments": self.comments}
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> TaskYaml:
+        return cls(record["strings"], record["resolved"], record["comments"])
+
+
+def load_task_yaml(text: str) -> TaskYaml:
+    strings: dict[str, Any] = {}
+    resolved: dict[str, Any] = {}
+    comments: dict[str, Any] = {}
+    block: list[str] | None = None
+    for raw in text.splitlines():
+        key, sep, value = raw.partition(":")
+        if sep:
+            key = key.strip()
+            # Comment lines, list items and empty keys take the slower path below.
+            if key and key[0] not in "#-":
+                value = value.strip()
+                block = None
+                if not value:
+                    block = resolved[key] = []
+                elif value.isascii() and value.isdigit():
+                    resolved[key] = int(value)
+                elif value in _BOOLEANS:
+                    resolved[key] = _BOOLEANS[value]
+                elif value[0] == "[" and value[-1] == "]":
+                    value = resolved[key] = _flow_list(value)
+                elif key in resolved:
+                    # A repeated key replaces the earlier typed value too.
+                    del resolved[key]
+                strings[key] = value
+                continue
+        line = raw.strip()
+        if not line:
+            continue
+        first = line[0]
+        if first == "-":
+            if block is not None:
+                block.append(line[1:].lstrip())
+        elif first == "#":
+            # Comment lines are kept for the string views but never open or close a block list.
+            if sep:
+                value = value.strip()
+                comments[key] = _flow_list(value) if value[-1:] == "]" and value[:1] == "[" else value
+        else:
+            block = None
+            if sep:
+                strings[key] = value.strip()
+    return TaskYaml(strings, resolved, comments)
@@ -2,10 +2,20 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 
 from .adr.validate import validate_adrs
+from .generated_files import write_if_changed
+from .handbook_index import HandbookIndex, get_handbook_index
+from .handbook_tree import HandbookTree
+from .parse_cache import ParseCache, get_parse_cache
 from .task_taxonomy import ALLOWED_TASK_TYPES, SESSION_TO_LEGACY_TASK_TYPE, TASK_TYPE_TO_SESSION
+from .task_yaml import load_task_yaml
+from .validate_profile import ValidationProfile
+from .validation_units import ValidationUnits, domain_for_path, run_unit
 
 _DR_ID_RE = re.compile(r"^DR-\d{4}$", re.IGNORECASE)
 _HEADING_INSIDE_LIST_RE = re.compile(r"^\s*(?:[-*]|\d+\.)\s+#{1,6}\s+\S")
@@ -67,96 +77,6 @@ def _strip(val: str) -> str:
     return val.strip().strip('"').strip("'")
 
 
-def parse_simple_yaml_mapping(text: str) -> dict:
-    data: dict = {}
-    lines = text.splitlines()
-    i = 0
-    n = len(lines)
-
-    def is_kv(line: str) -> bool:
-        return ":" in line and not line.lstrip().startswith("-")
-
-    while i < n:
-        raw = lines[i]
-        line = raw.rstrip("\n")
-        if not line.strip():
-            i += 1
-            continue
-        if not line.startswith(" ") and is_kv(line):
-            key, val = line.split(":", 1)
-            k = key.strip()
-            v = val.strip()
-            if v == "":
-                if i + 1 < n and lines[i + 1].lstrip().startswith("- "):
-                    i += 1
-                    arr = []
-                    while i < n and lines[i].startswith("  - "):
-                        arr.append(_strip(lines[i].split("- ", 1)[1]))
-                        i += 1
-                    data[k] = arr
-                    continue
-                if i + 1 < n and lines[i + 1].startswith("  "):
-                    i += 1
-                    sub = {}
-                    while i < n and lines[i].startswith("  ") and is_kv(lines[i].strip()):
-                        sk, sv = lines[i].strip().split(":", 1)
-                        sub[_strip(sk)] = _strip(sv)
-                        i += 1
-                    data[k] = sub
-                    continue
-                data[k] = ""
-            else:
-                data[k] = _strip(v)
-            i += 1
-            continue
-        i += 1
-    return data
-
-
-def parse_simple_yaml_task_list(text: str) -> list:
-    items = []
-    current = None
-    mode_list_key = None
-    for raw in text.splitlines():
-        if raw.startswith("- "):
-            if current is not None:
-                items.append(current)
-            current = {}
-            mode_list_key = None
-            remainder = raw[2:].strip()
-            if remainder and ":" in remainder:
-                k, v = remainder.split(":", 1)
-                current[_strip(k)] = _strip(v)
-            continue
-        if current is None:
-            continue
-        if raw.startswith("  ") and ":" in raw and not raw.strip().startswith("- "):
-            k, v = raw.strip().split(":", 1)
-            k = _strip(k)
-            v = v.strip()
-            if v.startswith("[") and v.endswith("]"):
-                list_content = v[1:-1].strip()
-                if list_content:
-                    current[k] = [_strip(item) for item in list_content.split(",")]
-                else:
-                    current[k] = []
-                mode_list_key = None
-            elif v == "":
-                mode_list_key = k
-                current[k] = []
-            else:
-                current[k] = _strip(v)
-                mode_list_key = None
-            continue
-        if raw.startswith("    - ") and mode_list_key:
-            current[mode_list_key].append(_strip(raw.split("- ", 1)[1]))
-            continue
-        mode_list_key = None
-    if current is not None:
-        items.append(current)
-    return items
-
-
 def parse_front_matter(text: str) -> tuple[dict, int, int]:
     lines = text.splitlines()
     if not lines or lines[0].strip() != "---":
@@ -236,59 +156,80 @@ def _looks_like_dr_backlink(link: str) -> bool:
     return bool(re.search(r"DR-\d{4}", candidate, flags=re.IGNORECASE))
 
 
-def validate_adr_fdr_backlinks(*, issues: list[dict], root: Path) -> None:
+def _front_matter_links(text: str) -> list[str] | None:
+    _fm, start, end = parse_front_matter(text)
+    if start == -1 or end == -1:
+        return None
+    return _extract_front_matter_list_field(text, "links")
+
+
+def _front_matter_fields(text: str) -> dict:
+    return parse_front_matter(text)[0]
+
+
+def _dr_backlink_issues(*, issues: list[dict], cache: ParseCache, md: Path, rel_path: str, doc_kind: str) -> None:
+    links = cache.parse(md, "front_matter_links", _front_matter_links)
+    if links is None:
+        return
+    if not any(_looks_like_dr_backlink(link) for link in links):
+        issues.append(
+            {
+                "path": rel_path,
+                "code": f"{doc_kind.lower()}_missing_dr_backlink",
+                "severity": "error",
+                "message": (
+                    f"{doc_kind} YAML front matter must include at least one DR backlink in `links:`.\n"
+                    "  expected: links contains a path like decision-register/DR-0001-....md\n"
+                    f"  found_links: {links}\n"
+                ),
+                "found_links": links,
+            }
+        )
+
+
+def validate_adr_fdr_backlinks(
+    *, issues: list[dict], root: Path, units: ValidationUnits | None = None, tree: HandbookTree | None = None
+) -> None:
+    cache = get_parse_cache(ph_data_root=root)
+    tree = tree or HandbookTree(root)
     adr_dir = root / "adr"
     if adr_dir.exists():
-        for md in sorted(adr_dir.rglob("*.md")):
+        for md in sorted(tree.with_suffix(".md", "adr")):
             rel_path = md.relative_to(root).as_posix()
-            text = read(md)
-            _fm, start, end = parse_front_matter(text)
-            if start == -1 or end == -1:
-                continue
-            links = _extract_front_matter_list_field(text, "links")
-            if not any(_looks_like_dr_backlink(link) for link in links):
-                issues.append(
-                    {
-                        "path": rel_path,
-                        "code": "adr_missing_dr_backlink",
-                        "severity": "error",
-                        "message": (
-                            "ADR YAML front matter must include at least one DR backlink in `links:`.\n"
-                            "  expected: links contains a path like decision-register/DR-0001-....md\n"
-                            f"  found_links: {links}\n"
-                        ),
-                        "found_links": links,
-                    }
-                )
+            run_unit(
+                units,
+                issues,
+                f"adr_backlink:{rel_path}",
+                [f"file:{rel_path}"],
+                lambda out, md=md, rel_path=rel_path: _dr_backlink_issues(
+                    issues=out, cache=cache, md=md, rel_path=rel_path, doc_kind="ADR"
+                ),
+                domains=("decision",),
+            )
 
     features_dir = root / "features"
     if not features_dir.exists():
         return
 
-    for md in sorted(features_dir.rglob("fdr/*.md")):
+    for md in sorted(tree.files("features", match=lambda rel_dir, name: _is_fdr_markdown(rel_dir, name))):
         try:
             rel_path = md.relative_to(root).as_posix()
         except Exception:
             rel_path = str(md)
-        text = read(md)
-        _fm, start, end = parse_front_matter(text)
-        if start == -1 or end == -1:
-            continue
-        links = _extract_front_matter_list_field(text, "links")
-        if not any(_looks_like_dr_backlink(link) for link in links):
-            issues.append(
-                {
-                    "path": rel_path,
-                    "code": "fdr_missing_dr_backlink",
-                    "severity": "error",
-                    "message": (
-                        "FDR YAML front matter must include at least one DR backlink in `links:`.\n"
-                        "  expected: links contains a path like decision-register/DR-0001-....md\n"
-                        f"  found_links: {links}\n"
-                    ),
-                    "found_links": links,
-                }
-            )
+        run_unit(
+            units,
+            issues,
+            f"fdr_backlink:{rel_path}",
+            [f"file:{rel_path}"],
+            lambda out, md=md, rel_path=rel_path: _dr_backlink_issues(
+                issues=out, cache=cache, md=md, rel_path=rel_path, doc_kind="FDR"
+            ),
+            domains=("feature",),
+        )
+
+
+def _is_fdr_markdown(rel_dir: str, name: str) -> bool:
+    return rel_dir.rpartition("/")[2] == "fdr" and name.endswith(".md")
 
 
 def _iter_dr_search_dirs(*, ph_data_root: Path, feature: str | None) -> tuple[list[Path], list[str]]:
@@ -324,31 +265,39 @@ def _dr_entry_exists(*, ph_data_root: Path, dr_id: str, feature: str | None) ->
     if not _DR_ID_RE.match(dr_id):
         return False
 
-    pattern = re.compile(rf"^#{{1,6}}\s+{re.escape(dr_id)}\b", flags=re.MULTILINE)
-    dirs, _labels = _iter_dr_search_dirs(ph_data_root=ph_data_root, feature=feature)
-    for folder in dirs:
-        if not folder.exists():
+    feature = (feature or "").strip()
+    for ref in get_handbook_index(ph_data_root=ph_data_root).decisions().refs(dr_id):
+        if ref.kind != "decision-register" or ref.source != "heading":
             continue
-        for candidate in sorted(folder.rglob("*.md")):
-            if pattern.search(read(candidate)):
-                return True
+        # Mirrors `_iter_dr_search_dirs`: the project register plus the task's feature (or every feature).
+        if ref.feature is None or not feature or (ref.feature == feature and not ref.implemented):
+            return True
     return False
 
 
-def validate_front_matter(*, issues: list[dict], rules: dict, root: Path, ph_root: Path, scope: str) -> None:
+def validate_front_matter(
+    *,
+    issues: list[dict],
+    rules: dict,
+    root: Path,
+    ph_root: Path,
+    scope: str,
+    units: ValidationUnits | None = None,
+    tree: HandbookTree | None = None,
+) -> None:
     if not rules.get("validation", {}).get("require_front_matter", True):
         return
 
     internal_system_root = ph_root / ".project-handbook" / "system"
+    cache = get_parse_cache(ph_data_root=root)
+    tree = tree or HandbookTree(root)
+    # In project scope the data root contains the system scope tree; it is validated by `--scope system`.
+    system_rel = _relative_dir(internal_system_root, root) if scope == "project" else None
 
-    for md in root.rglob("*.md"):
-        if scope == "project":
-            try:
-                md.resolve().relative_to(internal_system_root.resolve())
-                continue
-            except Exception:
-                pass
+    for md in tree.with_suffix(".md"):
         rel_path = md.relative_to(root)
+        if system_rel is not None and rel_path.parts[: len(system_rel)] == system_rel:
+            continue
         if rel_path.as_posix() == "status/current_summary.md":
             continue
         rel_str = rel_path.as_posix()
@@ -358,9 +307,27 @@ def validate_front_matter(*, issues: list[dict], rules: dict, root: Path, ph_roo
         if "backlog/" in rel_str and md.name == "triage.md":
             continue
 
-        fm, _, _ = parse_front_matter(read(md))
-        if not fm:
-            issues.append({"path": str(md), "code": "front_matter_missing", "severity": "error"})
+        run_unit(
+            units,
+            issues,
+            f"front_matter:{rel_str}",
+            [f"file:{rel_str}"],
+            lambda out, md=md: _front_matter_issues(issues=out, cache=cache, md=md),
+            domains=(domain_for_path(rel_str),),
+        )
+
+
+def _relative_dir(path: Path, root: Path) -> tuple[str, ...] | None:
+    try:
+        return path.resolve().relative_to(root.resolve()).parts
+    except ValueError:
+        return None
+
+
+def _front_matter_issues(*, issues: list[dict], cache: ParseCache, md: Path) -> None:
+    fm = cache.parse(md, "front_matter", _front_matter_fields, default={})
+    if not fm:
+        issues.append({"path": str(md), "code": "front_matter_missing", "severity": "error"})
 
 
 def validate_session_end_index(*, issues: list[dict], ph_project_root: Path, ph_root: Path) -> None:
@@ -579,7 +546,7 @@ def _extract_front_matter_tags(text: str) -> list[str]:
 
 
 def validate_system_scope_artifacts_in_project_scope(
-    *, issues: list[dict], rules: dict, root: Path, ph_root: Path, scope: str
+    *, issues: list[dict], rules: dict, root: Path, ph_root: Path, scope: str, tree: HandbookTree | None = None
 ) -> None:
     if scope != "project":
         return
@@ -626,9 +593,11 @@ def validate_system_scope_artifacts_in_project_scope(
                 }
             )
 
+    if tree is None or tree.root != root:
+        tree = HandbookTree(root)
     sprints_dir = root / "sprints"
     if sprints_dir.exists():
-        for task_yaml in sorted(sprints_dir.rglob("task.yaml")):
+        for task_yaml in sorted(tree.named("task.yaml", "sprints")):
             if "tasks" not in task_yaml.parts:
                 continue
             try:
@@ -658,7 +627,7 @@ def validate_system_scope_artifacts_in_project_scope(
 
     adr_dir = root / "adr"
     if adr_dir.exists():
-        for md in sorted(adr_dir.rglob("*.md")):
+        for md in sorted(tree.with_suffix(".md", "adr")):
             text = read(md)
             tags = _extract_front_matter_tags(text)
             if any(tag in adr_tags for tag in tags):
@@ -722,7 +691,7 @@ def normalize_roadmap_links(*, rules: dict, root: Path, scope: str, quick: bool)
         new_text = prefix + new_body
         if text.endswith("\n") and not new_text.endswith("\n"):
             new_text += "\n"
-        roadmap_path.write_text(new_text, encoding="utf-8")
+        write_if_changed(roadmap_path, new_text)
 
     return count
 
@@ -801,368 +770,377 @@ def _validate_sprint_gate_task_docs(*, issues: list[dict], task_dir: Path, task_
         )
 
 
-def validate_sprints(*, issues: list[dict], rules: dict, root: Path) -> None:
-    sprint_rules = rules.get("sprint_tasks", {})
-    story_rules = rules.get("story_points", {})
-
+def validate_sprints(*, issues: list[dict], rules: dict, root: Path, units: ValidationUnits | None = None) -> None:
     sprints_dir = root / "sprints"
     if not sprints_dir.exists():
         return
 
-    for year_dir in sprints_dir.iterdir():
-        if not year_dir.is_dir() or year_dir.name == "current":
+    index = get_handbook_index(ph_data_root=root)
+    for sprint in index.sprints():
+        if sprint.archived:
+            continue
+        sprint_dir = sprint.path
+        tasks_dir = sprint_dir / "tasks"
+        if not tasks_dir.exists():
             continue
 
-        for sprint_dir in year_dir.iterdir():
-            if not sprint_dir.is_dir() or not sprint_dir.name.startswith("SPRINT-"):
-                continue
+        rel_sprint = sprint_dir.relative_to(root).as_posix()
+        run_unit(
+            units,
+            issues,
+            f"sprint:{rel_sprint}",
+            [f"tree:{rel_sprint}"],
+            lambda out, sprint_dir=sprint_dir: _validate_sprint_dir(
+                issues=out, rules=rules, root=root, index=index, sprint_dir=sprint_dir
+            ),
+            # Research tasks also depend on the decision registers searched for their DR id.
+            domains=(f"sprint:{sprint_dir.name}", "decision"),
+        )
 
-            tasks_dir = sprint_dir / "tasks"
-            if not tasks_dir.exists():
-                continue
 
-            sprint_task_ids = set()
-            sprint_tasks: list[tuple[Path, dict]] = []
+def _dr_search_deps(*, ph_data_root: Path, feature: str | None) -> set[str]:
+    dirs, _labels = _iter_dr_search_dirs(ph_data_root=ph_data_root, feature=feature)
+    deps = {f"tree:{d.relative_to(ph_data_root).as_posix()}" for d in dirs}
+    if not (feature or "").strip():
+        deps.update({"list:features", "list:features/implemented"})
+    return deps
 
-            for task_dir in sorted(tasks_dir.iterdir()):
-                if not task_dir.is_dir():
-                    continue
 
-                task_yaml = task_dir / "task.yaml"
-                if not task_yaml.exists():
-                    issues.append({"path": str(task_dir), "code": "task_yaml_missing", "severity": "error"})
-                    continue
+def _validate_sprint_dir(
+    *, issues: list[dict], rules: dict, root: Path, index: HandbookIndex, sprint_dir: Path
+) -> set[str]:
+    """Validate one sprint's tasks; returns dependency keys consulted outside the sprint directory."""
+    sprint_rules = rules.get("sprint_tasks", {})
+    story_rules = rules.get("story_points", {})
+    deps: set[str] = set()
 
-                try:
-                    content = task_yaml.read_text(encoding="utf-8")
-                    task_data: dict = {}
+    sprint_task_ids = set()
+    sprint_tasks: list[tuple[Path, dict]] = []
 
-                    for line in content.splitlines():
-                        if ":" in line and not line.strip().startswith("-"):
-                            key, value = line.split(":", 1)
-                            key = key.strip()
-                            value = value.strip()
+    for entry in sorted(index.tasks(sprint_dir), key=lambda e: e.task_dir):
+        task_dir = entry.task_dir
+        task_yaml = entry.task_yaml
+        if not entry.has_yaml:
+            issues.append({"path": str(task_dir), "code": "task_yaml_missing", "severity": "error"})
+            continue
 
-                            if value.startswith("[") and value.endswith("]"):
-                                items = [item.strip().strip("\"'") for item in value[1:-1].split(",")]
-                                task_data[key] = [item for item in items if item]
-                            else:
-                                task_data[key] = value
+        if entry.error is not None:
+            issues.append(
+                {
+                    "path": str(task_yaml),
+                    "code": "task_yaml_parse_error",
+                    "severity": "error",
+                    "message": str(entry.error),
+                }
+            )
+            continue
 
-                    sprint_tasks.append((task_dir, task_data))
+        task_data: dict = entry.fields() or {}
+        sprint_tasks.append((task_dir, task_data))
 
-                    task_id = task_data.get("id")
-                    if task_id:
-                        sprint_task_ids.add(task_id)
+        task_id = task_data.get("id")
+        if task_id:
+            sprint_task_ids.add(task_id)
 
-                except Exception as exc:
-                    issues.append(
-                        {
-                            "path": str(task_yaml),
-                            "code": "task_yaml_parse_error",
-                            "severity": "error",
-                            "message": str(exc),
-                        }
-                    )
+    status_map: dict[str, str] = {}
+    for _, task in sprint_tasks:
+        task_id = str(task.get("id", "")).strip()
+        if not task_id:
+            continue
+        status_map[task_id] = str(task.get("status", "")).strip().lower()
 
-            status_map: dict[str, str] = {}
-            for _, task in sprint_tasks:
-                task_id = str(task.get("id", "")).strip()
-                if not task_id:
-                    continue
-                status_map[task_id] = str(task.get("status", "")).strip().lower()
-
-            sprint_gate_task_ids: list[str] = []
-
-            for task_dir, task_data in sprint_tasks:
-                task_yaml = task_dir / "task.yaml"
-
-                required_fields = sprint_rules.get(
-                    "required_task_fields",
-                    [
-                        "id",
-                        "title",
-                        "feature",
-                        "decision",
-                        "owner",
-                        "status",
-                        "story_points",
-                        "prio",
-                        "due",
-                        "acceptance",
-                    ],
-                )
+    sprint_gate_task_ids: list[str] = []
 
-                raw_session = _strip(str(task_data.get("session", ""))).strip().lower()
-                raw_task_type = _strip(str(task_data.get("task_type", ""))).strip().lower()
+    for task_dir, task_data in sprint_tasks:
+        task_yaml = task_dir / "task.yaml"
 
-                effective_task_type: str | None = None
-                derived_session: str | None = None
+        required_fields = sprint_rules.get(
+            "required_task_fields",
+            [
+                "id",
+                "title",
+                "feature",
+                "decision",
+                "owner",
+                "status",
+                "story_points",
+                "prio",
+                "due",
+                "acceptance",
+            ],
+        )
 
-                if raw_task_type:
-                    if raw_task_type not in _ALLOWED_TASK_TYPES:
+        raw_session = _strip(str(task_data.get("session", ""))).strip().lower()
+        raw_task_type = _strip(str(task_data.get("task_type", ""))).strip().lower()
+
+        effective_task_type: str | None = None
+        derived_session: str | None = None
+
+        if raw_task_type:
+            if raw_task_type not in _ALLOWED_TASK_TYPES:
+                issues.append(
+                    {
+                        "path": str(task_yaml),
+                        "code": "task_type_invalid",
+                        "severity": "error",
+                        "expected": sorted(_ALLOWED_TASK_TYPES),
+                        "found": raw_task_type,
+                        "message": (
+                            "Invalid task_type value in task.yaml.\n"
+                            f"  expected: one of {sorted(_ALLOWED_TASK_TYPES)}\n"
+                            f"  found: {raw_task_type}\n"
+                        ),
+                    }
+                )
+            else:
+                effective_task_type = raw_task_type
+                derived_session = TASK_TYPE_TO_SESSION.get(effective_task_type)
+
+                if raw_session:
+                    if derived_session and raw_session != derived_session:
                         issues.append(
                             {
                                 "path": str(task_yaml),
-                                "code": "task_type_invalid",
+                                "code": "task_type_session_mismatch",
                                 "severity": "error",
-                                "expected": sorted(_ALLOWED_TASK_TYPES),
-                                "found": raw_task_type,
+                                "task_type": effective_task_type,
+                                "expected": derived_session,
+                                "found": raw_session,
                                 "message": (
-                                    "Invalid task_type value in task.yaml.\n"
-                                    f"  expected: one of {sorted(_ALLOWED_TASK_TYPES)}\n"
-                                    f"  found: {raw_task_type}\n"
+                                    "task_type and session are inconsistent.\n"
+                                    f"  task_type: {effective_task_type}\n"
+                                    f"  expected_session: {derived_session}\n"
+                                    f"  found_session: {raw_session}\n"
                                 ),
                             }
                         )
-                    else:
-                        effective_task_type = raw_task_type
-                        derived_session = TASK_TYPE_TO_SESSION.get(effective_task_type)
-
-                        if raw_session:
-                            if derived_session and raw_session != derived_session:
-                                issues.append(
-                                    {
-                                        "path": str(task_yaml),
-                                        "code": "task_type_session_mismatch",
-                                        "severity": "error",
-                                        "task_type": effective_task_type,
-                                        "expected": derived_session,
-                                        "found": raw_session,
-                                        "message": (
-                                            "task_type and session are inconsistent.\n"
-                                            f"  task_type: {effective_task_type}\n"
-                                            f"  expected_session: {derived_session}\n"
-                                            f"  found_session: {raw_session}\n"
-                                        ),
-                                    }
-                                )
-                            else:
-                                issues.append(
-                                    {
-                                        "path": str(task_yaml),
-                                        "code": "task_session_deprecated",
-                                        "severity": "warning",
-                                        "message": (
-                                            "Deprecated key `session:` present in task.yaml; remove it "
-                                            "(derived from task_type)."
-                                        ),
-                                    }
-                                )
-                else:
-                    if raw_session:
-                        inferred = SESSION_TO_LEGACY_TASK_TYPE.get(raw_session)
-                        if inferred:
-                            effective_task_type = inferred
-                            derived_session = raw_session
-                            issues.append(
-                                {
-                                    "path": str(task_yaml),
-                                    "code": "task_type_missing_legacy_session",
-                                    "severity": "warning",
-                                    "message": (
-                                        "task.yaml is missing task_type; inferred from legacy session. "
-                                        "Add task_type and remove session."
-                                    ),
-                                }
-                            )
-                        else:
-                            issues.append(
-                                {
-                                    "path": str(task_yaml),
-                                    "code": "session_invalid",
-                                    "severity": "error",
-                                    "found": raw_session,
-                                    "message": f"Unknown session value in task.yaml: {raw_session}",
-                                }
-                            )
                     else:
                         issues.append(
                             {
                                 "path": str(task_yaml),
-                                "code": "task_type_missing",
-                                "severity": "error",
-                                "expected": sorted(_ALLOWED_TASK_TYPES),
-                                "found": "<missing>",
+                                "code": "task_session_deprecated",
+                                "severity": "warning",
                                 "message": (
-                                    "Missing task_type in task.yaml.\n"
-                                    f"  expected: one of {sorted(_ALLOWED_TASK_TYPES)}\n"
-                                    "  found: <missing>\n"
+                                    "Deprecated key `session:` present in task.yaml; remove it "
+                                    "(derived from task_type)."
                                 ),
                             }
                         )
-
-                # Allow older validation_rules.json configs to keep listing `session` as required. For
-                # modern tasks, `session` is derived from `task_type` and no longer needs to be stored.
-                missing = [k for k in required_fields if k not in task_data]
-                if "session" in missing and derived_session:
-                    missing = [k for k in missing if k != "session"]
-                if "task_type" in missing and effective_task_type:
-                    missing = [k for k in missing if k != "task_type"]
-                if missing and sprint_rules.get("require_task_yaml", True):
+        else:
+            if raw_session:
+                inferred = SESSION_TO_LEGACY_TASK_TYPE.get(raw_session)
+                if inferred:
+                    effective_task_type = inferred
+                    derived_session = raw_session
                     issues.append(
-                        {"path": str(task_yaml), "code": "task_missing_fields", "severity": "error", "missing": missing}
+                        {
+                            "path": str(task_yaml),
+                            "code": "task_type_missing_legacy_session",
+                            "severity": "warning",
+                            "message": (
+                                "task.yaml is missing task_type; inferred from legacy session. "
+                                "Add task_type and remove session."
+                            ),
+                        }
                     )
-
-                if effective_task_type == "sprint-gate":
-                    task_id = _strip(str(task_data.get("id", ""))).strip()
-                    if task_id:
-                        sprint_gate_task_ids.append(task_id)
-                    _validate_sprint_gate_task_docs(
-                        issues=issues,
-                        task_dir=task_dir,
-                        task_yaml=task_yaml,
-                        task_id=task_id,
+                else:
+                    issues.append(
+                        {
+                            "path": str(task_yaml),
+                            "code": "session_invalid",
+                            "severity": "error",
+                            "found": raw_session,
+                            "message": f"Unknown session value in task.yaml: {raw_session}",
+                        }
                     )
+            else:
+                issues.append(
+                    {
+                        "path": str(task_yaml),
+                        "code": "task_type_missing",
+                        "severity": "error",
+                        "expected": sorted(_ALLOWED_TASK_TYPES),
+                        "found": "<missing>",
+                        "message": (
+                            "Missing task_type in task.yaml.\n"
+                            f"  expected: one of {sorted(_ALLOWED_TASK_TYPES)}\n"
+                            "  found: <missing>\n"
+                        ),
+                    }
+                )
 
-                decision = task_data.get("decision")
-                if decision and sprint_rules.get("require_single_decision_per_task", True):
-                    decision = str(decision).strip()
-                    decision_norm = decision.upper()
-                    if derived_session == "research-discovery":
-                        if not re.match(r"^DR-\d{4}$", decision_norm):
-                            issues.append(
-                                {
-                                    "path": str(task_yaml),
-                                    "code": "task_decision_invalid",
-                                    "severity": "error",
-                                    "expected": "DR-XXXX",
-                                    "found": decision,
-                                    "message": (
-                                        "Decision id mismatch for session research-discovery: "
-                                        f"expected DR-XXXX, found {decision}"
-                                    ),
-                                }
-                            )
-                        else:
-                            feature = str(task_data.get("feature", "")).strip()
-                            if not _dr_entry_exists(ph_data_root=root, dr_id=decision_norm, feature=feature):
-                                _dirs, dir_labels = _iter_dr_search_dirs(ph_data_root=root, feature=feature)
-                                issues.append(
-                                    {
-                                        "path": str(task_yaml),
-                                        "code": "task_dr_missing",
-                                        "severity": "error",
-                                        "dr_id": decision_norm,
-                                        "searched_dirs": dir_labels,
-                                        "message": (
-                                            "Task references missing Decision Register entry.\n"
-                                            f"  dr_id: {decision_norm}\n"
-                                            f"  searched_dirs: {dir_labels}\n"
-                                        ),
-                                    }
-                                )
-                    elif derived_session == "task-execution":
-                        if not (decision_norm.startswith("ADR-") or decision_norm.startswith("FDR-")):
-                            issues.append(
-                                {
-                                    "path": str(task_yaml),
-                                    "code": "task_decision_invalid",
-                                    "severity": "error",
-                                    "expected": "ADR-XXXX or FDR-...",
-                                    "found": decision,
-                                    "message": (
-                                        "Decision id mismatch for session task-execution: "
-                                        f"expected ADR-XXXX or FDR-..., found {decision}"
-                                    ),
-                                }
-                            )
-
-                story_points = task_data.get("story_points")
-                if story_points and story_rules.get("validate_fibonacci_sequence", True):
-                    try:
-                        sp_int = int(story_points)
-                        allowed_points = story_rules.get("allowed_story_points", [1, 2, 3, 5, 8, 13, 21])
-                        if sp_int not in allowed_points:
-                            issues.append(
-                                {
-                                    "path": str(task_yaml),
-                                    "code": "task_story_points_invalid",
-                                    "severity": "warning",
-                                    "message": f"Story points should use configured sequence: {allowed_points}",
-                                }
-                            )
-                    except Exception:
-                        issues.append(
-                            {"path": str(task_yaml), "code": "task_story_points_not_integer", "severity": "error"}
-                        )
+        # Allow older validation_rules.json configs to keep listing `session` as required. For
+        # modern tasks, `session` is derived from `task_type` and no longer needs to be stored.
+        missing = [k for k in required_fields if k not in task_data]
+        if "session" in missing and derived_session:
+            missing = [k for k in missing if k != "session"]
+        if "task_type" in missing and effective_task_type:
+            missing = [k for k in missing if k != "task_type"]
+        if missing and sprint_rules.get("require_task_yaml", True):
+            issues.append(
+                {"path": str(task_yaml), "code": "task_missing_fields", "severity": "error", "missing": missing}
+            )
+
+        if effective_task_type == "sprint-gate":
+            task_id = _strip(str(task_data.get("id", ""))).strip()
+            if task_id:
+                sprint_gate_task_ids.append(task_id)
+            _validate_sprint_gate_task_docs(
+                issues=issues,
+                task_dir=task_dir,
+                task_yaml=task_yaml,
+                task_id=task_id,
+            )
 
-                if sprint_rules.get("enforce_sprint_scoped_dependencies", True):
-                    depends_on = task_data.get("depends_on", [])
-                    if isinstance(depends_on, str):
-                        depends_on = [depends_on]
-
-                    for dep in depends_on:
-                        if dep == "FIRST_TASK":
-                            continue
-                        if dep and dep not in sprint_task_ids:
-                            issues.append(
-                                {
-                                    "path": str(task_yaml),
-                                    "code": "task_dependency_out_of_sprint",
-                                    "severity": "error",
-                                    "message": (
-                                        f"Task depends on {dep} which is not in current sprint. "
-                                        "Dependencies must be sprint-scoped only."
-                                    ),
-                                }
-                            )
-
-                depends_on = task_data.get("depends_on", [])
-                if isinstance(depends_on, str):
-                    depends_on = [depends_on]
-
-                normalized_status = str(task_data.get("status", "")).strip().lower()
-                advanced_states = {"doing", "review", "done"}
-                if depends_on and normalized_status in advanced_states:
-                    unresolved = []
-                    for dep in depends_on:
-                        if dep == "FIRST_TASK":
-                            continue
-                        dep_status = status_map.get(dep)
-                        if dep_status is None:
-                            continue
-                        if dep_status != "done":
-                            unresolved.append(f"{dep} (status: {dep_status})")
-
-                    if unresolved:
+        decision = task_data.get("decision")
+        if decision and sprint_rules.get("require_single_decision_per_task", True):
+            decision = str(decision).strip()
+            decision_norm = decision.upper()
+            if derived_session == "research-discovery":
+                if not re.match(r"^DR-\d{4}$", decision_norm):
+                    issues.append(
+                        {
+                            "path": str(task_yaml),
+                            "code": "task_decision_invalid",
+                            "severity": "error",
+                            "expected": "DR-XXXX",
+                            "found": decision,
+                            "message": (
+                                "Decision id mismatch for session research-discovery: "
+                                f"expected DR-XXXX, found {decision}"
+                            ),
+                        }
+                    )
+                else:
+                    feature = str(task_data.get("feature", "")).strip()
+                    deps.update(_dr_search_deps(ph_data_root=root, feature=feature))
+                    if not _dr_entry_exists(ph_data_root=root, dr_id=decision_norm, feature=feature):
+                        _dirs, dir_labels = _iter_dr_search_dirs(ph_data_root=root, feature=feature)
                         issues.append(
                             {
                                 "path": str(task_yaml),
-                                "code": "task_dependency_not_done",
+                                "code": "task_dr_missing",
                                 "severity": "error",
-                                "message": "Cannot advance because dependencies are not done: " + ", ".join(unresolved),
+                                "dr_id": decision_norm,
+                                "searched_dirs": dir_labels,
+                                "message": (
+                                    "Task references missing Decision Register entry.\n"
+                                    f"  dr_id: {decision_norm}\n"
+                                    f"  searched_dirs: {dir_labels}\n"
+                                ),
                             }
                         )
+            elif derived_session == "task-execution":
+                if not (decision_norm.startswith("ADR-") or decision_norm.startswith("FDR-")):
+                    issues.append(
+                        {
+                            "path": str(task_yaml),
+                            "code": "task_decision_invalid",
+                            "severity": "error",
+                            "expected": "ADR-XXXX or FDR-...",
+                            "found": decision,
+                            "message": (
+                                "Decision id mismatch for session task-execution: "
+                                f"expected ADR-XXXX or FDR-..., found {decision}"
+                            ),
+                        }
+                    )
 
-                if sprint_rules.get("require_task_directory_files", True):
-                    required_files = sprint_rules.get(
-                        "required_task_files", ["README.md", "steps.md", "commands.md", "checklist.md", "validation.md"]
+        story_points = task_data.get("story_points")
+        if story_points and story_rules.get("validate_fibonacci_sequence", True):
+            try:
+                sp_int = int(story_points)
+                allowed_points = story_rules.get("allowed_story_points", [1, 2, 3, 5, 8, 13, 21])
+                if sp_int not in allowed_points:
+                    issues.append(
+                        {
+                            "path": str(task_yaml),
+                            "code": "task_story_points_invalid",
+                            "severity": "warning",
+                            "message": f"Story points should use configured sequence: {allowed_points}",
+                        }
+                    )
+            except Exception:
+                issues.append({"path": str(task_yaml), "code": "task_story_points_not_integer", "severity": "error"})
+
+        if sprint_rules.get("enforce_sprint_scoped_dependencies", True):
+            depends_on = task_data.get("depends_on", [])
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
+
+            for dep in depends_on:
+                if dep == "FIRST_TASK":
+                    continue
+                if dep and dep not in sprint_task_ids:
+                    issues.append(
+                        {
+                            "path": str(task_yaml),
+                            "code": "task_dependency_out_of_sprint",
+                            "severity": "error",
+                            "message": (
+                                f"Task depends on {dep} which is not in current sprint. "
+                                "Dependencies must be sprint-scoped only."
+                            ),
+                        }
                     )
-                    for req_file in required_files:
-                        if not (task_dir / req_file).exists():
-                            issues.append(
-                                {
-                                    "path": str(task_dir),
-                                    "code": f"task_missing_{req_file.replace('.', '_')}",
-                                    "severity": "warning",
-                                }
-                            )
-
-            if not sprint_gate_task_ids:
+
+        depends_on = task_data.get("depends_on", [])
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+
+        normalized_status = str(task_data.get("status", "")).strip().lower()
+        advanced_states = {"doing", "review", "done"}
+        if depends_on and normalized_status in advanced_states:
+            unresolved = []
+            for dep in depends_on:
+                if dep == "FIRST_TASK":
+                    continue
+                dep_status = status_map.get(dep)
+                if dep_status is None:
+                    continue
+                if dep_status != "done":
+                    unresolved.append(f"{dep} (status: {dep_status})")
+
+            if unresolved:
                 issues.append(
                     {
-                        "path": str(sprint_dir),
-                        "code": "sprint_gate_task_missing",
+                        "path": str(task_yaml),
+                        "code": "task_dependency_not_done",
                         "severity": "error",
-                        "message": (
-                            "Sprint is missing a sprint gate task.\n"
-                            f"  sprint: {sprint_dir.name}\n"
-                            "  expected: at least 1 task under tasks/ with `task_type: sprint-gate`\n"
-                        ),
+                        "message": "Cannot advance because dependencies are not done: " + ", ".join(unresolved),
                     }
                 )
 
+        if sprint_rules.get("require_task_directory_files", True):
+            required_files = sprint_rules.get(
+                "required_task_files", ["README.md", "steps.md", "commands.md", "checklist.md", "validation.md"]
+            )
+            for req_file in required_files:
+                if not (task_dir / req_file).exists():
+                    issues.append(
+                        {
+                            "path": str(task_dir),
+                            "code": f"task_missing_{req_file.replace('.', '_')}",
+                            "severity": "warning",
+                        }
+                    )
+
+    if not sprint_gate_task_ids:
+        issues.append(
+            {
+                "path": str(sprint_dir),
+                "code": "sprint_gate_task_missing",
+                "severity": "error",
+                "message": (
+                    "Sprint is missing a sprint gate task.\n"
+                    f"  sprint: {sprint_dir.name}\n"
+                    "  expected: at least 1 task under tasks/ with `task_type: sprint-gate`\n"
+                ),
+            }
+        )
+
+    return deps
+
 
 def _as_int(val: object) -> int | None:
     try:
@@ -1349,7 +1327,7 @@ def validate_current_sprint_plan_structure(*, issues: list[dict], root: Path, sc
             break
 
 
-def validate_release_plan_slots(*, issues: list[dict], root: Path) -> None:
+def validate_release_plan_slots(*, issues: list[dict], root: Path, tree: HandbookTree | None = None) -> None:
     releases_dir = root / "releases"
     if not releases_dir.exists():
         return
@@ -1357,9 +1335,7 @@ def validate_release_plan_slots(*, issues: list[dict], root: Path) -> None:
     slot_heading_re = re.compile(r"^## Slot ([1-9][0-9]*):\s*(.+)$")
     legacy_slot_heading_re = re.compile(r"^###\s+Slot\s+([1-9][0-9]*)\b", flags=re.IGNORECASE)
 
-    for release_dir in sorted(releases_dir.iterdir()):
-        if not release_dir.is_dir():
-            continue
+    for release_dir in sorted((tree or HandbookTree(root)).subdirs("releases")):
         if not release_dir.name.startswith("v"):
             continue
 
@@ -1499,12 +1475,12 @@ def validate_release_plan_slots(*, issues: list[dict], root: Path) -> None:
                 )
 
 
-def validate_sprint_release_alignment(*, issues: list[dict], root: Path) -> None:
+def validate_sprint_release_alignment(*, issues: list[dict], root: Path, tree: HandbookTree | None = None) -> None:
     sprints_dir = root / "sprints"
     if not sprints_dir.exists():
         return
 
-    for plan_path in sorted(sprints_dir.rglob("plan.md")):
+    for plan_path in sorted((tree or HandbookTree(root)).named("plan.md", "sprints")):
         # Avoid double-validating through `sprints/current` when it is a link.
         try:
             rel = plan_path.relative_to(sprints_dir).as_posix()
@@ -1544,7 +1520,7 @@ def validate_sprint_release_alignment(*, issues: list[dict], root: Path) -> None
             )
 
 
-def validate_release_features_schema(*, issues: list[dict], root: Path) -> None:
+def validate_release_features_schema(*, issues: list[dict], root: Path, tree: HandbookTree | None = None) -> None:
     releases_dir = root / "releases"
     if not releases_dir.exists():
         return
@@ -1586,8 +1562,8 @@ def validate_release_features_schema(*, issues: list[dict], root: Path) -> None:
                     features[current][key] = value
         return planned_sprints, features
 
-    for release_dir in sorted(releases_dir.iterdir()):
-        if not release_dir.is_dir() or not release_dir.name.startswith("v"):
+    for release_dir in sorted((tree or HandbookTree(root)).subdirs("releases")):
+        if not release_dir.name.startswith("v"):
             continue
         features_path = release_dir / "features.yaml"
         if not features_path.exists():
@@ -1676,21 +1652,22 @@ def validate_release_features_schema(*, issues: list[dict], root: Path) -> None:
                 )
 
 
-def validate_decision_register_sources(*, issues: list[dict], root: Path) -> None:
-    dirs: list[Path] = []
+def validate_decision_register_sources(*, issues: list[dict], root: Path, tree: HandbookTree | None = None) -> None:
+    tree = tree or HandbookTree(root)
+    dirs: list[str] = []
     project_dir = root / "decision-register"
     if project_dir.exists():
-        dirs.append(project_dir)
+        dirs.append("decision-register")
     features_dir = root / "features"
     if features_dir.exists():
-        for feat in sorted([p for p in features_dir.iterdir() if p.is_dir()]):
+        for feat in sorted(tree.subdirs("features")):
             dr_dir = feat / "decision-register"
             if dr_dir.exists():
-                dirs.append(dr_dir)
+                dirs.append(f"features/{feat.name}/decision-register")
 
     sources_re = re.compile(r"^##\s+Sources\s*$", flags=re.MULTILINE)
     for dr_dir in dirs:
-        for md in sorted(dr_dir.glob("DR-*.md")):
+        for md in sorted(p for p in tree.entries(dr_dir) if p.name.startswith("DR-") and p.name.endswith(".md")):
             text = read(md)
             fm, _, _ = parse_front_matter(text)
             if str(fm.get("type") or "").strip().lower() != "decision-register":
@@ -1721,7 +1698,7 @@ def validate_phase(*, issues: list[dict], root: Path) -> None:
         phase_yaml = pdir / "phase.yaml"
         if readme.exists() and phase_yaml.exists():
             rfm, _, _ = parse_front_matter(read(readme))
-            data = parse_simple_yaml_mapping(phase_yaml.read_text(encoding="utf-8"))
+            data = load_task_yaml(phase_yaml.read_text(encoding="utf-8")).mapping()
             if isinstance(data, dict):
                 for k in ["phase", "title"]:
                     if str(data.get(k, "")) != str(rfm.get(k, "")):
@@ -1732,6 +1709,41 @@ def validate_phase(*, issues: list[dict], root: Path) -> None:
                     issues.append({"path": str(pdir), "code": "phase_decisions_missing", "severity": "error"})
 
 
+Validator = Callable[[list[dict]], None]
+
+
+def _no_step(_name: str) -> AbstractContextManager[None]:
+    return nullcontext()
+
+
+def _best_effort(validator: Validator) -> Validator:
+    def run(out: list[dict]) -> None:
+        try:
+            validator(out)
+        except Exception:
+            pass
+
+    return run
+
+
+def run_validators(validators: list[Validator], *, jobs: int) -> list[dict]:
+    """Run independent validators (serially or on `jobs` threads) and concatenate their issues in list order.
+
+    Each validator appends to its own list, so the merged report is identical to a serial run whatever the
+    completion order.
+    """
+    results: list[list[dict]] = [[] for _ in validators]
+    if jobs <= 1 or len(validators) <= 1:
+        for validator, out in zip(validators, results):
+            validator(out)
+    else:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(validators))) as pool:
+            futures = [pool.submit(validator, out) for validator, out in zip(validators, results)]
+            for future in futures:
+                future.result()
+    return [issue for out in results for issue in out]
+
+
 def run_validate(
     *,
     ph_root: Path,
@@ -1740,44 +1752,168 @@ def run_validate(
     scope: str,
     quick: bool,
     silent_success: bool,
+    incremental: bool = False,
+    domains: Iterable[str] | None = None,
+    jobs: int | None = None,
+    profile: ValidationProfile | None = None,
 ) -> tuple[int, Path, str]:
-    rules = load_validation_rules(ph_project_root=ph_project_root)
-
-    normalized_count = normalize_roadmap_links(rules=rules, root=ph_project_root, scope=scope, quick=quick)
-    normalization_message = f"Normalized {normalized_count} roadmap link(s)\n" if normalized_count else ""
+    """Validate the handbook and write `status/validation.json`.
+
+    With `profile`, wall time and I/O counters are recorded per validator (plus `setup` and `report` steps).
+    """
+    with profile.session() if profile is not None else nullcontext():
+        return _run_validate(
+            ph_root=ph_root,
+            ph_project_root=ph_project_root,
+            ph_data_root=ph_data_root,
+            scope=scope,
+            quick=quick,
+            silent_success=silent_success,
+            incremental=incremental,
+            domains=domains,
+            jobs=jobs,
+            profile=profile,
+        )
 
-    issues: list[dict] = []
-    validate_front_matter(issues=issues, rules=rules, root=ph_data_root, ph_root=ph_root, scope=scope)
-    validate_current_sprint_plan_structure(issues=issues, root=ph_data_root, scope=scope)
-    validate_session_end_index(issues=issues, ph_project_root=ph_project_root, ph_root=ph_root)
-    validate_system_scope_artifacts_in_project_scope(
-        issues=issues, rules=rules, root=ph_project_root, ph_root=ph_root, scope=scope
-    )
-    validate_adrs(issues=issues, root=ph_data_root)
-    validate_adr_fdr_backlinks(issues=issues, root=ph_data_root)
 
-    try:
-        validate_release_plan_slots(issues=issues, root=ph_data_root)
-        validate_sprint_release_alignment(issues=issues, root=ph_data_root)
-        validate_release_features_schema(issues=issues, root=ph_data_root)
-        validate_decision_register_sources(issues=issues, root=ph_data_root)
-    except Exception:
-        pass
-
-    try:
-        validate_sprints(issues=issues, rules=rules, root=ph_data_root)
-    except Exception:
-        pass
+def _run_validate(
+    *,
+    ph_root: Path,
+    ph_project_root: Path,
+    ph_data_root: Path,
+    scope: str,
+    quick: bool,
+    silent_success: bool,
+    incremental: bool,
+    domains: Iterable[str] | None,
+    jobs: int | None,
+    profile: ValidationProfile | None,
+) -> tuple[int, Path, str]:
+    step = profile.step if profile is not None else _no_step
+    with step("setup"):
+        rules = load_validation_rules(ph_project_root=ph_project_root)
+
+        normalized_count = normalize_roadmap_links(rules=rules, root=ph_project_root, scope=scope, quick=quick)
+        normalization_message = f"Normalized {normalized_count} roadmap link(s)\n" if normalized_count else ""
+
+        # Incremental runs reuse per-file/per-sprint results whose inputs are unchanged; the cheap cross-tree
+        # validators (sprint plan, session index, releases, phases) are recomputed unless their domains are untouched.
+        units = (
+            ValidationUnits(
+                ph_data_root=ph_data_root,
+                mode="quick" if quick else "full",
+                context={
+                    "rules": rules,
+                    "scope": scope,
+                    "ph_root": str(ph_root),
+                    "ph_project_root": str(ph_project_root),
+                },
+                touched_domains=domains,
+            )
+            if incremental
+            else None
+        )
 
+        # One directory walk serves every validator that used to rglob its own subtree.
+        system_rel = (
+            _relative_dir(ph_root / ".project-handbook" / "system", ph_data_root) if scope == "project" else None
+        )
+        tree = HandbookTree(ph_data_root, skip=["/".join(system_rel)] if system_rel else ())
+
+    def _always(key: str, domains: tuple[str, ...], compute: Callable[[list[dict]], None]) -> Validator:
+        return lambda out: run_unit(units, out, key, (), compute, domains=domains, always=True)
+
+    def _release_checks(out: list[dict]) -> None:
+        validate_release_plan_slots(issues=out, root=ph_data_root, tree=tree)
+        validate_sprint_release_alignment(issues=out, root=ph_data_root, tree=tree)
+        validate_release_features_schema(issues=out, root=ph_data_root, tree=tree)
+        validate_decision_register_sources(issues=out, root=ph_data_root, tree=tree)
+
+    validators: list[tuple[str, Validator]] = [
+        (
+            "front_matter",
+            lambda out: validate_front_matter(
+                issues=out, rules=rules, root=ph_data_root, ph_root=ph_root, scope=scope, units=units, tree=tree
+            ),
+        ),
+        (
+            "current_sprint_plan",
+            _always(
+                "current_sprint_plan",
+                ("sprint",),
+                lambda out: validate_current_sprint_plan_structure(issues=out, root=ph_data_root, scope=scope),
+            ),
+        ),
+        (
+            "session_end_index",
+            _always(
+                "session_end_index",
+                ("process",),
+                lambda out: validate_session_end_index(issues=out, ph_project_root=ph_project_root, ph_root=ph_root),
+            ),
+        ),
+        (
+            "system_scope_artifacts",
+            _always(
+                "system_scope_artifacts",
+                ("feature", "sprint", "decision", "process"),
+                lambda out: validate_system_scope_artifacts_in_project_scope(
+                    issues=out, rules=rules, root=ph_project_root, ph_root=ph_root, scope=scope, tree=tree
+                ),
+            ),
+        ),
+        (
+            "adrs",
+            lambda out: run_unit(
+                units,
+                out,
+                "adrs",
+                ["tree:adr"],
+                lambda unit_out: validate_adrs(issues=unit_out, root=ph_data_root, tree=tree),
+                domains=("decision",),
+            ),
+        ),
+        (
+            "adr_fdr_backlinks",
+            lambda out: validate_adr_fdr_backlinks(issues=out, root=ph_data_root, units=units, tree=tree),
+        ),
+        (
+            "release_checks",
+            _best_effort(_always("release_checks", ("release", "sprint", "feature", "decision"), _release_checks)),
+        ),
+        (
+            "sprints",
+            _best_effort(lambda out: validate_sprints(issues=out, rules=rules, root=ph_data_root, units=units)),
+        ),
+    ]
     if not quick:
-        try:
-            validate_phase(issues=issues, root=ph_data_root)
-        except Exception:
-            pass
+        validators.append(
+            (
+                "phase",
+                _best_effort(
+                    _always("phase", ("execution",), lambda out: validate_phase(issues=out, root=ph_data_root))
+                ),
+            )
+        )
+
+    # Serial unless asked: `--jobs N` is opt-in.
+    jobs = jobs or 1
+    if jobs > 1 or profile is not None:
+        # Create the shared walk, index and parse cache before fanning out so worker threads only read them (and,
+        # when profiling, so the walk is charged to `setup` rather than whichever validator touches it first).
+        with step("setup"):
+            tree.entries("")
+            get_handbook_index(ph_data_root=ph_data_root)
+    issues = run_validators(
+        [profile.wrap(name, validator) if profile is not None else validator for name, validator in validators],
+        jobs=jobs,
+    )
 
-    out = ph_data_root / "status" / "validation.json"
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps({"issues": issues}, indent=2) + "\n", encoding="utf-8")
+    with step("report"):
+        out = ph_data_root / "status" / "validation.json"
+        write_if_changed(out, json.dumps({"issues": issues}, indent=2) + "\n")
+        if units is not None:
+            units.save()
 
     errs = sum(1 for i in issues if i.get("severity") == "error")
     warns = sum(1 for i in issues if i.get("severity") == "warning")
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .generated_files import write_counts
+
+VALIDATION_PROFILE_FILENAME = "validation_profile.json"
+PROFILE_ENV_VAR = "PH_VALIDATE_PROFILE"
+
+# The row being measured on the current thread; I/O from other threads (or outside a measured step) is not counted.
+_active = threading.local()
+_hook_lock = threading.Lock()
+_hook_installed = False
+_WRITE_FLAGS = os.O_WRONLY | os.O_RDWR
+
+
+@dataclass
+class ValidatorStats:
+    name: str
+    seconds: float = 0.0
+    files_read: int = 0
+    bytes_read: int = 0
+    stat_calls: int = 0
+    writes: int = 0
+    writes_avoided: int = 0
+    issues: int = 0
+
+
+def _counters(row: ValidatorStats) -> dict[str, int]:
+    return {key: value for key, value in asdict(row).items() if key not in {"name", "seconds"}}
+
+
+def _current() -> ValidatorStats | None:
+    return getattr(_active, "stats", None)
+
+
+def _audit(event: str, args: tuple[Any, ...]) -> None:
+    """Count files opened for reading (and their sizes) from the interpreter's `open` audit events."""
+    if event != "open":
+        return
+    stats = _current()
+    if stats is None:
+        return
+    path, _mode, flags = args
+    if flags & _WRITE_FLAGS:
+        return
+    size = 0
+    if isinstance(path, (str, bytes, os.PathLike)):
+        try:
+            size = os.stat(path).st_size
+        except (OSError, ValueError):
+            return  # the event precedes the open, which is about to fail
+    stats.files_read += 1
+    stats.bytes_read += size
+
+
+def _install_audit_hook() -> None:
+    # Audit hooks cannot be removed; outside a measured step the hook returns after one thread-local lookup.
+    global _hook_installed
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit)
+            _hook_installed = True
+
+
+def count_stats(calls: int = 1) -> None:
+    """Attribute `calls` stat syscalls to the step measured on this thread (a no-op outside a profiled step)."""
+    stats = _current()
+    if stats is not None:
+        stats.stat_calls += calls
+
+
+def profile_requested(env: Mapping[str, str]) -> bool:
+    return env.get(PROFILE_ENV_VAR, "").strip().lower() not in {"", "0", "false", "no", "off"}
+
+
+class ValidationProfile:
+    """Per-validator wall time and I/O counters for one `run_validate` call.
+
+    Files read counts files opened without write access (from `open` audit events, so `Path.read_text` and friends
+    included) and bytes read sums their sizes; stat calls count the stats made where the handbook is walked and cached
+    (`ParseCache`, `HandbookTree`, the handbook index), reported through `count_stats`. Counters are attributed to the
+    thread running the step, so they stay per-validator under `--jobs`. Writes and avoided writes count generated files
+    written or left untouched by `write_if_changed`.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[ValidatorStats] = []
+        self.total_seconds = 0.0
+        self._started = 0.0
+
+    @contextmanager
+    def session(self) -> Iterator[None]:
+        _install_audit_hook()
+        self._started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.total_seconds = time.perf_counter() - self._started
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[ValidatorStats]:
+        """Attribute the enclosed work to the `name` row (repeated steps with one name accumulate)."""
+        stats = next((row for row in self.rows if row.name == name), None)
+        if stats is None:
+            stats = ValidatorStats(name=name)
+            self.rows.append(stats)
+        previous = _current()
+        _active.stats = stats
+        written, unchanged = write_counts()
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds += time.perf_counter() - start
+            _active.stats = previous
+            # Generated files are only written by the serial `setup`/`report` steps, so process-wide deltas suffice.
+            now_written, now_unchanged = write_counts()
+            stats.writes += now_written - written
+            stats.writes_avoided += now_unchanged - unchanged
+
+    def wrap(self, name: str, validator: Callable[[list[dict]], None]) -> Callable[[list[dict]], None]:
+        def run(out: list[dict]) -> None:
+            with self.step(name) as stats:
+                try:
+                    validator(out)
+                finally:
+                    stats.issues = len(out)
+
+        return run
+
+    def sorted_rows(self) -> list[ValidatorStats]:
+        return sorted(self.rows, key=lambda row: (-row.seconds, row.name))
+
+    def format_table(self) -> str:
+        header = (
+            f"{'validator':<28} {'ms':>9} {'files':>7} {'bytes':>11} {'stats':>7} {'writes':>7} {'avoided':>7} "
+            f"{'issues':>7}"
+        )
+        lines = [header, "-" * len(header)]
+        for row in self.sorted_rows():
+            lines.append(
+                f"{row.name:<28} {row.seconds * 1000:9.1f} {row.files_read:7d} {row.bytes_read:11d} "
+                f"{row.stat_calls:7d} {row.writes:7d} {row.writes_avoided:7d} {row.issues:7d}"
+            )
+        lines.append("-" * len(header))
+        lines.append(
+            f"{'total (wall)':<28} {self.total_seconds * 1000:9.1f} "
+            f"{sum(r.files_read for r in self.rows):7d} {sum(r.bytes_read for r in self.rows):11d} "
+            f"{sum(r.stat_calls for r in self.rows):7d} {sum(r.writes for r in self.rows):7d} "
+            f"{sum(r.writes_avoided for r in self.rows):7d} {sum(r.issues for r in self.rows):7d}"
+        )
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self, **meta: Any) -> dict[str, Any]:
+        return {
+            **meta,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "validators": [
+                {"name": row.name, "ms": round(row.seconds * 1000, 3), **_counters(row)} for row in self.sorted_rows()
+            ],
+        }
+
+    def write_json(self, *, ph_data_root: Path, **meta: Any) -> Path:
+        out = ph_data_root / "status" / VALIDATION_PROFILE_FILENAME
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(self.to_dict(**meta), indent=2) + "\n", encoding="utf-8")
+        return out
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .parse_cache import cache_dir_for
+
+# Bump when validator output or dependency keys change shape so older state is recomputed.
+VALIDATION_STATE_SCHEMA = 1
+
+# Units whose inputs changed this recently are recomputed on the next run as well; a same-size rewrite within the
+# filesystem timestamp granularity would otherwise look unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
+
+UnitCompute = Callable[[list[dict]], Iterable[str] | None]
+
+
+class ValidationUnits:
+    """Persisted per-unit validation results for incremental `ph validate`.
+
+    A unit is one slice of a validator (one markdown file, one sprint, the ADR set) with the issues it produced and
+    the dependency keys it consulted. Dependency keys name filesystem facts relative to the data root:
+
+    - `file:<rel>`: st_mtime_ns/st_size of a single file (or absence)
+    - `tree:<rel>`: every file below a directory with its st_mtime_ns/st_size
+    - `list:<rel>`: the entry names of a directory
+
+    A unit is reused only when every recorded dependency still has the same fingerprint. When `touched_domains` is
+    given (post-command validation), units outside those domains are reused without re-checking their dependencies.
+    """
+
+    def __init__(
+        self,
+        *,
+        ph_data_root: Path,
+        mode: str,
+        context: dict[str, Any],
+        touched_domains: Iterable[str] | None = None,
+    ) -> None:
+        self.root = ph_data_root
+        self.touched_domains = None if touched_domains is None else frozenset(touched_domains)
+        self.path = cache_dir_for(ph_data_root=ph_data_root) / f"validate_state.{mode}.json"
+        self.context = {"ph_version": __version__, "schema": VALIDATION_STATE_SCHEMA, **context}
+        self.reused = 0
+        self.computed = 0
+        self._previous: dict[str, dict[str, Any]] = {}
+        self._units: dict[str, dict[str, Any]] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._now_ns = time.time_ns()
+        # Validators may run on a thread pool (`ph validate --jobs`); unit keys never overlap, the counters do.
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(payload, dict) or payload.get("context") != self.context:
+            return
+        units = payload.get("units")
+        if isinstance(units, dict):
+            self._previous = units
+
+    def fingerprint(self, dep: str) -> str:
+        cached = self._fingerprints.get(dep)
+        if cached is not None:
+            return cached
+        kind, _, rel = dep.partition(":")
+        path = self.root / rel if rel else self.root
+        if kind == "file":
+            value = self._file_fingerprint(path)
+        elif kind == "tree":
+            value = self._tree_fingerprint(path)
+        elif kind == "list":
+            try:
+                value = _digest(sorted(os.listdir(path)))
+            except OSError:
+                value = "-"
+        else:
+            raise ValueError(f"Unknown validation dependency: {dep}")
+        self._fingerprints[dep] = value
+        return value
+
+    def _is_racy(self, mtime_ns: int) -> bool:
+        return self._now_ns - mtime_ns < _RACY_WINDOW_NS
+
+    def _file_fingerprint(self, path: Path) -> str:
+        try:
+            st = path.stat()
+        except OSError:
+            return "-"
+        if self._is_racy(st.st_mtime_ns):
+            return "racy"
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _tree_fingerprint(self, path: Path) -> str:
+        if not path.is_dir():
+            return "-"
+        rows: list[list[Any]] = []
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, path)
+            rows.append([rel_dir, "dir"])
+            for name in sorted(filenames):
+                try:
+                    st = os.stat(os.path.join(dirpath, name))
+                except OSError:
+                    rows.append([rel_dir, name, "-"])
+                    continue
+                if self._is_racy(st.st_mtime_ns):
+                    return "racy"
+                rows.append([rel_dir, name, st.st_mtime_ns, st.st_size])
+        return _digest(rows)
+
+    def run(
+        self,
+        issues: list[dict],
+        key: str,
+        deps: Iterable[str],
+        compute: UnitCompute,
+        *,
+        domains: Iterable[str],
+        always: bool = False,
+    ) -> None:
+        """Append the issues for unit `key`, reusing the stored result when its dependencies are unchanged.
+
+        `always` units have no tracked dependencies: they are recomputed unless skipped as an untouched domain.
+        """
+        previous = self._previous.get(key)
+        if previous is not None and not domains_touched(domains, self.touched_domains):
+            self._units[key] = previous
+            issues.extend(previous["issues"])
+            with self._lock:
+                self.reused += 1
+            return
+        if previous is not None and not always and self._is_fresh(previous):
+            self._units[key] = previous
+            issues.extend(previous["issues"])
+            with self._lock:
+                self.reused += 1
+            return
+
+        unit_issues: list[dict] = []
+        try:
+            discovered = compute(unit_issues)
+        finally:
+            # Keep full-run semantics when a validator raises: partial issues are reported, nothing is stored.
+            issues.extend(unit_issues)
+        with self._lock:
+            self.computed += 1
+
+        dep_keys = sorted(set(deps) | set(discovered or ()))
+        fingerprints = {dep: self.fingerprint(dep) for dep in dep_keys}
+        if "racy" in fingerprints.values():
+            return
+        self._units[key] = {"deps": fingerprints, "issues": unit_issues}
+
+    def _is_fresh(self, unit: dict[str, Any]) -> bool:
+        deps = unit.get("deps")
+        if not isinstance(deps, dict) or not isinstance(unit.get("issues"), list):
+            return False
+        return all(self.fingerprint(dep) == value for dep, value in deps.items())
+
+    def save(self) -> None:
+        payload = {
+            "context": self.context,
+            "last_run": {"reused": self.reused, "computed": self.computed},
+            "units": self._units,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+
+
+def run_unit(
+    units: ValidationUnits | None,
+    issues: list[dict],
+    key: str,
+    deps: Iterable[str],
+    compute: UnitCompute,
+    *,
+    domains: Iterable[str],
+    always: bool = False,
+) -> None:
+    if units is None:
+        compute(issues)
+        return
+    units.run(issues, key, deps, compute, domains=domains, always=always)
+
+
+def domains_touched(unit_domains: Iterable[str], touched: frozenset[str] | None) -> bool:
+    """Return whether any of a unit's domains was touched.
+
+    Domains are `family` or `family:id` (e.g. `sprint` or `sprint:SPRINT-2026-01-05`); a bare family on either side
+    matches every id in that family.
+    """
+    if touched is None:
+        return True
+    for domain in unit_domains:
+        family = domain.partition(":")[0]
+        for candidate in touched:
+            if candidate == domain or candidate == family or candidate.partition(":")[0] == domain:
+                return True
+    return False
+
+
+def domain_for_path(rel_path: str) -> str:
+    """Map a data-root relative path to the validation domain that owns it."""
+    parts = rel_path.split("/")
+    top = parts[0]
+    if top == "sprints":
+        if len(parts) >= 3 and parts[1] != "archive" and parts[2].startswith("SPRINT-"):
+            return f"sprint:{parts[2]}"
+        return "sprint"
+    return _PATH_DOMAINS.get(top, "other")
+
+
+_PATH_DOMAINS = {
+    "features": "feature",
+    "releases": "release",
+    "backlog": "backlog",
+    "parking-lot": "parking",
+    "adr": "decision",
+    "decision-register": "decision",
+    "roadmap": "roadmap",
+    "status": "status",
+    "process": "process",
+    "execution": "execution",
+}
+
+
+def _digest(value: object) -> str:
+    return hashlib.sha1(json.dumps(value, separators=(",", ":")).encode("utf-8")).hexdigest()
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from .context import Context
+from .feature_status_updater import update_all_feature_status
+from .handbook_index import invalidate_handbook_index
+from .parse_cache import save_parse_caches
+from .status import write_status_files
+
+# Entries under the data root that change constantly without feeding any derived artifact.
+_IGNORED_TOP_LEVEL = frozenset({".cache", "history.log", "serve.sock"})
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+STATUS = "status"
+FEATURES = "features"
+_RELEASE_PREFIX = "release:"
+_CURRENT_RELEASE = f"{_RELEASE_PREFIX}current"
+
+
+def _iter_watched_dirs(root: Path) -> list[Path]:
+    dirs = [root]
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if directory == root and entry.name in _IGNORED_TOP_LEVEL:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(Path(entry.path))
+                stack.append(Path(entry.path))
+    return dirs
+
+
+class _InotifyWatcher:
+    """Recursive inotify watch on the data root (directories created later are added as they appear)."""
+
+    description = "inotify"
+
+    def __init__(self, root: Path) -> None:
+        import ctypes
+
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._root = root
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        for directory in _iter_watched_dirs(root):
+            self._add(directory)
+
+    def _add(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = directory
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        ready, _w, _x = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                raw_name = data[offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length].rstrip(b"\0")
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    changed.add(self._root)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                path = directory / os.fsdecode(raw_name) if raw_name else directory
+                if directory == self._root and path.name in _IGNORED_TOP_LEVEL:
+                    continue
+                changed.add(path)
+                if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    for created in _iter_watched_dirs(path):
+                        self._add(created)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """Stat-based fallback: diff (mtime_ns, size) snapshots of the data root every `interval` seconds."""
+
+    def __init__(self, root: Path, *, interval: float) -> None:
+        self._root = root
+        self._interval = interval
+        self.description = f"polling every {interval:g}s"
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        stack = [self._root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if directory == self._root and entry.name in _IGNORED_TOP_LEVEL:
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                snapshot[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+        return snapshot
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self._interval if deadline is None else min(self._interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+            snapshot = self._scan()
+            changed = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(root: Path, *, poll: bool, poll_interval: float) -> _InotifyWatcher | _PollingWatcher:
+    """Watch `root` recursively with inotify where available, else by polling every `poll_interval` seconds."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return _PollingWatcher(root, interval=poll_interval)
+
+
+def affected_artifacts(*, ph_data_root: Path, changed: set[Path]) -> set[str]:
+    """Map changed paths to the derived artifacts that read them."""
+    affected: set[str] = set()
+    for path in changed:
+        try:
+            parts = path.relative_to(ph_data_root).parts
+        except ValueError:
+            continue
+        if not parts:
+            return {STATUS, FEATURES, _CURRENT_RELEASE}
+        top = parts[0]
+        if top == "sprints":
+            affected.update({STATUS, FEATURES, _CURRENT_RELEASE})
+        elif top in {"features", "roadmap", "config.json"} or parts[:2] == ("status", "questions"):
+            affected.add(STATUS)
+        elif top == "releases" and len(parts) >= 2:
+            if parts[1] in {"current", "current.txt"}:
+                affected.add(_CURRENT_RELEASE)
+            elif not (len(parts) == 3 and parts[2] == "progress.md"):
+                affected.add(f"{_RELEASE_PREFIX}{parts[1]}")
+    return affected
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _Regenerator:
+    def __init__(self, *, ctx: Context, env: dict[str, str], log: Callable[[str], None]) -> None:
+        self._ctx = ctx
+        self._env = env
+        self._log = log
+        # Outputs as we left them, so our own writes are not mistaken for edits.
+        self._written: dict[Path, tuple[int, int] | None] = {}
+
+    def is_own_write(self, path: Path) -> bool:
+        return path in self._written and self._written[path] == _stat_key(path)
+
+    def _remember(self, paths: list[Path]) -> None:
+        for path in paths:
+            self._written[path] = _stat_key(path)
+
+    def _timed(self, label: str, regenerate: Callable[[], list[Path]]) -> None:
+        started = time.perf_counter()
+        try:
+            written = regenerate()
+        except Exception as exc:
+            self._log(f"{label} failed: {exc}")
+            return
+        self._remember(written)
+        self._log(f"regenerated {label} in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def _features(self) -> list[Path]:
+        with redirect_stdout(StringIO()):
+            update_all_feature_status(ph_data_root=self._ctx.ph_data_root, env=self._env)
+        return sorted((self._ctx.ph_data_root / "features").glob("*/status.md"))
+
+    def _status(self) -> list[Path]:
+        return list(
+            write_status_files(
+                ph_project_root=self._ctx.ph_project_root, ph_data_root=self._ctx.ph_data_root, env=self._env
+            )
+        )
+
+    def _releases(self, artifacts: set[str]) -> list[str]:
+        if self._ctx.scope == "system":
+            return []
+        from .release import get_current_release
+
+        versions = {artifact[len(_RELEASE_PREFIX) :] for artifact in artifacts if artifact.startswith(_RELEASE_PREFIX)}
+        if "current" in versions:
+            versions.discard("current")
+            current = get_current_release(ph_root=self._ctx.ph_data_root)
+            if current:
+                versions.add(current)
+        releases_dir = self._ctx.ph_data_root / "releases"
+        return sorted(version for version in versions if (releases_dir / version).is_dir())
+
+    def run(self, artifacts: set[str]) -> None:
+        from .release import write_release_progress
+
+        invalidate_handbook_index(ph_data_root=self._ctx.ph_data_root)
+        # Feature status files first: the status payload reads their manual sections.
+        if FEATURES in artifacts:
+            self._timed("features/*/status.md (Active Work)", self._features)
+        if STATUS in artifacts:
+            self._timed("status/current.json, status/current_summary.md", self._status)
+        for version in self._releases(artifacts):
+            self._timed(
+                f"releases/{version}/progress.md",
+                lambda version=version: [
+                    write_release_progress(ph_root=self._ctx.ph_data_root, version=version, env=self._env)
+                ],
+            )
+        save_parse_caches()
+
+
+def _log(message: str) -> None:
+    print(f"ph watch: {message}", flush=True)
+
+
+def run_watch(*, ctx: Context, env: dict[str, str], debounce: float, poll: bool, poll_interval: float) -> int:
+    root = ctx.ph_data_root
+    if not root.exists():
+        print(f"❌ Handbook data root not found: {root}")
+        return 1
+
+    watcher = open_watcher(root, poll=poll, poll_interval=poll_interval)
+
+    def _stop(_signum: int, _frame: object) -> None:
+        raise KeyboardInterrupt
+
+    previous_handler = signal.signal(signal.SIGTERM, _stop)
+    regenerator = _Regenerator(ctx=ctx, env=env, log=_log)
+    try:
+        regenerator.run({STATUS, FEATURES, _CURRENT_RELEASE})
+        _log(f"watching {root} ({watcher.description}; Ctrl-C to stop)")
+        while True:
+            changed = watcher.wait(None)
+            # Debounce: keep collecting until the tree has been quiet for `debounce` seconds.
+            while more := watcher.wait(debounce):
+                changed |= more
+            changed = {path for path in changed if not regenerator.is_own_write(path)}
+            artifacts = affected_artifacts(ph_data_root=root, changed=changed)
+            if artifacts:
+                _log(f"{len(changed)} changed path(s)")
+                regenerator.run(artifacts)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        watcher.close()
+    _log("stopped")
+    return 0
@@ -6,3 +6,29 @@ import subprocess
 def test_ph_help_exits_zero() -> None:
     result = subprocess.run(["ph", "--help"], capture_output=True, text=True)
     assert result.returncode == 0
+
+
+def test_subcommand_parsers_are_built_only_when_selected() -> None:
+    from ph.cli import _find_subparsers_action, build_parser
+
+    parser = build_parser()
+    commands = _find_subparsers_action(parser)
+    assert commands is not None
+    release_parser = commands.choices["release"]
+    assert _find_subparsers_action(release_parser) is None
+
+    args = parser.parse_args(["release", "list"])
+    assert args.release_command == "list"
+    assert args._post_validate == "never"
+    assert _find_subparsers_action(release_parser) is not None
+    assert _find_subparsers_action(commands.choices["sprint"]) is None
+
+
+def test_nested_help_usage_is_unchanged_by_lazy_parsers() -> None:
+    result = subprocess.run(["ph", "task", "show", "--help"], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert result.stdout.startswith("usage: ph task show <options>\n")
+
+    result = subprocess.run(["ph", "release", "--help"], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert result.stdout.startswith("usage: ph release <options> <subcommand> ...\n")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Command implementations that must not be imported to print help or show a task.
+_HEAVY_MODULES = {
+    "ph.release",
+    "ph.validate_docs",
+    "ph.end_session",
+    "ph.pre_exec",
+    "ph.task_create",
+    "ph.backlog_manager",
+    "packaging",
+}
+
+# Cumulative `import ph.cli` budget in microseconds (importing every command module used to take ~4x this).
+_PH_CLI_IMPORT_BUDGET_US = 350_000
+
+
+def _import_times(*args: str, cwd: Path) -> dict[str, int]:
+    cmd = [sys.executable, "-X", "importtime", "-m", "ph", *args]
+    # The first run may compile bytecode; measure the second.
+    subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def _assert_lean(times: dict[str, int]) -> None:
+    loaded_heavy = sorted(name for name in times if name in _HEAVY_MODULES or name.startswith("packaging."))
+    assert loaded_heavy == []
+    assert times["ph.cli"] < _PH_CLI_IMPORT_BUDGET_US, times["ph.cli"]
+
+
+def test_help_does_not_import_command_modules(tmp_path: Path) -> None:
+    _assert_lean(_import_times("--help", cwd=tmp_path))
+
+
+def test_task_show_only_imports_task_view(tmp_path: Path) -> None:
+    subprocess.run(["ph", "init", "--no-gitignore"], cwd=tmp_path, check=True, capture_output=True)
+    tasks_dir = tmp_path / ".project-handbook" / "sprints" / "2026" / "SPRINT-2026-01-05" / "tasks" / "TASK-001-a"
+    tasks_dir.mkdir(parents=True)
+    (tasks_dir / "task.yaml").write_text("id: TASK-001\ntitle: A\nstatus: todo\n", encoding="utf-8")
+    (tmp_path / ".project-handbook" / "sprints" / "current").symlink_to(Path("2026") / "SPRINT-2026-01-05")
+
+    times = _import_times("--no-post-hook", "task", "show", "--id", "TASK-001", cwd=tmp_path)
+    _assert_lean(times)
+    assert "ph.task_view" in times
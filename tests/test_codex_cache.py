@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from ph.codex_cache import CodexChunkCache, chunk_cache_key
+from ph.end_session import EndSessionError, summarize_with_codex
+
+_STUB = """\
+import re, sys
+from pathlib import Path
+
+state = Path({state!r})
+args = sys.argv[1:]
+prompt = sys.stdin.read()
+index = re.search(r"Chunk (\\d+)/", prompt).group(1)
+with (state / "calls.log").open("a") as log:
+    log.write(index + "\\n")
+if "BOOM" in prompt and (state / "fail").exists():
+    sys.stderr.write("codex exploded")
+    sys.exit(1)
+output = Path(args[args.index("--output-last-message") + 1])
+if "EMPTY" in prompt:
+    sys.exit(0)
+if "PARTIAL" in prompt:
+    output.write_text("Partial summary\\n")
+    sys.exit(1)
+output.write_text(f"Summary of chunk {{index}}\\n")
+"""
+
+
+def _calls(state: Path) -> list[str]:
+    log = state / "calls.log"
+    calls = log.read_text().split() if log.exists() else []
+    log.unlink(missing_ok=True)
+    return calls
+
+
+def test_chunk_cache_resumes_after_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = tmp_path / "state"
+    state.mkdir()
+    (state / "fail").touch()
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "codex"
+    stub.write_text(f"#!{sys.executable}\n" + _STUB.format(state=str(state)), encoding="utf-8")
+    stub.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    cache = CodexChunkCache(tmp_path / "logs" / ".codex_cache")
+    transcript = "a" * 30 + "BOOM" + "b" * 26 + "c" * 30
+
+    def summarize(**kwargs):
+        options = {"model": None, "overrides": None, "chunk_size": 30, "chunk_overlap": 0, "jobs": 1, **kwargs}
+        return summarize_with_codex(ph_root=tmp_path, transcript=transcript, cache=cache, **options)
+
+    with pytest.raises(EndSessionError, match="codex exploded"):
+        summarize()
+    assert _calls(state) == ["1", "2"]
+
+    (state / "fail").unlink()
+    merged, outputs = summarize()
+    assert _calls(state) == ["2", "3"]
+    assert outputs == ["Summary of chunk 1", "Summary of chunk 2", "Summary of chunk 3"]
+
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    assert summarize(jobs=3) == (merged, outputs)
+    assert (cache.hits, cache.misses) == (0 + 1 + 3, 3 + 2 + 0)
+
+    monkeypatch.setenv("PATH", str(bin_dir))
+    summarize(model="other-model", jobs=3)
+    assert sorted(_calls(state)) == ["1", "2", "3"]
+
+
+def test_chunk_cache_skips_placeholders_and_failed_runs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = tmp_path / "state"
+    state.mkdir()
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "codex"
+    stub.write_text(f"#!{sys.executable}\n" + _STUB.format(state=str(state)), encoding="utf-8")
+    stub.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    cache = CodexChunkCache(tmp_path / "logs" / ".codex_cache")
+    transcript = "EMPTY".ljust(30, "a") + "PARTIAL".ljust(30, "b") + "c" * 30
+
+    def summarize():
+        return summarize_with_codex(
+            ph_root=tmp_path,
+            transcript=transcript,
+            model=None,
+            overrides=None,
+            chunk_size=30,
+            chunk_overlap=0,
+            jobs=1,
+            cache=cache,
+        )
+
+    _, outputs = summarize()
+    assert outputs == ["(Codex returned an empty response.)", "Partial summary", "Summary of chunk 3"]
+    assert _calls(state) == ["1", "2", "3"]
+    assert summarize()[1] == outputs
+    assert _calls(state) == ["1", "2"]
+
+
+def test_chunk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = CodexChunkCache(tmp_path, max_bytes=25)
+    keys = [chunk_cache_key(template="t", model=None, overrides={"a": "1"}, chunk=str(n)) for n in range(3)]
+    assert keys[0] != chunk_cache_key(template="t", model=None, overrides={"a": "2"}, chunk="0")
+    for age, key in enumerate(keys):
+        cache.put(key, "x" * 10)
+        os.utime(tmp_path / f"{key}.md", ns=(10**18 + age, 10**18 + age))
+
+    assert cache.get(keys[0]) == "x" * 10
+    assert cache.evict() == 1
+    assert sorted(path.stem for path in tmp_path.iterdir()) == sorted([keys[0], keys[2]])
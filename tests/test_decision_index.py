@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ph.handbook_index import get_handbook_index, invalidate_handbook_index
+from ph.task_create import resolve_decision_doc
+from ph.validate_docs import _dr_entry_exists
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _write_decisions(ph_data_root: Path) -> dict[str, Path]:
+    return {
+        "adr": _write(ph_data_root / "adr" / "0001-use-x.md", "---\nid: ADR-0001\nstatus: accepted\n---\n# Context\n"),
+        "fdr": _write(
+            ph_data_root / "features" / "auth" / "fdr" / "0001-tokens.md", "---\nid: FDR-0001\ntitle: T\n---\n"
+        ),
+        "project_dr": _write(ph_data_root / "decision-register" / "DR-0001-storage.md", "# DR\n\n### DR-0001\n"),
+        "feature_dr": _write(
+            ph_data_root / "features" / "auth" / "decision-register" / "DR-0002-tokens.md", "## DR-0002 Tokens\n"
+        ),
+        "implemented_dr": _write(
+            ph_data_root / "features" / "implemented" / "billing" / "decision-register" / "DR-0003-x.md",
+            "### DR-0003\n",
+        ),
+    }
+
+
+def test_decision_index_records_declarations(tmp_path: Path) -> None:
+    ph_data_root = tmp_path / ".project-handbook"
+    docs = _write_decisions(ph_data_root)
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    decisions = get_handbook_index(ph_data_root=ph_data_root).decisions()
+
+    [adr] = decisions.refs("ADR-0001")
+    assert (adr.path, adr.line, adr.source, adr.status) == (docs["adr"], 2, "front_matter", "accepted")
+    assert {(ref.source, ref.line) for ref in decisions.refs("DR-0001")} == {("filename", 0), ("heading", 3)}
+    [implemented] = [ref for ref in decisions.refs("DR-0003") if ref.source == "heading"]
+    assert (implemented.feature, implemented.implemented) == ("billing", True)
+
+    assert resolve_decision_doc(ph_data_root=ph_data_root, decision_id="ADR-0001", feature="auth") == docs["adr"]
+    assert resolve_decision_doc(ph_data_root=ph_data_root, decision_id="FDR-0001", feature="") == docs["fdr"]
+    assert resolve_decision_doc(ph_data_root=ph_data_root, decision_id="DR-0001", feature="auth") == docs["project_dr"]
+    assert resolve_decision_doc(ph_data_root=ph_data_root, decision_id="ADR-0009", feature="auth") is None
+
+    assert _dr_entry_exists(ph_data_root=ph_data_root, dr_id="DR-0002", feature="auth")
+    assert not _dr_entry_exists(ph_data_root=ph_data_root, dr_id="DR-0002", feature="billing")
+    assert _dr_entry_exists(ph_data_root=ph_data_root, dr_id="DR-0003", feature=None)
+    assert not _dr_entry_exists(ph_data_root=ph_data_root, dr_id="DR-0003", feature="billing")
+
+
+def test_decision_lookups_read_each_document_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ph_data_root = tmp_path / ".project-handbook"
+    docs = _write_decisions(ph_data_root)
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args: object, **kwargs: object) -> str:
+        if self.suffix == ".md":
+            reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    for _ in range(20):
+        for dr_id in ("DR-0001", "DR-0002", "DR-0003", "DR-0404"):
+            _dr_entry_exists(ph_data_root=ph_data_root, dr_id=dr_id, feature="auth")
+        resolve_decision_doc(ph_data_root=ph_data_root, decision_id="FDR-0001", feature="auth")
+
+    assert sorted(reads) == sorted(docs.values())
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ph.end_session import EndSessionError, summarize_with_codex
+
+_STUB = """\
+import os, re, sys, time
+from pathlib import Path
+
+state = Path({state!r})
+args = sys.argv[1:]
+output = Path(args[args.index("--output-last-message") + 1])
+prompt = sys.stdin.read()
+index, total = map(int, re.search(r"Chunk (\\d+)/(\\d+):", prompt).groups())
+marker = state / "running" / str(index)
+marker.touch()
+time.sleep(0.1 if index == {fail_index} else {delay} * (total - index + 1))
+(state / "peak" / str(index)).write_text(str(len(list((state / "running").iterdir()))))
+marker.unlink()
+if index == {fail_index}:
+    sys.stderr.write("chunk failed")
+    sys.exit(1)
+output.write_text(f"Chunk {{index}} summary\\nShared next step\\n")
+"""
+
+
+def _install_codex_stub(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, delay: float, fail_index: int = 0) -> Path:
+    state = tmp_path / "state"
+    (state / "running").mkdir(parents=True)
+    (state / "peak").mkdir()
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    stub = bin_dir / "codex"
+    stub.write_text(
+        f"#!{sys.executable}\n" + _STUB.format(state=str(state), delay=delay, fail_index=fail_index), encoding="utf-8"
+    )
+    stub.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{Path(sys.executable).parent}")
+    return state
+
+
+def test_codex_chunks_run_concurrently_and_merge_in_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = _install_codex_stub(tmp_path, monkeypatch, delay=0.2)
+
+    merged, outputs = summarize_with_codex(
+        ph_root=tmp_path, transcript="x" * 90, model=None, overrides=None, chunk_size=30, chunk_overlap=0, jobs=3
+    )
+
+    assert outputs == [f"Chunk {n} summary\nShared next step" for n in (1, 2, 3)]
+    assert merged == "Chunk 1 summary\nShared next step\nChunk 2 summary\nChunk 3 summary"
+    assert max(int(p.read_text()) for p in (state / "peak").iterdir()) > 1
+
+
+def test_codex_chunk_failure_stops_remaining_work(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = _install_codex_stub(tmp_path, monkeypatch, delay=3, fail_index=2)
+
+    started = time.monotonic()
+    with pytest.raises(EndSessionError, match="chunk failed"):
+        summarize_with_codex(
+            ph_root=tmp_path, transcript="x" * 120, model=None, overrides=None, chunk_size=30, chunk_overlap=0, jobs=2
+        )
+
+    assert time.monotonic() - started < 3
+    assert [p.name for p in (state / "peak").iterdir()] == ["2"]
+    assert [p.name for p in (state / "running").iterdir()] == ["1"]  # killed mid-run; chunks 3 and 4 never started
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from ph import end_session
+from ph.end_session import run_end_session_codex, run_end_session_skip_codex
+
+
+def _write_minimal_ph_root(ph_root: Path) -> None:
+    config = ph_root / ".project-handbook" / "config.json"
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text(
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+        encoding="utf-8",
+    )
+    (ph_root / "process" / "sessions" / "templates").mkdir(parents=True, exist_ok=True)
+
+
+def _item(minute: int, role: str, text: str) -> dict:
+    return {
+        "type": "response_item",
+        "timestamp": f"2026-01-14T{minute // 60:02d}:{minute % 60:02d}:00Z",
+        "payload": {"type": "message", "role": role, "content": [{"type": "input_text", "text": text}]},
+    }
+
+
+def _append(rollout: Path, objects: list[dict]) -> None:
+    with rollout.open("a", encoding="utf-8") as handle:
+        for obj in objects:
+            handle.write(json.dumps(obj, indent=2) + "\n")
+
+
+def test_incremental_end_session_matches_full_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ph_root = tmp_path / "ph_root"
+    _write_minimal_ph_root(ph_root)
+    rollout = tmp_path / "rollout.jsonl"
+    meta = {
+        "type": "session_meta",
+        "timestamp": "2026-01-14T00:00:00Z",
+        "payload": {"id": "s-inc", "cwd": str(ph_root)},
+    }
+    _append(rollout, [meta, _item(0, "user", "Please add the parser"), _item(1, "assistant", "Plan: add parser")])
+
+    scanned: list[int] = []
+    real_scan = end_session.scan_rollout
+
+    def counting_scan(entries):
+        entries = list(entries)
+        scanned.append(len(entries))
+        return real_scan(entries)
+
+    monkeypatch.setattr(end_session, "scan_rollout", counting_scan)
+
+    def run(**kwargs):
+        return run_end_session_skip_codex(ph_root=ph_root, log_path=rollout, session_end_mode="continue-task", **kwargs)
+
+    first = run(incremental=True)
+    _append(rollout, [_item(20, "user", "Next we should fix the tests"), _item(21, "assistant", "Fixed the tests")])
+    second = run(incremental=True)
+    assert scanned == [3, 2]
+    assert second.summary_path == first.summary_path
+    assert second.session_end_summary_path == first.session_end_summary_path
+
+    logs_dir = ph_root / "process" / "sessions" / "logs"
+    manifest = json.loads((logs_dir / "manifest.json").read_text(encoding="utf-8"))
+    checkpoint = manifest["sessions"][0]["checkpoint"]
+    assert checkpoint["offset"] == len(rollout.read_bytes().rstrip())
+    assert checkpoint["last_timestamp"] == "2026-01-14T00:21:00+00:00"
+    assert [len(chapter["events"]) for chapter in checkpoint["chapters"]] == [2, 2]
+    index = json.loads((ph_root / "process" / "sessions" / "session_end" / "session_end_index.json").read_text())
+    assert len(index["records"]) == 1
+
+    incremental_text = second.summary_path.read_text(encoding="utf-8")
+    incremental_end = second.session_end_summary_path.read_text(encoding="utf-8")
+    assert "Fixed the tests" in incremental_text
+
+    run()
+    assert scanned[-1] == 5
+    assert second.summary_path.read_text(encoding="utf-8").splitlines()[1:] == incremental_text.splitlines()[1:]
+    assert second.session_end_summary_path.read_text(encoding="utf-8") == incremental_end
+
+    run(incremental=True)
+    assert scanned[-1] == 5
+
+
+def test_incremental_falls_back_to_full_run_when_codex_settings_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ph_root = tmp_path / "ph_root"
+    _write_minimal_ph_root(ph_root)
+    rollout = tmp_path / "rollout.jsonl"
+    meta = {"type": "session_meta", "timestamp": "2026-01-14T00:00:00Z", "payload": {"id": "s-cx", "cwd": str(ph_root)}}
+    _append(rollout, [meta, _item(0, "user", "Please add the parser"), _item(1, "assistant", "Plan: add parser")])
+
+    scanned: list[int] = []
+    real_scan = end_session.scan_rollout
+
+    def counting_scan(entries):
+        entries = list(entries)
+        scanned.append(len(entries))
+        return real_scan(entries)
+
+    def fake_codex(*, transcript: str, model: str | None, **_kwargs):
+        return "", [f"{model}: {len(transcript.splitlines())} lines"]
+
+    monkeypatch.setattr(end_session, "scan_rollout", counting_scan)
+    monkeypatch.setattr(end_session, "summarize_with_codex", fake_codex)
+
+    def codex(model: str) -> None:
+        run_end_session_codex(
+            ph_root=ph_root, log_path=rollout, model=model, overrides=None, codex_cache=False, incremental=True
+        )
+
+    run_end_session_skip_codex(ph_root=ph_root, log_path=rollout, incremental=True)
+    _append(rollout, [_item(20, "user", "Next we should fix the tests")])
+    codex("m1")
+    codex("m2")
+    run_end_session_skip_codex(ph_root=ph_root, log_path=rollout, incremental=True)
+    assert scanned == [3, 4, 4, 4]
+
+    _append(rollout, [_item(21, "assistant", "Fixed the tests")])
+    codex("m2")
+    _append(rollout, [_item(22, "user", "Thanks")])
+    codex("m2")
+    assert scanned == [3, 4, 4, 4, 5, 1]
+    manifest = json.loads((ph_root / "process" / "sessions" / "logs" / "manifest.json").read_text(encoding="utf-8"))
+    checkpoint = manifest["sessions"][0]["checkpoint"]
+    assert checkpoint["codex"] == {"model": "m2", "overrides": {}}
+    assert [output.split(":")[0] for output in checkpoint["chunk_outputs"]] == ["m2", "m2"]
+
+
+def test_incremental_after_since_window_keeps_early_events(tmp_path: Path) -> None:
+    ph_root = tmp_path / "ph_root"
+    _write_minimal_ph_root(ph_root)
+    rollout = tmp_path / "rollout.jsonl"
+    meta = {
+        "type": "session_meta",
+        "timestamp": "2026-01-14T00:00:00Z",
+        "payload": {"id": "s-win", "cwd": str(ph_root)},
+    }
+    _append(rollout, [meta, _item(0, "user", "Early marker request"), _item(30, "assistant", "Late reply")])
+
+    since = datetime(2026, 1, 14, 0, 10, tzinfo=timezone.utc)
+    windowed = run_end_session_skip_codex(ph_root=ph_root, log_path=rollout, since=since)
+    assert "Early marker request" not in windowed.summary_path.read_text(encoding="utf-8")
+    manifest = json.loads((ph_root / "process" / "sessions" / "logs" / "manifest.json").read_text(encoding="utf-8"))
+    assert "checkpoint" not in manifest["sessions"][0]
+
+    _append(rollout, [_item(31, "user", "Next we should fix the tests")])
+    result = run_end_session_skip_codex(ph_root=ph_root, log_path=rollout, incremental=True)
+    text = result.summary_path.read_text(encoding="utf-8")
+    assert "Early marker request" in text and "Next we should fix the tests" in text
@@ -78,3 +78,52 @@ def test_end_session_skip_codex_writes_summary_and_manifest(tmp_path: Path) -> N
     # Only assert the stable transcript payload.
     assert "USER :: Hello from fixture" in summary_text
     assert "- Hello from fixture (?) – no file changes" in summary_text
+
+
+def test_end_session_since_uses_rollout_index(tmp_path: Path) -> None:
+    ph_root = tmp_path / "ph_root"
+    ph_root.mkdir()
+    _write_minimal_ph_root(ph_root)
+
+    rollout_path = tmp_path / "rollout.jsonl"
+    objects = [{"type": "session_meta", "payload": {"id": "sess-2", "cwd": str(ph_root), "git": {}}}]
+    for hour, text in ((1, "Early fixture message"), (5, "Late fixture message")):
+        objects.append(
+            {
+                "type": "response_item",
+                "timestamp": f"2026-01-14T0{hour}:00:00Z",
+                "payload": {"type": "message", "role": "user", "content": [{"type": "input_text", "text": text}]},
+            }
+        )
+    rollout_path.write_text("\n".join(json.dumps(obj, indent=2) for obj in objects) + "\n", encoding="utf-8")
+
+    result = subprocess.run(
+        [
+            "ph",
+            "end-session",
+            "--skip-codex",
+            "--log",
+            str(rollout_path),
+            "--since",
+            "2026-01-14T04:00:00Z",
+            "--root",
+            str(ph_root),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, (result.stdout, result.stderr)
+
+    logs_dir = ph_root / "process" / "sessions" / "logs"
+    summary_text = (logs_dir / "latest_summary.md").read_text(encoding="utf-8")
+    assert "Late fixture message" in summary_text
+    assert "Early fixture message" not in summary_text
+    assert [p.name.startswith("rollout.jsonl.") for p in (logs_dir / ".rollout_index").iterdir()] == [True]
+
+    result = subprocess.run(
+        ["ph", "end-session", "--skip-codex", "--log", str(rollout_path), "--since", "soon", "--root", str(ph_root)],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "Invalid --since value" in result.stderr
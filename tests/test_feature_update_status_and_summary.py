@@ -142,3 +142,29 @@ def test_feature_update_status_rewrites_auto_section_and_summary_is_stable(tmp_p
 
     expected_points = f"{3:3d}/{8:3d} pts"
     assert any("feat-a" in line and expected_points in line for line in lines)
+
+
+def test_feature_update_status_skips_features_with_unchanged_tasks(tmp_path: Path) -> None:
+    _write_minimal_ph_root(tmp_path)
+    base = _seed_feature_and_sprint(ph_root=tmp_path, scope="project")
+    status_path = base / "features" / "feat-a" / "status.md"
+    cmd = ["ph", "--root", str(tmp_path), "--no-post-hook", "feature", "update-status"]
+
+    first = subprocess.run(cmd, capture_output=True, text=True, env={**os.environ, "PH_FAKE_TODAY": "2099-01-01"})
+    assert first.returncode == 0
+    generated = status_path.read_text(encoding="utf-8")
+    assert "<!-- ph:active-work digest=" in generated
+
+    second = subprocess.run(cmd, capture_output=True, text=True, env={**os.environ, "PH_FAKE_TODAY": "2099-01-02"})
+    assert second.returncode == 0
+    assert "feat-a status up to date" in second.stdout
+    assert status_path.read_text(encoding="utf-8") == generated
+
+    task_yaml = base / "sprints" / "2099" / "SPRINT-2099-01-01" / "tasks" / "TASK-002-doing" / "task.yaml"
+    task_yaml.write_text(task_yaml.read_text(encoding="utf-8").replace("status: doing", "status: review"))
+    third = subprocess.run(cmd, capture_output=True, text=True, env={**os.environ, "PH_FAKE_TODAY": "2099-01-03"})
+    assert third.returncode == 0
+    regenerated = status_path.read_text(encoding="utf-8")
+    assert "*Last updated: 2099-01-03*" in regenerated
+    assert "👀 TASK-002" in regenerated
+    assert regenerated.count("## Active Work (auto-generated)") == 1
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from ph.generated_files import write_counts, write_if_changed
+from ph.handbook_index import invalidate_handbook_index
+from ph.status import write_status_files
+
+
+def test_write_if_changed_skips_identical_content(tmp_path: Path) -> None:
+    path = tmp_path / "status" / "current.json"
+    written, unchanged = write_counts()
+
+    assert write_if_changed(path, "{}\n") is True
+    os.utime(path, ns=(1, 1))
+    assert write_if_changed(path, "{}\n") is False
+    assert path.stat().st_mtime_ns == 1
+    assert write_if_changed(path, '{"a": 1}\n') is True
+    assert path.read_text(encoding="utf-8") == '{"a": 1}\n'
+
+    assert write_counts() == (written + 2, unchanged + 1)
+    assert [p.name for p in path.parent.iterdir()] == ["current.json"]
+
+
+def test_write_if_changed_follows_file_symlinks(tmp_path: Path) -> None:
+    real = tmp_path / "real.md"
+    real.write_text("old\n", encoding="utf-8")
+    os.chmod(real, 0o640)
+    link = tmp_path / "link.md"
+    link.symlink_to(real.name)
+
+    assert write_if_changed(link, "new\n") is True
+    assert link.is_symlink()
+    assert real.read_text(encoding="utf-8") == "new\n"
+    assert real.stat().st_mode & 0o777 == 0o640
+
+
+def test_repeated_validate_keeps_report_mtime(tmp_path: Path) -> None:
+    ph_data_root = tmp_path / ".project-handbook"
+    (ph_data_root / "process" / "checks").mkdir(parents=True)
+    (ph_data_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    (ph_data_root / "config.json").write_text(
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+        encoding="utf-8",
+    )
+    cmd = ["ph", "--root", str(tmp_path), "--no-post-hook", "validate", "--profile"]
+
+    subprocess.run(cmd, capture_output=True, text=True, check=True)
+    report = ph_data_root / "status" / "validation.json"
+    os.utime(report, ns=(1, 1))
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+    assert report.stat().st_mtime_ns == 1
+    report_row = next(line for line in result.stdout.splitlines() if line.startswith("report "))
+    writes, avoided = report_row.split()[-3:-1]
+    assert (writes, avoided) == ("0", "1")
+
+
+def test_unchanged_status_keeps_current_json_and_its_stamp(tmp_path: Path) -> None:
+    ph_data_root = tmp_path / ".project-handbook"
+    (ph_data_root / "process" / "checks").mkdir(parents=True)
+    (ph_data_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    task_yaml = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05" / "tasks" / "TASK-001-t" / "task.yaml"
+    task_yaml.parent.mkdir(parents=True)
+    task_yaml.write_text("id: TASK-001\nfeature: a\nstatus: todo\nstory_points: 3\n", encoding="utf-8")
+
+    def write(now: str) -> dict:
+        invalidate_handbook_index(ph_data_root=ph_data_root)
+        json_path, _ = write_status_files(
+            ph_project_root=ph_data_root, ph_data_root=ph_data_root, env={"PH_FAKE_NOW": now}
+        )
+        return json.loads(json_path.read_text(encoding="utf-8"))
+
+    assert write("2026-01-01T00:00:00Z")["generated_at"] == "2026-01-01T00:00:00Z"
+    current_json = ph_data_root / "status" / "current.json"
+    os.utime(current_json, ns=(1, 1))
+    assert write("2026-01-02T00:00:00Z")["generated_at"] == "2026-01-01T00:00:00Z"
+    assert current_json.stat().st_mtime_ns == 1
+
+    task_yaml.write_text("id: TASK-001\nfeature: a\nstatus: done\nstory_points: 3\n", encoding="utf-8")
+    assert write("2026-01-03T00:00:00Z")["generated_at"] == "2026-01-03T00:00:00Z"
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+from ph.handbook_index import forget_handbook_paths, get_handbook_index, invalidate_handbook_index
+from ph.handbook_tree import HandbookTree
+from ph.release import archived_sprint_dir, is_sprint_archived
+from ph.status import run_status
+from ph.validate_docs import validate_sprints
+
+
+def _write_minimal_ph_root(ph_root: Path) -> Path:
+    config = ph_root / ".project-handbook" / "config.json"
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text(
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+        encoding="utf-8",
+    )
+    ph_data_root = config.parent
+    (ph_data_root / "process" / "checks").mkdir(parents=True, exist_ok=True)
+    (ph_data_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    return ph_data_root
+
+
+def _write_task(*, sprint_dir: Path, task_id: str, feature: str, status: str) -> None:
+    task_dir = sprint_dir / "tasks" / f"{task_id}-example"
+    task_dir.mkdir(parents=True, exist_ok=True)
+    (task_dir / "task.yaml").write_text(
+        "\n".join(
+            [
+                f"id: {task_id}",
+                f"title: Example {task_id}",
+                f"feature: {feature}",
+                "decision: ADR-0001",
+                "owner: @a",
+                f"status: {status}",
+                "story_points: 3",
+                "depends_on: [FIRST_TASK]",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_status_and_validate_share_one_parse_per_task(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    sprint_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    _write_task(sprint_dir=sprint_dir, task_id="TASK-001", feature="alpha", status="doing")
+    _write_task(sprint_dir=sprint_dir, task_id="TASK-002", feature="alpha", status="todo")
+    archived_dir = ph_data_root / "sprints" / "archive" / "2025" / "SPRINT-2025-12-29"
+    _write_task(sprint_dir=archived_dir, task_id="TASK-003", feature="alpha", status="done")
+
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    env = {"PH_FAKE_NOW": "2026-01-06T00:00:00Z"}
+    with redirect_stdout(io.StringIO()):
+        run_status(ph_root=tmp_path, ph_project_root=tmp_path, ph_data_root=ph_data_root, env=env)
+        issues: list[dict] = []
+        validate_sprints(issues=issues, rules={}, root=ph_data_root)
+
+    index = get_handbook_index(ph_data_root=ph_data_root)
+    assert index.parse_count == 3
+    assert not [i for i in issues if i["code"].startswith("task_yaml")]
+
+
+def test_invalidate_handbook_index_rereads_task_yaml(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    sprint_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    _write_task(sprint_dir=sprint_dir, task_id="TASK-001", feature="alpha", status="todo")
+
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    [entry] = get_handbook_index(ph_data_root=ph_data_root).tasks(sprint_dir)
+    assert entry.fields()["status"] == "todo"
+
+    _write_task(sprint_dir=sprint_dir, task_id="TASK-001", feature="alpha", status="done")
+    [stale] = get_handbook_index(ph_data_root=ph_data_root).tasks(sprint_dir)
+    assert stale.fields()["status"] == "todo"
+
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    [fresh] = get_handbook_index(ph_data_root=ph_data_root).tasks(sprint_dir)
+    assert fresh.fields()["status"] == "done"
+
+
+def test_forget_handbook_paths_drops_only_changed_subtrees(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    sprint_a = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    sprint_b = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-12"
+    _write_task(sprint_dir=sprint_a, task_id="TASK-001", feature="alpha", status="todo")
+    _write_task(sprint_dir=sprint_b, task_id="TASK-002", feature="alpha", status="todo")
+
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    index = get_handbook_index(ph_data_root=ph_data_root)
+    tasks_a, tasks_b, sprints = index.tasks(sprint_a), index.tasks(sprint_b), index.sprints()
+
+    # Generated outputs and session logs are not part of the model.
+    forget_handbook_paths(
+        {ph_data_root / "status" / "current.json", ph_data_root / "process" / "sessions" / "logs" / "latest.md"}
+    )
+    assert index.tasks(sprint_a) is tasks_a and index.sprints() is sprints
+
+    forget_handbook_paths({sprint_a / "tasks" / "TASK-001-example" / "task.yaml"})
+    assert index.tasks(sprint_a) is not tasks_a
+    assert index.tasks(sprint_b) is tasks_b
+    assert index.sprints() is sprints
+
+    forget_handbook_paths({ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-19"})
+    assert index.sprints() is not sprints
+
+    forget_handbook_paths({ph_data_root})
+    assert get_handbook_index(ph_data_root=ph_data_root) is not index
+
+
+def test_archived_sprint_lookups_scan_archive_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    active_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    _write_task(sprint_dir=active_dir, task_id="TASK-001", feature="a", status="todo")
+    archived_dir = ph_data_root / "sprints" / "archive" / "2025" / "SPRINT-2025-12-29"
+    _write_task(sprint_dir=archived_dir, task_id="TASK-002", feature="a", status="done")
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+
+    listed: list[str] = []
+    real_scandir, real_listdir = os.scandir, os.listdir
+
+    def counting_scandir(path: object = ".") -> object:
+        listed.append(os.fspath(path))
+        return real_scandir(path)
+
+    def counting_listdir(path: object = ".") -> list[str]:
+        listed.append(os.fspath(path))
+        return real_listdir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    monkeypatch.setattr(os, "listdir", counting_listdir)
+    for _ in range(3):
+        assert archived_sprint_dir(ph_root=ph_data_root, sprint_id="SPRINT-2025-12-29") == archived_dir
+        assert not is_sprint_archived(ph_root=ph_data_root, sprint_id="SPRINT-2026-01-05")
+        assert not is_sprint_archived(ph_root=ph_data_root, sprint_id="SPRINT-2024-01-01")
+    monkeypatch.undo()
+
+    # One shallow listing per directory down to archive/<year>/, never inside sprint directories.
+    assert listed
+    assert not any(path.startswith(str(archived_dir)) for path in listed)
+    assert len(listed) == len(set(listed))
+
+
+def test_concurrent_readers_build_each_part_once(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    sprint_dirs = [ph_data_root / "sprints" / "2026" / f"SPRINT-2026-01-0{n}" for n in range(1, 5)]
+    for n, sprint_dir in enumerate(sprint_dirs):
+        for m in range(5):
+            _write_task(sprint_dir=sprint_dir, task_id=f"TASK-{n}{m:02d}", feature="alpha", status="todo")
+
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    tree = HandbookTree(ph_data_root)
+    barrier = threading.Barrier(8)
+
+    def read(_n: int) -> tuple[int, int]:
+        barrier.wait()
+        index = get_handbook_index(ph_data_root=ph_data_root)
+        return len(index.all_tasks()), len(tree.named("task.yaml", "sprints"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(read, range(8)))
+
+    assert results == [(20, 20)] * 8
+    assert get_handbook_index(ph_data_root=ph_data_root).parse_count == 20
@@ -155,3 +155,22 @@ def test_plan_post_validate_never_skips_validation() -> None:
     )
     assert plan.append_history is True
     assert plan.run_validation is False
+
+
+def test_plan_background_mode_is_per_command_and_env_overridable() -> None:
+    def plan(mode: str, env: dict[str, str]):
+        return plan_post_command_hook(
+            command="task",
+            exit_code=0,
+            no_post_hook=False,
+            no_history=False,
+            no_validate=False,
+            post_validate_mode=mode,
+            env=env,
+        )
+
+    assert plan("background", {}).background_validation is True
+    assert plan("quick", {}).background_validation is False
+    assert plan("background", {"PH_POST_VALIDATE_MODE": "quick"}).background_validation is False
+    assert plan("quick", {"PH_POST_VALIDATE_MODE": "background"}).background_validation is True
+    assert plan("never", {"PH_POST_VALIDATE_MODE": "background"}).run_validation is False
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+from ph import __version__, parse_cache
+from ph.handbook_index import get_handbook_index, invalidate_handbook_index
+
+
+def _write_minimal_ph_root(ph_root: Path) -> Path:
+    config = ph_root / ".project-handbook" / "config.json"
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text(
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+        encoding="utf-8",
+    )
+    ph_data_root = config.parent
+    (ph_data_root / "process" / "checks").mkdir(parents=True, exist_ok=True)
+    (ph_data_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    return ph_data_root
+
+
+def _write_old_task(*, sprint_dir: Path, task_id: str, status: str) -> Path:
+    task_yaml = sprint_dir / "tasks" / f"{task_id}-example" / "task.yaml"
+    task_yaml.parent.mkdir(parents=True, exist_ok=True)
+    task_yaml.write_text(f"id: {task_id}\ntitle: Example\nstatus: {status}\nstory_points: 3\n", encoding="utf-8")
+    # Age the file past the racy window so the cache is allowed to persist it.
+    old = time.time() - 3600
+    os.utime(task_yaml, (old, old))
+    return task_yaml
+
+
+def _fresh_process_state(ph_data_root: Path) -> None:
+    parse_cache.save_parse_caches()
+    parse_cache._CACHES.clear()
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+
+
+def test_unchanged_task_yaml_is_served_from_disk_cache(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    sprint_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    _write_old_task(sprint_dir=sprint_dir, task_id="TASK-001", status="todo")
+    changed = _write_old_task(sprint_dir=sprint_dir, task_id="TASK-002", status="todo")
+
+    _fresh_process_state(ph_data_root)
+    first = get_handbook_index(ph_data_root=ph_data_root)
+    assert [e.fields()["status"] for e in sorted(first.tasks(sprint_dir), key=lambda e: e.task_dir)] == [
+        "todo",
+        "todo",
+    ]
+    assert first.parse_count == 2
+
+    _fresh_process_state(ph_data_root)
+    assert (ph_data_root / ".cache" / "parse_cache.json").exists()
+    second = get_handbook_index(ph_data_root=ph_data_root)
+    cached_fields = [e.fields() for e in second.tasks(sprint_dir)]
+    assert second.parse_count == 0
+    assert all(list(f) == ["id", "title", "status", "story_points"] for f in cached_fields)
+
+    # Same size, different content and mtime: only the changed file is re-parsed.
+    changed.write_text(changed.read_text(encoding="utf-8").replace("todo", "done"), encoding="utf-8")
+    _fresh_process_state(ph_data_root)
+    third = get_handbook_index(ph_data_root=ph_data_root)
+    statuses = [e.fields()["status"] for e in sorted(third.tasks(sprint_dir), key=lambda e: e.task_dir)]
+    assert statuses == ["todo", "done"]
+    assert third.parse_count == 1
+
+
+def test_cache_from_other_ph_version_is_discarded(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    cache_path = ph_data_root / ".cache" / "parse_cache.json"
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(
+        json.dumps({"ph_version": "0.0.0", "schema": 1, "entries": {"adr/x.md": {"mtime_ns": 1, "size": 1}}}),
+        encoding="utf-8",
+    )
+
+    result = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-post-hook", "validate", "--quick"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert payload["ph_version"] == __version__
+    assert "adr/x.md" not in payload["entries"]
+
+
+def test_cache_stats_and_clear(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    _write_old_task(
+        sprint_dir=ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05", task_id="TASK-001", status="todo"
+    )
+
+    subprocess.run(["ph", "--root", str(tmp_path), "--no-post-hook", "validate", "--quick"], capture_output=True)
+
+    stats = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-post-hook", "cache", "stats"],
+        capture_output=True,
+        text=True,
+    )
+    assert stats.returncode == 0
+    assert f"Cache directory: {ph_data_root / '.cache'}\n" in stats.stdout
+    assert "Parse cache: 1 file(s)" in stats.stdout
+    assert "  task_yaml: 1\n" in stats.stdout
+
+    clear = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-post-hook", "cache", "clear"],
+        capture_output=True,
+        text=True,
+    )
+    assert clear.returncode == 0
+    assert clear.stdout == f"Removed 1 cache file(s) from {ph_data_root / '.cache'}\n"
+    assert not (ph_data_root / ".cache").exists()
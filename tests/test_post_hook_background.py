@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from ph import background_validate
+from ph.background_validate import take_background_failure, worker_lock_path
+from ph.context import build_context
+
+
+def _write_minimal_ph_root(ph_root: Path) -> Path:
+    ph_project_root = ph_root / ".project-handbook"
+    config = ph_project_root / "config.json"
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text(
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+        encoding="utf-8",
+    )
+    (ph_project_root / "process" / "checks").mkdir(parents=True, exist_ok=True)
+    (ph_project_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    return ph_project_root
+
+
+def _ph(ph_root: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        ["ph", "--root", str(ph_root), "--no-history", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PH_POST_VALIDATE_MODE": "background"},
+    )
+
+
+def _add_question(ph_root: Path, title: str) -> subprocess.CompletedProcess[str]:
+    return _ph(ph_root, "question", "add", "--title", title, "--severity", "blocking", "--q-scope", "project")
+
+
+def test_background_validation_failure_is_reported_by_next_command(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    (ph_data_root / "INVALID.md").write_text("# Missing front matter\n", encoding="utf-8")
+    pending = ph_data_root / "status" / "validation.pending"
+
+    result = _add_question(tmp_path, "First")
+    assert result.returncode == 0, result.stderr
+    assert "validate --quick failed" not in result.stderr
+
+    deadline = time.monotonic() + 60
+    while pending.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert not pending.exists()
+    report = json.loads((ph_data_root / "status" / "validation.json").read_text(encoding="utf-8"))
+    assert any(issue["path"].endswith("INVALID.md") for issue in report["issues"])
+
+    listing = _ph(tmp_path, "question", "list")
+    assert listing.returncode == 0
+    assert "Background validate --quick failed (non-blocking): validation: 1 error(s)" in listing.stderr
+
+    # The failure is reported once.
+    again = _ph(tmp_path, "question", "list")
+    assert "Background validate --quick failed" not in again.stderr
+
+
+def test_invocations_during_a_running_validation_are_coalesced(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    pending = ph_data_root / "status" / "validation.pending"
+    pending.parent.mkdir(parents=True)
+    # Pretend a worker (this test process) is already validating: it holds the worker lock.
+    pending.write_text(json.dumps({"pid": os.getpid(), "generation": 1, "domains": ["backlog"]}), encoding="utf-8")
+    lock_path = worker_lock_path(ph_data_root=ph_data_root)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a+") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        for title in ("First", "Second"):
+            result = _add_question(tmp_path, title)
+            assert result.returncode == 0, result.stderr
+
+    assert json.loads(pending.read_text(encoding="utf-8")) == {
+        "pid": os.getpid(),
+        "generation": 3,
+        "domains": ["backlog", "status"],
+    }
+    assert not (ph_data_root / "status" / "validation.json").exists()
+
+
+def test_marker_of_a_dead_worker_does_not_block_a_new_one(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    pending = ph_data_root / "status" / "validation.pending"
+    pending.parent.mkdir(parents=True)
+    # A live PID (this process, as if recycled) that holds no worker lock.
+    pending.write_text(json.dumps({"pid": os.getpid(), "generation": 7, "domains": []}), encoding="utf-8")
+
+    result = _add_question(tmp_path, "First")
+    assert result.returncode == 0, result.stderr
+
+    deadline = time.monotonic() + 60
+    while pending.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert not pending.exists()
+    assert (ph_data_root / "status" / "validation.json").exists()
+
+
+def test_worker_crash_is_reported_as_a_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    ctx = build_context(ph_root=tmp_path, scope="project")
+
+    def crash(**_kwargs: object) -> tuple[int, Path, str]:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("ph.validate_docs.run_validate", crash)
+    lock_fd = background_validate._claim_worker_lock(ph_data_root=ph_data_root)
+    assert lock_fd is not None
+    assert background_validate._run_worker(ctx=ctx, env={}, lock_fd=lock_fd) == 1
+
+    assert take_background_failure(ph_data_root=ph_data_root) == "background validation crashed: RuntimeError: boom"
+    assert take_background_failure(ph_data_root=ph_data_root) is None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+from ph.handbook_index import invalidate_handbook_index
+from ph.release import collect_release_tagged_tasks
+from ph.release_index import ReleaseTaskIndex
+
+_OLD_NS = 1_600_000_000 * 10**9
+
+
+def _write_task(sprint_dir: Path, task_id: str, *, release: str, status: str = "todo", mtime_ns: int = _OLD_NS) -> None:
+    task_yaml = sprint_dir / "tasks" / f"{task_id}-t" / "task.yaml"
+    task_yaml.parent.mkdir(parents=True, exist_ok=True)
+    task_yaml.write_text(
+        f"id: {task_id}\ntitle: {task_id}\nfeature: f\nstatus: {status}\nstory_points: 2\n{release}\n",
+        encoding="utf-8",
+    )
+    os.utime(task_yaml, ns=(mtime_ns, mtime_ns))
+
+
+def _seed(ph_root: Path) -> Path:
+    ph_data_root = ph_root / ".project-handbook"
+    active = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-12"
+    archived = ph_data_root / "sprints" / "archive" / "2026" / "SPRINT-2026-01-05"
+    _write_task(archived, "TASK-001", release="release: 1.0.0", status="done")
+    _write_task(active, "TASK-002", release="release: [v1.1.0, current]")
+    _write_task(active, "TASK-003", release="release: current")
+    _write_task(active, "TASK-004", release="release: null")
+    _write_task(active, "TASK-005", release="release:\n  - v1.0.0\n  - v1.1.0\nrelease_gate: true")
+    return ph_data_root
+
+
+def _ids(tasks: list[dict]) -> list[str]:
+    return [task["id"] for task in tasks]
+
+
+def test_release_view_groups_tagged_tasks_and_rescans_only_changed_sprints(tmp_path: Path) -> None:
+    ph_data_root = _seed(tmp_path)
+
+    view = ReleaseTaskIndex(ph_data_root=ph_data_root)
+    assert sorted(view.rescanned) == ["SPRINT-2026-01-05", "SPRINT-2026-01-12"]
+    assert view.releases() == ["v1.0.0", "v1.1.0"]
+    assert _ids(view.tasks_for("v1.0.0")) == ["TASK-001", "TASK-002", "TASK-003", "TASK-005"]
+    assert _ids(view.tasks_for("1.1.0", include_current=False)) == ["TASK-002", "TASK-005"]
+    assert view.tasks_for("v1.0.0")[0]["sprint"] == "SPRINT-2026-01-05"
+
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    assert ReleaseTaskIndex(ph_data_root=ph_data_root).rescanned == []
+
+    _write_task(
+        ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-12",
+        "TASK-004",
+        release="release: v1.1.0",
+        mtime_ns=_OLD_NS + 10**9,
+    )
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    view = ReleaseTaskIndex(ph_data_root=ph_data_root)
+    assert view.rescanned == ["SPRINT-2026-01-12"]
+    assert _ids(view.tasks_for("v1.1.0", include_current=False)) == ["TASK-002", "TASK-004", "TASK-005"]
+    assert _ids(collect_release_tagged_tasks(ph_root=ph_data_root, version="v1.1.0")) == [
+        "TASK-002",
+        "TASK-003",
+        "TASK-004",
+        "TASK-005",
+    ]
+
+
+def test_release_list_progress(tmp_path: Path) -> None:
+    ph_data_root = _seed(tmp_path)
+    (ph_data_root / "config.json").write_text(
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+        encoding="utf-8",
+    )
+    (ph_data_root / "process" / "checks").mkdir(parents=True)
+    (ph_data_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    releases_dir = ph_data_root / "releases"
+    (releases_dir / "v1.0.0").mkdir(parents=True)
+    (releases_dir / "v1.1.0").mkdir(parents=True)
+    (releases_dir / "current").symlink_to("v1.1.0")
+
+    result = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-post-hook", "release", "list", "--progress"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    lines = [line for line in result.stdout.splitlines() if line.startswith("  v")]
+    assert lines == [
+        "  v1.0.0: 1/2 tasks done, 2/4 pts (50%), gates 0/1",
+        "  v1.1.0 (current): 0/3 tasks done, 0/6 pts (0%), gates 0/1",
+    ]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from ph import rollout_parser
+from ph.end_session import build_command_timeline, build_summary_events_from_timeline, compute_log_bounds
+from ph.rollout_parser import CodexRolloutParser, RolloutIndex, RolloutParserError, iter_json_objects
+
+
+def _message(n: int, text: str) -> dict:
+    return {
+        "type": "response_item",
+        "timestamp": f"2026-01-14T00:00:{n:02d}Z",
+        "payload": {"type": "message", "role": "user", "content": [{"type": "input_text", "text": text}]},
+    }
+
+
+def _write_rollout(path: Path, objects: list) -> None:
+    path.write_text("\n".join(json.dumps(obj, indent=2) for obj in objects) + "\n\n", encoding="utf-8")
+
+
+def test_iter_json_objects_streams_across_chunk_boundaries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rollout_parser, "_READ_SIZE", 7)
+    rollout = tmp_path / "rollout.jsonl"
+    objects = [{"type": "session_meta", "payload": {"id": "s"}}, [1, 2], _message(1, "x" * 500), _message(2, "é ✓")]
+    _write_rollout(rollout, objects)
+
+    stream = iter_json_objects(rollout)
+    assert iter(stream) is stream
+    assert list(stream) == [objects[0], objects[2], objects[3]]
+    assert list(iter_json_objects(rollout, limit=2)) == [objects[0]]
+
+    rollout.write_text(rollout.read_text(encoding="utf-8") + '{"type": ', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_objects(rollout))
+
+
+def test_parse_returns_reiterable_stream(tmp_path: Path) -> None:
+    rollout = tmp_path / "rollout.jsonl"
+    objects = [{"type": "session_meta", "payload": {"id": "sess-1", "cwd": "/x"}}, _message(1, "a"), _message(2, "b")]
+    _write_rollout(rollout, objects)
+
+    metadata, entries = CodexRolloutParser(tmp_path).parse(rollout)
+    assert metadata.session_id == "sess-1"
+    assert entries and list(entries) == objects == list(entries)
+
+    timeline = build_command_timeline(iter(entries))
+    events = build_summary_events_from_timeline(iter(timeline))
+    assert [event.text for event in events] == ["a", "b"]
+    start, end = compute_log_bounds(iter(entries))
+    assert (start.second, end.second) == (1, 2)
+
+    _write_rollout(rollout, [_message(1, "a")])
+    with pytest.raises(RolloutParserError):
+        CodexRolloutParser(tmp_path).parse(rollout)
+
+
+def test_rollout_index_extends_appended_tail_and_reads_windows(tmp_path: Path) -> None:
+    rollout = tmp_path / "rollout.jsonl"
+    index_dir = tmp_path / "logs" / ".rollout_index"
+    meta = {"type": "session_meta", "timestamp": "2026-01-14T00:00:00Z", "payload": {"id": "sess-1"}}
+    objects = [meta, _message(1, "é ✓"), _message(2, "b")]
+    _write_rollout(rollout, objects)
+
+    index = RolloutIndex(rollout, index_dir=index_dir)
+    assert index.decoded_bytes == 0 and not index.fresh
+    index.refresh()
+    assert index.decoded_bytes == len(rollout.read_bytes().rstrip())
+    assert [row[2] for row in index.rows] == ["session_meta", "response_item", "response_item"]
+    assert list(index.read(index.rows)) == objects
+
+    with rollout.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(_message(3, "c"), indent=2) + "\n" + '{"type": "response_item", "payl')
+    grown = RolloutIndex(rollout, index_dir=index_dir)
+    grown.refresh()
+    assert 0 < grown.decoded_bytes < index.decoded_bytes
+    assert len(grown.rows) == 4
+    assert RolloutIndex(rollout, index_dir=index_dir).fresh
+
+    since = datetime(2026, 1, 14, 0, 0, 2, tzinfo=timezone.utc)
+    window = list(grown.read(grown.select(since=since)))
+    assert [obj["type"] for obj in window] == ["session_meta", "response_item", "response_item"]
+    assert window[1] == objects[2]
+    assert list(grown.read(grown.select(tail=1)))[1]["timestamp"] == "2026-01-14T00:00:03Z"
+
+    _write_rollout(rollout, [{"type": "session_meta", "payload": {"id": "other"}}])
+    parser = CodexRolloutParser(tmp_path, index_dir=index_dir)
+    assert parser.read_session_meta(rollout).session_id == "other"
+    metadata, entries = parser.parse(rollout, since=since)
+    assert metadata.session_id == "other" and len(list(entries)) == 1
+
+
+def test_whole_log_read_indexes_cold_log_in_one_pass(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    rollout = tmp_path / "rollout.jsonl"
+    index_dir = tmp_path / "logs" / ".rollout_index"
+    objects = [{"type": "session_meta", "payload": {"id": "sess-1"}}] + [_message(n, str(n)) for n in range(1, 30)]
+    _write_rollout(rollout, objects)
+    decoded: list[int] = []
+    iter_spans = rollout_parser._iter_spans
+
+    def counting_spans(handle, offset=0):
+        for span in iter_spans(handle, offset):
+            decoded.append(span[0])
+            yield span
+
+    monkeypatch.setattr(rollout_parser, "_iter_spans", counting_spans)
+    parser = CodexRolloutParser(tmp_path, index_dir=index_dir)
+    metadata, entries = parser.parse(rollout)
+    assert metadata.session_id == "sess-1"
+    assert entries and list(entries) == objects
+    assert len(decoded) < len(objects) + 3
+    index = parser.index(rollout)
+    assert index.fresh and len(index.rows) == len(objects)
+
+    decoded.clear()
+    reopened = RolloutIndex(rollout, index_dir=index_dir)
+    assert reopened.fresh and list(reopened.scan()) == objects and decoded == []
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ph.serve_client import forward_to_server
+
+
+def _write_task(ph_root: Path, status: str) -> Path:
+    task_dir = ph_root / ".project-handbook" / "sprints" / "2026" / "SPRINT-2026-01-05" / "tasks" / "TASK-001-a"
+    task_dir.mkdir(parents=True, exist_ok=True)
+    task_yaml = task_dir / "task.yaml"
+    task_yaml.write_text(f"id: TASK-001\ntitle: A\nstatus: {status}\n", encoding="utf-8")
+    return task_yaml
+
+
+def _ph(ph_root: Path, *args: str, **env: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        ["ph", "--root", str(ph_root), "--no-post-hook", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+    )
+
+
+def test_commands_are_forwarded_to_a_running_daemon(tmp_path: Path) -> None:
+    subprocess.run(["ph", "init", "--no-gitignore"], cwd=tmp_path, check=True, capture_output=True)
+    task_yaml = _write_task(tmp_path, "todo")
+    (tmp_path / ".project-handbook" / "sprints" / "current").symlink_to(Path("2026") / "SPRINT-2026-01-05")
+    socket_path = tmp_path / ".project-handbook" / "serve.sock"
+    log_path = tmp_path / "serve.log"
+
+    with log_path.open("w", encoding="utf-8") as log:
+        daemon = subprocess.Popen(
+            ["ph", "--root", str(tmp_path), "serve", "--idle-timeout", "60"],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    try:
+        deadline = time.monotonic() + 30
+        while not socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert socket_path.exists()
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+        direct = _ph(tmp_path, "task", "show", "--id", "TASK-001", PH_NO_SERVE="1")
+        served = _ph(tmp_path, "task", "show", "--id", "TASK-001")
+        assert served.returncode == direct.returncode == 0
+        assert served.stdout == direct.stdout
+        assert "todo" in served.stdout
+
+        # Edits made behind the daemon's back are picked up by the next request.
+        task_yaml.write_text("id: TASK-001\ntitle: A\nstatus: doing\n", encoding="utf-8")
+        assert "doing" in _ph(tmp_path, "task", "show", "--id", "TASK-001").stdout
+
+        # Each request runs with the caller's environment, and it does not leak into the next request.
+        (tmp_path / "package.json").write_text('{"name": "demo", "version": "1.0.0"}', encoding="utf-8")
+        silent = _ph(tmp_path, "task", "show", "--id", "TASK-001", npm_config_reporter="silent")
+        assert "> demo@1.0.0" not in silent.stdout
+        assert "> demo@1.0.0" in _ph(tmp_path, "task", "show", "--id", "TASK-001").stdout
+
+        bogus = _ph(tmp_path, "no-such-command")
+        assert bogus.returncode == 2
+        assert "invalid choice" in bogus.stderr
+
+        daemon.terminate()
+        daemon.wait(timeout=30)
+        assert not socket_path.exists()
+        assert "doing" in _ph(tmp_path, "task", "show", "--id", "TASK-001").stdout
+    finally:
+        if daemon.poll() is None:
+            daemon.kill()
+            daemon.wait()
+
+    log_text = log_path.read_text(encoding="utf-8")
+    assert "task show --id TASK-001 -> 0" in log_text
+    assert "ph serve: stopped" in log_text
+
+
+def _fake_daemon(ph_root: Path, replies: list[bytes]) -> threading.Thread:
+    """Answer one request per reply with raw `reply` bytes, then close the connection."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(ph_root / ".project-handbook" / "serve.sock"))
+    server.listen(1)
+
+    def serve() -> None:
+        with server:
+            for reply in replies:
+                conn, _addr = server.accept()
+                with conn:
+                    while conn.recv(65536):
+                        pass
+                    conn.sendall(reply)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_client_runs_in_process_only_when_the_daemon_refuses(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    subprocess.run(["ph", "init", "--no-gitignore"], cwd=tmp_path, check=True, capture_output=True)
+    refused = json.dumps({"error": "ph serve is running ph 0.0.0"}).encode("utf-8") + b"\n"
+    daemon = _fake_daemon(tmp_path, [refused, b""])
+    argv = ["--root", str(tmp_path), "task", "status", "--id", "TASK-001", "--status", "doing"]
+    env = {k: v for k, v in os.environ.items() if k != "PH_NO_SERVE"}
+
+    assert forward_to_server(argv=argv, env=env) is None
+    # A connection dropped after the request was delivered may follow a (half) run, so it is not retried in-process.
+    assert forward_to_server(argv=argv, env=env) == 1
+    assert "closed the connection before the command finished" in capsys.readouterr().err
+    daemon.join(timeout=10)
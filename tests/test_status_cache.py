@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ph import status
+from ph.handbook_index import invalidate_handbook_index
+
+_OLD_NS = 1_600_000_000 * 10**9
+
+
+def _write_task(sprint_dir: Path, task_id: str, *, status_value: str, feature: str, mtime_ns: int = _OLD_NS) -> None:
+    task_yaml = sprint_dir / "tasks" / f"{task_id}-t" / "task.yaml"
+    task_yaml.parent.mkdir(parents=True, exist_ok=True)
+    task_yaml.write_text(
+        f"id: {task_id}\ntitle: {task_id}\nfeature: {feature}\nstatus: {status_value}\nstory_points: 3\n",
+        encoding="utf-8",
+    )
+    os.utime(task_yaml, ns=(mtime_ns, mtime_ns))
+
+
+def _payload(ph_data_root: Path) -> dict:
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    payload = status._generate_status_payload(ph_data_root=ph_data_root, env={})
+    payload.pop("generated_at")
+    for phase in payload["phases"]:
+        phase["features"].sort()
+        phase["decisions"].sort()
+    return payload
+
+
+def test_status_reaggregates_only_changed_sprints(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ph_data_root = tmp_path / ".project-handbook"
+    first = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    second = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-12"
+    _write_task(first, "TASK-001", status_value="done", feature="a")
+    _write_task(first, "TASK-002", status_value="doing", feature="b")
+    _write_task(second, "TASK-003", status_value="todo", feature="a")
+
+    aggregated: list[str] = []
+    real_aggregate = status._aggregate_sprint
+
+    def counting_aggregate(**kwargs):
+        aggregated.append(kwargs["sprint"].sprint_id)
+        return real_aggregate(**kwargs)
+
+    monkeypatch.setattr(status, "_aggregate_sprint", counting_aggregate)
+
+    cold = _payload(ph_data_root)
+    assert sorted(aggregated) == ["SPRINT-2026-01-05", "SPRINT-2026-01-12"]
+    assert cold["totals"]["done"] == 1 and cold["totals"]["in_progress"] == 1 and cold["totals"]["planned"] == 1
+
+    aggregated.clear()
+    assert _payload(ph_data_root) == cold
+    assert aggregated == []
+
+    _write_task(second, "TASK-003", status_value="done", feature="a", mtime_ns=_OLD_NS + 10**9)
+    aggregated.clear()
+    warm = _payload(ph_data_root)
+    assert aggregated == ["SPRINT-2026-01-12"]
+
+    shutil.rmtree(ph_data_root / ".cache")
+    assert warm == _payload(ph_data_root)
+    assert sorted(task["id"] for task in warm["features"]["a"]["done"]) == ["TASK-001", "TASK-003"]
+
+    cached = json.loads((ph_data_root / ".cache" / "status_sprints.json").read_text(encoding="utf-8"))
+    assert set(cached["sprints"]) == {"sprints/2026/SPRINT-2026-01-05", "sprints/2026/SPRINT-2026-01-12"}
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ph.handbook_index import invalidate_handbook_index
+from ph.task_index import TaskIndex
+
+
+def _write_minimal_ph_root(ph_root: Path) -> Path:
+    ph_data_root = ph_root / ".project-handbook"
+    (ph_data_root / "process" / "checks").mkdir(parents=True, exist_ok=True)
+    (ph_data_root / "config.json").write_text(
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+        encoding="utf-8",
+    )
+    (ph_data_root / "process" / "checks" / "validation_rules.json").write_text("{}", encoding="utf-8")
+    return ph_data_root
+
+
+def _write_task(*, sprint_dir: Path, task_id: str, status: str) -> Path:
+    task_dir = sprint_dir / "tasks" / f"{task_id}-example"
+    task_dir.mkdir(parents=True, exist_ok=True)
+    (task_dir / "task.yaml").write_text(
+        f"id: {task_id}\ntitle: Example {task_id}\nfeature: alpha\nstatus: {status}\nstory_points: 1\n",
+        encoding="utf-8",
+    )
+    return task_dir
+
+
+def test_task_show_resolves_archived_task_from_index(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    archive = ph_data_root / "sprints" / "archive" / "2025"
+    _write_task(sprint_dir=archive / "SPRINT-2025-12-01", task_id="TASK-001", status="done")
+    doing = _write_task(sprint_dir=archive / "SPRINT-2025-12-15", task_id="TASK-001", status="doing")
+
+    result = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-post-hook", "task", "show", "--id", "TASK-001"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "SPRINT-2025-12-15" in result.stdout
+
+    payload = json.loads((ph_data_root / ".cache" / "task_index.json").read_text(encoding="utf-8"))
+    dirs = sorted(record["dir"] for record in payload["tasks"]["TASK-001"])
+    assert dirs == [
+        "sprints/archive/2025/SPRINT-2025-12-01/tasks/TASK-001-example",
+        doing.relative_to(ph_data_root).as_posix(),
+    ]
+
+
+def test_lookup_does_not_walk_archived_sprints(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    archive = ph_data_root / "sprints" / "archive" / "2025"
+    task_dir = _write_task(sprint_dir=archive / "SPRINT-2025-12-01", task_id="TASK-007", status="review")
+    for n in range(5):
+        _write_task(sprint_dir=archive / f"SPRINT-2025-11-0{n + 1}", task_id=f"TASK-10{n}", status="done")
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    assert TaskIndex(ph_data_root=ph_data_root).rebuilt
+
+    def no_listing(path: object = ".") -> object:
+        raise AssertionError(f"unexpected directory listing: {path}")
+
+    monkeypatch.setattr(os, "scandir", no_listing)
+    monkeypatch.setattr(os, "listdir", no_listing)
+    index = TaskIndex(ph_data_root=ph_data_root)
+    [location] = index.locate("TASK-007", archived_only=True)
+    monkeypatch.undo()
+
+    assert not index.rebuilt
+    assert (location.task_dir, location.status) == (task_dir, "review")
+
+    (task_dir / "task.yaml").write_text("id: TASK-007\ntitle: Example\nstatus: done\n", encoding="utf-8")
+    [location] = TaskIndex(ph_data_root=ph_data_root).locate("TASK-007")
+    assert location.status == "done"
+
+
+def test_sprint_archive_moves_indexed_tasks(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    sprints_dir = ph_data_root / "sprints"
+    sprint_dir = sprints_dir / "2026" / "SPRINT-2026-01-05"
+    _write_task(sprint_dir=sprint_dir, task_id="TASK-001", status="done")
+    (sprints_dir / "current").symlink_to(sprint_dir.relative_to(sprints_dir))
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+    assert TaskIndex(ph_data_root=ph_data_root).locate("TASK-001", archived_only=True) == []
+
+    result = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-post-hook", "sprint", "archive", "--sprint", "SPRINT-2026-01-05"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+    index = TaskIndex(ph_data_root=ph_data_root)
+    assert not index.rebuilt
+    [location] = index.locate("TASK-001", archived_only=True)
+    assert location.task_dir == sprints_dir / "archive" / "2026" / "SPRINT-2026-01-05" / "tasks" / "TASK-001-example"
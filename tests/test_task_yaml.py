@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from ph.task_yaml import TaskYaml, load_task_yaml
+
+TEXT = """id: TASK-001
+title: Wire auth
+status: doing
+story_points: 3
+release_gate: true
+depends_on: [FIRST_TASK, "TASK-000"]
+# owner: '@someone'
+acceptance:
+  - Tests pass
+  # not an item
+  - Docs updated
+notes: done
+"""
+
+
+def test_views_share_one_parse() -> None:
+    document = load_task_yaml(TEXT)
+
+    assert document.resolved["story_points"] == 3
+    assert document.resolved["acceptance"] == ["Tests pass", "Docs updated"]
+    assert "title" not in document.resolved
+
+    fields = document.fields()
+    assert fields["depends_on"] == ["FIRST_TASK", "TASK-000"]
+    assert fields["story_points"] == "3"
+    assert fields["acceptance"] == ""
+    assert fields["# owner"] == "'@someone'"
+
+    typed = document.typed()
+    assert typed["story_points"] == 3
+    assert typed["release_gate"] is True
+    assert typed["acceptance"] == ["Tests pass", "Docs updated"]
+    assert typed["notes"] == "done"
+    assert "# owner" not in typed
+
+
+def test_repeated_key_replaces_typed_value() -> None:
+    document = load_task_yaml("story_points: 3\nstory_points: TBD\n")
+    assert document.fields() == {"story_points": "TBD"}
+    assert document.typed() == {"story_points": "TBD"}
+
+
+def test_only_ascii_digits_become_integers() -> None:
+    document = load_task_yaml("story_points: 1²\nestimate: ٣\nsize: 5\n")
+    assert document.typed() == {"story_points": "1²", "estimate": "٣", "size": 5}
+
+
+def test_mapping_strips_quotes_and_collects_blocks() -> None:
+    document = load_task_yaml('phase: 01\ntitle: "Launch"\nfeatures:\n  - "auth"\n  - billing\ndecisions:\n')
+    assert document.mapping() == {"phase": "01", "title": "Launch", "features": ["auth", "billing"], "decisions": ""}
+
+
+def test_record_round_trip() -> None:
+    document = load_task_yaml(TEXT)
+    restored = TaskYaml.from_record(document.to_record())
+    assert restored.typed() == document.typed()
+    assert restored.fields() == document.fields()
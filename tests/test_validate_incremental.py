@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+# Timestamps far enough in the past that incremental validation treats every file as settled.
+_BASE_MTIME = time.time() - 10_000
+
+
+def _ph(ph_root: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        ["ph", "--root", str(ph_root), "--no-post-hook", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PH_FAKE_NOW": "2026-01-06T00:00:00Z"},
+    )
+
+
+def _age_tree(root: Path) -> None:
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (_BASE_MTIME, _BASE_MTIME))
+
+
+def _write(path: Path, text: str, *, step: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (_BASE_MTIME + step, _BASE_MTIME + step))
+
+
+def _task_yaml(*, task_id: str, task_type: str, decision: str, status: str) -> str:
+    return (
+        f"id: {task_id}\n"
+        f"title: Example {task_id}\n"
+        "feature: alpha\n"
+        f"decision: {decision}\n"
+        "owner: @a\n"
+        f"status: {status}\n"
+        "story_points: 3\n"
+        "depends_on: [FIRST_TASK]\n"
+        "prio: P2\n"
+        "due: 2026-01-09\n"
+        f"task_type: {task_type}\n"
+        "acceptance:\n"
+        "  - done\n"
+    )
+
+
+def _write_handbook(ph_root: Path) -> Path:
+    result = subprocess.run(["ph", "init", "--no-gitignore"], cwd=ph_root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    ph_data_root = ph_root / ".project-handbook"
+
+    tasks_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05" / "tasks"
+    for task_id, task_type, decision in [
+        ("TASK-001", "implementation", "ADR-0001"),
+        ("TASK-002", "research-discovery", "DR-0001"),
+    ]:
+        task_dir = tasks_dir / f"{task_id}-example"
+        _write(
+            task_dir / "task.yaml",
+            _task_yaml(task_id=task_id, task_type=task_type, decision=decision, status="todo"),
+            step=0,
+        )
+        for name in ("README.md", "steps.md", "commands.md", "checklist.md", "validation.md"):
+            _write(task_dir / name, f"---\ntitle: {name}\n---\n\n# {name}\n", step=0)
+
+    _write(
+        ph_data_root / "adr" / "0001-example.md",
+        "---\nid: ADR-0001\ntitle: Example\nstatus: accepted\nlinks: []\n---\n\n# ADR-0001: Example\n",
+        step=0,
+    )
+    _write(ph_data_root / "features" / "alpha" / "overview.md", "---\ntitle: Alpha\n---\n\n# Alpha\n", step=0)
+    _age_tree(ph_data_root)
+    return ph_data_root
+
+
+def _assert_incremental_matches_full(ph_root: Path, ph_data_root: Path) -> dict:
+    report = ph_data_root / "status" / "validation.json"
+
+    incremental = _ph(ph_root, "validate", "--quick", "--incremental")
+    incremental_bytes = report.read_bytes()
+    full = _ph(ph_root, "validate", "--quick")
+    full_bytes = report.read_bytes()
+
+    assert incremental.returncode == full.returncode
+    assert incremental_bytes == full_bytes
+    state = json.loads((ph_data_root / ".cache" / "validate_state.quick.json").read_text(encoding="utf-8"))
+    return state["last_run"]
+
+
+def test_incremental_validate_report_is_byte_identical_to_full_run(tmp_path: Path) -> None:
+    ph_data_root = _write_handbook(tmp_path)
+    tasks_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05" / "tasks"
+
+    first = _assert_incremental_matches_full(tmp_path, ph_data_root)
+    assert first["reused"] == 0
+
+    # Only the cheap cross-tree validators (sprint plan, session index, system-scope artifacts, releases) rerun.
+    unchanged = _assert_incremental_matches_full(tmp_path, ph_data_root)
+    assert unchanged["computed"] == 4
+    assert unchanged["reused"] == first["computed"] - 4
+
+    mutations = [
+        # Same-size status rewrite inside a sprint.
+        lambda step: _write(
+            tasks_dir / "TASK-001-example" / "task.yaml",
+            _task_yaml(task_id="TASK-001", task_type="implementation", decision="ADR-0001", status="done"),
+            step=step,
+        ),
+        # New markdown without front matter.
+        lambda step: _write(ph_data_root / "features" / "alpha" / "notes.md", "# Notes\n", step=step),
+        # Deleted required task file.
+        lambda step: (tasks_dir / "TASK-001-example" / "README.md").unlink(),
+        # Cross-file: the DR referenced by TASK-002 appears in the feature's decision register.
+        lambda step: _write(
+            ph_data_root / "features" / "alpha" / "decision-register" / "DR-0001-choice.md",
+            "---\ntitle: DR-0001\n---\n\n# DR-0001 Choice\n",
+            step=step,
+        ),
+        # ADR gains a DR backlink.
+        lambda step: _write(
+            ph_data_root / "adr" / "0001-example.md",
+            "---\nid: ADR-0001\ntitle: Example\nstatus: accepted\n"
+            "links: [../features/alpha/decision-register/DR-0001-choice.md]\n---\n\n# ADR-0001: Example\n",
+            step=step,
+        ),
+        # Front matter removed from an existing doc.
+        lambda step: _write(ph_data_root / "features" / "alpha" / "overview.md", "# Alpha\n", step=step),
+        # New task in the sprint depending on an unknown task.
+        lambda step: _write(
+            tasks_dir / "TASK-003-example" / "task.yaml",
+            _task_yaml(task_id="TASK-003", task_type="implementation", decision="ADR-0001", status="doing").replace(
+                "[FIRST_TASK]", "[TASK-999]"
+            ),
+            step=step,
+        ),
+    ]
+    for step, mutate in enumerate(mutations, start=1):
+        mutate(step)
+        last_run = _assert_incremental_matches_full(tmp_path, ph_data_root)
+        assert last_run["reused"] > 0, step
+
+    # Rule changes invalidate every stored unit.
+    rules_path = ph_data_root / "process" / "checks" / "validation_rules.json"
+    rules = json.loads(rules_path.read_text(encoding="utf-8"))
+    rules.setdefault("story_points", {})["allowed_story_points"] = [1, 2]
+    _write(rules_path, json.dumps(rules, indent=2) + "\n", step=100)
+    last_run = _assert_incremental_matches_full(tmp_path, ph_data_root)
+    assert last_run["reused"] == 0
+
+
+def test_post_hook_only_rechecks_domains_touched_by_the_command(tmp_path: Path) -> None:
+    ph_data_root = _write_handbook(tmp_path)
+    report = ph_data_root / "status" / "validation.json"
+    _ph(tmp_path, "validate", "--quick", "--incremental")
+    baseline = report.read_bytes()
+
+    # A feature doc loses its front matter, then a command that only touches status/questions runs.
+    _write(ph_data_root / "features" / "alpha" / "overview.md", "# Alpha\n", step=1)
+    result = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-history", "question", "add", "--title", "Why?", "--severity", "blocking"]
+        + ["--q-scope", "project", "--body", "Because."],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PH_FAKE_NOW": "2026-01-06T00:00:00Z"},
+    )
+    assert result.returncode == 0, result.stderr
+    assert report.read_bytes() == baseline
+    state = json.loads((ph_data_root / ".cache" / "validate_state.quick.json").read_text(encoding="utf-8"))
+    assert state["last_run"]["reused"] > state["last_run"]["computed"]
+
+    # A full incremental run still picks the feature change up.
+    _assert_incremental_matches_full(tmp_path, ph_data_root)
+    assert b"features/alpha/overview.md" in report.read_bytes()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_threaded_validate_report_matches_serial(tmp_path: Path) -> None:
+    ph_data_root = tmp_path / ".project-handbook"
+    _write(
+        ph_data_root / "config.json",
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+    )
+    _write(ph_data_root / "process" / "checks" / "validation_rules.json", "{}")
+    for n in range(6):
+        _write(ph_data_root / "adr" / f"000{n}-x.md", "# no front matter\n")
+        _write(ph_data_root / "features" / f"f{n}" / "overview.md", "# no front matter\n")
+    sprint_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    _write(sprint_dir / "plan.md", "# no front matter\n")
+    for n in range(4):
+        _write(sprint_dir / "tasks" / f"TASK-00{n}-a" / "task.yaml", f"id: TASK-00{n}\nstatus: bogus\n")
+    (ph_data_root / "sprints" / "current").symlink_to(Path("2026") / "SPRINT-2026-01-05")
+
+    reports = []
+    for jobs in ("1", "4"):
+        shutil.rmtree(ph_data_root / ".cache", ignore_errors=True)
+        result = subprocess.run(
+            ["ph", "--root", str(tmp_path), "--no-post-hook", "validate", "--jobs", jobs],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 1, result.stdout + result.stderr
+        reports.append((ph_data_root / "status" / "validation.json").read_text(encoding="utf-8"))
+
+    assert reports[0] == reports[1]
+    codes = {issue["code"] for issue in json.loads(reports[0])["issues"]}
+    assert len(codes) > 3
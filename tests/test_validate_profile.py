@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from ph.validate_docs import run_validators
+from ph.validate_profile import ValidationProfile, count_stats
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _write_minimal_ph_root(ph_root: Path) -> Path:
+    ph_data_root = ph_root / ".project-handbook"
+    _write(
+        ph_data_root / "config.json",
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+    )
+    _write(ph_data_root / "process" / "checks" / "validation_rules.json", "{}")
+    (ph_data_root / "process" / "sessions" / "templates").mkdir(parents=True)
+    for n in range(3):
+        _write(ph_data_root / "adr" / f"000{n}-x.md", f"---\ntitle: ADR {n}\n---\n# ADR-000{n}\n")
+    return ph_data_root
+
+
+def test_profile_counts_io_per_validator_across_threads(tmp_path: Path) -> None:
+    for n in range(5):
+        _write(tmp_path / f"{n}.md", "x" * 10)
+
+    def read(count: int):
+        def run(out: list[dict]) -> None:
+            for n in range(count):
+                (tmp_path / f"{n}.md").read_text(encoding="utf-8")
+                count_stats()
+            (tmp_path / f"out-{count}.txt").write_text("not a read", encoding="utf-8")
+            out.extend({"code": "c"} for _ in range(count))
+
+        return run
+
+    profile = ValidationProfile()
+    with profile.session():
+        issues = run_validators([profile.wrap("two", read(2)), profile.wrap("five", read(5))], jobs=2)
+
+    assert len(issues) == 7
+    rows = {row.name: row for row in profile.rows}
+    assert (rows["two"].files_read, rows["two"].bytes_read, rows["two"].stat_calls, rows["two"].issues) == (2, 20, 2, 2)
+    assert (rows["five"].files_read, rows["five"].bytes_read, rows["five"].issues) == (5, 50, 5)
+    assert "five" in profile.format_table()
+
+
+def test_validate_profile_json(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+
+    result = subprocess.run(
+        ["ph", "--root", str(tmp_path), "--no-post-hook", "validate", "--profile-json", "--jobs", "2"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 1, result.stdout + result.stderr
+    assert "validator" in result.stdout and "front_matter" in result.stdout
+
+    payload = json.loads((ph_data_root / "status" / "validation_profile.json").read_text(encoding="utf-8"))
+    assert payload["source"] == "validate" and payload["jobs"] == 2
+    rows = {row["name"]: row for row in payload["validators"]}
+    assert {"setup", "front_matter", "adrs", "report"} <= set(rows)
+    assert rows["front_matter"]["files_read"] >= 3
+    assert [row["ms"] for row in payload["validators"]] == sorted(
+        (row["ms"] for row in payload["validators"]), reverse=True
+    )
+
+
+def test_post_hook_profile_env(tmp_path: Path) -> None:
+    ph_data_root = _write_minimal_ph_root(tmp_path)
+    env = {**os.environ, "PH_VALIDATE_PROFILE": "1"}
+    env.pop("PH_POST_VALIDATE_MODE", None)
+
+    result = subprocess.run(["ph", "--root", str(tmp_path), "doctor"], capture_output=True, text=True, env=env)
+    assert "Post-hook validate --quick profile" in result.stderr, result.stdout + result.stderr
+
+    payload = json.loads((ph_data_root / "status" / "validation_profile.json").read_text(encoding="utf-8"))
+    assert payload["source"] == "post-hook" and payload["command"] == "doctor"
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import collections
+import os
+from pathlib import Path
+
+import pytest
+
+from ph.handbook_index import invalidate_handbook_index
+from ph.handbook_tree import HandbookTree
+from ph.validate_docs import run_validate
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _write_handbook(ph_root: Path) -> Path:
+    ph_data_root = ph_root / ".project-handbook"
+    _write(
+        ph_data_root / "config.json",
+        '{\n  "handbook_schema_version": 1,\n  "requires_ph_version": ">=0.0.1,<0.1.0",\n  "repo_root": "."\n}\n',
+    )
+    _write(ph_data_root / "process" / "checks" / "validation_rules.json", "{}")
+    _write(ph_data_root / "adr" / "0001-use-x.md", "---\ntitle: Use X\n---\n# ADR-0001: Use X\n")
+    _write(ph_data_root / "adr" / "nested" / "0002-use-y.md", "# no front matter\n")
+    _write(ph_data_root / "features" / "auth" / "overview.md", "---\ntitle: Auth\n---\n")
+    _write(ph_data_root / "features" / "auth" / "fdr" / "FDR-0001-x.md", "---\ntitle: FDR\n---\n")
+    _write(
+        ph_data_root / "features" / "auth" / "decision-register" / "DR-0001-x.md",
+        "---\ntitle: DR\ntype: decision-register\n---\n# DR-0001\n",
+    )
+    _write(ph_data_root / "decision-register" / "DR-0002-y.md", "---\ntitle: DR\n---\n")
+    _write(ph_data_root / "releases" / "v1.0.0" / "plan.md", "---\ntitle: Release\n---\n")
+    sprint_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05"
+    _write(sprint_dir / "plan.md", "---\ntitle: Plan\n---\n")
+    _write(sprint_dir / "tasks" / "TASK-001-a" / "task.yaml", "id: TASK-001\ntitle: A\nstatus: todo\n")
+    _write(sprint_dir / "tasks" / "TASK-001-a" / "README.md", "# no front matter\n")
+    (ph_data_root / "sprints" / "current").symlink_to(Path("2026") / "SPRINT-2026-01-05")
+    _write(ph_data_root / "system" / "adr" / "0001-system.md", "# system scope is validated separately\n")
+    return ph_data_root
+
+
+def test_tree_yields_files_in_rglob_order(tmp_path: Path) -> None:
+    ph_data_root = _write_handbook(tmp_path)
+    tree = HandbookTree(ph_data_root)
+    assert tree.with_suffix(".md") == list(ph_data_root.rglob("*.md"))
+    assert tree.named("task.yaml", "sprints") == list((ph_data_root / "sprints").rglob("task.yaml"))
+    assert sorted(tree.subdirs("features")) == [ph_data_root / "features" / "auth"]
+
+
+@pytest.mark.parametrize("quick", [True, False], ids=["quick", "full"])
+def test_validate_lists_each_directory_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, quick: bool) -> None:
+    ph_data_root = _write_handbook(tmp_path)
+    expected_dirs = {
+        dirpath
+        for dirpath, _dirnames, _filenames in os.walk(ph_data_root)
+        if not Path(dirpath).is_relative_to(ph_data_root / "system")
+    }
+    invalidate_handbook_index(ph_data_root=ph_data_root)
+
+    calls: collections.Counter[tuple[str, str]] = collections.Counter()
+    real_scandir, real_listdir = os.scandir, os.listdir
+
+    def counting_scandir(path: object = ".") -> object:
+        calls["scandir", os.fspath(path)] += 1
+        return real_scandir(path)
+
+    def counting_listdir(path: object = ".") -> list[str]:
+        calls["listdir", os.fspath(path)] += 1
+        return real_listdir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    monkeypatch.setattr(os, "listdir", counting_listdir)
+    run_validate(
+        ph_root=tmp_path,
+        ph_project_root=ph_data_root,
+        ph_data_root=ph_data_root,
+        scope="project",
+        quick=quick,
+        silent_success=True,
+    )
+    monkeypatch.undo()
+
+    repeated = {key: count for key, count in calls.items() if count > 1}
+    assert repeated == {}
+    scanned = {path for kind, path in calls if kind == "scandir"}
+    assert scanned == expected_dirs
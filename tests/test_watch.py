@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+
+def _wait_for(predicate, *, timeout: float = 30) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _totals(current_json: Path) -> dict[str, int]:
+    try:
+        return json.loads(current_json.read_text(encoding="utf-8"))["totals"]
+    except (OSError, ValueError):
+        # Caught mid-write.
+        return {}
+
+
+@pytest.mark.parametrize("backend_args", [[], ["--poll", "--poll-interval", "0.1"]], ids=["default", "poll"])
+def test_watch_regenerates_status_and_feature_artifacts(tmp_path: Path, backend_args: list[str]) -> None:
+    subprocess.run(["ph", "init", "--no-gitignore"], cwd=tmp_path, check=True, capture_output=True)
+    ph_data_root = tmp_path / ".project-handbook"
+    task_dir = ph_data_root / "sprints" / "2026" / "SPRINT-2026-01-05" / "tasks" / "TASK-001-a"
+    task_dir.mkdir(parents=True)
+    task_yaml = task_dir / "task.yaml"
+    task_yaml.write_text("id: TASK-001\ntitle: A\nfeature: auth\nstatus: todo\nstory_points: 3\n", encoding="utf-8")
+    (ph_data_root / "sprints" / "current").symlink_to(Path("2026") / "SPRINT-2026-01-05")
+    feature_status = ph_data_root / "features" / "auth" / "status.md"
+    feature_status.parent.mkdir(parents=True)
+    feature_status.write_text("# Auth Status\n\nStage: developing\n", encoding="utf-8")
+    current_json = ph_data_root / "status" / "current.json"
+    log_path = tmp_path / "watch.log"
+
+    with log_path.open("w", encoding="utf-8") as log:
+        watcher = subprocess.Popen(
+            ["ph", "--root", str(tmp_path), "watch", "--debounce", "0.2", *backend_args],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    try:
+        assert _wait_for(lambda: "watching" in log_path.read_text(encoding="utf-8")), log_path.read_text()
+        assert _totals(current_json)["planned"] == 1
+        assert "## Active Work (auto-generated)" in feature_status.read_text(encoding="utf-8")
+
+        task_yaml.write_text("id: TASK-001\ntitle: A\nfeature: auth\nstatus: done\nstory_points: 3\n", encoding="utf-8")
+        assert _wait_for(lambda: _totals(current_json).get("done") == 1)
+        assert _wait_for(lambda: "**Completed Points**: 3 (100%)" in feature_status.read_text(encoding="utf-8"))
+
+        watcher.terminate()
+        watcher.wait(timeout=30)
+    finally:
+        if watcher.poll() is None:
+            watcher.kill()
+            watcher.wait()
+
+    log_text = log_path.read_text(encoding="utf-8")
+    assert "changed path(s)" in log_text
+    assert "regenerated status/current.json, status/current_summary.md in " in log_text
+    assert "ph watch: stopped" in log_text